@@ -29,7 +29,7 @@ def decode_jwt(token: str) -> dict[str, Any]:
     )
 
 
-def _decode_access_token(token: str) -> tuple[dict[str, Any], str]:
+async def _decode_access_token(token: str) -> tuple[dict[str, Any], str]:
     try:
         header = jwt.get_unverified_header(token)
     except JWTError as exc:
@@ -46,7 +46,7 @@ def _decode_access_token(token: str) -> tuple[dict[str, Any], str]:
 
     if alg in {"ES256", "RS256"}:
         try:
-            payload = verify_supabase_access_token(
+            payload = await verify_supabase_access_token(
                 token,
                 jwks_url=SUPABASE_JWKS_URL,
                 issuer=SUPABASE_JWT_ISSUER,
@@ -132,30 +132,44 @@ def _validated_onboarding_state(value: object) -> str | None:
     return None
 
 
-async def _build_current_user(user_id: str, payload: dict[str, Any]) -> dict[str, Any]:
-    from .repositories.auth import get_user_by_id
+async def _load_auth_identity(user_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+    from .repositories import auth_identity
     from .repositories.auth_subjects import ensure_authenticated_auth_subject
-    from .repositories.profiles import get_profile
 
-    user = await get_user_by_id(user_id)
-    if user is None:
+    identity = await auth_identity.get_auth_identity(user_id)
+    if identity is None:
         raise ValueError("Canonical auth user missing")
 
-    auth_subject = await ensure_authenticated_auth_subject(
-        user_id,
-        email=user.get("email") or payload.get("email"),
-    )
-    if auth_subject is None:
-        raise ValueError("Canonical auth subject missing")
+    if identity["auth_subject"] is None:
+        identity["auth_subject"] = await ensure_authenticated_auth_subject(
+            user_id,
+            email=identity["user"].get("email") or payload.get("email"),
+        )
+        if identity["auth_subject"] is None:
+            raise ValueError("Canonical auth subject missing")
+    return identity
+
+
+async def _build_current_user(user_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+    from .repositories import auth_identity
+
+    identity = auth_identity.cached_auth_identity(user_id)
+    cached = identity is not None
+    if identity is None:
+        identity = await _load_auth_identity(user_id, payload)
 
+    user = identity["user"]
+    auth_subject = identity["auth_subject"]
     normalized_role = _normalized_subject_role(auth_subject.get("role"))
     onboarding_state = _validated_onboarding_state(auth_subject.get("onboarding_state"))
     if normalized_role is None:
         raise ValueError("Canonical role authority missing")
     if onboarding_state is None:
         raise ValueError("Canonical onboarding_state invalid")
+    if not cached:
+        auth_identity.remember_auth_identity(user_id, identity)
 
-    profile = await get_profile(user_id)
+    profile = identity["profile"]
 
     return {
         "id": user_id,
@@ -175,7 +189,7 @@ async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]):
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload, source = _decode_access_token(token)
+        payload, source = await _decode_access_token(token)
         if is_token_expired(payload):
             raise credentials_exception
         user_id: str | None = payload.get("sub")
@@ -200,7 +214,7 @@ async def get_optional_user(
     if not token:
         return None
     try:
-        payload, source = _decode_access_token(token)
+        payload, source = await _decode_access_token(token)
         if is_token_expired(payload):
             return None
         user_id: str | None = payload.get("sub")
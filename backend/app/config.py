@@ -191,6 +191,18 @@ class Settings(BaseSettings):
     database_name: str | None = Field(default=None, validation_alias="DATABASE_NAME")
     database_user: str | None = Field(default=None, validation_alias="DATABASE_USER")
     database_password: str | None = Field(default=None, validation_alias="DATABASE_PASSWORD")
+    database_prepared_statements: bool = Field(
+        default=False, validation_alias="DATABASE_PREPARED_STATEMENTS"
+    )
+    worker_wakeups_enabled: bool = Field(
+        default=True, validation_alias="WORKER_WAKEUPS_ENABLED"
+    )
+    # LISTEN and singleton job locks need a session-level connection; point
+    # this at a direct or session-mode endpoint when DATABASE_URL goes through
+    # a transaction pooler.
+    worker_wakeup_database_url: AnyUrl | None = Field(
+        default=None, validation_alias="WORKER_WAKEUP_DATABASE_URL"
+    )
     mcp_mode: str = Field(default="local", validation_alias="MCP_MODE")
     mcp_production_database_url: AnyUrl | None = Field(
         default=None,
@@ -203,6 +215,9 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_expires_minutes: int = 15
     jwt_refresh_expires_minutes: int = 60 * 24
+    auth_identity_cache_enabled: bool = True
+    auth_identity_cache_ttl_seconds: float = 10.0
+    auth_identity_cache_max_entries: int = 10000
     media_root: str = "media"
     frontend_base_url: str | None = "http://localhost:3000"
     netlify_auth_token: str | None = Field(default=None, validation_alias="NETLIFY_AUTH_TOKEN")
@@ -295,6 +310,12 @@ class Settings(BaseSettings):
     stripe_connect_client_id: str | None = None
     stripe_connect_refresh_url: str | None = None
     stripe_connect_return_url: str | None = None
+    stripe_http_timeout_seconds: float = Field(
+        default=20.0,
+        validation_alias="STRIPE_HTTP_TIMEOUT_SECONDS",
+    )
+    stripe_object_cache_ttl_seconds: int = 300
+    stripe_object_cache_max_entries: int = 1024
     livekit_api_key: str | None = None
     livekit_api_secret: str | None = None
     livekit_ws_url: str | None = "wss://lk.wisdom.dev"
@@ -313,6 +334,9 @@ class Settings(BaseSettings):
     media_upload_max_audio_bytes: int = 5 * 1024 * 1024 * 1024
     media_upload_max_video_bytes: int = 5 * 1024 * 1024 * 1024
     media_playback_url_ttl_seconds: int = 3600
+    media_signed_url_cache_enabled: bool = True
+    media_signed_url_cache_max_entries: int = 4096
+    media_signed_url_cache_safety_seconds: int = 300
     media_signing_secret: str | None = None
     media_signing_ttl_seconds: int = 600
     media_public_cache_seconds: int = 3600
@@ -322,10 +346,18 @@ class Settings(BaseSettings):
     media_transcode_enabled: bool = True
     media_transcode_poll_interval_seconds: int = 10
     media_transcode_batch_size: int = 3
+    media_transcode_concurrency: int = 4
+    media_transcode_audio_concurrency: int = 1
+    media_transcode_image_concurrency: int = 2
+    media_transcode_passthrough_concurrency: int = 1
+    media_transcode_streaming_enabled: bool = False
     media_transcode_stale_lock_seconds: int = 1800
     media_transcode_max_attempts: int = 5
     media_transcode_max_retry_seconds: int = 300
     course_drip_worker_interval_seconds: int = 60 * 60
+    course_drip_worker_batch_size: int = 500
+    worker_processes: int = Field(default=1, validation_alias="WORKER_PROCESSES")
+    worker_heartbeat_interval_seconds: int = 15
     sentry_dsn: str | None = Field(
         default=None, validation_alias=AliasChoices("SENTRY_DSN", "BACKEND_SENTRY_DSN")
     )
@@ -340,6 +372,18 @@ class Settings(BaseSettings):
     email_from: str | None = Field(default=None, validation_alias="EMAIL_FROM")
     membership_expiry_warning_interval_seconds: int = 60 * 60 * 24
     notification_dispatcher_interval_seconds: int = 30
+    notification_dispatcher_claim_lease_seconds: int = 300
+    notification_push_concurrency: int = 16
+    stripe_webhook_inbox_enabled: bool = Field(
+        default=False, validation_alias="STRIPE_WEBHOOK_INBOX_ENABLED"
+    )
+    stripe_webhook_inbox_interval_seconds: int = 2
+    stripe_webhook_inbox_batch_size: int = 50
+    stripe_webhook_inbox_concurrency: int = 8
+    stripe_webhook_inbox_lease_seconds: int = 300
+    stripe_webhook_inbox_max_attempts: int = 10
+    stripe_webhook_inbox_retry_base_seconds: int = 15
+    stripe_webhook_inbox_retry_max_seconds: int = 60 * 60
     firebase_project_id: str | None = Field(
         default=None,
         validation_alias=AliasChoices("FIREBASE_PROJECT_ID", "FCM_PROJECT_ID"),
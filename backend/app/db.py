@@ -2,8 +2,9 @@ import asyncio
 from contextlib import asynccontextmanager, contextmanager
 from contextvars import ContextVar, Token
 import sys
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Sequence
 from uuid import UUID
+import weakref
 
 from psycopg.rows import dict_row
 from psycopg_pool import AsyncConnectionPool
@@ -73,13 +74,25 @@ def use_test_session(value: str | UUID | None):
         reset_test_session_id(token)
 
 
+# Last app.test_session_id applied to each pooled connection. The setting is
+# session-scoped, so a connection only needs a round trip when the caller's
+# test session differs from what it already carries; new connections start
+# unset, which the database treats the same as an empty value.
+_applied_test_session_ids: weakref.WeakKeyDictionary[object, str] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 async def _apply_test_session_setting(conn) -> None:
     session_id = get_test_session_id() or ""
+    if _applied_test_session_ids.get(conn, "") == session_id:
+        return
     await conn.execute(
         "SELECT set_config('app.test_session_id', %s, false)",
         (session_id,),
     )
     await conn.commit()
+    _applied_test_session_ids[conn] = session_id
 
 
 class ContextAwareAsyncConnectionPool(AsyncConnectionPool):
@@ -90,9 +103,26 @@ class ContextAwareAsyncConnectionPool(AsyncConnectionPool):
             yield conn
 
 
+# psycopg's default threshold; only used when prepared statements are enabled.
+_PREPARE_THRESHOLD = 5
+
+
+def _prepare_threshold() -> int | None:
+    """Server-side prepared statements are opt-in.
+
+    They are only safe when every pooled connection maps to one server
+    session (direct connections or a session-mode pooler); transaction-mode
+    poolers hand statements to backends that never saw the PREPARE.
+    """
+
+    if settings.database_prepared_statements:
+        return _PREPARE_THRESHOLD
+    return None
+
+
 pool = ContextAwareAsyncConnectionPool(
     conninfo=settings.database_url.unicode_string(),
-    kwargs={"prepare_threshold": None},
+    kwargs={"prepare_threshold": _prepare_threshold()},
     min_size=1,
     max_size=10,
     check=ContextAwareAsyncConnectionPool.check_connection,
@@ -105,3 +135,38 @@ async def get_conn() -> AsyncIterator:
     async with pool.connection() as conn:  # type: ignore
         async with conn.cursor(row_factory=dict_row) as cur:  # type: ignore[attr-defined]
             yield cur
+
+
+async def execute_hot(cur: Any, query: str, params: Any = None) -> None:
+    """Execute a stable hot-path query, preparing it on first use when enabled."""
+
+    if settings.database_prepared_statements:
+        await cur.execute(query, params, prepare=True)
+    else:
+        await cur.execute(query, params)
+
+
+async def pipelined_fetchall(
+    conn: Any,
+    statements: Sequence[tuple[str, Any]],
+) -> list[list[dict[str, Any]]]:
+    """Run independent reads in one pipeline and return each statement's rows.
+
+    All statements are sent before any result is read, so the batch costs a
+    single round trip. Statements run inside the connection's current
+    transaction.
+    """
+
+    if not statements:
+        return []
+    results: list[list[dict[str, Any]]] = []
+    async with conn.pipeline():
+        cursors = []
+        for query, params in statements:
+            cur = conn.cursor(row_factory=dict_row)
+            await cur.execute(query, params)
+            cursors.append(cur)
+        for cur in cursors:
+            async with cur:
+                results.append([dict(row) for row in await cur.fetchall()])
+    return results
@@ -32,6 +32,7 @@ except (
         return b""
 
 
+from .auth import SUPABASE_JWKS_URL
 from .config import settings
 from .auth_onboarding_failures import (
     canonical_error_response,
@@ -76,8 +77,12 @@ from .services import (
     media_transcode_worker,
     membership_expiry_warnings,
     notifications_dispatcher_worker,
+    storage_service,
+    stripe_gateway,
+    stripe_webhook_inbox_worker,
     studio_home_player_text_catalog,
 )
+from .utils import supabase_jwt
 
 ASSETS_ROOT = Path(__file__).resolve().parents[1] / "assets"
 UPLOADS_ROOT = ASSETS_ROOT / "uploads"
@@ -98,10 +103,15 @@ _CORS_ALLOW_HEADER_NAMES = (
     "X-Test-Session-ID",
     "Accept",
     "Range",
+    "X-Text-Bundle-Hashes",
+)
+_CORS_EXPOSE_HEADER_NAMES = (
+    "ETag",
+    "X-Text-Bundle-Hashes",
 )
 _CORS_ALLOW_METHODS = ", ".join(_CORS_ALLOW_METHOD_NAMES)
 _CORS_ALLOW_HEADERS = ", ".join(_CORS_ALLOW_HEADER_NAMES)
-_CORS_EXPOSE_HEADERS = "ETag"
+_CORS_EXPOSE_HEADERS = ", ".join(_CORS_EXPOSE_HEADER_NAMES)
 _WorkerStop = Callable[[], Awaitable[None]]
 _WorkerStart = Callable[..., Awaitable[None]]
 
@@ -130,6 +140,11 @@ def _local_background_workers() -> tuple[tuple[str, _WorkerStart, _WorkerStop],
             notifications_dispatcher_worker.start_worker,
             notifications_dispatcher_worker.stop_worker,
         ),
+        (
+            "stripe_webhook_inbox",
+            stripe_webhook_inbox_worker.start_worker,
+            stripe_webhook_inbox_worker.stop_worker,
+        ),
     )
 
 
@@ -202,11 +217,17 @@ async def lifespan(app: FastAPI):
         (UPLOADS_ROOT / sub).mkdir(parents=True, exist_ok=True)
     _enforce_windows_selector_runtime()
     await pool.open(wait=True)
+    await storage_service.open_shared_http_clients()
+    await stripe_gateway.open_shared_client()
+    await supabase_jwt.start_jwks_refresh(SUPABASE_JWKS_URL)
     try:
         started_workers = await _start_local_background_workers()
         yield
     finally:
         await _stop_local_background_workers(started_workers)
+        await supabase_jwt.stop_jwks_refresh()
+        await stripe_gateway.close_shared_client()
+        await storage_service.close_shared_http_clients()
         await pool.close()
 
 
@@ -254,7 +275,7 @@ def _configure_middleware(app: FastAPI) -> None:
         allow_credentials=True,
         allow_methods=list(_CORS_ALLOW_METHOD_NAMES),
         allow_headers=list(_CORS_ALLOW_HEADER_NAMES),
-        expose_headers=[_CORS_EXPOSE_HEADERS],
+        expose_headers=list(_CORS_EXPOSE_HEADER_NAMES),
     )
 
 
@@ -45,3 +45,23 @@ livekit_webhook_queue_size = Gauge(
     "livekit_webhook_queue_size",
     "Current in-memory queue size for LiveKit webhook worker.",
 )
+auth_identity_cache_hits_total = Counter(
+    "auth_identity_cache_hits_total",
+    "Number of authenticated requests resolved from the in-process identity cache.",
+)
+auth_identity_cache_misses_total = Counter(
+    "auth_identity_cache_misses_total",
+    "Number of authenticated requests that read identity from the database.",
+)
+media_signed_url_cache_hits_total = Counter(
+    "media_signed_url_cache_hits_total",
+    "Number of presigned storage URLs served from the in-process cache.",
+)
+media_signed_url_cache_misses_total = Counter(
+    "media_signed_url_cache_misses_total",
+    "Number of presigned storage URLs that required a Supabase signing call.",
+)
+media_storage_proxied_bytes_total = Counter(
+    "media_storage_proxied_bytes_total",
+    "Bytes relayed from Supabase Storage through the media proxy.",
+)
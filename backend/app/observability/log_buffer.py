@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import logging
 import re
-import time
 from collections import deque
-from datetime import date, datetime
+from datetime import date, datetime, timezone
+from itertools import count
+from operator import attrgetter
 from threading import Lock
 from typing import Any, Iterable
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
@@ -72,13 +73,20 @@ _ASSIGNMENT_RE = re.compile(
 )
 _KEY_VALUE_RE = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)=([^\s]+)")
 _URL_RE = re.compile(r"https?://[^\s]+", re.IGNORECASE)
-_EVENTS: deque[dict[str, Any]] = deque(maxlen=_BUFFER_MAX_EVENTS)
+_EVENTS: deque["_BufferedRecord"] = deque(maxlen=_BUFFER_MAX_EVENTS)
+# Secondary indexes over _EVENTS, oldest first. Every entry is in exactly one
+# level index and one logger index, so eviction pops the same entry from the
+# front of each.
+_EVENTS_BY_LEVEL: dict[int, deque["_BufferedRecord"]] = {}
+_EVENTS_BY_LOGGER: dict[str, deque["_BufferedRecord"]] = {}
 _EVENTS_LOCK = Lock()
+_SEQUENCE = count()
 _HANDLER: "OperationalLogBufferHandler | None" = None
 
 
-def _now_iso() -> str:
-    return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+def _iso_from_epoch(value: float) -> str:
+    stamp = datetime.fromtimestamp(value, timezone.utc).replace(microsecond=0)
+    return stamp.isoformat().replace("+00:00", "Z")
 
 
 def _normalize_level(value: str | int | None) -> int:
@@ -155,15 +163,20 @@ def sanitize_value(value: Any) -> Any:
     return sanitize_string(str(value))
 
 
-def _extract_record_fields(record: logging.LogRecord) -> dict[str, Any]:
-    extras = {
-        key: value
-        for key, value in record.__dict__.items()
-        if key not in _BUILTIN_LOG_RECORD_KEYS
-    }
+def _snapshot_extra(value: Any) -> Any:
+    """Detach an extra from the caller so later mutation cannot change it."""
+
+    if value is None or isinstance(value, (bool, int, float, str, date)):
+        return value
+    if isinstance(value, (dict, list, tuple, set)):
+        return sanitize_value(value)
+    return str(value)
+
+
+def _extract_record_fields(message: str, extras: dict[str, Any]) -> dict[str, Any]:
     parsed_fields: dict[str, Any] = {
         key: value
-        for key, value in _KEY_VALUE_RE.findall(record.getMessage())
+        for key, value in _KEY_VALUE_RE.findall(message)
     }
     fields = dict(parsed_fields)
     fields.update(extras)
@@ -197,37 +210,80 @@ def _event_name_for_record(logger_name: str, message: str, component: str) -> st
     return f"{component}_{slug or 'event'}"
 
 
-def _serialize_event(event: dict[str, Any]) -> dict[str, Any]:
-    return {
-        "timestamp": event["timestamp"],
-        "level": event["level"],
-        "logger": event["logger"],
-        "component": event["component"],
-        "event": event["event"],
-        "message": event["message"],
-        "fields": event["fields"],
-    }
+class _BufferedRecord:
+    """A log record as captured on the logging thread.
 
+    Only the formatted message and a snapshot of the record extras are kept;
+    sanitizing, field extraction and classification run on first read and are
+    cached, so records that are never listed never pay for them.
+    """
 
-class OperationalLogBufferHandler(logging.Handler):
-    def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover - log plumbing
-        try:
-            message = sanitize_string(record.getMessage())
-            fields = _extract_record_fields(record)
-            component = _component_for_record(record.name, message)
-            event_name = _event_name_for_record(record.name, message, component)
+    __slots__ = (
+        "sequence",
+        "observed_at",
+        "levelno",
+        "level",
+        "logger",
+        "raw_message",
+        "extras",
+        "event",
+    )
+
+    def __init__(self, record: logging.LogRecord) -> None:
+        self.sequence = 0
+        self.observed_at = record.created
+        self.levelno = record.levelno
+        self.level = record.levelname
+        self.logger = record.name
+        self.raw_message = record.getMessage()
+        self.extras = {
+            key: _snapshot_extra(value)
+            for key, value in record.__dict__.items()
+            if key not in _BUILTIN_LOG_RECORD_KEYS
+        }
+        self.event: dict[str, Any] | None = None
+
+    def materialize(self) -> dict[str, Any]:
+        event = self.event
+        if event is None:
+            message = sanitize_string(self.raw_message)
+            component = _component_for_record(self.logger, message)
             event = {
-                "observed_at": time.time(),
-                "timestamp": _now_iso(),
-                "level": record.levelname,
-                "logger": record.name,
+                "timestamp": _iso_from_epoch(self.observed_at),
+                "level": self.level,
+                "logger": self.logger,
                 "component": component,
-                "event": event_name,
+                "event": _event_name_for_record(self.logger, message, component),
                 "message": message,
-                "fields": fields,
+                "fields": _extract_record_fields(self.raw_message, self.extras),
             }
-            with _EVENTS_LOCK:
-                _EVENTS.append(event)
+            # Concurrent readers may both build the event; the results match.
+            self.event = event
+        return event
+
+
+def _append(entry: _BufferedRecord) -> None:
+    with _EVENTS_LOCK:
+        if len(_EVENTS) == _EVENTS.maxlen:
+            evicted = _EVENTS[0]
+            level_index = _EVENTS_BY_LEVEL[evicted.levelno]
+            level_index.popleft()
+            if not level_index:
+                del _EVENTS_BY_LEVEL[evicted.levelno]
+            logger_index = _EVENTS_BY_LOGGER[evicted.logger]
+            logger_index.popleft()
+            if not logger_index:
+                del _EVENTS_BY_LOGGER[evicted.logger]
+        entry.sequence = next(_SEQUENCE)
+        _EVENTS.append(entry)
+        _EVENTS_BY_LEVEL.setdefault(entry.levelno, deque()).append(entry)
+        _EVENTS_BY_LOGGER.setdefault(entry.logger, deque()).append(entry)
+
+
+class OperationalLogBufferHandler(logging.Handler):
+    def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover - log plumbing
+        try:
+            _append(_BufferedRecord(record))
         except Exception:
             self.handleError(record)
 
@@ -242,6 +298,36 @@ def get_event_buffer_handler() -> OperationalLogBufferHandler:
 def clear_events() -> None:
     with _EVENTS_LOCK:
         _EVENTS.clear()
+        _EVENTS_BY_LEVEL.clear()
+        _EVENTS_BY_LOGGER.clear()
+
+
+def _candidates(
+    min_level_number: int,
+    allowed_loggers: set[str],
+) -> list[_BufferedRecord]:
+    """Entries that can match the level and logger filters, oldest first."""
+
+    with _EVENTS_LOCK:
+        if allowed_loggers:
+            indexes = [
+                _EVENTS_BY_LOGGER[name]
+                for name in allowed_loggers
+                if name in _EVENTS_BY_LOGGER
+            ]
+        elif min_level_number > min(_EVENTS_BY_LEVEL, default=min_level_number):
+            indexes = [
+                index
+                for levelno, index in _EVENTS_BY_LEVEL.items()
+                if levelno >= min_level_number
+            ]
+        else:
+            return list(_EVENTS)
+        merged = [entry for index in indexes for entry in index]
+    if len(indexes) > 1:
+        # Each index is in buffer order; restore the order across them.
+        merged.sort(key=attrgetter("sequence"))
+    return merged
 
 
 def list_events(
@@ -259,22 +345,20 @@ def list_events(
     allowed_loggers = {str(item).strip() for item in (logger_names or []) if str(item).strip()}
     allowed_events = {str(item).strip().lower() for item in (event_names or []) if str(item).strip()}
 
-    with _EVENTS_LOCK:
-        snapshot = list(_EVENTS)
-
     results: list[dict[str, Any]] = []
-    for event in reversed(snapshot):
-        if since_epoch_seconds is not None and event["observed_at"] < since_epoch_seconds:
+    for entry in reversed(_candidates(min_level_number, allowed_loggers)):
+        if since_epoch_seconds is not None and entry.observed_at < since_epoch_seconds:
             continue
-        if _normalize_level(event["level"]) < min_level_number:
+        if entry.levelno < min_level_number:
             continue
-        if allowed_components and event["component"].lower() not in allowed_components:
+        if allowed_loggers and entry.logger not in allowed_loggers:
             continue
-        if allowed_loggers and event["logger"] not in allowed_loggers:
+        event = entry.materialize()
+        if allowed_components and event["component"].lower() not in allowed_components:
             continue
         if allowed_events and event["event"].lower() not in allowed_events:
             continue
-        results.append(_serialize_event(event))
+        results.append({**event, "fields": dict(event["fields"])})
         if len(results) >= capped_limit:
             break
     return results
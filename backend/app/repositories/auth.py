@@ -9,6 +9,7 @@ from psycopg.rows import dict_row
 from psycopg.types.json import Jsonb
 
 from ..db import get_conn, pool
+from .auth_identity import invalidate_auth_identity
 from .auth_subjects import ensure_authenticated_auth_subject
 from .profiles import get_profile as get_profile_for_user
 _CANONICAL_AUTH_EVENT_TYPES = frozenset(
@@ -52,7 +53,8 @@ async def _upsert_profile_row(
             )
             row = await cur.fetchone()
             await conn.commit()
-            return dict(row) if row else None
+    invalidate_auth_identity(user_id)
+    return dict(row) if row else None
 
 
 async def create_user(
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any
+from uuid import UUID
+
+from .. import metrics
+from ..config import settings
+from ..db import get_conn
+
+AuthIdentity = dict[str, Any]
+
+_PROFILE_COLUMNS = (
+    "display_name",
+    "bio",
+    "avatar_media_id",
+    "created_at",
+    "updated_at",
+)
+_MEMBERSHIP_COLUMNS = (
+    "membership_id",
+    "status",
+    "effective_at",
+    "expires_at",
+    "canceled_at",
+    "ended_at",
+    "source",
+    "created_at",
+    "updated_at",
+)
+
+
+class AuthIdentityCache:
+    """Bounded in-process cache of authenticated identities with a short TTL.
+
+    Entries are dropped explicitly when this process writes a role, onboarding,
+    profile, or membership change; the TTL bounds staleness for writes made by
+    other processes.
+    """
+
+    def __init__(self, *, max_entries: int) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[str, tuple[float, AuthIdentity]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, user_id: str, *, now: float) -> AuthIdentity | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, identity = entry
+        if expires_at <= now:
+            self._entries.pop(user_id, None)
+            return None
+        self._entries.move_to_end(user_id)
+        return identity
+
+    def set(self, user_id: str, identity: AuthIdentity, *, expires_at: float) -> None:
+        self._entries[user_id] = (expires_at, identity)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, user_id: str) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_identity_cache = AuthIdentityCache(
+    max_entries=settings.auth_identity_cache_max_entries,
+)
+
+
+def cached_auth_identity(user_id: str | UUID) -> AuthIdentity | None:
+    if not settings.auth_identity_cache_enabled:
+        return None
+    identity = _identity_cache.get(str(user_id), now=time.monotonic())
+    if identity is None:
+        metrics.auth_identity_cache_misses_total.inc()
+        return None
+    metrics.auth_identity_cache_hits_total.inc()
+    return identity
+
+
+def remember_auth_identity(user_id: str | UUID, identity: AuthIdentity) -> None:
+    ttl_seconds = float(settings.auth_identity_cache_ttl_seconds)
+    if not settings.auth_identity_cache_enabled or ttl_seconds <= 0:
+        return
+    _identity_cache.set(
+        str(user_id),
+        identity,
+        expires_at=time.monotonic() + ttl_seconds,
+    )
+
+
+def invalidate_auth_identity(user_id: str | UUID) -> None:
+    _identity_cache.discard(str(user_id))
+
+
+def clear_auth_identity_cache() -> None:
+    _identity_cache.clear()
+
+
+async def get_auth_identity(user_id: str | UUID) -> AuthIdentity | None:
+    """Read the auth user with its auth subject, profile, and membership.
+
+    Returns ``None`` when the auth user does not exist. Missing sibling rows
+    are reported as ``None`` under their key.
+    """
+
+    profile_sql = ",\n                   ".join(
+        f"p.{column} as profile_{column}" for column in _PROFILE_COLUMNS
+    )
+    membership_sql = ",\n                   ".join(
+        f"m.{column} as membership_{column}" for column in _MEMBERSHIP_COLUMNS
+    )
+    async with get_conn() as cur:
+        await cur.execute(
+            f"""
+            SELECT u.id,
+                   u.email,
+                   s.user_id as subject_user_id,
+                   s.email as subject_email,
+                   s.onboarding_state as subject_onboarding_state,
+                   s.role::text as subject_role,
+                   p.user_id as profile_user_id,
+                   {profile_sql},
+                   m.user_id as membership_user_id,
+                   {membership_sql}
+            FROM auth.users u
+            LEFT JOIN app.auth_subjects s ON s.user_id = u.id
+            LEFT JOIN app.profiles p ON p.user_id = u.id
+            LEFT JOIN app.memberships m ON m.user_id = u.id
+            WHERE u.id = %s
+            LIMIT 1
+            """,
+            (user_id,),
+        )
+        row = await cur.fetchone()
+    if row is None:
+        return None
+
+    row = dict(row)
+    auth_subject = None
+    if row["subject_user_id"] is not None:
+        auth_subject = {
+            "user_id": row["subject_user_id"],
+            "email": row["subject_email"],
+            "onboarding_state": row["subject_onboarding_state"],
+            "role": row["subject_role"],
+        }
+    profile = None
+    if row["profile_user_id"] is not None:
+        profile = {
+            "user_id": row["profile_user_id"],
+            "email": row["email"],
+            **{column: row[f"profile_{column}"] for column in _PROFILE_COLUMNS},
+        }
+    membership = None
+    if row["membership_user_id"] is not None:
+        membership = {
+            "user_id": row["membership_user_id"],
+            **{column: row[f"membership_{column}"] for column in _MEMBERSHIP_COLUMNS},
+        }
+    return {
+        "user": {"id": row["id"], "email": row["email"]},
+        "auth_subject": auth_subject,
+        "profile": profile,
+        "membership": membership,
+    }
+
+
+__all__ = [
+    "AuthIdentityCache",
+    "cached_auth_identity",
+    "clear_auth_identity_cache",
+    "get_auth_identity",
+    "invalidate_auth_identity",
+    "remember_auth_identity",
+]
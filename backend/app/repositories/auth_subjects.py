@@ -6,6 +6,7 @@ from uuid import UUID
 from psycopg.rows import dict_row
 
 from ..db import get_conn, pool
+from .auth_identity import invalidate_auth_identity
 
 _VALID_ONBOARDING_STATES = frozenset({"incomplete", "welcome_pending", "completed"})
 _VALID_ROLES = frozenset({"learner", "teacher", "admin"})
@@ -140,7 +141,8 @@ async def set_role_authority(
             )
             row = await cur.fetchone()
             await conn.commit()
-            return dict(row) if row else None
+    invalidate_auth_identity(user_id)
+    return dict(row) if row else None
 
 
 async def mark_create_profile_step_complete(
@@ -160,4 +162,5 @@ async def mark_create_profile_step_complete(
             )
             row = await cur.fetchone()
             await conn.commit()
-            return dict(row) if row else None
+    invalidate_auth_identity(user_id)
+    return dict(row) if row else None
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Sequence
+import re
+from typing import Any, NamedTuple, Sequence
 from uuid import UUID, uuid4
 
 from psycopg import Error as PsycopgError
 from psycopg.rows import dict_row
 from psycopg.types.json import Jsonb
 
-from ..db import get_conn, pool
+from ..db import execute_hot, get_conn, pool
 
 
 CourseRow = dict[str, Any]
@@ -21,6 +22,8 @@ _MISSING_COURSE_PUBLIC_CONTENT_ERROR = (
     "Invariant violation: missing course_public_content"
 )
 _COURSE_PUBLIC_CONTENT_SHORT_DESCRIPTION_COMPAT = "Pending public summary"
+_COURSE_SEARCH_TERM_RE = re.compile(r"[^\W_]+")
+_COURSE_SEARCH_RANK_SQL = "ts_rank_cd(cpc.search_document, course_search.query)"
 
 _COURSE_COLUMNS = """
     c.id,
@@ -554,7 +557,7 @@ async def get_course(
 
     async def _execute(active_conn: Any) -> CourseRow | None:
         async with active_conn.cursor(row_factory=dict_row) as cur:  # type: ignore[attr-defined]
-            await cur.execute(query, params)
+            await execute_hot(cur, query, params)
             row = await cur.fetchone()
         return dict(row) if row else None
 
@@ -737,21 +740,97 @@ async def get_course_publish_subject(course_id: str) -> dict[str, Any] | None:
     return dict(row) if row else None
 
 
+class _CourseListWindow(NamedTuple):
+    join_sql: str
+    join_params: list[Any]
+    rank_sql: str
+    clauses: list[str]
+    params: list[Any]
+    order_sql: str
+
+
+def course_search_tsquery(search: str) -> str | None:
+    terms = _COURSE_SEARCH_TERM_RE.findall(search.lower())
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def _course_list_window(
+    *,
+    slug_column: str,
+    search: str | None,
+    after_slug: str | None,
+    after_rank: float | None,
+) -> _CourseListWindow:
+    """Indexed search filter and keyset position for course list queries.
+
+    Search matches ``cpc.search_document`` as Swedish prefix terms and orders by
+    relevance, then slug. Without search the list stays in slug order. The
+    keyset continues strictly after ``(after_rank, after_slug)``.
+    """
+
+    if not search:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if after_slug is not None:
+            clauses.append(f"{slug_column} > %s")
+            params.append(after_slug)
+        return _CourseListWindow("", [], "", clauses, params, f"{slug_column} asc")
+
+    tsquery = course_search_tsquery(search)
+    if tsquery is None:
+        return _CourseListWindow("", [], "", ["false"], [], f"{slug_column} asc")
+
+    clauses = ["cpc.search_document @@ course_search.query"]
+    params = []
+    if after_slug is not None:
+        if after_rank is None:
+            raise ValueError("Search keyset requires after_rank")
+        clauses.append(
+            f"""(
+              {_COURSE_SEARCH_RANK_SQL} < %s::real
+              or (
+                {_COURSE_SEARCH_RANK_SQL} = %s::real
+                and {slug_column} > %s
+              )
+            )"""
+        )
+        params.extend([after_rank, after_rank, after_slug])
+    return _CourseListWindow(
+        join_sql="""
+        cross join lateral (
+          select to_tsquery('swedish'::regconfig, %s) as query
+        ) as course_search""",
+        join_params=[tsquery],
+        rank_sql=f",\n            {_COURSE_SEARCH_RANK_SQL} as search_rank",
+        clauses=clauses,
+        params=params,
+        order_sql=f"search_rank desc, {slug_column} asc",
+    )
+
+
 async def list_courses(
     *,
     teacher_id: str | None = None,
     limit: int | None = None,
     search: str | None = None,
+    after_slug: str | None = None,
+    after_rank: float | None = None,
 ) -> Sequence[CourseRow]:
+    window = _course_list_window(
+        slug_column="c.slug",
+        search=search,
+        after_slug=after_slug,
+        after_rank=after_rank,
+    )
     clauses: list[str] = []
-    params: list[Any] = []
+    params: list[Any] = list(window.join_params)
     if teacher_id:
         clauses.append("c.teacher_id = %s::uuid")
         params.append(teacher_id)
-    if search:
-        pattern = f"%{search}%"
-        clauses.append("(c.title ilike %s or c.slug ilike %s)")
-        params.extend([pattern, pattern])
+    clauses.extend(window.clauses)
+    params.extend(window.params)
 
     where_sql = f"where {' and '.join(clauses)}" if clauses else ""
     limit_sql = "limit %s" if limit is not None else ""
@@ -761,12 +840,12 @@ async def list_courses(
     query = f"""
         select
             {_COURSE_COLUMNS},
-            cpc.description
+            cpc.description{window.rank_sql}
         from app.courses as c
         join app.course_public_content as cpc
-          on cpc.course_id = c.id
+          on cpc.course_id = c.id{window.join_sql}
         {where_sql}
-        order by c.slug asc
+        order by {window.order_sql}
         {limit_sql}
     """
 
@@ -782,16 +861,22 @@ async def list_studio_courses(
     teacher_id: str | None = None,
     limit: int | None = None,
     search: str | None = None,
+    after_slug: str | None = None,
+    after_rank: float | None = None,
 ) -> Sequence[CourseRow]:
+    window = _course_list_window(
+        slug_column="c.slug",
+        search=search,
+        after_slug=after_slug,
+        after_rank=after_rank,
+    )
     clauses: list[str] = []
-    params: list[Any] = []
+    params: list[Any] = list(window.join_params)
     if teacher_id:
         clauses.append("c.teacher_id = %s::uuid")
         params.append(teacher_id)
-    if search:
-        pattern = f"%{search}%"
-        clauses.append("(c.title ilike %s or c.slug ilike %s)")
-        params.extend([pattern, pattern])
+    clauses.extend(window.clauses)
+    params.extend(window.params)
 
     where_sql = f"where {' and '.join(clauses)}" if clauses else ""
     limit_sql = "limit %s" if limit is not None else ""
@@ -799,10 +884,12 @@ async def list_studio_courses(
         params.append(int(limit))
 
     query = f"""
-        select {_STUDIO_COURSE_COLUMNS}
+        select {_STUDIO_COURSE_COLUMNS}{window.rank_sql}
         from app.courses as c
+        left join app.course_public_content as cpc
+          on cpc.course_id = c.id{window.join_sql}
         {where_sql}
-        order by c.slug asc
+        order by {window.order_sql}
         {limit_sql}
     """
 
@@ -829,16 +916,21 @@ async def list_public_courses(
     *,
     search: str | None = None,
     limit: int | None = None,
+    after_slug: str | None = None,
+    after_rank: float | None = None,
 ) -> Sequence[CourseRow]:
+    window = _course_list_window(
+        slug_column="c.slug",
+        search=search,
+        after_slug=after_slug,
+        after_rank=after_rank,
+    )
     clauses = [
         "c.visibility = 'public'::app.course_visibility",
         _PUBLIC_DISCOVERABLE_COURSE_SQL,
+        *window.clauses,
     ]
-    params: list[Any] = []
-    if search:
-        pattern = f"%{search}%"
-        clauses.append("(c.title ilike %s or c.slug ilike %s)")
-        params.extend([pattern, pattern])
+    params: list[Any] = [*window.join_params, *window.params]
 
     where_sql = f"where {' and '.join(clauses)}"
     limit_sql = "limit %s" if limit is not None else ""
@@ -846,10 +938,12 @@ async def list_public_courses(
         params.append(int(limit))
 
     query = f"""
-        select {_COURSE_COLUMNS}
+        select {_COURSE_COLUMNS}{window.rank_sql}
         from app.courses as c
+        left join app.course_public_content as cpc
+          on cpc.course_id = c.id{window.join_sql}
         {where_sql}
-        order by c.slug asc
+        order by {window.order_sql}
         {limit_sql}
     """
 
@@ -865,13 +959,17 @@ async def list_public_course_discovery(
     search: str | None = None,
     limit: int | None = None,
     group_position: int | None = None,
+    after_slug: str | None = None,
+    after_rank: float | None = None,
 ) -> Sequence[CourseRow]:
-    clauses: list[str] = []
-    params: list[Any] = []
-    if search:
-        pattern = f"%{search}%"
-        clauses.append("(cds.title ilike %s or cds.slug ilike %s)")
-        params.extend([pattern, pattern])
+    window = _course_list_window(
+        slug_column="cds.slug",
+        search=search,
+        after_slug=after_slug,
+        after_rank=after_rank,
+    )
+    clauses: list[str] = list(window.clauses)
+    params: list[Any] = [*window.join_params, *window.params]
     if group_position is not None:
         clauses.append("cds.group_position = %s")
         params.append(int(group_position))
@@ -881,17 +979,17 @@ async def list_public_course_discovery(
         params.append(int(limit))
 
     query = f"""
-        select {_PUBLIC_DISCOVERY_COLUMNS}
+        select {_PUBLIC_DISCOVERY_COLUMNS}{window.rank_sql}
         from app.course_discovery_surface as cds
         join app.courses as c
           on c.id = cds.id
         left join app.profiles as p
           on p.user_id = c.teacher_id
         join app.course_public_content as cpc
-          on cpc.course_id = cds.id
+          on cpc.course_id = cds.id{window.join_sql}
         where {_PUBLIC_DISCOVERABLE_COURSE_SQL}
         {"and " + " and ".join(clauses) if clauses else ""}
-        order by cds.slug asc
+        order by {window.order_sql}
         {limit_sql}
     """
 
@@ -1735,7 +1833,7 @@ async def get_course_enrollment(
 
     async def _execute(active_conn: Any) -> dict[str, Any] | None:
         async with active_conn.cursor(row_factory=dict_row) as cur:  # type: ignore[attr-defined]
-            await cur.execute(query, (user_id, course_id))
+            await execute_hot(cur, query, (user_id, course_id))
             row = await cur.fetchone()
         return dict(row) if row else None
 
@@ -1766,7 +1864,7 @@ async def get_course_entry_enrollment(
 
     async def _execute(active_conn: Any) -> dict[str, Any] | None:
         async with active_conn.cursor(row_factory=dict_row) as cur:  # type: ignore[attr-defined]
-            await cur.execute(query, (user_id, course_id))
+            await execute_hot(cur, query, (user_id, course_id))
             row = await cur.fetchone()
         return dict(row) if row else None
 
@@ -2152,7 +2250,7 @@ async def get_lesson(
 
     async def _execute(active_conn: Any) -> LessonRow | None:
         async with active_conn.cursor(row_factory=dict_row) as cur:  # type: ignore[attr-defined]
-            await cur.execute(query, (lesson_id,))
+            await execute_hot(cur, query, (lesson_id,))
             row = await cur.fetchone()
         return dict(row) if row else None
 
@@ -2855,16 +2953,18 @@ async def update_lesson(lesson_id: str, patch: dict[str, Any]) -> LessonRow | No
 async def reorder_lessons(course_id: str, ordered_lesson_ids: Sequence[str]) -> None:
     async with pool.connection() as conn:  # type: ignore
         async with conn.cursor() as cur:  # type: ignore[attr-defined]
-            for index, lesson_id in enumerate(ordered_lesson_ids, start=1):
-                await cur.execute(
-                    """
-                    update app.lessons
-                    set position = %s
-                    where id = %s::uuid
-                      and course_id = %s::uuid
-                    """,
-                    (index, lesson_id, course_id),
-                )
+            # One statement so the drip schedule triggers refresh the course once.
+            await cur.execute(
+                """
+                update app.lessons as l
+                set position = ordered.position
+                from unnest(%s::uuid[]) with ordinality as ordered(id, position)
+                where l.id = ordered.id
+                  and l.course_id = %s::uuid
+                  and l.position is distinct from ordered.position
+                """,
+                (list(ordered_lesson_ids), course_id),
+            )
             await conn.commit()
 
 
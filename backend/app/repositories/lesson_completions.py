@@ -5,7 +5,7 @@ from typing import Any
 from psycopg import Error as PsycopgError
 from psycopg.rows import dict_row
 
-from ..db import pool
+from ..db import pipelined_fetchall, pool
 
 
 class LessonCompletionAlreadyExistsError(RuntimeError):
@@ -37,6 +37,43 @@ _LESSON_COMPLETION_COLUMNS = """
     completion_source
 """
 
+_LESSON_COMPLETION_LOOKUP_QUERY = f"""
+    select
+        {_LESSON_COMPLETION_COLUMNS}
+    from app.lesson_completions
+    where user_id = %s::uuid
+      and lesson_id = %s::uuid
+    limit 1
+"""
+
+_INTRO_FINAL_LESSON_AUTO_COMPLETION_CANDIDATE_QUERY = """
+    select
+        ce.id as enrollment_id,
+        ce.user_id,
+        ce.course_id,
+        ce.drip_started_at,
+        fl.id as final_lesson_id,
+        app.compute_course_final_unlock_at(
+            ce.course_id,
+            ce.drip_started_at
+        ) as final_unlock_at
+    from app.course_enrollments as ce
+    join app.courses as c
+      on c.id = ce.course_id
+    join app.lessons as fl
+      on fl.course_id = ce.course_id
+    where ce.id = %s::uuid
+      and c.required_enrollment_source = 'intro'::app.course_enrollment_source
+      and ce.source = c.required_enrollment_source
+      and fl.position = (
+        select max(l2.position)
+        from app.lessons as l2
+        where l2.course_id = ce.course_id
+      )
+    order by fl.id asc
+    limit 1
+"""
+
 
 def _constraint_name(exc: PsycopgError) -> str | None:
     diag = getattr(exc, "diag", None)
@@ -116,14 +153,7 @@ async def get_lesson_completion(
     lesson_id: str,
     conn: Any | None = None,
 ) -> dict[str, Any] | None:
-    query = f"""
-        select
-            {_LESSON_COMPLETION_COLUMNS}
-        from app.lesson_completions
-        where user_id = %s::uuid
-          and lesson_id = %s::uuid
-        limit 1
-    """
+    query = _LESSON_COMPLETION_LOOKUP_QUERY
 
     async def _execute(active_conn: Any) -> dict[str, Any] | None:
         async with active_conn.cursor(row_factory=dict_row) as cur:  # type: ignore[attr-defined]
@@ -175,33 +205,7 @@ async def get_intro_final_lesson_auto_completion_candidate(
     enrollment_id: str,
     conn: Any | None = None,
 ) -> dict[str, Any] | None:
-    query = """
-        select
-            ce.id as enrollment_id,
-            ce.user_id,
-            ce.course_id,
-            ce.drip_started_at,
-            fl.id as final_lesson_id,
-            app.compute_course_final_unlock_at(
-                ce.course_id,
-                ce.drip_started_at
-            ) as final_unlock_at
-        from app.course_enrollments as ce
-        join app.courses as c
-          on c.id = ce.course_id
-        join app.lessons as fl
-          on fl.course_id = ce.course_id
-        where ce.id = %s::uuid
-          and c.required_enrollment_source = 'intro'::app.course_enrollment_source
-          and ce.source = c.required_enrollment_source
-          and fl.position = (
-            select max(l2.position)
-            from app.lessons as l2
-            where l2.course_id = ce.course_id
-          )
-        order by fl.id asc
-        limit 1
-    """
+    query = _INTRO_FINAL_LESSON_AUTO_COMPLETION_CANDIDATE_QUERY
 
     async def _execute(active_conn: Any) -> dict[str, Any] | None:
         async with active_conn.cursor(row_factory=dict_row) as cur:  # type: ignore[attr-defined]
@@ -218,6 +222,40 @@ async def get_intro_final_lesson_auto_completion_candidate(
         return result
 
 
+async def list_intro_final_lesson_auto_completion_candidates(
+    *,
+    enrollment_ids: list[str],
+    conn: Any,
+) -> list[dict[str, Any] | None]:
+    """Batch form of ``get_intro_final_lesson_auto_completion_candidate``.
+
+    Returns one entry per enrollment id, in order, read in a single pipeline.
+    """
+
+    results = await pipelined_fetchall(
+        conn,
+        [
+            (_INTRO_FINAL_LESSON_AUTO_COMPLETION_CANDIDATE_QUERY, (enrollment_id,))
+            for enrollment_id in enrollment_ids
+        ],
+    )
+    return [rows[0] if rows else None for rows in results]
+
+
+async def list_existing_lesson_completions(
+    *,
+    user_lesson_pairs: list[tuple[str, str]],
+    conn: Any,
+) -> list[dict[str, Any] | None]:
+    """Batch form of ``get_lesson_completion`` for (user_id, lesson_id) pairs."""
+
+    results = await pipelined_fetchall(
+        conn,
+        [(_LESSON_COMPLETION_LOOKUP_QUERY, (user_id, lesson_id)) for user_id, lesson_id in user_lesson_pairs],
+    )
+    return [rows[0] if rows else None for rows in results]
+
+
 __all__ = [
     "LessonCompletionAlreadyExistsError",
     "LessonCompletionInvalidLessonCourseError",
@@ -227,4 +265,6 @@ __all__ = [
     "get_intro_final_lesson_auto_completion_candidate",
     "get_lesson_completion",
     "list_course_lesson_completions",
+    "list_existing_lesson_completions",
+    "list_intro_final_lesson_auto_completion_candidates",
 ]
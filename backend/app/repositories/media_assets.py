@@ -626,6 +626,45 @@ async def get_media_asset_access(media_asset_id: str) -> dict[str, Any] | None:
     return row
 
 
+async def list_media_assets_access(
+    media_asset_ids: Sequence[str],
+) -> dict[str, dict[str, Any]]:
+    normalized_ids = list(
+        dict.fromkeys(str(value).strip() for value in media_asset_ids if value)
+    )
+    if not normalized_ids:
+        return {}
+    query = """
+        select
+            id,
+            media_type::text as media_type,
+            purpose::text as purpose,
+            original_filename,
+            lesson_id::text as lesson_id,
+            course_id::text as course_id,
+            owner_user_id::text as owner_user_id,
+            original_object_path,
+            ingest_format,
+            playback_object_path,
+            playback_format,
+            state::text as state
+        from app.media_assets
+        where id = any(%s::uuid[])
+    """
+    async with pool.connection() as conn:  # type: ignore
+        async with conn.cursor(row_factory=dict_row) as cur:  # type: ignore[attr-defined]
+            await cur.execute(query, (normalized_ids,))
+            rows = await cur.fetchall()
+    assets: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        decorated = _decorate_media_asset_row(dict(row))
+        if decorated is None:
+            continue
+        decorated["storage_bucket"] = _canonical_storage_bucket_for_access(decorated)
+        assets[str(decorated["id"])] = decorated
+    return assets
+
+
 async def media_processing_queue_supported() -> bool:
     global _media_processing_queue_supported_cache
     if _media_processing_queue_supported_cache is None:
@@ -782,11 +821,13 @@ async def fetch_and_lock_pending_media_assets(
     *,
     limit: int,
     max_attempts: int,
+    media_types: Sequence[str] | None = None,
 ) -> list[dict[str, Any]]:
     if not await media_processing_queue_supported():
         return []
     bounded_limit = _transcode_worker_limit(limit)
     bounded_attempts = max(1, int(max_attempts))
+    media_type_filter = list(media_types) if media_types is not None else None
     locked_rows: list[dict[str, Any]] = []
 
     async with pool.connection() as conn:  # type: ignore
@@ -822,11 +863,15 @@ async def fetch_and_lock_pending_media_assets(
                   and coalesce(processing_attempts, 0) < %s::integer
                   and processing_locked_at is null
                   and coalesce(next_retry_at, now()) <= now()
+                  and (
+                    %s::text[] is null
+                    or media_type::text = any(%s::text[])
+                  )
                 order by coalesce(next_retry_at, created_at, updated_at, now()) asc, id asc
                 limit %s::integer
                 for update skip locked
                 """,
-                (bounded_attempts, bounded_limit),
+                (bounded_attempts, media_type_filter, media_type_filter, bounded_limit),
             )
             candidates = [dict(row) for row in await cur.fetchall()]
 
@@ -7,6 +7,7 @@ from uuid import uuid4
 from psycopg.rows import dict_row
 
 from ..db import get_conn, pool
+from .auth_identity import invalidate_auth_identity
 
 MembershipRow = dict[str, Any]
 _UNSET = object()
@@ -150,12 +151,16 @@ async def upsert_membership_record(
         return _normalize_membership_row(row) or {}
 
     if conn is not None:
+        # The caller owns the transaction and must invalidate the cached
+        # identity once it commits; dropping it here would let a concurrent
+        # read re-cache the pre-commit membership.
         return await _execute(conn)
 
     async with pool.connection() as conn:  # type: ignore[attr-defined]
         membership = await _execute(conn)
         await conn.commit()
-        return membership
+    invalidate_auth_identity(user_id)
+    return membership
 
 
 def _resolve_explicit(explicit: Any, fallback: Any) -> Any:
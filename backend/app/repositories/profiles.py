@@ -6,6 +6,7 @@ from uuid import UUID
 from psycopg.rows import dict_row
 
 from ..db import get_conn, pool
+from .auth_identity import invalidate_auth_identity
 
 
 def _hydrate_profile_projection(row: dict[str, Any]) -> dict[str, Any]:
@@ -70,6 +71,7 @@ async def update_profile(
             await cur.execute(query, params)
             row = await cur.fetchone()
             await conn.commit()
+    invalidate_auth_identity(user_id)
     if row is None:
         return None
     return await get_profile(user_id)
@@ -92,6 +94,7 @@ async def update_avatar_media_projection(
             await cur.execute(query, (str(avatar_media_id), str(user_id)))
             row = await cur.fetchone()
             await conn.commit()
+    invalidate_auth_identity(user_id)
     if row is None:
         return None
     return await get_profile(user_id)
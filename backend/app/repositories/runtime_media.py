@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
 
 from psycopg.rows import dict_row
 
-from ..db import get_conn
+from ..db import execute_hot, get_conn
 
 
 _RUNTIME_MEDIA_COLUMNS = """
@@ -75,7 +75,7 @@ async def get_course_cover_runtime_media(
     """
 
     async def _execute(cur: Any) -> dict[str, Any] | None:
-        await cur.execute(query, (course_id, media_asset_id))
+        await execute_hot(cur, query, (course_id, media_asset_id))
         row = await cur.fetchone()
         return dict(row) if row else None
 
@@ -87,6 +87,51 @@ async def get_course_cover_runtime_media(
         return await _execute(cur)
 
 
+async def list_course_cover_runtime_media(
+    *,
+    course_media_pairs: Sequence[tuple[str, str]],
+    conn: Any | None = None,
+) -> dict[tuple[str, str], dict[str, Any]]:
+    pairs = list(dict.fromkeys(course_media_pairs))
+    if not pairs:
+        return {}
+
+    query = f"""
+        select distinct on (rm.course_id, rm.media_asset_id)
+          {_RUNTIME_MEDIA_COLUMNS}
+        from unnest(%s::uuid[], %s::uuid[])
+          as requested(course_id, media_asset_id)
+        join app.runtime_media as rm
+          on rm.course_id = requested.course_id
+         and rm.media_asset_id = requested.media_asset_id
+        join app.media_assets as ma
+          on ma.id = rm.media_asset_id
+        where ma.purpose = 'course_cover'::app.media_purpose
+          and rm.lesson_media_id is null
+          and rm.lesson_id is null
+        order by rm.course_id, rm.media_asset_id
+    """
+    params = (
+        [course_id for course_id, _ in pairs],
+        [media_asset_id for _, media_asset_id in pairs],
+    )
+
+    async def _execute(cur: Any) -> dict[tuple[str, str], dict[str, Any]]:
+        await cur.execute(query, params)
+        rows = await cur.fetchall()
+        return {
+            (str(row["course_id"]), str(row["media_asset_id"])): dict(row)
+            for row in rows
+        }
+
+    if conn is not None:
+        async with conn.cursor(row_factory=dict_row) as cur:  # type: ignore[attr-defined]
+            return await _execute(cur)
+
+    async with get_conn() as cur:
+        return await _execute(cur)
+
+
 async def get_home_player_runtime_media(
     *,
     media_asset_id: str,
@@ -141,7 +186,8 @@ async def get_lesson_runtime_media(
     media_asset_id: str,
 ) -> dict[str, Any] | None:
     async with get_conn() as cur:
-        await cur.execute(
+        await execute_hot(
+            cur,
             f"""
             select
               {_RUNTIME_MEDIA_COLUMNS}
@@ -167,7 +213,8 @@ async def list_runtime_media_for_lesson(
 ) -> list[dict[str, Any]]:
     capped_limit = max(1, min(int(limit or 100), 200))
     async with get_conn() as cur:
-        await cur.execute(
+        await execute_hot(
+            cur,
             f"""
             select
               {_RUNTIME_MEDIA_COLUMNS}
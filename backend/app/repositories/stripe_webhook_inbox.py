@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Mapping
+
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb
+
+from ..db import pool
+
+
+async def enqueue_event(
+    *,
+    event_id: str,
+    event_type: str,
+    ordering_key: str,
+    payload: Mapping[str, Any],
+    event_created_at: datetime | None,
+) -> bool:
+    """Store a verified event; return False when it is already in the inbox."""
+
+    async with pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            await cur.execute(
+                """
+                insert into app.stripe_webhook_inbox (
+                    event_id,
+                    event_type,
+                    ordering_key,
+                    payload,
+                    event_created_at
+                )
+                values (%s, %s, %s, %s, %s)
+                on conflict (event_id) do nothing
+                returning event_id
+                """,
+                (
+                    event_id,
+                    event_type,
+                    ordering_key,
+                    Jsonb(dict(payload)),
+                    event_created_at,
+                ),
+            )
+            row = await cur.fetchone()
+        await conn.commit()
+    return row is not None
+
+
+async def claim_due_events(*, limit: int, lease_seconds: int) -> list[dict[str, Any]]:
+    """Lease the oldest pending event of each ordering key that is due.
+
+    Later events for a key stay queued until its head succeeds or is dead, so
+    events for one order or customer are applied in order while different keys
+    run concurrently.
+    """
+
+    async with pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor(row_factory=dict_row) as cur:  # type: ignore[attr-defined]
+            await cur.execute(
+                """
+                with heads as (
+                  select distinct on (i.ordering_key) i.event_id
+                    from app.stripe_webhook_inbox as i
+                   where i.status = 'pending'
+                   order by i.ordering_key,
+                            i.event_created_at asc nulls last,
+                            i.received_at asc,
+                            i.event_id asc
+                ),
+                claimable as (
+                  select i.event_id
+                    from app.stripe_webhook_inbox as i
+                    join heads on heads.event_id = i.event_id
+                   where i.next_attempt_at <= clock_timestamp()
+                     and (
+                       i.leased_until is null
+                       or i.leased_until < clock_timestamp()
+                     )
+                   order by i.next_attempt_at asc, i.received_at asc
+                   limit %s
+                   for update of i skip locked
+                )
+                update app.stripe_webhook_inbox as i
+                   set leased_until = clock_timestamp() + make_interval(secs => %s),
+                       attempts = i.attempts + 1
+                  from claimable
+                 where i.event_id = claimable.event_id
+                returning i.event_id,
+                          i.event_type,
+                          i.ordering_key,
+                          i.payload,
+                          i.attempts
+                """,
+                (max(1, int(limit)), max(1, int(lease_seconds))),
+            )
+            rows = [dict(row) for row in await cur.fetchall()]
+        await conn.commit()
+    return rows
+
+
+async def mark_event_succeeded(event_id: str) -> None:
+    async with pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            await cur.execute(
+                """
+                update app.stripe_webhook_inbox
+                   set status = 'succeeded',
+                       processed_at = clock_timestamp(),
+                       leased_until = null,
+                       last_error = null
+                 where event_id = %s
+                   and status = 'pending'
+                """,
+                (event_id,),
+            )
+        await conn.commit()
+
+
+async def mark_event_failed(
+    event_id: str,
+    *,
+    error: str,
+    retry_in_seconds: float | None,
+) -> None:
+    """Schedule a retry, or mark the event dead when ``retry_in_seconds`` is None."""
+
+    async with pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            if retry_in_seconds is None:
+                await cur.execute(
+                    """
+                    update app.stripe_webhook_inbox
+                       set status = 'dead',
+                           processed_at = clock_timestamp(),
+                           leased_until = null,
+                           last_error = %s
+                     where event_id = %s
+                       and status = 'pending'
+                    """,
+                    (error[:1000], event_id),
+                )
+            else:
+                await cur.execute(
+                    """
+                    update app.stripe_webhook_inbox
+                       set next_attempt_at = clock_timestamp()
+                                             + make_interval(secs => %s),
+                           leased_until = null,
+                           last_error = %s
+                     where event_id = %s
+                       and status = 'pending'
+                    """,
+                    (max(0.0, float(retry_in_seconds)), error[:1000], event_id),
+                )
+        await conn.commit()
+
+
+async def count_pending_events() -> int:
+    async with pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            await cur.execute(
+                "select count(*) from app.stripe_webhook_inbox where status = 'pending'"
+            )
+            row = await cur.fetchone()
+    return int(row[0]) if row else 0
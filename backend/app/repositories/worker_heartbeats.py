@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Sequence
+
+from psycopg.rows import dict_row
+
+from ..db import pool
+
+
+async def upsert_heartbeat(
+    *,
+    worker_id: str,
+    hostname: str,
+    pid: int,
+    process_index: int,
+    jobs: Sequence[str],
+    started_at: datetime,
+    prune_after_seconds: int,
+) -> None:
+    """Refresh this process's heartbeat and drop rows of long-dead processes."""
+
+    async with pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            await cur.execute(
+                """
+                insert into app.worker_heartbeats (
+                    worker_id,
+                    hostname,
+                    pid,
+                    process_index,
+                    jobs,
+                    started_at,
+                    heartbeat_at
+                )
+                values (%s, %s, %s, %s, %s, %s, clock_timestamp())
+                on conflict (worker_id) do update
+                   set jobs = excluded.jobs,
+                       heartbeat_at = excluded.heartbeat_at
+                """,
+                (worker_id, hostname, pid, process_index, list(jobs), started_at),
+            )
+            await cur.execute(
+                """
+                delete from app.worker_heartbeats
+                 where heartbeat_at < clock_timestamp() - make_interval(secs => %s)
+                """,
+                (max(1, int(prune_after_seconds)),),
+            )
+        await conn.commit()
+
+
+async def delete_heartbeat(worker_id: str) -> None:
+    async with pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            await cur.execute(
+                "delete from app.worker_heartbeats where worker_id = %s",
+                (worker_id,),
+            )
+        await conn.commit()
+
+
+async def list_heartbeats(*, stale_after_seconds: int) -> list[dict[str, Any]]:
+    async with pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor(row_factory=dict_row) as cur:  # type: ignore[attr-defined]
+            await cur.execute(
+                """
+                select worker_id,
+                       hostname,
+                       pid,
+                       process_index,
+                       jobs,
+                       started_at,
+                       heartbeat_at,
+                       heartbeat_at
+                         >= clock_timestamp() - make_interval(secs => %s) as alive
+                  from app.worker_heartbeats
+                 order by hostname asc, process_index asc, started_at asc
+                """,
+                (max(1, int(stale_after_seconds)),),
+            )
+            return [dict(row) for row in await cur.fetchall()]
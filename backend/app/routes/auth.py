@@ -19,6 +19,7 @@ from ..auth import (
     is_token_expired,
 )
 from ..db import pool
+from ..repositories import auth_identity as auth_identity_repo
 from ..repositories import auth_subjects as auth_subjects_repo
 from .. import models, schemas
 from ..services.email_verification import (
@@ -172,7 +173,8 @@ async def _complete_onboarding_at_canonical_route(user_id: str) -> dict[str, Any
             )
             row = await cur.fetchone()
             await conn.commit()
-            return dict(row) if row else None
+    auth_identity_repo.invalidate_auth_identity(user_id)
+    return dict(row) if row else None
 
 
 @router.post(
@@ -1,7 +1,7 @@
 from typing import Any, Mapping
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Header, HTTPException, Query, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
@@ -75,9 +75,13 @@ def _course_list_item_response(course: Mapping[str, Any]) -> schemas.CourseListI
 
 def _course_list_response(
     rows: list[Mapping[str, Any]] | tuple[Mapping[str, Any], ...],
+    *,
+    limit: int | None = None,
 ) -> schemas.CourseListResponse:
+    items = [_course_list_item_response(row) for row in rows]
     return schemas.CourseListResponse(
-        items=[_course_list_item_response(row) for row in rows]
+        items=items,
+        next_cursor=courses_service.next_course_list_cursor(rows, limit=limit),
     )
 
 
@@ -108,7 +112,10 @@ def _course_access_response(payload: dict) -> schemas.CourseAccessStateResponse:
     )
 
 
-def _cta_text_response(response: Any) -> JSONResponse:
+def _cta_text_response(
+    response: Any,
+    known_text_bundle_hashes: object = None,
+) -> JSONResponse:
     return JSONResponse(
         content=jsonable_encoder(
             text_catalog_service.attach_text_bundles(
@@ -118,6 +125,9 @@ def _cta_text_response(response: Any) -> JSONResponse:
                     text_catalog_service.COURSE_LESSON_CHROME_BUNDLE_ID,
                 ],
                 text_catalog_service.DEFAULT_LOCALE,
+                known_hashes=text_catalog_service.parse_known_bundle_hashes(
+                    known_text_bundle_hashes
+                ),
             )
         )
     )
@@ -127,11 +137,16 @@ def _cta_text_response(response: Any) -> JSONResponse:
 async def list_courses(
     search: str | None = Query(default=None, min_length=2),
     limit: int | None = Query(default=None, ge=1, le=100),
+    cursor: str | None = Query(default=None, min_length=1, max_length=512),
 ):
-    rows = await courses_service.list_public_courses(search=search, limit=limit)
+    rows = await courses_service.list_public_courses(
+        search=search,
+        limit=limit,
+        cursor=cursor,
+    )
     normalized_rows = list(rows)
     await courses_service.attach_course_cover_read_contract(normalized_rows)
-    return _course_list_response(normalized_rows)
+    return _course_list_response(normalized_rows, limit=limit)
 
 
 router.add_api_route("/", list_courses, methods=["GET"], include_in_schema=False)
@@ -170,6 +185,10 @@ async def lesson_detail(
     lesson_id: str,
     current: AppEntryUser,
     preview: bool = False,
+    known_text_bundle_hashes: str | None = Header(
+        default=None,
+        alias=text_catalog_service.TEXT_BUNDLE_HASHES_HEADER,
+    ),
 ):
     user_id = str((current or {}).get("id") or "")
     try:
@@ -191,7 +210,7 @@ async def lesson_detail(
 
     if response is None:
         raise HTTPException(status_code=404, detail=_LESSON_NOT_FOUND_DETAIL)
-    return _cta_text_response(response)
+    return _cta_text_response(response, known_text_bundle_hashes)
 
 
 @router.post(
@@ -324,6 +343,10 @@ async def course_detail_by_slug(slug: str, current: OptionalCurrentUser = None):
 async def course_entry_view(
     course_id_or_slug: str,
     current: OptionalCurrentUser = None,
+    known_text_bundle_hashes: str | None = Header(
+        default=None,
+        alias=text_catalog_service.TEXT_BUNDLE_HASHES_HEADER,
+    ),
 ):
     response = await courses_service.read_course_entry_view_surface(
         course_id_or_slug,
@@ -331,7 +354,7 @@ async def course_entry_view(
     )
     if response is None:
         raise HTTPException(status_code=404, detail=_COURSE_NOT_FOUND_DETAIL)
-    return _cta_text_response(response)
+    return _cta_text_response(response, known_text_bundle_hashes)
 
 
 @router.get("/{course_id}/public", response_model=schemas.CoursePublicContent)
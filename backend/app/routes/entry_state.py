@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException, status
 
 from .. import schemas
 from ..auth import CurrentUser, _validated_onboarding_state
+from ..repositories import auth_identity as auth_identity_repo
 from ..repositories import memberships as memberships_repo
 from ..utils.membership_status import is_membership_row_active
 
@@ -15,7 +16,11 @@ router = APIRouter(tags=["entry-state"])
 async def build_entry_state(
     current: Mapping[str, Any],
 ) -> schemas.EntryStateResponse:
-    membership = await memberships_repo.get_membership(str(current["id"]))
+    identity = auth_identity_repo.cached_auth_identity(str(current["id"]))
+    if identity is not None:
+        membership = identity["membership"]
+    else:
+        membership = await memberships_repo.get_membership(str(current["id"]))
     onboarding_state = _validated_onboarding_state(current.get("onboarding_state"))
     if onboarding_state is None:
         raise HTTPException(
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 
 from .. import schemas
 from ..auth import AppEntryUser
 from ..services import home_audio_service
 from ..services import home_entry_view_service
 from ..services import studio_home_player_text_catalog
+from ..services import text_catalog_service
 
 router = APIRouter(prefix="/home", tags=["home"])
 
@@ -24,6 +25,8 @@ async def home_entry_view(
     response_model=schemas.HomeAudioFeedResponse,
 )
 async def home_audio_feed(
+    request: Request,
+    response: Response,
     current: AppEntryUser,
     limit: int = Query(default=12, ge=1, le=50),
 ):
@@ -31,14 +34,16 @@ async def home_audio_feed(
         str(current["id"]),
         limit=limit,
     )
-    text_bundle = studio_home_player_text_catalog.build_home_audio_runtime_text_bundle()
+    text_bundle = studio_home_player_text_catalog.HOME_AUDIO_RUNTIME_TEXT_BUNDLE
+    response.headers[text_catalog_service.TEXT_BUNDLE_HASHES_HEADER] = text_bundle.hash
     return schemas.HomeAudioFeedResponse(
         items=[schemas.HomeAudioItem(**item) for item in items],
         homeplayer_logo=schemas.HomePlayerLogoSet(
             **home_audio_service.build_homeplayer_logo_payload()
         ),
-        text_bundle={
-            text_id: schemas.HomePlayerCatalogTextValue(**entry)
-            for text_id, entry in text_bundle.items()
-        },
+        text_bundle=text_bundle.response_text_bundle(
+            text_catalog_service.parse_known_bundle_hashes(
+                request.headers.get(text_catalog_service.TEXT_BUNDLE_HASHES_HEADER)
+            )
+        ),
     )
@@ -1,19 +1,23 @@
 from __future__ import annotations
 
+from email.utils import formatdate, parsedate_to_datetime
 import logging
 import mimetypes
+import os
 from pathlib import Path
 import re
 from urllib.parse import urlparse
 
 import httpx
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from starlette.background import BackgroundTask
 
+from .. import metrics
 from ..config import settings
 from ..repositories import media_resolution_failures
 from ..repositories import storage_objects
+from ..services import media_resolver
 from ..services import storage_service
 from ..utils.http_headers import build_content_disposition
 from ..utils import media_robustness
@@ -23,6 +27,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/media", tags=["media"])
 
+# This router is not mounted by app.main. Lesson media reaches clients through
+# signed storage URLs, so the streaming helpers below only serve callers that
+# import them directly.
+
 
 _KNOWN_BUCKET_PREFIXES = {
     "course-media",
@@ -190,6 +198,53 @@ def _resolve_streaming_content_type(row: dict, storage_path: str | None) -> str:
     return "application/octet-stream"
 
 
+class _LocalMediaFileResponse(FileResponse):
+    """Local media response backed by Starlette's FileResponse.
+
+    Full bodies use the server's pathsend (sendfile) extension when offered;
+    range and If-Range handling reuse Starlette's single/multipart support.
+    """
+
+    chunk_size = 1024 * 1024
+
+
+def _local_media_etag(row: dict, stat_result: os.stat_result) -> str:
+    content_hash = str(row.get("content_hash") or "").strip().lower()
+    if content_hash and re.fullmatch(r"[0-9a-f]{16,128}", content_hash):
+        algorithm = str(row.get("content_hash_algorithm") or "sha256").strip().lower()
+        return f'"{algorithm}-{content_hash}"'
+    return f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison function (RFC 9110 section 13.1.2).
+    if if_none_match.strip() == "*":
+        return True
+    normalized = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        if candidate.strip().removeprefix("W/") == normalized:
+            return True
+    return False
+
+
+def _is_not_modified(request: Request, *, etag: str, modified_at: int) -> bool:
+    if request.method not in {"GET", "HEAD"}:
+        return False
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return modified_at <= int(since.timestamp())
+
+
 async def _augment_failure_details_with_invariant(
     *,
     row: dict,
@@ -267,7 +322,7 @@ async def _build_streaming_response(
     *,
     lesson_media_id: str | None = None,
     mode: str | None = None,
-) -> StreamingResponse:
+) -> Response:
     kind = str(row.get("kind") or "").strip().lower()
     storage_path = row.get("storage_path")
     if not storage_path:
@@ -355,7 +410,8 @@ async def _build_streaming_response(
                 if not candidate_client.enabled:
                     continue
                 try:
-                    presigned = await candidate_client.get_presigned_url(
+                    presigned = await media_resolver.get_presigned_url(
+                        candidate_bucket,
                         candidate_key,
                         ttl=ttl_seconds,
                         filename=filename,
@@ -441,16 +497,18 @@ async def _build_streaming_response(
             bucket,
             storage_path,
         )
-        client = httpx.AsyncClient(
+        client_ctx = storage_service.storage_http_client("proxy")
+        client = await client_ctx.__aenter__()
+        upstream_ctx = client.stream(
+            "GET",
+            presigned.url,
+            headers=request_headers,
             follow_redirects=True,
-            timeout=storage_service.storage_http_timeout(),
-            limits=storage_service.storage_http_limits(),
         )
-        upstream_ctx = client.stream("GET", presigned.url, headers=request_headers)
         try:
             upstream = await upstream_ctx.__aenter__()
         except httpx.HTTPError as exc:
-            await client.aclose()
+            await client_ctx.__aexit__(None, None, None)
             logger.warning(
                 "Storage proxy request failed: media_id=%s storage_bucket=%s storage_path=%s error=%s",
                 row.get("id"),
@@ -481,7 +539,7 @@ async def _build_streaming_response(
         if upstream.status_code >= 400:
             status_code = upstream.status_code
             await upstream_ctx.__aexit__(None, None, None)
-            await client.aclose()
+            await client_ctx.__aexit__(None, None, None)
             logger.warning(
                 "Storage proxy returned error: media_id=%s status=%s storage_bucket=%s storage_path=%s",
                 row.get("id"),
@@ -553,11 +611,12 @@ async def _build_streaming_response(
 
         async def _cleanup() -> None:
             await upstream_ctx.__aexit__(None, None, None)
-            await client.aclose()
+            await client_ctx.__aexit__(None, None, None)
 
         async def _stream_upstream():
             try:
                 async for chunk in upstream.aiter_bytes():
+                    metrics.media_storage_proxied_bytes_total.inc(len(chunk))
                     yield chunk
             except httpx.HTTPError as exc:
                 logger.warning(
@@ -579,35 +638,17 @@ async def _build_streaming_response(
             background=BackgroundTask(_cleanup),
         )
 
-    file_size = file_path.stat().st_size
+    stat_result = file_path.stat()
     content_type = _resolve_streaming_content_type(row, str(storage_path))
     lower_content_type = str(content_type).strip().lower()
     document_response = kind in {"document", "pdf"} or lower_content_type.startswith(
         "application/pdf"
     )
-    range_header = request.headers.get("range")
-
-    def file_iterator(
-        start: int = 0, end: int | None = None, chunk_size: int = 64 * 1024
-    ):
-        with file_path.open("rb") as stream:
-            stream.seek(start)
-            remaining = None if end is None else end - start + 1
-            while True:
-                read_size = (
-                    chunk_size if remaining is None else min(chunk_size, remaining)
-                )
-                data = stream.read(read_size)
-                if not data:
-                    break
-                yield data
-                if remaining is not None:
-                    remaining -= len(data)
-                    if remaining <= 0:
-                        break
 
     headers = {
         "Accept-Ranges": "bytes",
+        "ETag": _local_media_etag(row, stat_result),
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
     }
     headers.update(_cors_response_headers(request))
     filename = row.get("original_name") or Path(storage_path).name
@@ -616,44 +657,21 @@ async def _build_streaming_response(
         headers["Cache-Control"] = f"private, max-age={cache_seconds}"
     else:
         headers["Cache-Control"] = "no-store"
+
+    if _is_not_modified(
+        request,
+        etag=headers["ETag"],
+        modified_at=int(stat_result.st_mtime),
+    ):
+        return Response(status_code=304, headers=headers)
+
     headers["Content-Disposition"] = build_content_disposition(
         filename,
         disposition="attachment" if document_response else "inline",
     )
-
-    if range_header and range_header.startswith("bytes="):
-        try:
-            range_value = range_header.replace("bytes=", "")
-            start_str, end_str = (range_value.split("-", 1) + [""])[:2]
-            start = int(start_str) if start_str else 0
-            end = int(end_str) if end_str else file_size - 1
-        except ValueError:
-            raise HTTPException(
-                status_code=416, detail="Invalid range header"
-            ) from None
-
-        start = max(0, start)
-        end = min(file_size - 1, end)
-        if start > end:
-            raise HTTPException(status_code=416, detail="Invalid range header")
-
-        content_length = end - start + 1
-        headers.update(
-            {
-                "Content-Range": f"bytes {start}-{end}/{file_size}",
-                "Content-Length": str(content_length),
-            }
-        )
-        return StreamingResponse(
-            file_iterator(start, end),
-            status_code=206,
-            media_type=content_type,
-            headers=headers,
-        )
-
-    headers["Content-Length"] = str(file_size)
-    return StreamingResponse(
-        file_iterator(),
+    return _LocalMediaFileResponse(
+        file_path,
         media_type=content_type,
         headers=headers,
+        stat_result=stat_result,
     )
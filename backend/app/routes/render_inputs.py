@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Header, HTTPException, status
 
 from .. import schemas
 from ..services import app_render_inputs_service, storage_service, text_catalog_service
@@ -10,7 +10,12 @@ router = APIRouter(prefix="/app", tags=["app"])
     "/render-inputs",
     response_model=schemas.AppRenderInputsResponse,
 )
-def app_render_inputs():
+def app_render_inputs(
+    known_text_bundle_hashes: str | None = Header(
+        default=None,
+        alias=text_catalog_service.TEXT_BUNDLE_HASHES_HEADER,
+    ),
+):
     try:
         payload = app_render_inputs_service.build_app_render_inputs_payload()
     except storage_service.StorageServiceError:
@@ -22,5 +27,8 @@ def app_render_inputs():
         payload,
         [text_catalog_service.GLOBAL_SYSTEM_NAVIGATION_BUNDLE_ID],
         text_catalog_service.DEFAULT_LOCALE,
+        known_hashes=text_catalog_service.parse_known_bundle_hashes(
+            known_text_bundle_hashes
+        ),
     )
     return schemas.AppRenderInputsResponse(**payload)
@@ -9,6 +9,7 @@ import stripe
 from fastapi import APIRouter, HTTPException, Request, status
 from psycopg.rows import dict_row
 
+from ..config import settings
 from ..db import pool
 from ..repositories import membership_support as membership_support_repo
 from ..repositories import orders as orders_repo
@@ -18,6 +19,7 @@ from ..services import (
     notification_service,
     stripe_webhook_bundle_service,
     stripe_webhook_course_service,
+    stripe_webhook_inbox_worker,
     stripe_webhook_membership_service,
     stripe_webhook_support_service,
 )
@@ -38,6 +40,10 @@ class CheckoutOrderValidationError(RuntimeError):
     pass
 
 
+class StripeEventInProgressError(RuntimeError):
+    pass
+
+
 def _sentry_enabled() -> bool:
     return sentry_sdk.Hub.current.client is not None
 
@@ -111,10 +117,12 @@ async def stripe_payment_element_webhook(request: Request):
         )
 
     try:
-        event = stripe.Webhook.construct_event(
-            payload=payload.decode("utf-8"),
-            sig_header=signature,
-            secret=secret,
+        event = _event_payload(
+            stripe.Webhook.construct_event(
+                payload=payload.decode("utf-8"),
+                sig_header=signature,
+                secret=secret,
+            )
         )
     except ValueError as exc:
         logger.warning("Invalid Stripe payload: %s", exc)
@@ -141,6 +149,90 @@ async def stripe_payment_element_webhook(request: Request):
             status_code=status.HTTP_400_BAD_REQUEST, detail="Ogiltig signatur"
         ) from exc
 
+    event_type = event.get("type")
+    event_id = event.get("id")
+
+    if settings.stripe_webhook_inbox_enabled and isinstance(event_id, str) and event_id:
+        try:
+            await stripe_webhook_inbox_worker.enqueue_verified_event(_event_payload(event))
+        except Exception as exc:
+            _capture_exception(
+                str(event_type) if event_type else None,
+                event_id,
+                exc,
+            )
+            logger.exception("Stripe webhook inbox write failed: %s", exc)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Webhook-bearbetningen misslyckades",
+            ) from exc
+        return {"status": "ok"}
+
+    try:
+        processed = await process_verified_event(event)
+    except StripeEventInProgressError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Webhook-bearbetning pågår",
+        ) from exc
+    except stripe_webhook_bundle_service.BundleFulfillmentError as exc:
+        _capture_exception(
+            str(event_type) if event_type else None,
+            str(event_id) if event_id else None,
+            exc,
+        )
+        logger.exception("Stripe bundle webhook fulfillment failed: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(exc),
+        ) from exc
+    except (CheckoutOrderResolutionError, CheckoutOrderValidationError) as exc:
+        _capture_exception(
+            str(event_type) if event_type else None,
+            str(event_id) if event_id else None,
+            exc,
+        )
+        logger.warning("Stripe checkout webhook validation failed: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+    except HTTPException:
+        raise
+    except Exception as exc:  # pragma: no cover - defensive logging
+        _capture_exception(
+            str(event_type) if event_type else None,
+            str(event_id) if event_id else None,
+            exc,
+        )
+        logger.exception("Stripe webhook processing failed: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Webhook-bearbetningen misslyckades",
+        ) from exc
+
+    if not processed:
+        return {"status": "ok"}
+
+    _capture_message(
+        status="success",
+        event_type=str(event_type) if event_type else None,
+        event_id=str(event_id) if event_id else None,
+        message="Stripe webhook processed",
+        level="info",
+    )
+
+    return {"status": "ok"}
+
+
+async def process_verified_event(event: Mapping[str, Any]) -> bool:
+    """Apply a signature-verified Stripe event exactly once.
+
+    Used inline by the webhook route and by the inbox worker. Returns False
+    when the event was already completed and only its side effects were
+    re-checked.
+    """
+
     event_type = event.get("type")
     event_id = event.get("id")
     data_object = event.get("data", {}).get("object", {})
@@ -159,7 +251,7 @@ async def stripe_payment_element_webhook(request: Request):
                         "Skipping completed Stripe event %s after confirming course checkout side effects",
                         event_id,
                     )
-                    return {"status": "ok"}
+                    return False
                 membership_effect_checked = (
                     await stripe_webhook_membership_service.ensure_completed_event_effect_applied(
                         event
@@ -172,13 +264,10 @@ async def stripe_payment_element_webhook(request: Request):
                     )
                 else:
                     logger.info("Skipping completed Stripe event %s", event_id)
-                return {"status": "ok"}
+                return False
             if event_claim.processing:
                 logger.info("Stripe event %s is already being processed", event_id)
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail="Webhook-bearbetning pågår",
-                )
+                raise StripeEventInProgressError(event_id)
 
         if event_type == "payment_intent.succeeded":
             await stripe_webhook_support_service.handle_payment_intent_succeeded(
@@ -227,54 +316,11 @@ async def stripe_payment_element_webhook(request: Request):
                 event_claim,
                 dict(event),
             )
-    except stripe_webhook_bundle_service.BundleFulfillmentError as exc:
-        _capture_exception(
-            str(event_type) if event_type else None,
-            str(event_id) if event_id else None,
-            exc,
-        )
-        logger.exception("Stripe bundle webhook fulfillment failed: %s", exc)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(exc),
-        ) from exc
-    except (CheckoutOrderResolutionError, CheckoutOrderValidationError) as exc:
-        _capture_exception(
-            str(event_type) if event_type else None,
-            str(event_id) if event_id else None,
-            exc,
-        )
-        logger.warning("Stripe checkout webhook validation failed: %s", exc)
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc),
-        ) from exc
-    except HTTPException:
-        raise
-    except Exception as exc:  # pragma: no cover - defensive logging
-        _capture_exception(
-            str(event_type) if event_type else None,
-            str(event_id) if event_id else None,
-            exc,
-        )
-        logger.exception("Stripe webhook processing failed: %s", exc)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Webhook-bearbetningen misslyckades",
-        ) from exc
     finally:
         if event_claim is not None:
             await event_claim.release()
 
-    _capture_message(
-        status="success",
-        event_type=str(event_type) if event_type else None,
-        event_id=str(event_id) if event_id else None,
-        message="Stripe webhook processed",
-        level="info",
-    )
-
-    return {"status": "ok"}
+    return True
 
 
 async def _handle_checkout_session_completion(
@@ -376,6 +422,13 @@ async def _resolve_checkout_order(
     return order
 
 
+def _event_payload(event: Mapping[str, Any]) -> dict[str, Any]:
+    to_dict = getattr(event, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    return dict(event)
+
+
 def _mapping(value: object) -> Mapping[str, Any]:
     return value if isinstance(value, Mapping) else {}
 
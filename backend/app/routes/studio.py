@@ -10,6 +10,7 @@ from fastapi import (
     File,
     Form,
     HTTPException,
+    Query,
     Request,
     Response,
     UploadFile,
@@ -39,8 +40,8 @@ from ..services import (
 )
 from ..services import media_cleanup
 from ..services import studio_home_player_text_catalog
+from ..services import text_catalog_service
 from ..utils.profile_media import profile_media_item_from_row
-from .media import _build_streaming_response
 from . import upload as upload_routes
 
 router = APIRouter(prefix="/studio", tags=["studio"])
@@ -619,9 +620,13 @@ def _studio_course_detail_response(
 
 def _studio_course_list_response(
     rows: list[dict[str, Any]],
+    *,
+    limit: int | None = None,
 ) -> schemas.StudioCourseListResponse:
+    items = [_studio_course_summary_response(row) for row in rows]
     return schemas.StudioCourseListResponse(
-        items=[_studio_course_summary_response(row) for row in rows]
+        items=items,
+        next_cursor=courses_service.next_course_list_cursor(rows, limit=limit),
     )
 
 
@@ -1886,11 +1891,16 @@ async def studio_delete_profile_media(item_id: UUID, current: TeacherEntryUser):
     "/home-player/library",
     response_model=schemas.HomePlayerLibraryResponse,
 )
-async def studio_home_player_library(current: TeacherEntryUser):
+async def studio_home_player_library(
+    request: Request,
+    response: Response,
+    current: TeacherEntryUser,
+):
     payload = await studio_home_player_library_repo.get_home_player_library(
         teacher_id=str(current["id"]),
     )
-    text_bundle = studio_home_player_text_catalog.build_studio_home_player_text_bundle()
+    text_bundle = studio_home_player_text_catalog.STUDIO_HOME_PLAYER_TEXT_BUNDLE
+    response.headers[text_catalog_service.TEXT_BUNDLE_HASHES_HEADER] = text_bundle.hash
     return schemas.HomePlayerLibraryResponse(
         uploads=[
             schemas.HomePlayerLibraryUploadItem(**item) for item in payload["uploads"]
@@ -1903,10 +1913,11 @@ async def studio_home_player_library(current: TeacherEntryUser):
             schemas.HomePlayerLibraryCourseMediaItem(**item)
             for item in payload["course_media"]
         ],
-        text_bundle={
-            text_id: schemas.HomePlayerCatalogTextValue(**entry)
-            for text_id, entry in text_bundle.items()
-        },
+        text_bundle=text_bundle.response_text_bundle(
+            text_catalog_service.parse_known_bundle_hashes(
+                request.headers.get(text_catalog_service.TEXT_BUNDLE_HASHES_HEADER)
+            )
+        ),
     )
 
 
@@ -2187,11 +2198,21 @@ async def studio_reserve_recording(
 
 
 @course_lesson_router.get("/courses", response_model=schemas.StudioCourseListResponse)
-async def studio_courses(current: TeacherEntryUser):
+async def studio_courses(
+    current: TeacherEntryUser,
+    search: str | None = Query(default=None, min_length=2),
+    limit: int | None = Query(default=None, ge=1, le=100),
+    cursor: str | None = Query(default=None, min_length=1, max_length=512),
+):
     rows = list(
-        await courses_service.list_studio_courses(teacher_id=str(current["id"]))
+        await courses_service.list_studio_courses(
+            teacher_id=str(current["id"]),
+            search=search,
+            limit=limit,
+            cursor=cursor,
+        )
     )
-    return _studio_course_list_response(rows)
+    return _studio_course_list_response(rows, limit=limit)
 
 
 @course_lesson_router.get(
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
 import mimetypes
+import os
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, AsyncIterator, BinaryIO
 from urllib.parse import urljoin
 from uuid import uuid4
 
@@ -54,6 +56,8 @@ _LESSON_IMAGE_DEFAULT_EXTENSION_BY_CONTENT_TYPE = {
     "image/svg+xml": "svg",
 }
 _LEGACY_LESSON_UPLOAD_DISABLED_DETAIL = "Legacy lesson upload is disabled"
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+_INCOMING_UPLOADS_DIRNAME = ".incoming"
 
 
 class UploadMediaType(str, Enum):
@@ -69,6 +73,9 @@ legacy_router = APIRouter(prefix="/upload", tags=["upload"])
 
 # UWD-001 non-canonical write isolation: these upload routers are not mounted by
 # app.main and their write helpers remain legacy drift, not canonical media authority.
+# The chunked writers below (_stream_upload_to_path, _store_lesson_image) therefore
+# do not bound upload memory in the deployed app; lesson media uploads go straight
+# to storage through signed upload URLs.
 
 _ALLOWED_MEDIA_PREFIXES = {
     UploadMediaType.image: ("image/",),
@@ -86,6 +93,12 @@ class UploadWriteResult:
     checksum: str | None
 
 
+class _UploadTooLargeError(Exception):
+    def __init__(self, received_bytes: int) -> None:
+        super().__init__("upload exceeds max_bytes")
+        self.received_bytes = received_bytes
+
+
 def _raise_legacy_lesson_upload_disabled() -> None:
     raise HTTPException(
         status_code=status.HTTP_410_GONE,
@@ -255,42 +268,96 @@ async def _write_upload(
     safe_name = f"{uuid4().hex}{suffix}"
     destination_path = destination_dir / safe_name
 
-    payload = await file.read()
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="File payload is empty"
+    try:
+        size, checksum = await _stream_upload_to_path(
+            file,
+            destination_path,
+            max_bytes=max_bytes,
         )
-
-    size = len(payload)
-    if max_bytes is not None and size > max_bytes:
-        max_mb = max(1, max_bytes // (1024 * 1024))
+    except _UploadTooLargeError as exc:
+        max_mb = max(1, (max_bytes or 0) // (1024 * 1024))
         logger.warning(
             "Upload rejected due to size: filename=%s size=%s max=%s",
             file.filename,
-            size,
+            exc.received_bytes,
             max_bytes,
         )
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=f"File too large (max {max_mb} MB)",
-        )
+        ) from None
+
+    return UploadWriteResult(
+        filename=safe_name,
+        destination_path=destination_path,
+        size=size,
+        checksum=checksum,
+    )
+
+
+def _open_for_write(path: Path) -> BinaryIO:
+    return path.open("wb")
+
+
+def _write_upload_chunk(handle: BinaryIO, hasher: Any, chunk: bytes) -> None:
+    # hashlib releases the GIL for large buffers, so hashing and writing both
+    # stay off the event loop.
+    hasher.update(chunk)
+    handle.write(chunk)
+
 
+async def _stream_upload_to_path(
+    file: UploadFile,
+    destination_path: Path,
+    *,
+    max_bytes: int | None,
+) -> tuple[int, str]:
+    """Copy an upload to ``destination_path`` chunk by chunk.
+
+    Returns the byte size and sha256 hex digest. Enforces ``max_bytes`` as
+    bytes arrive, so oversize uploads stop at the first chunk past the limit.
+    The file only appears at ``destination_path`` once it is complete.
+    """
+
+    partial_path = destination_path.with_name(f"{destination_path.name}.part")
+    hasher = hashlib.sha256()
+    size = 0
     try:
-        destination_path.write_bytes(payload)
+        handle = await asyncio.to_thread(_open_for_write, partial_path)
+        try:
+            while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise _UploadTooLargeError(size)
+                await asyncio.to_thread(_write_upload_chunk, handle, hasher, chunk)
+        finally:
+            await asyncio.to_thread(handle.close)
+        if size == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File payload is empty",
+            )
+        await asyncio.to_thread(os.replace, partial_path, destination_path)
+    except (HTTPException, _UploadTooLargeError):
+        await asyncio.to_thread(partial_path.unlink, missing_ok=True)
+        raise
     except Exception:  # pragma: no cover - defensive logging
+        await asyncio.to_thread(partial_path.unlink, missing_ok=True)
         logger.exception("Failed to write uploaded file")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to persist file",
         ) from None
+    return size, hasher.hexdigest()
 
-    checksum = hashlib.sha256(payload).hexdigest() if payload else None
-    return UploadWriteResult(
-        filename=safe_name,
-        destination_path=destination_path,
-        size=size,
-        checksum=checksum,
-    )
+
+async def _iter_file_chunks(path: Path) -> AsyncIterator[bytes]:
+    handle = await asyncio.to_thread(path.open, "rb")
+    try:
+        while chunk := await asyncio.to_thread(handle.read, _UPLOAD_CHUNK_SIZE):
+            yield chunk
+    finally:
+        await asyncio.to_thread(handle.close)
 
 
 async def _persist_lesson_media(
@@ -523,64 +590,16 @@ async def upload_course_media(
     return response
 
 
-@router.post("/lesson-image")
-async def upload_lesson_image(
+async def _store_lesson_image(
     request: Request,
-    file: Annotated[UploadFile, File(description="Lesson image file")],
-    current: TeacherUser,
-    lesson_id: Annotated[str, Form()],
-    course_id: Annotated[str | None, Form()] = None,
-) -> dict[str, Any]:
-    _raise_legacy_lesson_upload_disabled()
-
-    owner = current["id"]
-    owner_id = str(owner)
-    lesson_id_str = str(lesson_id).strip()
-    if not lesson_id_str:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="lesson_id is required"
-        )
-
-    _, lesson_course_id = await courses_service.lesson_course_ids(lesson_id_str)
-    if not lesson_course_id or not await models.is_course_owner(
-        owner, lesson_course_id
-    ):
-        logger.warning(
-            "Permission denied: lesson image upload user_id=%s lesson_id=%s course_id=%s",
-            owner_id,
-            lesson_id_str,
-            lesson_course_id,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail="Not course owner"
-        )
-
-    if (
-        course_id
-        and str(course_id).strip()
-        and str(course_id).strip() != str(lesson_course_id)
-    ):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="course_id does not match lesson ownership",
-        )
-
-    content_type, extension = _normalize_lesson_image_upload(file)
-    payload = await file.read()
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="File payload is empty"
-        )
-
-    max_bytes = max(1, int(settings.media_upload_max_image_bytes))
-    size = len(payload)
-    if size > max_bytes:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail="File too large",
-        )
-
-    storage_key = f"lessons/{lesson_id_str}/images/{uuid4()}.{extension}"
+    incoming_path: Path,
+    *,
+    lesson_id: str,
+    extension: str,
+    content_type: str,
+    size: int,
+) -> str:
+    storage_key = f"lessons/{lesson_id}/images/{uuid4()}.{extension}"
     if storage_service.public_storage_service.enabled:
         try:
             upload = await storage_service.public_storage_service.create_upload_url(
@@ -591,7 +610,7 @@ async def upload_lesson_image(
             )
             logger.info(
                 "Supabase lesson image upload request started lesson_id=%s key=%s url=%s",
-                lesson_id_str,
+                lesson_id,
                 upload.path,
                 storage_service.redact_http_url(upload.url),
             )
@@ -602,8 +621,8 @@ async def upload_lesson_image(
                 try:
                     response = await client.put(
                         upload.url,
-                        headers=dict(upload.headers),
-                        content=payload,
+                        headers={**dict(upload.headers), "Content-Length": str(size)},
+                        content=_iter_file_chunks(incoming_path),
                     )
                 except httpx.HTTPError as exc:
                     raise storage_service.StorageServiceError(
@@ -611,14 +630,14 @@ async def upload_lesson_image(
                     ) from exc
             logger.info(
                 "Supabase lesson image upload request completed lesson_id=%s key=%s status=%s",
-                lesson_id_str,
+                lesson_id,
                 upload.path,
                 response.status_code,
             )
             if response.status_code >= 400:
                 logger.warning(
                     "Supabase lesson image upload failed: lesson_id=%s status=%s key=%s",
-                    lesson_id_str,
+                    lesson_id,
                     response.status_code,
                     upload.path,
                 )
@@ -630,7 +649,7 @@ async def upload_lesson_image(
         except storage_service.StorageServiceError as exc:
             logger.warning(
                 "Supabase lesson image storage operation failed: lesson_id=%s error=%s",
-                lesson_id_str,
+                lesson_id,
                 exc,
             )
             raise HTTPException(
@@ -641,15 +660,85 @@ async def upload_lesson_image(
         relative_public_path = Path(_PUBLIC_MEDIA_BUCKET) / storage_key
         destination_path = _safe_join(UPLOADS_ROOT, *relative_public_path.parts)
         destination_path.parent.mkdir(parents=True, exist_ok=True)
-        destination_path.write_bytes(payload)
+        await asyncio.to_thread(os.replace, incoming_path, destination_path)
         if _public_url(request, relative_public_path) is None:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Public upload storage misconfigured",
             )
         persisted_storage_path = storage_key
+    return persisted_storage_path
+
+
+@router.post("/lesson-image")
+async def upload_lesson_image(
+    request: Request,
+    file: Annotated[UploadFile, File(description="Lesson image file")],
+    current: TeacherUser,
+    lesson_id: Annotated[str, Form()],
+    course_id: Annotated[str | None, Form()] = None,
+) -> dict[str, Any]:
+    _raise_legacy_lesson_upload_disabled()
+
+    owner = current["id"]
+    owner_id = str(owner)
+    lesson_id_str = str(lesson_id).strip()
+    if not lesson_id_str:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="lesson_id is required"
+        )
+
+    _, lesson_course_id = await courses_service.lesson_course_ids(lesson_id_str)
+    if not lesson_course_id or not await models.is_course_owner(
+        owner, lesson_course_id
+    ):
+        logger.warning(
+            "Permission denied: lesson image upload user_id=%s lesson_id=%s course_id=%s",
+            owner_id,
+            lesson_id_str,
+            lesson_course_id,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not course owner"
+        )
+
+    if (
+        course_id
+        and str(course_id).strip()
+        and str(course_id).strip() != str(lesson_course_id)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="course_id does not match lesson ownership",
+        )
+
+    content_type, extension = _normalize_lesson_image_upload(file)
+    incoming_dir = UPLOADS_ROOT / _INCOMING_UPLOADS_DIRNAME
+    incoming_dir.mkdir(parents=True, exist_ok=True)
+    incoming_path = incoming_dir / f"{uuid4().hex}.{extension}"
+    try:
+        size, checksum = await _stream_upload_to_path(
+            file,
+            incoming_path,
+            max_bytes=max(1, int(settings.media_upload_max_image_bytes)),
+        )
+    except _UploadTooLargeError:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="File too large",
+        ) from None
+    try:
+        persisted_storage_path = await _store_lesson_image(
+            request,
+            incoming_path,
+            lesson_id=lesson_id_str,
+            extension=extension,
+            content_type=content_type,
+            size=size,
+        )
+    finally:
+        await asyncio.to_thread(incoming_path.unlink, missing_ok=True)
 
-    checksum = hashlib.sha256(payload).hexdigest()
     normalized_path = media_paths.validate_new_upload_object_path(
         persisted_storage_path
     )
@@ -678,7 +678,7 @@ class AppRenderInputsResponse(BaseModel):
 
     brand: BrandRenderInputs
     ui: UiRenderInputs
-    text_bundles: List[TextBundleResponse] = Field(min_length=1)
+    text_bundles: List[TextBundleResponse]
 
 
 class CourseCoverMedia(BaseModel):
@@ -1204,6 +1204,7 @@ class StudioCourseListResponse(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     items: List[StudioCourseSummary]
+    next_cursor: Optional[str] = None
 
 
 class StudioCourseScheduleLockError(BaseModel):
@@ -1551,6 +1552,7 @@ class CourseListResponse(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     items: List[CourseListItem]
+    next_cursor: Optional[str] = None
 
 
 class CoursePublicContent(BaseModel):
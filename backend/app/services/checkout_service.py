@@ -13,6 +13,7 @@ from ..repositories import course_bundles as bundle_repo
 from ..repositories import courses as courses_repo
 from ..repositories import payments as payments_repo
 from . import stripe_customers as stripe_customers_service
+from . import stripe_gateway
 
 RETURN_PATH = "checkout/return?session_id={CHECKOUT_SESSION_ID}"
 CANCEL_PATH = "checkout/cancel"
@@ -182,7 +183,9 @@ async def create_course_checkout(
     checkout_kwargs["ui_mode"] = settings.stripe_checkout_ui_mode or "custom"
 
     try:
-        session = await run_in_threadpool(lambda: stripe.checkout.Session.create(**checkout_kwargs))
+        session = await run_in_threadpool(
+            lambda: stripe_gateway.as_dict(stripe.checkout.Session.create(**checkout_kwargs))
+        )
     except stripe.error.StripeError as exc:  # type: ignore[attr-defined]
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -310,14 +313,16 @@ async def _apply_one_off_refund_resolution(
     affected_course_ids = await _resolve_one_off_course_ids(order)
 
     def _create_refund() -> dict[str, Any]:
-        return stripe.Refund.create(
-            payment_intent=payment_intent_id,
-            metadata={
-                "resolution_kind": resolution_kind,
-                "order_id": str(order["id"]),
-                "checkout_type": "one_off",
-                "user_id": user_id,
-            },
+        return stripe_gateway.as_dict(
+            stripe.Refund.create(
+                payment_intent=payment_intent_id,
+                metadata={
+                    "resolution_kind": resolution_kind,
+                    "order_id": str(order["id"]),
+                    "checkout_type": "one_off",
+                    "user_id": user_id,
+                },
+            )
         )
 
     try:
@@ -11,6 +11,7 @@ from starlette.concurrency import run_in_threadpool
 from .. import repositories
 from .. import stripe_mode
 from ..config import settings
+from . import stripe_gateway
 
 logger = logging.getLogger(__name__)
 
@@ -85,20 +86,22 @@ async def create_onboarding_link(
 
         try:
             account = await run_in_threadpool(
-                lambda: stripe.Account.create(
-                    type="express",
-                    country="SE",
-                    email=email,
-                    business_type="individual",
-                    capabilities={
-                        "card_payments": {"requested": True},
-                        "transfers": {"requested": True},
-                    },
-                    business_profile={
-                        "product_description": "Aveli lärarstudioplattform",
-                        "name": display_name or "Aveli Teacher",
-                    },
-                    metadata={"teacher_id": teacher_id},
+                lambda: stripe_gateway.as_dict(
+                    stripe.Account.create(
+                        type="express",
+                        country="SE",
+                        email=email,
+                        business_type="individual",
+                        capabilities={
+                            "card_payments": {"requested": True},
+                            "transfers": {"requested": True},
+                        },
+                        business_profile={
+                            "product_description": "Aveli lärarstudioplattform",
+                            "name": display_name or "Aveli Teacher",
+                        },
+                        metadata={"teacher_id": teacher_id},
+                    )
                 )
             )
         except Exception as exc:  # pragma: no cover - Stripe errors
@@ -120,11 +123,13 @@ async def create_onboarding_link(
 
     try:
         account_link = await run_in_threadpool(
-            lambda: stripe.AccountLink.create(
-                account=account_id,
-                refresh_url=refresh,
-                return_url=return_dest,
-                type="account_onboarding",
+            lambda: stripe_gateway.as_dict(
+                stripe.AccountLink.create(
+                    account=account_id,
+                    refresh_url=refresh,
+                    return_url=return_dest,
+                    type="account_onboarding",
+                )
             )
         )
     except Exception as exc:  # pragma: no cover
@@ -168,7 +173,7 @@ async def get_connect_status(teacher_id: str) -> dict[str, Any]:
     if account_id:
         try:
             account = await run_in_threadpool(
-                lambda: stripe.Account.retrieve(account_id)
+                lambda: stripe_gateway.as_dict(stripe.Account.retrieve(account_id))
             )
         except stripe.error.InvalidRequestError:  # type: ignore[attr-defined]
             account = None
@@ -21,6 +21,7 @@ from ..schemas.course_bundles import (
     CourseBundleUpdateRequest,
 )
 from . import stripe_customers as stripe_customers_service
+from . import stripe_gateway
 
 RETURN_PATH = "checkout/return?session_id={CHECKOUT_SESSION_ID}"
 CANCEL_PATH = "checkout/cancel"
@@ -439,15 +440,17 @@ async def create_checkout_session(user: Mapping[str, Any], bundle_id: str) -> Ch
     success_url, cancel_url = _default_checkout_urls()
     try:
         session = await run_in_threadpool(
-            lambda: stripe.checkout.Session.create(
-                mode="payment",
-                customer=customer_id,
-                line_items=[{"price": price_id, "quantity": 1}],
-                success_url=success_url,
-                cancel_url=cancel_url,
-                metadata=metadata,
-                ui_mode=settings.stripe_checkout_ui_mode or "custom",
-                locale="sv",
+            lambda: stripe_gateway.as_dict(
+                stripe.checkout.Session.create(
+                    mode="payment",
+                    customer=customer_id,
+                    line_items=[{"price": price_id, "quantity": 1}],
+                    success_url=success_url,
+                    cancel_url=cancel_url,
+                    metadata=metadata,
+                    ui_mode=settings.stripe_checkout_ui_mode or "custom",
+                    locale="sv",
+                )
             )
         )
     except stripe.error.StripeError as exc:  # type: ignore[attr-defined]
@@ -673,13 +676,15 @@ async def _stripe_create_bundle_product(
 
     try:
         product = await run_in_threadpool(
-            lambda: stripe.Product.create(
-                name=title,
-                metadata={
-                    "bundle_id": bundle_id,
-                    "teacher_id": teacher_id,
-                    "type": "course_bundle",
-                },
+            lambda: stripe_gateway.as_dict(
+                stripe.Product.create(
+                    name=title,
+                    metadata={
+                        "bundle_id": bundle_id,
+                        "teacher_id": teacher_id,
+                        "type": "course_bundle",
+                    },
+                )
             )
         )
     except stripe.error.StripeError as exc:  # type: ignore[attr-defined]
@@ -694,10 +699,12 @@ async def _stripe_create_bundle_product(
 async def _stripe_create_bundle_price(*, product_id: str, amount_cents: int) -> str:
     try:
         price = await run_in_threadpool(
-            lambda: stripe.Price.create(
-                product=product_id,
-                unit_amount=amount_cents,
-                currency=_CANONICAL_BUNDLE_STRIPE_CURRENCY,
+            lambda: stripe_gateway.as_dict(
+                stripe.Price.create(
+                    product=product_id,
+                    unit_amount=amount_cents,
+                    currency=_CANONICAL_BUNDLE_STRIPE_CURRENCY,
+                )
             )
         )
     except stripe.error.StripeError as exc:  # type: ignore[attr-defined]
@@ -711,7 +718,9 @@ async def _stripe_create_bundle_price(*, product_id: str, amount_cents: int) ->
 
 async def _stripe_retrieve_bundle_price(price_id: str) -> Mapping[str, Any]:
     try:
-        price = await run_in_threadpool(lambda: stripe.Price.retrieve(price_id))
+        price = await run_in_threadpool(
+            lambda: stripe_gateway.as_dict(stripe.Price.retrieve(price_id))
+        )
     except stripe.error.StripeError as exc:  # type: ignore[attr-defined]
         raise CourseBundleError("Kunde inte läsa Stripe-pris för paketet", status_code=502) from exc
     if not isinstance(price, Mapping):
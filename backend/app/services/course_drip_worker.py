@@ -13,9 +13,13 @@ from ..observability import log_buffer
 from ..repositories import lesson_completions
 from ..repositories.lesson_completions import LessonCompletionAlreadyExistsError
 from . import notification_service
+from . import worker_coordination
+from . import worker_wakeups
 
 logger = logging.getLogger(__name__)
 
+SINGLETON_JOB = "course_drip"
+
 _worker_task: asyncio.Task[None] | None = None
 _verification_mode = False
 _worker_run_started_at: float | None = None
@@ -86,83 +90,169 @@ async def stop_worker() -> None:
     logger.info("Course drip worker stopped")
 
 
-async def run_once(*, now: datetime | None = None) -> int:
-    current_time = now or datetime.now(timezone.utc)
-    async with pool.connection() as conn:
+async def _advance_due_enrollments(
+    conn: Any,
+    current_time: datetime,
+) -> int:
+    """Advance every enrollment whose persisted ``next_unlock_at`` is due.
+
+    Due rows are read through the partial ``next_unlock_at`` index in keyset
+    order, one batch per transaction, and each batch is advanced in a single
+    pipelined round trip. Enrollments that are not due are never touched.
+    """
+
+    batch_size = max(1, int(settings.course_drip_worker_batch_size))
+    advanced_enrollments = 0
+    after: tuple[datetime, Any] | None = None
+    while True:
         async with conn.cursor() as cur:
             await cur.execute(
                 """
                 select ce.id,
                        ce.user_id,
                        ce.course_id,
-                       ce.current_unlock_position
+                       ce.current_unlock_position,
+                       ce.next_unlock_at
                 from app.course_enrollments as ce
-                where app.resolve_course_drip_mode(ce.course_id) in (
-                    'legacy_uniform_drip',
-                    'custom_lesson_offsets'
-                )
-                order by ce.granted_at asc, ce.id asc
-                limit 100
-                """
+                where ce.next_unlock_at is not null
+                  and ce.next_unlock_at <= %s
+                  and (
+                    %s::timestamptz is null
+                    or (ce.next_unlock_at, ce.id) > (%s::timestamptz, %s::uuid)
+                  )
+                order by ce.next_unlock_at asc, ce.id asc
+                limit %s
+                for update of ce skip locked
+                """,
+                (
+                    current_time,
+                    after[0] if after else None,
+                    after[0] if after else None,
+                    after[1] if after else None,
+                    batch_size,
+                ),
             )
             candidates = await cur.fetchall()
-            advanced_enrollments = 0
-            for (
-                enrollment_id,
-                user_id,
-                course_id,
-                current_unlock_position,
-            ) in candidates:
+            if not candidates:
+                await conn.commit()
+                break
+            after = (candidates[-1][4], candidates[-1][0])
+
+            await cur.executemany(
+                """
+                select current_unlock_position
+                from app.canonical_worker_advance_course_enrollment_drip(%s, %s)
+                """,
+                [(enrollment_id, current_time) for enrollment_id, *_ in candidates],
+                returning=True,
+            )
+            next_unlock_positions: list[int] = []
+            while True:
+                row = await cur.fetchone()
+                next_unlock_positions.append(int(row[0] if row else 0))
+                if not cur.nextset():
+                    break
+
+            advanced = [
+                (enrollment_id, user_id, course_id, int(previous or 0), position)
+                for (enrollment_id, user_id, course_id, previous, _), position in zip(
+                    candidates, next_unlock_positions
+                )
+                if position > int(previous or 0)
+            ]
+            stalled = [
+                enrollment_id
+                for (enrollment_id, _, _, previous, _), position in zip(
+                    candidates, next_unlock_positions
+                )
+                if position <= int(previous or 0)
+            ]
+            if stalled:
+                # A due row that did not advance carries a stale schedule;
+                # re-project it so it leaves the due set.
                 await cur.execute(
                     """
-                    select current_unlock_position
-                    from app.canonical_worker_advance_course_enrollment_drip(%s, %s)
+                    update app.course_enrollments as ce
+                       set next_unlock_at = app.project_course_enrollment_next_unlock_at(
+                         ce.course_id,
+                         ce.drip_started_at,
+                         ce.current_unlock_position
+                       )
+                     where ce.id = any(%s::uuid[])
                     """,
-                    (enrollment_id, current_time),
+                    (stalled,),
                 )
-                row = await cur.fetchone()
-                next_unlock_position = int(row[0] if row else 0)
-                if next_unlock_position > int(current_unlock_position or 0):
-                    advanced_enrollments += 1
-                    await cur.execute(
-                        """
-                        select id::text as lesson_id,
-                               lesson_title
-                          from app.lessons
-                         where course_id = %s
-                           and position = %s
-                         limit 1
-                        """,
-                        (course_id, next_unlock_position),
-                    )
-                    lesson_row = await cur.fetchone()
-                    lesson_id = str(lesson_row[0]) if lesson_row else None
-                    lesson_title = str(lesson_row[1]) if lesson_row else None
-                    if lesson_id is None:
-                        raise RuntimeError(
-                            "advanced drip enrollment without unlocked lesson row"
-                        )
-                    await notification_service.create_notification(
-                        str(user_id),
-                        "lesson_drip",
-                        {
-                            "course_id": str(course_id),
-                            "lesson_id": lesson_id,
-                            "title": lesson_title,
-                            "enrollment_id": str(enrollment_id),
-                            "previous_unlock_position": int(
-                                current_unlock_position or 0
-                            ),
-                            "current_unlock_position": next_unlock_position,
-                            "evaluated_at": current_time.isoformat(),
-                        },
-                        (
-                            "lesson_drip:"
-                            f"{enrollment_id}:{lesson_id}"
-                        ),
-                        conn=conn,
+
+            lesson_rows: dict[tuple[str, int], tuple[str, str | None]] = {}
+            if advanced:
+                await cur.execute(
+                    """
+                    select distinct on (l.course_id, l.position)
+                           l.course_id::text,
+                           l.position,
+                           l.id::text as lesson_id,
+                           l.lesson_title
+                      from app.lessons as l
+                      join unnest(%s::uuid[], %s::integer[])
+                        as unlocked(course_id, position)
+                        on unlocked.course_id = l.course_id
+                       and unlocked.position = l.position
+                     order by l.course_id, l.position, l.id
+                    """,
+                    (
+                        [course_id for _, _, course_id, _, _ in advanced],
+                        [position for _, _, _, _, position in advanced],
+                    ),
+                )
+                for course_id, position, lesson_id, lesson_title in await cur.fetchall():
+                    lesson_rows[(str(course_id), int(position))] = (
+                        str(lesson_id),
+                        str(lesson_title) if lesson_title is not None else None,
                     )
 
+        for (
+            enrollment_id,
+            user_id,
+            course_id,
+            current_unlock_position,
+            next_unlock_position,
+        ) in advanced:
+            advanced_enrollments += 1
+            lesson_row = lesson_rows.get((str(course_id), next_unlock_position))
+            if lesson_row is None:
+                raise RuntimeError(
+                    "advanced drip enrollment without unlocked lesson row"
+                )
+            lesson_id, lesson_title = lesson_row
+            await notification_service.create_notification(
+                str(user_id),
+                "lesson_drip",
+                {
+                    "course_id": str(course_id),
+                    "lesson_id": lesson_id,
+                    "title": lesson_title,
+                    "enrollment_id": str(enrollment_id),
+                    "previous_unlock_position": current_unlock_position,
+                    "current_unlock_position": next_unlock_position,
+                    "evaluated_at": current_time.isoformat(),
+                },
+                (
+                    "lesson_drip:"
+                    f"{enrollment_id}:{lesson_id}"
+                ),
+                conn=conn,
+            )
+        await conn.commit()
+        if len(candidates) < batch_size:
+            break
+    return advanced_enrollments
+
+
+async def run_once(*, now: datetime | None = None) -> int:
+    current_time = now or datetime.now(timezone.utc)
+    async with pool.connection() as conn:
+        advanced_enrollments = await _advance_due_enrollments(conn, current_time)
+        async with conn.cursor() as cur:
             await cur.execute(
                 """
                 select ce.id
@@ -182,26 +272,28 @@ async def run_once(*, now: datetime | None = None) -> int:
             )
             auto_completion_candidates = await cur.fetchall()
 
-        for (enrollment_id,) in auto_completion_candidates:
-            candidate = await lesson_completions.get_intro_final_lesson_auto_completion_candidate(
-                enrollment_id=str(enrollment_id),
-                conn=conn,
-            )
-            if candidate is None:
-                continue
-
-            final_unlock_at = candidate["final_unlock_at"]
-            if final_unlock_at is None:
-                continue
-
-            if current_time < final_unlock_at + timedelta(days=7):
-                continue
+        # Candidate and existing-completion lookups are each read for the
+        # whole batch in one pipelined round trip.
+        candidates = await lesson_completions.list_intro_final_lesson_auto_completion_candidates(
+            enrollment_ids=[str(enrollment_id) for (enrollment_id,) in auto_completion_candidates],
+            conn=conn,
+        )
+        due_candidates = [
+            candidate
+            for candidate in candidates
+            if candidate is not None
+            and candidate["final_unlock_at"] is not None
+            and current_time >= candidate["final_unlock_at"] + timedelta(days=7)
+        ]
+        existing_completions = await lesson_completions.list_existing_lesson_completions(
+            user_lesson_pairs=[
+                (str(candidate["user_id"]), str(candidate["final_lesson_id"]))
+                for candidate in due_candidates
+            ],
+            conn=conn,
+        )
 
-            existing_completion = await lesson_completions.get_lesson_completion(
-                user_id=str(candidate["user_id"]),
-                lesson_id=str(candidate["final_lesson_id"]),
-                conn=conn,
-            )
+        for candidate, existing_completion in zip(due_candidates, existing_completions):
             if existing_completion is not None:
                 continue
 
@@ -225,14 +317,21 @@ async def run_once(*, now: datetime | None = None) -> int:
 
 
 async def _poll_loop() -> None:
-    while True:
-        try:
-            await run_once()
-        except asyncio.CancelledError:
-            break
-        except Exception as exc:  # pragma: no cover - defensive worker logging
-            logger.exception("Course drip worker error: %s", exc)
-        await asyncio.sleep(settings.course_drip_worker_interval_seconds)
+    await worker_wakeups.subscribe()
+    try:
+        while True:
+            try:
+                await worker_coordination.run_singleton(SINGLETON_JOB, run_once)
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:  # pragma: no cover - defensive worker logging
+                logger.exception("Course drip worker error: %s", exc)
+            await worker_wakeups.wait(
+                worker_wakeups.COURSE_ENROLLMENTS_CHANNEL,
+                settings.course_drip_worker_interval_seconds,
+            )
+    finally:
+        await worker_wakeups.unsubscribe()
 
 
 def get_metrics() -> dict[str, Any]:
@@ -255,6 +354,7 @@ def get_metrics() -> dict[str, Any]:
         "worker_running": _worker_task is not None and not _worker_task.done(),
         **enablement,
         "poll_interval_seconds": settings.course_drip_worker_interval_seconds,
+        "singleton": worker_coordination.singleton_metrics(SINGLETON_JOB),
         "last_error": last_error,
         "verification_mode": _verification_mode,
         "write_suppressed": _verification_mode,
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import base64
+import binascii
 import hashlib
+import json
 import logging
 import os
 from collections.abc import Sequence as SequenceABC
@@ -14,7 +17,6 @@ import stripe
 from fastapi import HTTPException, status
 from psycopg import DataError, Error as PsycopgError, IntegrityError
 from psycopg import errors as psycopg_errors
-from starlette.concurrency import run_in_threadpool
 
 from .. import schemas
 from ..config import settings
@@ -33,6 +35,7 @@ from . import lesson_playback_service
 from . import media_cleanup
 from . import studio_authority
 from . import storage_service
+from . import stripe_gateway
 from . import intro_selection_state
 from . import text_catalog_service
 
@@ -45,6 +48,7 @@ COURSE_CREATE_SLUG_CONFLICT_DETAIL = "Kursens identifierare är redan upptagen"
 COURSE_CREATE_INVALID_DATA_DETAIL = "Kursen kunde inte skapas"
 COURSE_CREATE_TECHNICAL_DETAIL = "Ett tekniskt fel uppstod vid skapande av kurs"
 _COURSE_SLUG_UNIQUE_CONSTRAINT = "courses_slug_key"
+_COURSE_LIST_CURSOR_INVALID_DETAIL = "Invalid course list cursor"
 _INVALID_LESSON_DOCUMENT_DETAIL = (
     "Invalid lesson document. Content must be corrected before saving."
 )
@@ -485,36 +489,33 @@ def _course_publish_price_idempotency_key(
     )
 
 
-def _require_stripe_for_course_mapping() -> None:
+def _require_stripe_for_course_mapping() -> stripe_mode.StripeContext:
     try:
-        context = stripe_mode.resolve_stripe_context()
+        return stripe_mode.resolve_stripe_context()
     except stripe_mode.StripeConfigurationError as exc:
         raise RuntimeError(str(exc)) from exc
-    stripe.api_key = context.secret_key
 
 
 async def _stripe_create_course_product(
     course: Mapping[str, Any],
     *,
+    context: stripe_mode.StripeContext,
     teacher_id: str,
     idempotency_key: str | None = None,
 ) -> str:
     course_id = str(course.get("id") or "").strip()
     title = str(course.get("title") or "").strip() or "Course"
-    create_kwargs: dict[str, Any] = {
-        "name": title,
-        "metadata": {
-            "course_id": course_id,
-            "teacher_id": teacher_id,
-            "type": "course",
-        },
-    }
-    if idempotency_key:
-        create_kwargs["idempotency_key"] = idempotency_key
 
     try:
-        product = await run_in_threadpool(
-            lambda: stripe.Product.create(**create_kwargs)
+        product = await stripe_gateway.create_product(
+            context,
+            name=title,
+            metadata={
+                "course_id": course_id,
+                "teacher_id": teacher_id,
+                "type": "course",
+            },
+            idempotency_key=idempotency_key,
         )
     except stripe.error.StripeError as exc:  # type: ignore[attr-defined]
         raise RuntimeError("Failed to create Stripe product for course") from exc
@@ -525,9 +526,12 @@ async def _stripe_create_course_product(
     return product_id
 
 
-async def _stripe_retrieve_course_product(product_id: str) -> Mapping[str, Any]:
+async def _stripe_retrieve_course_product(
+    context: stripe_mode.StripeContext,
+    product_id: str,
+) -> Mapping[str, Any]:
     try:
-        product = await run_in_threadpool(lambda: stripe.Product.retrieve(product_id))
+        product = await stripe_gateway.retrieve_product(context, product_id)
     except stripe.error.StripeError as exc:  # type: ignore[attr-defined]
         raise RuntimeError("Failed to load Stripe product for course") from exc
     if not isinstance(product, Mapping):
@@ -537,20 +541,19 @@ async def _stripe_retrieve_course_product(product_id: str) -> Mapping[str, Any]:
 
 async def _stripe_create_course_price(
     *,
+    context: stripe_mode.StripeContext,
     product_id: str,
     amount_cents: int,
     idempotency_key: str | None = None,
 ) -> str:
-    create_kwargs: dict[str, Any] = {
-        "product": product_id,
-        "unit_amount": amount_cents,
-        "currency": _CANONICAL_COURSE_STRIPE_CURRENCY,
-    }
-    if idempotency_key:
-        create_kwargs["idempotency_key"] = idempotency_key
-
     try:
-        price = await run_in_threadpool(lambda: stripe.Price.create(**create_kwargs))
+        price = await stripe_gateway.create_price(
+            context,
+            product=product_id,
+            unit_amount=amount_cents,
+            currency=_CANONICAL_COURSE_STRIPE_CURRENCY,
+            idempotency_key=idempotency_key,
+        )
     except stripe.error.StripeError as exc:  # type: ignore[attr-defined]
         raise RuntimeError("Failed to create Stripe price for course") from exc
 
@@ -560,9 +563,12 @@ async def _stripe_create_course_price(
     return price_id
 
 
-async def _stripe_retrieve_price(price_id: str) -> Mapping[str, Any]:
+async def _stripe_retrieve_price(
+    context: stripe_mode.StripeContext,
+    price_id: str,
+) -> Mapping[str, Any]:
     try:
-        price = await run_in_threadpool(lambda: stripe.Price.retrieve(price_id))
+        price = await stripe_gateway.retrieve_price(context, price_id)
     except stripe.error.StripeError as exc:  # type: ignore[attr-defined]
         raise RuntimeError("Failed to load Stripe price for course") from exc
     if not isinstance(price, Mapping):
@@ -617,18 +623,79 @@ async def fetch_course_access_subject(course_id: str) -> dict[str, Any] | None:
     return await fetch_course(course_id=course_id)
 
 
+def encode_course_list_cursor(row: Mapping[str, Any]) -> str:
+    payload: dict[str, Any] = {"slug": row["slug"]}
+    if row.get("search_rank") is not None:
+        payload["rank"] = float(row["search_rank"])
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_course_list_cursor(
+    cursor: str | None,
+    *,
+    search: str | None,
+) -> tuple[str | None, float | None]:
+    """Return the ``(after_slug, after_rank)`` keyset encoded in ``cursor``.
+
+    Search cursors carry the relevance rank of the last row; plain slug-order
+    cursors must not. A cursor from the other mode is rejected as invalid.
+    """
+
+    if cursor is None:
+        return None, None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        payload = None
+    if not isinstance(payload, dict):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_COURSE_LIST_CURSOR_INVALID_DETAIL,
+        )
+
+    slug = payload.get("slug")
+    rank = payload.get("rank")
+    rank_valid = (
+        isinstance(rank, (int, float)) and not isinstance(rank, bool)
+        if search
+        else rank is None
+    )
+    if not isinstance(slug, str) or not slug or not rank_valid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_COURSE_LIST_CURSOR_INVALID_DETAIL,
+        )
+    return slug, float(rank) if search else None
+
+
+def next_course_list_cursor(
+    rows: Sequence[Mapping[str, Any]],
+    *,
+    limit: int | None,
+) -> str | None:
+    if limit is None or not rows or len(rows) < limit:
+        return None
+    return encode_course_list_cursor(rows[-1])
+
+
 async def list_courses(
     *,
     teacher_id: str | None = None,
     limit: int | None = None,
     search: str | None = None,
+    cursor: str | None = None,
 ) -> Sequence[dict[str, Any]]:
+    after_slug, after_rank = decode_course_list_cursor(cursor, search=search)
     rows = [
         dict(row)
         for row in await courses_repo.list_courses(
             teacher_id=teacher_id,
             limit=limit,
             search=search,
+            after_slug=after_slug,
+            after_rank=after_rank,
         )
     ]
     attach_course_access_model(rows)
@@ -642,13 +709,17 @@ async def list_studio_courses(
     teacher_id: str | None = None,
     limit: int | None = None,
     search: str | None = None,
+    cursor: str | None = None,
 ) -> Sequence[dict[str, Any]]:
+    after_slug, after_rank = decode_course_list_cursor(cursor, search=search)
     rows = [
         dict(row)
         for row in await courses_repo.list_studio_courses(
             teacher_id=teacher_id,
             limit=limit,
             search=search,
+            after_slug=after_slug,
+            after_rank=after_rank,
         )
     ]
     attach_course_access_model(rows)
@@ -685,13 +756,17 @@ async def list_public_courses(
     search: str | None = None,
     limit: int | None = None,
     group_position: int | None = None,
+    cursor: str | None = None,
 ) -> Sequence[dict[str, Any]]:
+    after_slug, after_rank = decode_course_list_cursor(cursor, search=search)
     rows = [
         dict(row)
         for row in await courses_repo.list_public_course_discovery(
             search=search,
             limit=limit,
             group_position=group_position,
+            after_slug=after_slug,
+            after_rank=after_rank,
         )
     ]
     attach_course_access_model(rows)
@@ -830,7 +905,7 @@ async def read_protected_lesson_content_surface(
 
     lesson = _canonical_lesson_surface_lesson(rows[0])
 
-    media_rows: list[dict[str, Any]] = []
+    media_candidates: list[tuple[dict[str, Any], str, Any]] = []
     seen_lesson_media_ids: set[str] = set()
     for row in rows:
         lesson_media_id = row.get("lesson_media_id")
@@ -846,6 +921,13 @@ async def read_protected_lesson_content_surface(
             normalized_lesson_media_id,
             emit_logs=False,
         )
+        media_candidates.append((row, normalized_lesson_media_id, resolution))
+    await lesson_playback_service.prefetch_playback_urls(
+        resolution for _, _, resolution in media_candidates
+    )
+
+    media_rows: list[dict[str, Any]] = []
+    for row, normalized_lesson_media_id, resolution in media_candidates:
         if (
             not resolution.is_playable
             or resolution.playback_mode != LessonMediaPlaybackMode.PIPELINE_ASSET
@@ -1807,13 +1889,18 @@ async def list_lesson_media(
     if not normalized_user_id:
         raise ValueError("user_id is required for student_render lesson media")
 
-    learner_rows: list[dict[str, Any]] = []
-    for item in normalized_rows:
-        lesson_media_id = str(item["id"])
-        resolution = await canonical_media_resolver.resolve_lesson_media(
-            lesson_media_id,
+    resolutions = [
+        await canonical_media_resolver.resolve_lesson_media(
+            str(item["id"]),
             emit_logs=False,
         )
+        for item in normalized_rows
+    ]
+    await lesson_playback_service.prefetch_playback_urls(resolutions)
+
+    learner_rows: list[dict[str, Any]] = []
+    for item, resolution in zip(normalized_rows, resolutions):
+        lesson_media_id = str(item["id"])
         media_asset_id = str(resolution.media_asset_id or "").strip()
         if (
             not resolution.is_playable
@@ -2145,6 +2232,14 @@ async def _resolve_course_cover_runtime_media(
             media_asset_id=media_id,
             conn=conn,
         )
+    return _course_cover_from_runtime_row(media_id=media_id, runtime_row=runtime_row)
+
+
+def _course_cover_from_runtime_row(
+    *,
+    media_id: str,
+    runtime_row: Mapping[str, Any] | None,
+) -> dict[str, Any] | None:
     if runtime_row is None:
         return None
 
@@ -2256,12 +2351,13 @@ async def attach_course_cover_read_contract(
     if not rows:
         return
 
-    for row in rows:
+    if len(rows) == 1:
+        row = rows[0]
         strip_legacy_course_cover_output_fields(row)
         media_id = _normalize_cover_media_id(row.get("cover_media_id"))
         if media_id is None:
             row["cover"] = None
-            continue
+            return
         row["cover"] = _course_cover_payload(
             media_id=media_id,
             cover=await _resolve_course_cover_runtime_media(
@@ -2270,6 +2366,43 @@ async def attach_course_cover_read_contract(
                 conn=conn,
             ),
         )
+        return
+
+    requested: list[tuple[dict[str, Any], str, tuple[str, str] | None]] = []
+    for row in rows:
+        strip_legacy_course_cover_output_fields(row)
+        media_id = _normalize_cover_media_id(row.get("cover_media_id"))
+        if media_id is None:
+            row["cover"] = None
+            continue
+        try:
+            pair = (str(UUID(str(row.get("id") or "").strip())), str(UUID(media_id)))
+        except ValueError:
+            pair = None
+        requested.append((row, media_id, pair))
+
+    pairs = [pair for _, _, pair in requested if pair is not None]
+    runtime_rows: Mapping[tuple[str, str], Mapping[str, Any]] = {}
+    if pairs:
+        if conn is None:
+            runtime_rows = await runtime_media_repo.list_course_cover_runtime_media(
+                course_media_pairs=pairs,
+            )
+        else:
+            runtime_rows = await runtime_media_repo.list_course_cover_runtime_media(
+                course_media_pairs=pairs,
+                conn=conn,
+            )
+
+    for row, media_id, pair in requested:
+        runtime_row = runtime_rows.get(pair) if pair is not None else None
+        row["cover"] = _course_cover_payload(
+            media_id=media_id,
+            cover=_course_cover_from_runtime_row(
+                media_id=media_id,
+                runtime_row=runtime_row,
+            ),
+        )
 
 
 async def create_course(
@@ -3037,13 +3170,13 @@ async def _resolve_publish_stripe_mapping(
     product_id = str(course.get("stripe_product_id") or "").strip() or None
     active_price_id = str(course.get("active_stripe_price_id") or "").strip() or None
 
-    _require_stripe_for_course_mapping()
+    stripe_context = _require_stripe_for_course_mapping()
 
     if active_price_id and not product_id:
         raise RuntimeError("Course Stripe mapping is incomplete")
 
     if product_id:
-        product = await _stripe_retrieve_course_product(product_id)
+        product = await _stripe_retrieve_course_product(stripe_context, product_id)
         _validate_publish_stripe_product(
             product,
             expected_product_id=product_id,
@@ -3053,12 +3186,13 @@ async def _resolve_publish_stripe_mapping(
     else:
         product_id = await _stripe_create_course_product(
             course,
+            context=stripe_context,
             teacher_id=teacher_id,
             idempotency_key=_course_publish_product_idempotency_key(course_id),
         )
 
     if active_price_id:
-        price = await _stripe_retrieve_price(active_price_id)
+        price = await _stripe_retrieve_price(stripe_context, active_price_id)
         if _publish_stripe_price_matches(
             price,
             product_id=product_id,
@@ -3067,6 +3201,7 @@ async def _resolve_publish_stripe_mapping(
             return product_id, active_price_id
 
     price_id = await _stripe_create_course_price(
+        context=stripe_context,
         product_id=product_id,
         amount_cents=amount_cents,
         idempotency_key=_course_publish_price_idempotency_key(
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Sequence
+from typing import Any, AsyncIterator, Sequence
 
 from fastapi import HTTPException, status
 
@@ -127,10 +127,47 @@ async def list_home_audio_media(user_id: str, *, limit: int = 12) -> Sequence[di
     playback_cache: dict[str, dict[str, Any]] = {}
     items: list[dict[str, Any]] = []
 
-    for row in candidates:
-        if len(items) >= capped_limit:
-            break
+    eligible_rows = _eligible_home_audio_rows(
+        candidates,
+        user_id=normalized_user_id,
+        lesson_access_cache=lesson_access_cache,
+    )
+    exhausted = False
+    while len(items) < capped_limit and not exhausted:
+        window: list[dict[str, Any]] = []
+        while len(window) < capped_limit - len(items):
+            try:
+                window.append(await anext(eligible_rows))
+            except StopAsyncIteration:
+                exhausted = True
+                break
+        ready_media_asset_ids = [
+            str(row.get("media_asset_id") or "").strip()
+            for row in window
+            if str(row.get("media_state") or "").strip().lower() == "ready"
+        ]
+        await lesson_playback_service.prefetch_media_asset_playback_urls(
+            [
+                media_asset_id
+                for media_asset_id in dict.fromkeys(ready_media_asset_ids)
+                if media_asset_id not in playback_cache
+            ]
+        )
+        for row in window:
+            item = await _compose_home_audio_item(row, playback_cache=playback_cache)
+            if item is not None:
+                items.append(item)
+
+    return items
+
 
+async def _eligible_home_audio_rows(
+    candidates: Sequence[dict[str, Any]],
+    *,
+    user_id: str,
+    lesson_access_cache: dict[str, bool],
+) -> AsyncIterator[dict[str, Any]]:
+    for row in candidates:
         source_type = str(row.get("source_type") or "").strip()
         teacher_id = str(row.get("teacher_id") or "").strip()
         media_asset_id = str(row.get("media_asset_id") or "").strip()
@@ -142,7 +179,7 @@ async def list_home_audio_media(user_id: str, *, limit: int = 12) -> Sequence[di
             continue
 
         if source_type == "direct_upload":
-            if teacher_id != normalized_user_id:
+            if teacher_id != user_id:
                 continue
         elif source_type == "course_link":
             lesson_id = str(row.get("lesson_id") or "").strip()
@@ -155,7 +192,7 @@ async def list_home_audio_media(user_id: str, *, limit: int = 12) -> Sequence[di
             can_access = lesson_access_cache.get(lesson_id)
             if can_access is None:
                 access = await courses_service.read_canonical_lesson_access(
-                    normalized_user_id, lesson_id
+                    user_id, lesson_id
                 )
                 can_access = bool(access["can_access"])
                 lesson_access_cache[lesson_id] = can_access
@@ -167,40 +204,45 @@ async def list_home_audio_media(user_id: str, *, limit: int = 12) -> Sequence[di
                 extra={"source_type": source_type},
             )
             continue
+        yield row
 
-        media_state = _normalized_home_audio_state(row.get("media_state"))
-        media = await _compose_home_audio_media(
-            media_asset_id=media_asset_id,
-            media_state=media_state,
-            playback_cache=playback_cache,
-        )
-        if media is None:
-            continue
-        items.append(
-            {
-                "source_type": source_type,
-                "title": str(row.get("title") or "").strip(),
-                "lesson_title": (
-                    None
-                    if source_type == "direct_upload"
-                    else str(row.get("lesson_title") or "").strip() or None
-                ),
-                "course_id": row.get("course_id"),
-                "course_title": (
-                    str(row.get("course_title") or "").strip() or None
-                    if source_type == "course_link"
-                    else None
-                ),
-                "course_slug": (
-                    str(row.get("course_slug") or "").strip() or None
-                    if source_type == "course_link"
-                    else None
-                ),
-                "teacher_id": row.get("teacher_id"),
-                "teacher_name": str(row.get("teacher_name") or "").strip() or None,
-                "created_at": row.get("created_at"),
-                "media": media,
-            }
-        )
 
-    return items
+async def _compose_home_audio_item(
+    row: dict[str, Any],
+    *,
+    playback_cache: dict[str, dict[str, Any]],
+) -> dict[str, Any] | None:
+    source_type = str(row.get("source_type") or "").strip()
+    media_asset_id = str(row.get("media_asset_id") or "").strip()
+    media_state = _normalized_home_audio_state(row.get("media_state"))
+    media = await _compose_home_audio_media(
+        media_asset_id=media_asset_id,
+        media_state=media_state,
+        playback_cache=playback_cache,
+    )
+    if media is None:
+        return None
+    return {
+        "source_type": source_type,
+        "title": str(row.get("title") or "").strip(),
+        "lesson_title": (
+            None
+            if source_type == "direct_upload"
+            else str(row.get("lesson_title") or "").strip() or None
+        ),
+        "course_id": row.get("course_id"),
+        "course_title": (
+            str(row.get("course_title") or "").strip() or None
+            if source_type == "course_link"
+            else None
+        ),
+        "course_slug": (
+            str(row.get("course_slug") or "").strip() or None
+            if source_type == "course_link"
+            else None
+        ),
+        "teacher_id": row.get("teacher_id"),
+        "teacher_name": str(row.get("teacher_name") or "").strip() or None,
+        "created_at": row.get("created_at"),
+        "media": media,
+    }
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Sequence
 
 from fastapi import HTTPException, status
 
@@ -16,7 +16,7 @@ from ..media_control_plane.services.media_resolver_service import (
     media_resolver_service as canonical_media_resolver,
 )
 from ..repositories import media_assets as media_assets_repo
-from ..services import courses_service, storage_service
+from ..services import courses_service, media_resolver, storage_service
 
 logger = logging.getLogger(__name__)
 
@@ -263,10 +263,9 @@ async def _build_pipeline_playback_response(
     if storage_path is None or storage_bucket is None:
         raise _resolution_http_exception(resolution)
 
-    storage_client = storage_service.get_storage_service(storage_bucket)
-
     try:
-        presigned = await storage_client.get_presigned_url(
+        presigned = await media_resolver.get_presigned_url(
+            storage_bucket,
             storage_path,
             ttl=settings.media_playback_url_ttl_seconds,
             filename=Path(storage_path).name,
@@ -286,6 +285,54 @@ async def _build_pipeline_playback_response(
     }
 
 
+async def prefetch_playback_urls(resolutions: Iterable[LessonMediaResolution]) -> None:
+    """Sign playable pipeline assets in bulk so per-item playback hits the URL cache."""
+
+    if not settings.media_signed_url_cache_enabled:
+        return
+
+    paths_by_bucket: dict[str, list[str]] = {}
+    for resolution in resolutions:
+        if (
+            not resolution.is_playable
+            or resolution.playback_mode != LessonMediaPlaybackMode.PIPELINE_ASSET
+        ):
+            continue
+        storage_bucket = _exact_text(getattr(resolution, "storage_bucket", None))
+        storage_path = _exact_text(getattr(resolution, "storage_path", None))
+        if storage_bucket is None or storage_path is None:
+            continue
+        paths_by_bucket.setdefault(storage_bucket, []).append(storage_path)
+
+    for storage_bucket, storage_paths in paths_by_bucket.items():
+        try:
+            await media_resolver.get_presigned_urls(
+                storage_bucket,
+                storage_paths,
+                ttl=settings.media_playback_url_ttl_seconds,
+            )
+        except storage_service.StorageServiceError as exc:
+            logger.warning(
+                "PLAYBACK_URL_PREFETCH_FAILED bucket=%s paths=%s error=%s",
+                storage_bucket,
+                len(storage_paths),
+                exc,
+            )
+
+
+async def prefetch_media_asset_playback_urls(media_asset_ids: Sequence[str]) -> None:
+    if not media_asset_ids or not settings.media_signed_url_cache_enabled:
+        return
+    media_assets = await media_assets_repo.list_media_assets_access(media_asset_ids)
+    await prefetch_playback_urls(
+        _media_asset_audio_resolution(
+            media_asset_id=media_asset_id,
+            media_asset=media_assets.get(media_asset_id),
+        )
+        for media_asset_id in media_asset_ids
+    )
+
+
 def _resolution_http_exception(resolution: LessonMediaResolution) -> HTTPException:
     reason = resolution.failure_reason
     if reason == LessonMediaResolutionReason.LESSON_MEDIA_NOT_FOUND:
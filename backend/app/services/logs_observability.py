@@ -15,6 +15,7 @@ from . import (
     media_transcode_worker,
     membership_expiry_warnings,
     notifications_dispatcher_worker,
+    worker_coordination,
 )
 
 _DEFAULT_LIMIT = 20
@@ -389,9 +390,23 @@ async def get_worker_health() -> dict[str, Any]:
             "write_suppressed": notification_write_suppressed,
         },
     }
+    worker_processes = [
+        {
+            "worker_id": row["worker_id"],
+            "hostname": row["hostname"],
+            "pid": int(row["pid"]),
+            "process_index": int(row["process_index"]),
+            "jobs": list(row.get("jobs") or []),
+            "alive": bool(row.get("alive")),
+            "started_at": _iso(row.get("started_at")),
+            "heartbeat_at": _iso(row.get("heartbeat_at")),
+        }
+        for row in await worker_coordination.list_worker_processes()
+    ]
     return {
         "generated_at": _iso(_now()),
         "worker_health": worker_health,
+        "worker_processes": worker_processes,
         "safety": {
             "logs_mcp_enabled": bool(settings.logs_mcp_enabled),
             "log_buffer_max_events": 500,
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from dataclasses import dataclass
 import logging
 from pathlib import Path
+import time
+from typing import Mapping, Protocol, Sequence
 from urllib.parse import urlparse
 
 from . import storage_service
+from .. import metrics
 from ..config import settings
 
 logger = logging.getLogger(__name__)
@@ -100,13 +105,190 @@ def is_direct_home_mp3_path(
     return key.startswith("home-player/")
 
 
+SignedUrlCacheKey = tuple[str, str, bool, str | None]
+
+
+@dataclass(frozen=True, slots=True)
+class CachedSignedUrl:
+    url: str
+    headers: Mapping[str, str]
+    expires_at: float
+
+
+class SignedUrlCache(Protocol):
+    def get(self, key: SignedUrlCacheKey) -> CachedSignedUrl | None: ...
+
+    def set(self, key: SignedUrlCacheKey, value: CachedSignedUrl) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class LruSignedUrlCache:
+    """Bounded in-process cache of presigned URLs with LRU eviction."""
+
+    def __init__(self, *, max_entries: int) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[SignedUrlCacheKey, CachedSignedUrl] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: SignedUrlCacheKey) -> CachedSignedUrl | None:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: SignedUrlCacheKey, value: CachedSignedUrl) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_signed_url_cache: SignedUrlCache = LruSignedUrlCache(
+    max_entries=settings.media_signed_url_cache_max_entries,
+)
+
+
+def set_signed_url_cache(cache: SignedUrlCache) -> None:
+    global _signed_url_cache
+    _signed_url_cache = cache
+
+
+def clear_signed_url_cache() -> None:
+    _signed_url_cache.clear()
+
+
+def _reusable(cached: CachedSignedUrl, *, ttl: int, safety_seconds: int, now: float) -> bool:
+    # A cached URL must still cover a real share of the lifetime the caller
+    # asked for; a long playback session must not get one about to expire.
+    remaining = cached.expires_at - now
+    return remaining > safety_seconds and remaining >= ttl // 2
+
+
+async def get_presigned_url(
+    bucket: str,
+    key: str,
+    *,
+    ttl: int,
+    filename: str | None = None,
+    download: bool = False,
+) -> storage_service.PresignedUrl:
+    """Return a presigned URL, reusing a cached one while it covers half of ``ttl``."""
+
+    storage = storage_service.get_storage_service(bucket)
+    if not settings.media_signed_url_cache_enabled:
+        return await storage.get_presigned_url(
+            key,
+            ttl=ttl,
+            filename=filename,
+            download=download,
+        )
+
+    cache_key: SignedUrlCacheKey = (
+        storage.bucket,
+        key,
+        download,
+        filename if download else None,
+    )
+    safety_seconds = max(0, int(settings.media_signed_url_cache_safety_seconds))
+    now = time.monotonic()
+    cached = _signed_url_cache.get(cache_key)
+    if cached is not None and _reusable(
+        cached, ttl=ttl, safety_seconds=safety_seconds, now=now
+    ):
+        metrics.media_signed_url_cache_hits_total.inc()
+        return storage_service.PresignedUrl(
+            url=cached.url,
+            expires_in=int(cached.expires_at - now),
+            headers=cached.headers,
+        )
+
+    metrics.media_signed_url_cache_misses_total.inc()
+    presigned = await storage.get_presigned_url(
+        key,
+        ttl=ttl,
+        filename=filename,
+        download=download,
+    )
+    if presigned.expires_in > safety_seconds:
+        _signed_url_cache.set(
+            cache_key,
+            CachedSignedUrl(
+                url=presigned.url,
+                headers=dict(presigned.headers),
+                expires_at=now + presigned.expires_in,
+            ),
+        )
+    return presigned
+
+
+async def get_presigned_urls(
+    bucket: str,
+    keys: Sequence[str],
+    *,
+    ttl: int,
+) -> dict[str, storage_service.PresignedUrl]:
+    """Return inline presigned URLs for many keys, signing cache misses in one call."""
+
+    storage = storage_service.get_storage_service(bucket)
+    safety_seconds = max(0, int(settings.media_signed_url_cache_safety_seconds))
+    cache_enabled = settings.media_signed_url_cache_enabled
+    now = time.monotonic()
+    resolved: dict[str, storage_service.PresignedUrl] = {}
+    missing: list[str] = []
+    for key in dict.fromkeys(keys):
+        cached = (
+            _signed_url_cache.get((storage.bucket, key, False, None))
+            if cache_enabled
+            else None
+        )
+        if cached is not None and _reusable(
+            cached, ttl=ttl, safety_seconds=safety_seconds, now=now
+        ):
+            metrics.media_signed_url_cache_hits_total.inc()
+            resolved[key] = storage_service.PresignedUrl(
+                url=cached.url,
+                expires_in=int(cached.expires_at - now),
+                headers=cached.headers,
+            )
+            continue
+        missing.append(key)
+
+    if not missing:
+        return resolved
+
+    if cache_enabled:
+        metrics.media_signed_url_cache_misses_total.inc(len(missing))
+    signed = await storage.get_presigned_urls(missing, ttl=ttl, download=False)
+    for key in missing:
+        presigned = signed.get(key.lstrip("/"))
+        if presigned is None:
+            continue
+        resolved[key] = presigned
+        if cache_enabled and presigned.expires_in > safety_seconds:
+            _signed_url_cache.set(
+                (storage.bucket, key, False, None),
+                CachedSignedUrl(
+                    url=presigned.url,
+                    headers=dict(presigned.headers),
+                    expires_at=now + presigned.expires_in,
+                ),
+            )
+    return resolved
+
+
 async def resolve_media_url(storage_path: str) -> str:
     bucket, key = _detect_bucket_and_key(storage_path)
-    presigned = await storage_service.get_storage_service(bucket).get_presigned_url(
+    presigned = await get_presigned_url(
+        bucket,
         key,
         ttl=_SIGNED_URL_TTL_SECONDS,
         filename=Path(key).name,
         download=False,
     )
     return presigned.url
-
@@ -20,6 +20,7 @@ from ..config import settings
 from ..observability import log_buffer
 from ..repositories import media_assets as media_assets_repo
 from ..services import storage_service
+from ..services import worker_wakeups
 from ..utils import media_paths
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,12 @@ _worker_task: asyncio.Task[None] | None = None
 _logged_missing_source_assets: set[str] = set()
 _verification_mode: bool = False
 _worker_run_started_at: float | None = None
+_in_flight_assets: dict[asyncio.Task[None], tuple[str, dict]] = {}
+_WORKER_LANE_MEDIA_TYPES: dict[str, tuple[str, ...]] = {
+    "audio": ("audio",),
+    "image": ("image",),
+    "passthrough": ("video", "document"),
+}
 _DOWNLOAD_CHUNK_TIMEOUT_SECONDS = 5.0
 _FFMPEG_TIMEOUT_SECONDS = 180.0
 _FFPROBE_TIMEOUT_SECONDS = 30.0
@@ -44,6 +51,14 @@ _READ_CHUNK_SIZE = 1024 * 1024
 _DURATION_RE = re.compile(
     r"Duration:\s*(?P<hours>\d+):(?P<minutes>\d+):(?P<seconds>\d+(?:\.\d+)?)"
 )
+_PROGRESS_TIME_RE = re.compile(
+    r"time=\s*(?P<hours>\d+):(?P<minutes>\d+):(?P<seconds>\d+(?:\.\d+)?)"
+)
+# Containers that ffmpeg can demux from a non-seekable pipe. MP4-family
+# sources are excluded because their index may trail the media data.
+_STREAMABLE_AUDIO_SUFFIXES = frozenset(
+    {".wav", ".ogg", ".oga", ".opus", ".flac", ".aac", ".webm"}
+)
 
 
 def _now() -> datetime:
@@ -399,6 +414,15 @@ async def _materialize_source_file(
     await _download_to_file(signed.url, destination)
 
 
+def _audio_streaming_enabled(asset: dict) -> bool:
+    if not settings.media_transcode_streaming_enabled or _local_storage_enabled():
+        return False
+    if _audio_source_suffix(asset) not in _STREAMABLE_AUDIO_SUFFIXES:
+        return False
+    # Verified local projection sources need the file-based fallback path.
+    return _resolve_local_projection_source_file(asset) is None
+
+
 def _derive_audio_output_path(source_path: str, ext: str) -> str:
     normalized = source_path.lstrip("/")
     prefix = "media/source/audio/"
@@ -899,6 +923,9 @@ async def get_metrics() -> dict[str, Any]:
         "queue_contract_supported": queue_contract_supported,
         "poll_interval_seconds": settings.media_transcode_poll_interval_seconds,
         "batch_size": settings.media_transcode_batch_size,
+        "concurrency": _worker_concurrency(),
+        "lane_concurrency": _worker_lane_limits(),
+        "in_flight": _in_flight_lane_counts(),
         "max_attempts": settings.media_transcode_max_attempts,
         "queue_summary": summary,
         "last_error": last_error,
@@ -907,29 +934,120 @@ async def get_metrics() -> dict[str, Any]:
     }
 
 
-async def _poll_loop() -> None:
-    while True:
-        try:
-            await _log_skipped_missing_source_assets()
-            batch = await media_assets_repo.fetch_and_lock_pending_media_assets(
-                limit=settings.media_transcode_batch_size,
-                max_attempts=settings.media_transcode_max_attempts,
+def _worker_concurrency() -> int:
+    return max(1, int(settings.media_transcode_concurrency))
+
+
+def _worker_lane_limits() -> dict[str, int]:
+    return {
+        "audio": max(1, int(settings.media_transcode_audio_concurrency)),
+        "image": max(1, int(settings.media_transcode_image_concurrency)),
+        "passthrough": max(1, int(settings.media_transcode_passthrough_concurrency)),
+    }
+
+
+def _in_flight_lane_counts() -> dict[str, int]:
+    counts = {lane: 0 for lane in _WORKER_LANE_MEDIA_TYPES}
+    for lane, _ in _in_flight_assets.values():
+        counts[lane] = counts.get(lane, 0) + 1
+    return counts
+
+
+async def _dispatch_pending_assets() -> int:
+    """Lock pending assets for every lane with free capacity and start them."""
+
+    dispatched = 0
+    lane_limits = _worker_lane_limits()
+    for lane, media_types in _WORKER_LANE_MEDIA_TYPES.items():
+        global_free = _worker_concurrency() - len(_in_flight_assets)
+        lane_free = lane_limits[lane] - _in_flight_lane_counts()[lane]
+        limit = min(settings.media_transcode_batch_size, global_free, lane_free)
+        if limit <= 0:
+            continue
+        batch = await media_assets_repo.fetch_and_lock_pending_media_assets(
+            limit=limit,
+            max_attempts=settings.media_transcode_max_attempts,
+            media_types=media_types,
+        )
+        for asset in batch:
+            task = asyncio.create_task(_process_asset(asset))
+            _in_flight_assets[task] = (lane, asset)
+            dispatched += 1
+    return dispatched
+
+
+async def _reap_finished_assets() -> None:
+    finished = [task for task in _in_flight_assets if task.done()]
+    cancelled_assets: list[dict] = []
+    for task in finished:
+        _, asset = _in_flight_assets.pop(task)
+        if task.cancelled():
+            cancelled_assets.append(asset)
+            continue
+        exc = task.exception()
+        if exc is not None:  # pragma: no cover - _process_asset records failures
+            logger.error(
+                "Media transcode task crashed for %s: %s",
+                asset.get("id"),
+                exc,
+                exc_info=exc,
             )
-            if not batch:
+    if cancelled_assets:
+        await _reschedule_cancelled_assets(cancelled_assets)
+
+
+async def _cancel_in_flight_assets() -> None:
+    tasks = list(_in_flight_assets)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    assets = [_in_flight_assets.pop(task)[1] for task in tasks]
+    await _reschedule_cancelled_assets(
+        [
+            asset
+            for task, asset in zip(tasks, assets)
+            if task.cancelled()
+        ]
+    )
+
+
+async def _wait_for_work() -> None:
+    """Wait for an in-flight asset to finish, an upload notification, or the poll interval."""
+
+    wakeup = asyncio.create_task(
+        worker_wakeups.wait(
+            worker_wakeups.MEDIA_ASSETS_CHANNEL,
+            settings.media_transcode_poll_interval_seconds,
+        )
+    )
+    try:
+        await asyncio.wait(
+            [*_in_flight_assets, wakeup],
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+    finally:
+        wakeup.cancel()
+
+
+async def _poll_loop() -> None:
+    await worker_wakeups.subscribe()
+    try:
+        while True:
+            try:
+                await _reap_finished_assets()
+                await _log_skipped_missing_source_assets()
+                await _dispatch_pending_assets()
+                await _wait_for_work()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # pragma: no cover - defensive logging
+                logger.exception("Media transcode poller error: %s", exc)
                 await asyncio.sleep(settings.media_transcode_poll_interval_seconds)
-                continue
-            for index, asset in enumerate(batch):
-                try:
-                    await _process_asset(asset)
-                except asyncio.CancelledError:
-                    _uncancel_current_task()
-                    await _reschedule_cancelled_assets(batch[index:])
-                    raise
-        except asyncio.CancelledError:
-            break
-        except Exception as exc:  # pragma: no cover - defensive logging
-            logger.exception("Media transcode poller error: %s", exc)
-            await asyncio.sleep(settings.media_transcode_poll_interval_seconds)
+    except asyncio.CancelledError:
+        _uncancel_current_task()
+        await _cancel_in_flight_assets()
+    finally:
+        await worker_wakeups.unsubscribe()
 
 
 async def _log_skipped_missing_source_assets() -> None:
@@ -1168,6 +1286,22 @@ async def _transcode_audio_asset(
     source_storage = storage_service.get_storage_service(source_bucket)
     output_path = _resolved_audio_output_path(asset, ext="mp3")
 
+    if _audio_streaming_enabled(asset):
+        duration = await _stream_transcode_audio(
+            asset=asset,
+            source_storage=source_storage,
+            source_path=source_path,
+            output_path=output_path,
+            consume_attempt=consume_attempt,
+        )
+        await _finalize_audio_asset(
+            asset=asset,
+            source_storage=source_storage,
+            output_path=output_path,
+            duration=duration,
+        )
+        return
+
     with tempfile.TemporaryDirectory(prefix="aveli_media_") as temp_dir:
         temp_root = Path(temp_dir)
         input_file = temp_root / f"source{_audio_source_suffix(asset)}"
@@ -1221,6 +1355,21 @@ async def _transcode_audio_asset(
             cache_seconds=settings.media_public_cache_seconds,
         )
 
+    await _finalize_audio_asset(
+        asset=asset,
+        source_storage=source_storage,
+        output_path=output_path,
+        duration=duration,
+    )
+
+
+async def _finalize_audio_asset(
+    *,
+    asset: dict,
+    source_storage: storage_service.StorageService,
+    output_path: str,
+    duration: int | None,
+) -> None:
     await _verify_ready_contract(
         asset=asset,
         playback_storage=source_storage,
@@ -1419,7 +1568,6 @@ async def _transcode_profile_media_image_asset(
 
 
 async def _download_to_file(url: str, destination: Path) -> None:
-    timeout = httpx.Timeout(connect=5.0, read=5.0, write=5.0, pool=5.0)
     logger.info(
         "Storage download request started url=%s destination=%s",
         storage_service.redact_http_url(url),
@@ -1427,10 +1575,7 @@ async def _download_to_file(url: str, destination: Path) -> None:
     )
     bytes_written = 0
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=storage_service.storage_http_limits(),
-        ) as client:
+        async with storage_service.storage_http_client("download") as client:
             async with client.stream("GET", url) as response:
                 logger.info(
                     "Storage download response received url=%s status=%s",
@@ -1525,10 +1670,7 @@ async def _upload_file(url: str, source: Path, headers: dict[str, str] | None) -
         source_size,
     )
     try:
-        async with httpx.AsyncClient(
-            timeout=storage_service.storage_http_timeout(),
-            limits=storage_service.storage_http_limits(),
-        ) as client:
+        async with storage_service.storage_http_client() as client:
             response = await client.put(
                 url, headers=upload_headers, content=_file_stream(source)
             )
@@ -1616,22 +1758,16 @@ async def _run_subprocess(
     return int(result.returncode or 0), stdout, stderr
 
 
-async def _run_ffmpeg_audio(input_path: Path, output_path: Path) -> None:
-    if not input_path.exists() or input_path.stat().st_size <= 0:
-        raise RuntimeError(f"ffmpeg audio input missing or empty: {input_path}")
-    logger.info(
-        "Running ffmpeg audio input=%s input_bytes=%s output=%s",
-        input_path,
-        input_path.stat().st_size,
-        output_path,
-    )
+def _ffmpeg_audio_command(input_arg: str, output_arg: str) -> list[str]:
+    streaming = input_arg == "pipe:0"
     command = [
         _ffmpeg_executable(),
         "-hide_banner",
-        "-nostdin",
+        # stdin carries the source bytes when streaming.
+        *(() if streaming else ("-nostdin",)),
         "-y",
         "-i",
-        str(input_path),
+        input_arg,
         "-map_metadata",
         "-1",
         "-vn",
@@ -1639,8 +1775,23 @@ async def _run_ffmpeg_audio(input_path: Path, output_path: Path) -> None:
         "libmp3lame",
         "-b:a",
         "192k",
-        str(output_path),
     ]
+    if output_arg == "pipe:1":
+        command.extend(["-f", "mp3"])
+    command.append(output_arg)
+    return command
+
+
+async def _run_ffmpeg_audio(input_path: Path, output_path: Path) -> None:
+    if not input_path.exists() or input_path.stat().st_size <= 0:
+        raise RuntimeError(f"ffmpeg audio input missing or empty: {input_path}")
+    logger.info(
+        "Running ffmpeg audio input=%s input_bytes=%s output=%s",
+        input_path,
+        input_path.stat().st_size,
+        output_path,
+    )
+    command = _ffmpeg_audio_command(str(input_path), str(output_path))
     await _run_subprocess(
         command,
         label="ffmpeg audio",
@@ -1650,6 +1801,185 @@ async def _run_ffmpeg_audio(input_path: Path, output_path: Path) -> None:
         raise RuntimeError(f"ffmpeg audio output missing or empty: {output_path}")
 
 
+async def _stream_transcode_audio(
+    *,
+    asset: dict,
+    source_storage: storage_service.StorageService,
+    source_path: str,
+    output_path: str,
+    consume_attempt: ConsumeAttemptFn,
+) -> int | None:
+    """Pipe the source download through ffmpeg straight into storage.
+
+    Returns the encoded duration reported by ffmpeg. Nothing touches local
+    disk, so the upload starts while the encoder is still running.
+    """
+
+    try:
+        signed = await source_storage.get_presigned_url(
+            source_path,
+            ttl=settings.media_playback_url_ttl_seconds,
+            download=False,
+        )
+    except storage_service.StorageObjectNotFoundError as exc:
+        raise SourceNotReadyError(str(exc)) from exc
+
+    url = storage_service.redact_http_url(signed.url)
+    command = _ffmpeg_audio_command("pipe:0", "pipe:1")
+    process: asyncio.subprocess.Process | None = None
+    feeder: asyncio.Task[int] | None = None
+    stderr_reader: asyncio.Task[bytes] | None = None
+    uploaded = False
+    completed = False
+    output_bytes = 0
+    try:
+        async with storage_service.storage_http_client("download") as client:
+            async with client.stream("GET", signed.url) as response:
+                logger.info(
+                    "Streaming audio source response received media_id=%s url=%s status=%s",
+                    asset.get("id"),
+                    url,
+                    response.status_code,
+                )
+                if response.status_code == 404:
+                    raise SourceNotReadyError("Source object not yet available")
+                response.raise_for_status()
+                await consume_attempt()
+
+                logger.info("ffmpeg audio stream starting command=%s", command)
+                try:
+                    process = await asyncio.create_subprocess_exec(
+                        *command,
+                        stdin=asyncio.subprocess.PIPE,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                    )
+                except FileNotFoundError as exc:
+                    raise RuntimeError(
+                        f"ffmpeg audio binary not found: {command[0]}"
+                    ) from exc
+                assert process.stdin is not None
+                assert process.stdout is not None
+                assert process.stderr is not None
+                stdin = process.stdin
+                stdout = process.stdout
+
+                async def _feed_source() -> int:
+                    fed = 0
+                    chunks = response.aiter_bytes(chunk_size=_READ_CHUNK_SIZE).__aiter__()
+                    try:
+                        while True:
+                            try:
+                                chunk = await asyncio.wait_for(
+                                    chunks.__anext__(),
+                                    timeout=_DOWNLOAD_CHUNK_TIMEOUT_SECONDS,
+                                )
+                            except StopAsyncIteration:
+                                break
+                            except TimeoutError as exc:
+                                raise storage_service.StorageServiceError(
+                                    "Timed out waiting for storage download bytes"
+                                ) from exc
+                            if not chunk:
+                                continue
+                            fed += len(chunk)
+                            stdin.write(chunk)
+                            await stdin.drain()
+                    except (BrokenPipeError, ConnectionResetError):
+                        # ffmpeg exited early; its return code explains why.
+                        pass
+                    finally:
+                        stdin.close()
+                    return fed
+
+                async def _encoded_chunks():
+                    nonlocal output_bytes
+                    while True:
+                        chunk = await stdout.read(_READ_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        output_bytes += len(chunk)
+                        yield chunk
+
+                feeder = asyncio.create_task(_feed_source())
+                stderr_reader = asyncio.create_task(process.stderr.read())
+                await source_storage.upload_object(
+                    output_path,
+                    content=_encoded_chunks(),
+                    content_type="audio/mpeg",
+                    media_asset_id=str(asset.get("id") or "") or None,
+                    upsert=True,
+                    cache_seconds=settings.media_public_cache_seconds,
+                )
+                uploaded = True
+                source_bytes = await feeder
+                try:
+                    returncode = await asyncio.wait_for(
+                        process.wait(), timeout=_FFMPEG_TIMEOUT_SECONDS
+                    )
+                except TimeoutError as exc:
+                    raise RuntimeError(
+                        f"ffmpeg audio timed out after {_FFMPEG_TIMEOUT_SECONDS:g}s"
+                    ) from exc
+                stderr = (await stderr_reader).decode("utf-8", errors="ignore")
+                completed = True
+    except httpx.HTTPError as exc:
+        logger.warning(
+            "Streaming audio source request failed media_id=%s url=%s error=%s",
+            asset.get("id"),
+            url,
+            exc,
+        )
+        raise storage_service.StorageServiceError(
+            "Failed to download storage object"
+        ) from exc
+    finally:
+        for task in (feeder, stderr_reader):
+            if task is not None and not task.done():
+                task.cancel()
+        if process is not None and process.returncode is None:
+            process.kill()
+            await process.wait()
+        if uploaded and not completed:
+            await _delete_partial_stream_output(
+                asset=asset, storage=source_storage, object_path=output_path
+            )
+
+    logger.info(
+        "ffmpeg audio stream completed media_id=%s returncode=%s source_bytes=%s output_bytes=%s stderr=%s",
+        asset.get("id"),
+        returncode,
+        source_bytes,
+        output_bytes,
+        _truncate(stderr or "<empty>"),
+    )
+    if returncode != 0 or output_bytes <= 0:
+        await _delete_partial_stream_output(
+            asset=asset, storage=source_storage, object_path=output_path
+        )
+        raise RuntimeError(
+            _truncate(stderr or "ffmpeg audio stream produced no output")
+        )
+    return _parse_encoded_duration_seconds(stderr)
+
+
+async def _delete_partial_stream_output(
+    *,
+    asset: dict,
+    storage: storage_service.StorageService,
+    object_path: str,
+) -> None:
+    try:
+        await storage.delete_object(object_path)
+    except storage_service.StorageServiceError as exc:
+        logger.warning(
+            "Failed to cleanup partial streamed audio media_id=%s output=%s error=%s",
+            asset.get("id"),
+            object_path,
+            exc,
+        )
+
+
 async def _run_ffmpeg_cover(input_path: Path, output_path: Path) -> None:
     if not input_path.exists() or input_path.stat().st_size <= 0:
         raise RuntimeError(f"ffmpeg cover input missing or empty: {input_path}")
@@ -1693,6 +2023,17 @@ def _parse_duration_seconds(output: str) -> int | None:
     return int((hours * 3600) + (minutes * 60) + seconds)
 
 
+def _parse_encoded_duration_seconds(output: str) -> int | None:
+    matches = list(_PROGRESS_TIME_RE.finditer(output))
+    if not matches:
+        return _parse_duration_seconds(output)
+    match = matches[-1]
+    hours = int(match.group("hours"))
+    minutes = int(match.group("minutes"))
+    seconds = float(match.group("seconds"))
+    return int((hours * 3600) + (minutes * 60) + seconds)
+
+
 async def _probe_duration(path: Path) -> int | None:
     if not path.exists() or path.stat().st_size <= 0:
         raise RuntimeError(f"duration probe input missing or empty: {path}")
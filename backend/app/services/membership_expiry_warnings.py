@@ -11,12 +11,15 @@ from ..db import get_conn
 from ..observability import log_buffer
 from ..repositories import membership_support as membership_support_repo
 from . import email_service
+from . import worker_coordination
+from . import worker_wakeups
 
 logger = logging.getLogger(__name__)
 
 _worker_task: asyncio.Task[None] | None = None
 _WARNING_STEP = "membership_expiry_warning_sent"
 _WARNING_TYPE = "expiry_7_day"
+SINGLETON_JOB = "membership_expiry_warnings"
 _verification_mode = False
 _worker_run_started_at: float | None = None
 
@@ -124,14 +127,21 @@ async def run_once(*, now: datetime | None = None) -> int:
 
 
 async def _poll_loop() -> None:
-    while True:
-        try:
-            await run_once()
-        except asyncio.CancelledError:
-            break
-        except Exception as exc:  # pragma: no cover - defensive worker logging
-            logger.exception("Membership expiry warning worker error: %s", exc)
-        await asyncio.sleep(settings.membership_expiry_warning_interval_seconds)
+    await worker_wakeups.subscribe()
+    try:
+        while True:
+            try:
+                await worker_coordination.run_singleton(SINGLETON_JOB, run_once)
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:  # pragma: no cover - defensive worker logging
+                logger.exception("Membership expiry warning worker error: %s", exc)
+            await worker_wakeups.wait(
+                worker_wakeups.MEMBERSHIPS_CHANNEL,
+                settings.membership_expiry_warning_interval_seconds,
+            )
+    finally:
+        await worker_wakeups.unsubscribe()
 
 
 async def _list_expiring_memberships(
@@ -219,6 +229,7 @@ def get_metrics() -> dict[str, Any]:
     return {
         "worker_running": _worker_task is not None and not _worker_task.done(),
         "poll_interval_seconds": settings.membership_expiry_warning_interval_seconds,
+        "singleton": worker_coordination.singleton_metrics(SINGLETON_JOB),
         "last_error": last_error,
         "verification_mode": _verification_mode,
         "write_suppressed": _verification_mode,
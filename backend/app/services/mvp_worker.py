@@ -1,36 +1,173 @@
 from __future__ import annotations
 
 import asyncio
+import importlib
 import logging
+import multiprocessing
+import os
+import signal
+import time
 
-from . import course_drip_worker, media_transcode_worker, notifications_dispatcher_worker
+from ..config import settings
+from . import (
+    course_drip_worker,
+    media_transcode_worker,
+    notifications_dispatcher_worker,
+    storage_service,
+    stripe_webhook_inbox_worker,
+    worker_coordination,
+)
 
 logger = logging.getLogger(__name__)
 
+_SUPERVISOR_TICK_SECONDS = 1.0
+_RESTART_BACKOFF_MAX_SECONDS = 60.0
+# A child that stayed up this long is considered healthy; its next exit
+# restarts immediately instead of continuing the backoff.
+_HEALTHY_RUNTIME_SECONDS = 60.0
+_SHUTDOWN_GRACE_SECONDS = 30.0
 
-async def _run_worker_forever() -> None:
+
+def _started_jobs() -> list[str]:
+    # Queue jobs claim rows with FOR UPDATE SKIP LOCKED and can run in every
+    # process; course drip runs in every process but only executes while it
+    # holds its advisory lock.
+    workers = (
+        ("media_transcode", media_transcode_worker),
+        ("course_drip", course_drip_worker),
+        ("notifications_dispatcher", notifications_dispatcher_worker),
+        ("stripe_webhook_inbox", stripe_webhook_inbox_worker),
+    )
+    return [name for name, worker in workers if worker._worker_task is not None]
+
+
+async def _run_worker_forever(*, process_index: int = 0) -> None:
     from ..db import pool
 
     await pool.open(wait=True)
+    await storage_service.open_shared_http_clients()
     try:
         await media_transcode_worker.start_worker()
         await course_drip_worker.start_worker()
         await notifications_dispatcher_worker.start_worker()
-        logger.info("MVP worker runtime started")
+        await stripe_webhook_inbox_worker.start_worker()
+        await worker_coordination.start_heartbeat(
+            process_index=process_index,
+            jobs=_started_jobs(),
+        )
+        logger.info("MVP worker runtime started", extra={"process_index": process_index})
         while True:
             await asyncio.sleep(3600)
     finally:
+        await worker_coordination.stop_heartbeat()
+        await stripe_webhook_inbox_worker.stop_worker()
         await notifications_dispatcher_worker.stop_worker()
         await course_drip_worker.stop_worker()
         await media_transcode_worker.stop_worker()
+        await storage_service.close_shared_http_clients()
         await pool.close()
 
 
+def _run_worker_process(process_index: int) -> None:
+    from ..logging_utils import setup_logging
+
+    setup_logging()
+    try:
+        asyncio.run(_run_worker_forever(process_index=process_index))
+    except KeyboardInterrupt:
+        logger.info("MVP worker process %s stopped", process_index)
+
+
+def _stop_processes(processes: dict[int, multiprocessing.process.BaseProcess]) -> None:
+    for process in processes.values():
+        if process.is_alive() and process.pid is not None:
+            # SIGINT lets asyncio.run cancel the runtime and run its cleanup.
+            os.kill(process.pid, signal.SIGINT)
+    deadline = time.monotonic() + _SHUTDOWN_GRACE_SECONDS
+    for process in processes.values():
+        process.join(timeout=max(0.0, deadline - time.monotonic()))
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+
+def supervise(process_count: int) -> None:
+    """Run ``process_count`` worker processes and restart any that exit.
+
+    Each process starts the full worker runtime; queue jobs share work through
+    row locks and singleton jobs through advisory locks, so supervisors on
+    several machines can run side by side.
+    """
+
+    spawn = multiprocessing.get_context("spawn")
+    processes: dict[int, multiprocessing.process.BaseProcess] = {}
+    started_at: dict[int, float] = {}
+    restart_at: dict[int, float] = {}
+    backoff: dict[int, float] = {}
+    stopping = False
+
+    def _request_stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, _request_stop)
+
+    def _start(index: int) -> None:
+        process = spawn.Process(
+            target=_run_worker_process,
+            args=(index,),
+            name=f"aveli-worker-{index}",
+        )
+        process.start()
+        processes[index] = process
+        started_at[index] = time.monotonic()
+        logger.info("Started worker process %s (pid %s)", index, process.pid)
+
+    try:
+        for index in range(process_count):
+            _start(index)
+        while not stopping:
+            now = time.monotonic()
+            for index, process in list(processes.items()):
+                if process.is_alive():
+                    continue
+                if index not in restart_at:
+                    if now - started_at[index] >= _HEALTHY_RUNTIME_SECONDS:
+                        backoff[index] = 0.0
+                    else:
+                        backoff[index] = min(
+                            _RESTART_BACKOFF_MAX_SECONDS,
+                            max(1.0, backoff.get(index, 0.0) * 2),
+                        )
+                    restart_at[index] = now + backoff[index]
+                    logger.warning(
+                        "Worker process %s exited with code %s; restarting in %.0fs",
+                        index,
+                        process.exitcode,
+                        backoff[index],
+                    )
+                if now >= restart_at[index]:
+                    restart_at.pop(index)
+                    _start(index)
+            time.sleep(_SUPERVISOR_TICK_SECONDS)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        _stop_processes(processes)
+        logger.info("MVP worker supervisor stopped")
+
+
 if __name__ == "__main__":
     from ..logging_utils import setup_logging
 
     setup_logging()
+    process_count = max(1, int(settings.worker_processes))
     try:
-        asyncio.run(_run_worker_forever())
+        if process_count == 1:
+            asyncio.run(_run_worker_forever())
+        else:
+            # Child processes must resolve their target by the real module
+            # name, not the ``__main__`` this file runs as.
+            importlib.import_module(f"{__package__}.mvp_worker").supervise(process_count)
     except KeyboardInterrupt:
         logger.info("MVP worker runtime stopped")
@@ -11,6 +11,7 @@ from ..config import settings
 from ..db import pool
 from ..observability import log_buffer
 from . import push_provider
+from . import worker_wakeups
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +22,10 @@ _DEFAULT_BATCH_SIZE = 50
 _MAX_ATTEMPTS = 5
 
 
+def _is_push_delivery(delivery: dict[str, Any]) -> bool:
+    return str(delivery.get("channel") or "").strip() == "push"
+
+
 async def _deliver_stub(delivery: dict[str, Any]) -> tuple[str, str | None]:
     del delivery
     return "sent", None
@@ -69,7 +74,7 @@ async def _ensure_push_device_deliveries(
     )
 
 
-async def _push_delivery_summary(cur: Any, delivery_id: str) -> tuple[int, int, int]:
+async def _queue_push_delivery_summary(cur: Any, delivery_id: str) -> None:
     await cur.execute(
         """
         select count(*)::int as total,
@@ -80,51 +85,66 @@ async def _push_delivery_summary(cur: Any, delivery_id: str) -> tuple[int, int,
         """,
         (delivery_id,),
     )
+
+
+async def _read_push_delivery_summary(cur: Any) -> tuple[int, int, int]:
     row = await cur.fetchone()
     if row is None:
         return 0, 0, 0
     return int(row["total"] or 0), int(row["sent"] or 0), int(row["failed"] or 0)
 
 
-async def _deliver_push(cur: Any, delivery: dict[str, Any]) -> tuple[str, str | None]:
-    await _ensure_push_device_deliveries(cur, delivery)
-    await cur.execute(
-        """
-        select pdd.id::text as push_delivery_id,
-               ud.id::text as device_id,
-               ud.push_token,
-               ud.platform
-          from app.notification_push_device_deliveries as pdd
-          join app.user_devices as ud
-            on ud.id = pdd.device_id
-         where pdd.delivery_id = %s::uuid
-           and pdd.status <> 'sent'
-           and pdd.attempts < %s
-         order by ud.created_at asc, ud.id asc
-         for update of pdd
-        """,
-        (delivery["delivery_id"], _MAX_ATTEMPTS),
-    )
-    device_deliveries = [dict(row) for row in await cur.fetchall()]
-    if not device_deliveries:
-        total, sent, failed = await _push_delivery_summary(cur, delivery["delivery_id"])
-        if total == 0 or total == sent:
-            return "sent", None
-        return "failed", "push delivery has no remaining deliverable devices"
+async def _load_push_device_deliveries(
+    conn: Any,
+    deliveries: list[dict[str, Any]],
+) -> None:
+    """Attach the pending device rows to each push delivery.
+
+    The projection inserts and device reads for the whole batch are queued in
+    one pipeline, so the batch costs a single round trip instead of two per
+    delivery.
+    """
+
+    if not deliveries:
+        return
+    async with conn.pipeline():  # type: ignore[attr-defined]
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            for delivery in deliveries:
+                await _ensure_push_device_deliveries(cur, delivery)
+        device_cursors = []
+        for delivery in deliveries:
+            device_cur = conn.cursor(row_factory=dict_row)  # type: ignore[attr-defined]
+            await device_cur.execute(
+                """
+                select pdd.id::text as push_delivery_id,
+                       ud.id::text as device_id,
+                       ud.push_token,
+                       ud.platform
+                  from app.notification_push_device_deliveries as pdd
+                  join app.user_devices as ud
+                    on ud.id = pdd.device_id
+                 where pdd.delivery_id = %s::uuid
+                   and pdd.status <> 'sent'
+                   and pdd.attempts < %s
+                 order by ud.created_at asc, ud.id asc
+                """,
+                (delivery["delivery_id"], _MAX_ATTEMPTS),
+            )
+            device_cursors.append(device_cur)
+        for delivery, device_cur in zip(deliveries, device_cursors):
+            async with device_cur:
+                delivery["devices"] = [dict(row) for row in await device_cur.fetchall()]
 
-    message = _push_message_for_delivery(delivery)
-    try:
-        provider = push_provider.get_push_provider()
-        provider_error: Exception | None = None
-    except Exception as exc:  # configuration errors are recorded per device
-        provider = None
-        provider_error = exc
 
-    failed_errors: list[str] = []
-    for device_delivery in device_deliveries:
-        status = "sent"
-        error_text = None
-        provider_message_id = None
+async def _send_push_device(
+    provider: push_provider.PushProvider | None,
+    provider_error: Exception | None,
+    semaphore: asyncio.Semaphore,
+    delivery: dict[str, Any],
+    device_delivery: dict[str, Any],
+    message: push_provider.PushMessage,
+) -> tuple[str, str | None, str | None]:
+    async with semaphore:
         try:
             if provider_error is not None:
                 raise provider_error
@@ -137,46 +157,196 @@ async def _deliver_push(cur: Any, delivery: dict[str, Any]) -> tuple[str, str |
                 message=message,
             )
         except Exception as exc:
-            status = "failed"
-            error_text = str(exc)[:1000]
-            failed_errors.append(error_text)
             logger.exception(
                 "Push delivery failed delivery_id=%s device_id=%s",
                 delivery["delivery_id"],
                 device_delivery["device_id"],
             )
+            return "failed", None, str(exc)[:1000]
+    return "sent", provider_message_id, None
 
-        await cur.execute(
-            """
-            update app.notification_push_device_deliveries
-               set status = %s,
-                   attempts = attempts + 1,
-                   provider_message_id = %s,
-                   last_attempt_at = clock_timestamp(),
-                   error_text = %s
-             where id = %s::uuid
-            """,
-            (
-                status,
-                provider_message_id,
-                error_text,
-                device_delivery["push_delivery_id"],
-            ),
+
+async def _send_push_deliveries(
+    deliveries: list[dict[str, Any]],
+) -> dict[str, list[tuple[str, str | None, str | None]]]:
+    """Fan out every claimed device send without holding a database transaction."""
+
+    pending = [delivery for delivery in deliveries if delivery.get("devices")]
+    if not pending:
+        return {}
+    try:
+        provider = push_provider.get_push_provider()
+        provider_error: Exception | None = None
+    except Exception as exc:  # configuration errors are recorded per device
+        provider = None
+        provider_error = exc
+
+    semaphore = asyncio.Semaphore(max(1, int(settings.notification_push_concurrency)))
+    jobs = [
+        (delivery, device_delivery)
+        for delivery in pending
+        for device_delivery in delivery["devices"]
+    ]
+    messages = {
+        delivery["delivery_id"]: _push_message_for_delivery(delivery)
+        for delivery in pending
+    }
+    outcomes = await asyncio.gather(
+        *(
+            _send_push_device(
+                provider,
+                provider_error,
+                semaphore,
+                delivery,
+                device_delivery,
+                messages[delivery["delivery_id"]],
+            )
+            for delivery, device_delivery in jobs
         )
+    )
+    results: dict[str, list[tuple[str, str | None, str | None]]] = {}
+    for (delivery, _device_delivery), outcome in zip(jobs, outcomes):
+        results.setdefault(delivery["delivery_id"], []).append(outcome)
+    return results
 
-    total, sent, failed = await _push_delivery_summary(cur, delivery["delivery_id"])
+
+async def _record_push_device_results(
+    cur: Any,
+    delivery: dict[str, Any],
+    outcomes: list[tuple[str, str | None, str | None]],
+) -> None:
+    devices = delivery.get("devices") or []
+    if not devices:
+        return
+    await cur.executemany(
+        """
+        update app.notification_push_device_deliveries
+           set status = %s,
+               attempts = attempts + 1,
+               provider_message_id = %s,
+               last_attempt_at = clock_timestamp(),
+               error_text = %s
+         where id = %s::uuid
+        """,
+        [
+            (status, provider_message_id, error_text, device["push_delivery_id"])
+            for device, (status, provider_message_id, error_text) in zip(
+                devices, outcomes
+            )
+        ],
+    )
+
+
+def _push_delivery_status(
+    delivery: dict[str, Any],
+    outcomes: list[tuple[str, str | None, str | None]],
+    summary: tuple[int, int, int],
+) -> tuple[str, str | None]:
+    total, sent, failed = summary
     if total == 0 or total == sent:
         return "sent", None
+    if not delivery.get("devices"):
+        return "failed", "push delivery has no remaining deliverable devices"
+    failed_errors = [error for _, _, error in outcomes if error]
     if failed > 0:
         return "failed", (failed_errors[0] if failed_errors else "push delivery failed")
     return "failed", "push delivery did not reach all devices"
 
 
-async def _deliver(cur: Any, delivery: dict[str, Any]) -> tuple[str, str | None]:
-    channel = str(delivery.get("channel") or "").strip()
-    if channel == "push":
-        return await _deliver_push(cur, delivery)
-    return await _deliver_stub(delivery)
+async def _record_push_results(
+    conn: Any,
+    deliveries: list[dict[str, Any]],
+    push_results: dict[str, list[tuple[str, str | None, str | None]]],
+) -> dict[str, tuple[str, str | None]]:
+    """Record device outcomes and derive each push delivery's status.
+
+    Device updates and the per-delivery summaries are pipelined together.
+    """
+
+    if not deliveries:
+        return {}
+    async with conn.pipeline():  # type: ignore[attr-defined]
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            for delivery in deliveries:
+                await _record_push_device_results(
+                    cur,
+                    delivery,
+                    push_results.get(delivery["delivery_id"], []),
+                )
+        summary_cursors = []
+        for delivery in deliveries:
+            summary_cur = conn.cursor(row_factory=dict_row)  # type: ignore[attr-defined]
+            await _queue_push_delivery_summary(summary_cur, delivery["delivery_id"])
+            summary_cursors.append(summary_cur)
+        statuses: dict[str, tuple[str, str | None]] = {}
+        for delivery, summary_cur in zip(deliveries, summary_cursors):
+            async with summary_cur:
+                summary = await _read_push_delivery_summary(summary_cur)
+            statuses[delivery["delivery_id"]] = _push_delivery_status(
+                delivery,
+                push_results.get(delivery["delivery_id"], []),
+                summary,
+            )
+    return statuses
+
+
+async def _claim_deliveries(limit: int) -> list[dict[str, Any]]:
+    """Lease pending deliveries in a short transaction.
+
+    Stamping ``last_attempt_at`` keeps other dispatchers off the rows while the
+    sends run outside any transaction; a crashed run is retried once the lease
+    lapses.
+    """
+
+    async with pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor(row_factory=dict_row) as cur:  # type: ignore[attr-defined]
+            await cur.execute(
+                """
+                with claimable as (
+                  select d.id
+                    from app.notification_deliveries as d
+                   where d.status = 'pending'
+                     and d.attempts < %s
+                     and (
+                       d.last_attempt_at is null
+                       or d.last_attempt_at
+                          < clock_timestamp() - make_interval(secs => %s)
+                     )
+                   order by d.attempts asc, d.id asc
+                   limit %s
+                   for update of d skip locked
+                )
+                update app.notification_deliveries as d
+                   set last_attempt_at = clock_timestamp()
+                  from claimable, app.notifications as n
+                 where d.id = claimable.id
+                   and n.id = d.notification_id
+                returning d.id::text as delivery_id,
+                          d.notification_id::text as notification_id,
+                          d.channel,
+                          d.status,
+                          d.attempts,
+                          n.user_id::text as user_id,
+                          n.type as notification_type,
+                          n.payload_json,
+                          n.dedup_key
+                """,
+                (
+                    _MAX_ATTEMPTS,
+                    max(0, int(settings.notification_dispatcher_claim_lease_seconds)),
+                    limit,
+                ),
+            )
+            deliveries = sorted(
+                (dict(row) for row in await cur.fetchall()),
+                key=lambda row: (int(row["attempts"] or 0), row["delivery_id"]),
+            )
+        await _load_push_device_deliveries(
+            conn,
+            [delivery for delivery in deliveries if _is_push_delivery(delivery)],
+        )
+        await conn.commit()
+    return deliveries
 
 
 async def _verification_idle_loop() -> None:
@@ -213,6 +383,7 @@ async def stop_worker() -> None:
     _worker_task = None
     _verification_mode = False
     _worker_run_started_at = None
+    await push_provider.close_push_provider()
     logger.info("Notification dispatcher stopped")
 
 
@@ -220,56 +391,56 @@ async def run_once(*, limit: int = _DEFAULT_BATCH_SIZE) -> int:
     normalized_limit = max(1, int(limit))
     processed = 0
 
+    deliveries = await _claim_deliveries(normalized_limit)
+    if not deliveries:
+        logger.info(
+            "NOTIFICATION_DISPATCHER_RUN_SUMMARY",
+            extra={"processed": processed},
+        )
+        return processed
+
+    try:
+        push_results = await _send_push_deliveries(deliveries)
+    except Exception:  # pragma: no cover - defensive batch boundary
+        logger.exception("Notification push fan-out failed")
+        push_results = {}
+
     async with pool.connection() as conn:  # type: ignore[attr-defined]
-        async with conn.cursor(row_factory=dict_row) as cur:  # type: ignore[attr-defined]
-            await cur.execute(
+        push_statuses = await _record_push_results(
+            conn,
+            [delivery for delivery in deliveries if _is_push_delivery(delivery)],
+            push_results,
+        )
+        delivery_updates: list[tuple[str, str | None, str]] = []
+        for delivery in deliveries:
+            try:
+                if _is_push_delivery(delivery):
+                    status, error_text = push_statuses[delivery["delivery_id"]]
+                else:
+                    status, error_text = await _deliver_stub(delivery)
+            except Exception as exc:  # pragma: no cover - defensive batch boundary
+                status = "failed"
+                error_text = str(exc)[:1000]
+                logger.exception(
+                    "Notification delivery failed delivery_id=%s",
+                    delivery["delivery_id"],
+                )
+            delivery_updates.append((status, error_text, delivery["delivery_id"]))
+
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            await cur.executemany(
                 """
-                select d.id::text as delivery_id,
-                       d.notification_id::text as notification_id,
-                       d.channel,
-                       d.status,
-                       d.attempts,
-                       n.user_id::text as user_id,
-                       n.type as notification_type,
-                       n.payload_json,
-                       n.dedup_key
-                  from app.notification_deliveries as d
-                  join app.notifications as n
-                    on n.id = d.notification_id
-                 where d.status = 'pending'
-                   and d.attempts < %s
-                 order by d.attempts asc, d.id asc
-                 limit %s
-                 for update of d skip locked
+                update app.notification_deliveries
+                   set status = %s,
+                       attempts = attempts + 1,
+                       last_attempt_at = clock_timestamp(),
+                       error_text = %s
+                 where id = %s::uuid
+                   and status = 'pending'
                 """,
-                (_MAX_ATTEMPTS, normalized_limit),
+                delivery_updates,
             )
-            deliveries = [dict(row) for row in await cur.fetchall()]
-
-            for delivery in deliveries:
-                try:
-                    status, error_text = await _deliver(cur, delivery)
-                except Exception as exc:  # pragma: no cover - defensive batch boundary
-                    status = "failed"
-                    error_text = str(exc)[:1000]
-                    logger.exception(
-                        "Notification delivery failed delivery_id=%s",
-                        delivery["delivery_id"],
-                    )
-
-                await cur.execute(
-                    """
-                    update app.notification_deliveries
-                       set status = %s,
-                           attempts = attempts + 1,
-                           last_attempt_at = clock_timestamp(),
-                           error_text = %s
-                     where id = %s::uuid
-                       and status = 'pending'
-                    """,
-                    (status, error_text, delivery["delivery_id"]),
-                )
-                processed += cur.rowcount
+            processed += max(0, cur.rowcount)
 
         await conn.commit()
 
@@ -281,14 +452,21 @@ async def run_once(*, limit: int = _DEFAULT_BATCH_SIZE) -> int:
 
 
 async def _poll_loop() -> None:
-    while True:
-        try:
-            await run_once()
-        except asyncio.CancelledError:
-            break
-        except Exception as exc:  # pragma: no cover - defensive worker logging
-            logger.exception("Notification dispatcher error: %s", exc)
-        await asyncio.sleep(settings.notification_dispatcher_interval_seconds)
+    await worker_wakeups.subscribe()
+    try:
+        while True:
+            try:
+                await run_once()
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:  # pragma: no cover - defensive worker logging
+                logger.exception("Notification dispatcher error: %s", exc)
+            await worker_wakeups.wait(
+                worker_wakeups.NOTIFICATION_DELIVERIES_CHANNEL,
+                settings.notification_dispatcher_interval_seconds,
+            )
+    finally:
+        await worker_wakeups.unsubscribe()
 
 
 def get_metrics() -> dict[str, Any]:
@@ -309,6 +487,7 @@ def get_metrics() -> dict[str, Any]:
     return {
         "worker_running": _worker_task is not None and not _worker_task.done(),
         "poll_interval_seconds": settings.notification_dispatcher_interval_seconds,
+        "push_concurrency": settings.notification_push_concurrency,
         "last_error": last_error,
         "verification_mode": _verification_mode,
         "write_suppressed": _verification_mode,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 from dataclasses import dataclass
@@ -45,6 +46,7 @@ class FirebasePushProvider:
         token_url: str,
         api_base_url: str,
         timeout_seconds: float,
+        max_connections: int = 16,
     ) -> None:
         self._project_id = project_id
         self._client_email = client_email
@@ -52,8 +54,14 @@ class FirebasePushProvider:
         self._token_url = token_url
         self._api_base_url = api_base_url.rstrip("/")
         self._timeout = httpx.Timeout(timeout_seconds)
+        self._limits = httpx.Limits(
+            max_connections=max(1, int(max_connections)),
+            max_keepalive_connections=max(1, int(max_connections)),
+        )
+        self._client: httpx.AsyncClient | None = None
         self._access_token: str | None = None
         self._access_token_expires_at = 0.0
+        self._token_lock = asyncio.Lock()
 
     @classmethod
     def from_settings(cls, active_settings: Settings) -> "FirebasePushProvider":
@@ -76,13 +84,38 @@ class FirebasePushProvider:
             token_url=active_settings.fcm_oauth_token_url,
             api_base_url=active_settings.fcm_api_base_url,
             timeout_seconds=active_settings.fcm_request_timeout_seconds,
+            max_connections=active_settings.notification_push_concurrency,
         )
 
-    async def _bearer_token(self) -> str:
-        now = int(time.time())
+    def _http_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self._timeout, limits=self._limits)
+        return self._client
+
+    async def aclose(self) -> None:
+        client = self._client
+        self._client = None
+        if client is not None:
+            await client.aclose()
+
+    def _cached_bearer_token(self) -> str | None:
         if self._access_token and time.time() < self._access_token_expires_at:
             return self._access_token
+        return None
 
+    async def _bearer_token(self) -> str:
+        cached = self._cached_bearer_token()
+        if cached is not None:
+            return cached
+        # Concurrent sends share one refresh instead of each minting a token.
+        async with self._token_lock:
+            cached = self._cached_bearer_token()
+            if cached is not None:
+                return cached
+            return await self._refresh_bearer_token()
+
+    async def _refresh_bearer_token(self) -> str:
+        now = int(time.time())
         claims = {
             "iss": self._client_email,
             "scope": _FCM_SCOPE,
@@ -91,11 +124,10 @@ class FirebasePushProvider:
             "exp": now + 3600,
         }
         assertion = jwt.encode(claims, self._private_key, algorithm="RS256")
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(
-                self._token_url,
-                data={"grant_type": _JWT_GRANT_TYPE, "assertion": assertion},
-            )
+        response = await self._http_client().post(
+            self._token_url,
+            data={"grant_type": _JWT_GRANT_TYPE, "assertion": assertion},
+        )
         if response.status_code >= 400:
             raise PushProviderError(
                 f"Firebase OAuth token request failed with status {response.status_code}"
@@ -127,12 +159,11 @@ class FirebasePushProvider:
             }
         }
         url = f"{self._api_base_url}/v1/projects/{self._project_id}/messages:send"
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(
-                url,
-                headers={"Authorization": f"Bearer {bearer_token}"},
-                json=payload,
-            )
+        response = await self._http_client().post(
+            url,
+            headers={"Authorization": f"Bearer {bearer_token}"},
+            json=payload,
+        )
         if response.status_code >= 400:
             raise PushProviderError(
                 f"Firebase push send failed with status {response.status_code}"
@@ -197,12 +228,21 @@ def set_push_provider_for_tests(provider: PushProvider | None) -> None:
     _provider = provider
 
 
+async def close_push_provider() -> None:
+    """Release the provider's pooled HTTP connections."""
+
+    aclose = getattr(_provider, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
 __all__ = [
     "FirebasePushProvider",
     "PushMessage",
     "PushProvider",
     "PushProviderConfigurationError",
     "PushProviderError",
+    "close_push_provider",
     "get_push_provider",
     "set_push_provider_for_tests",
 ]
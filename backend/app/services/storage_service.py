@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 import time
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Sequence
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Mapping
@@ -24,10 +25,79 @@ def storage_upload_http_timeout() -> httpx.Timeout:
     return httpx.Timeout(900.0, connect=5.0, read=900.0, write=900.0, pool=5.0)
 
 
+def storage_download_http_timeout() -> httpx.Timeout:
+    return httpx.Timeout(connect=5.0, read=5.0, write=5.0, pool=5.0)
+
+
 def storage_http_limits() -> httpx.Limits:
     return httpx.Limits(max_keepalive_connections=0)
 
 
+def storage_shared_http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=64,
+        max_keepalive_connections=32,
+        keepalive_expiry=60.0,
+    )
+
+
+_STORAGE_HTTP_PROFILES: dict[str, Callable[[], httpx.Timeout]] = {
+    "default": storage_http_timeout,
+    "upload": storage_upload_http_timeout,
+    "download": storage_download_http_timeout,
+    "proxy": storage_http_timeout,
+}
+_shared_http_clients: dict[str, httpx.AsyncClient] | None = None
+_BULK_SIGN_BATCH_SIZE = 100
+
+
+async def open_shared_http_clients() -> None:
+    """Enable process-wide keep-alive clients for Supabase Storage traffic."""
+
+    global _shared_http_clients
+    if _shared_http_clients is None:
+        _shared_http_clients = {}
+
+
+async def close_shared_http_clients() -> None:
+    global _shared_http_clients
+    clients, _shared_http_clients = _shared_http_clients, None
+    for client in (clients or {}).values():
+        await client.aclose()
+
+
+def _shared_http_client(profile: str) -> httpx.AsyncClient | None:
+    clients = _shared_http_clients
+    if clients is None:
+        return None
+    client = clients.get(profile)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=_STORAGE_HTTP_PROFILES[profile](),
+            limits=storage_shared_http_limits(),
+            http2=True,
+        )
+        clients[profile] = client
+    return client
+
+
+@asynccontextmanager
+async def storage_http_client(profile: str = "default") -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the shared storage client, or a one-off client outside the app lifespan."""
+
+    if profile not in _STORAGE_HTTP_PROFILES:
+        raise ValueError(f"unknown storage http profile: {profile}")
+    shared = _shared_http_client(profile)
+    if shared is not None:
+        yield shared
+        return
+    async with httpx.AsyncClient(
+        timeout=_STORAGE_HTTP_PROFILES[profile](),
+        limits=storage_http_limits(),
+    ) as client:
+        yield client
+
+
 def redact_http_url(url: str) -> str:
     try:
         parsed = urlsplit(str(url))
@@ -117,6 +187,29 @@ def _response_size_bytes(response: httpx.Response) -> int | None:
     return None
 
 
+def _presigned_url_from_signed_path(
+    base_url: str,
+    signed_path: str,
+    *,
+    expires_in: int,
+    download_name: str | None,
+) -> PresignedUrl:
+    if download_name is not None:
+        connector = "&" if "?" in signed_path else "?"
+        quoted_download = quote(download_name, safe="")
+        signed_path = f"{signed_path}{connector}download={quoted_download}"
+        headers = {"Content-Disposition": build_content_disposition(download_name)}
+    else:
+        headers = {}
+    if signed_path.startswith("/object/"):
+        absolute_url = f"{base_url}/storage/v1{signed_path}"
+    elif signed_path.startswith("/"):
+        absolute_url = f"{base_url}{signed_path}"
+    else:
+        absolute_url = signed_path
+    return PresignedUrl(url=absolute_url, expires_in=expires_in, headers=headers)
+
+
 class StorageService:
     def __init__(
         self,
@@ -182,10 +275,7 @@ class StorageService:
             self._bucket,
             normalized_path,
         )
-        async with httpx.AsyncClient(
-            timeout=storage_http_timeout(),
-            limits=storage_http_limits(),
-        ) as client:
+        async with storage_http_client() as client:
             try:
                 response = await client.post(
                     request_url,
@@ -242,20 +332,101 @@ class StorageService:
         if not signed_path:
             raise StorageServiceError("signedURL missing in Supabase response")
 
-        if download:
-            connector = "&" if "?" in signed_path else "?"
-            quoted_download = quote(download_name, safe="")
-            signed_path = f"{signed_path}{connector}download={quoted_download}"
-            headers = {"Content-Disposition": build_content_disposition(download_name)}
-        else:
-            headers = {}
-        if signed_path.startswith("/object/"):
-            absolute_url = f"{base_url}/storage/v1{signed_path}"
-        elif signed_path.startswith("/"):
-            absolute_url = f"{base_url}{signed_path}"
-        else:
-            absolute_url = signed_path
-        return PresignedUrl(url=absolute_url, expires_in=expires_in, headers=headers)
+        return _presigned_url_from_signed_path(
+            base_url,
+            signed_path,
+            expires_in=expires_in,
+            download_name=download_name if download else None,
+        )
+
+    async def get_presigned_urls(
+        self,
+        paths: Sequence[str],
+        ttl: int,
+        *,
+        download: bool = False,
+    ) -> dict[str, PresignedUrl]:
+        """Sign many objects through Supabase's multi-object sign endpoint.
+
+        Paths Supabase cannot sign are omitted from the result.
+        """
+
+        supabase_url = self._supabase_url
+        service_role_key = self._service_role_key
+        if not supabase_url or not service_role_key:
+            raise StorageServiceError("Supabase Storage is not configured")
+
+        normalized_paths = list(
+            dict.fromkeys(_normalize_storage_path(path) for path in paths)
+        )
+        if not normalized_paths:
+            return {}
+        expires_in = max(60, min(int(ttl), 60 * 60 * 24))
+        base_url = supabase_url.rstrip("/")
+        request_url = f"{base_url}/storage/v1/object/sign/{self._bucket}"
+
+        signed: dict[str, PresignedUrl] = {}
+        for offset in range(0, len(normalized_paths), _BULK_SIGN_BATCH_SIZE):
+            batch = normalized_paths[offset : offset + _BULK_SIGN_BATCH_SIZE]
+            logger.info(
+                "Supabase Storage bulk presigned URL request started bucket=%s paths=%s",
+                self._bucket,
+                len(batch),
+            )
+            async with storage_http_client() as client:
+                try:
+                    response = await client.post(
+                        request_url,
+                        json={"expiresIn": expires_in, "paths": batch},
+                        headers={
+                            "apikey": service_role_key,
+                            "Authorization": f"Bearer {service_role_key}",
+                            "Content-Type": "application/json",
+                        },
+                    )
+                except httpx.HTTPError as exc:  # pragma: no cover - network failure path
+                    logger.warning(
+                        "Supabase Storage bulk presigned URL request failed bucket=%s paths=%s error=%s",
+                        self._bucket,
+                        len(batch),
+                        exc,
+                    )
+                    raise StorageServiceError("Failed to call Supabase Storage") from exc
+            logger.info(
+                "Supabase Storage bulk presigned URL request completed bucket=%s paths=%s status=%s",
+                self._bucket,
+                len(batch),
+                response.status_code,
+            )
+            if response.status_code >= 400:
+                raise StorageServiceError(
+                    f"Supabase Storage bulk signing failed with status {response.status_code}",
+                    status_code=response.status_code,
+                )
+
+            data = response.json()
+            if not isinstance(data, list):
+                raise StorageServiceError("Unexpected Supabase bulk signing response")
+            for entry in data:
+                if not isinstance(entry, dict):
+                    continue
+                path = str(entry.get("path") or "").strip().lstrip("/")
+                signed_path = entry.get("signedURL")
+                if path not in batch or not signed_path or entry.get("error"):
+                    logger.warning(
+                        "Supabase Storage bulk presigned URL entry failed bucket=%s path=%s error=%s",
+                        self._bucket,
+                        path or "<missing>",
+                        entry.get("error"),
+                    )
+                    continue
+                signed[path] = _presigned_url_from_signed_path(
+                    base_url,
+                    signed_path,
+                    expires_in=expires_in,
+                    download_name=(Path(path).name or "media") if download else None,
+                )
+        return signed
 
     async def inspect_object(self, path: str, *, ttl: int = 60) -> StorageObjectMetadata:
         if not path:
@@ -268,10 +439,7 @@ class StorageService:
             download=False,
         )
 
-        async with httpx.AsyncClient(
-            timeout=storage_http_timeout(),
-            limits=storage_http_limits(),
-        ) as client:
+        async with storage_http_client() as client:
             try:
                 response = await client.head(signed.url)
                 if response.status_code in {405, 501}:
@@ -340,10 +508,7 @@ class StorageService:
             self._bucket,
             normalized_path,
         )
-        async with httpx.AsyncClient(
-            timeout=storage_http_timeout(),
-            limits=storage_http_limits(),
-        ) as client:
+        async with storage_http_client() as client:
             try:
                 response = await client.post(
                     request_url,
@@ -427,10 +592,7 @@ class StorageService:
             logged_content_type,
         )
         started_at = time.monotonic()
-        async with httpx.AsyncClient(
-            timeout=storage_upload_http_timeout(),
-            limits=storage_http_limits(),
-        ) as client:
+        async with storage_http_client("upload") as client:
             try:
                 response = await client.put(
                     upload.url,
@@ -551,10 +713,7 @@ class StorageService:
             self._bucket,
             normalized_path,
         )
-        async with httpx.AsyncClient(
-            timeout=storage_http_timeout(),
-            limits=storage_http_limits(),
-        ) as client:
+        async with storage_http_client() as client:
             try:
                 response = await client.delete(
                     request_url,
@@ -654,10 +813,7 @@ async def copy_object(
         cache_seconds=cache_seconds,
     )
 
-    async with httpx.AsyncClient(
-        timeout=storage_http_timeout(),
-        limits=storage_http_limits(),
-    ) as client:
+    async with storage_http_client() as client:
         logger.info(
             "Supabase Storage copy download request started source_bucket=%s source_path=%s url=%s",
             normalized_source_bucket,
@@ -7,6 +7,7 @@ from starlette.concurrency import run_in_threadpool
 
 from .. import stripe_mode
 from ..repositories import stripe_customers as stripe_customers_repo
+from . import stripe_gateway
 
 
 async def ensure_customer_id(user: Mapping[str, Any]) -> str:
@@ -25,10 +26,12 @@ async def ensure_customer_id(user: Mapping[str, Any]) -> str:
     stripe.api_key = context.secret_key
 
     def _create_customer() -> dict[str, Any]:
-        return stripe.Customer.create(
-            email=user.get("email"),
-            name=user.get("display_name"),
-            metadata={"user_id": user_id},
+        return stripe_gateway.as_dict(
+            stripe.Customer.create(
+                email=user.get("email"),
+                name=user.get("display_name"),
+                metadata={"user_id": user_id},
+            )
         )
 
     customer = await run_in_threadpool(_create_customer)
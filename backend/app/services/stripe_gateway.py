@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+import stripe
+
+from ..config import settings
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from ..stripe_mode import StripeContext
+
+# Payload handling in this app is written against the API version that
+# stripe-python 5.x pinned; newer SDKs default to a later one, so keep both
+# the module-level API and StripeClient on it.
+STRIPE_API_VERSION = "2022-11-15"
+stripe.api_version = STRIPE_API_VERSION
+
+_shared_http_client: stripe.HTTPXClient | None = None
+_shared_clients: dict[str, stripe.StripeClient] = {}
+# Prices are immutable in Stripe and course products only change through this
+# backend, so objects fetched by id are safe to reuse for a short TTL.
+_object_cache: OrderedDict[tuple[str, str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+
+
+def as_dict(obj: Any) -> Any:
+    """Return a Stripe SDK object as a plain dict; other values pass through.
+
+    Since stripe-python 12 API resources are no longer dicts, while payload
+    handling here reads them with ``.get()`` and checks ``Mapping``. Convert
+    every SDK result at the point it enters the app.
+    """
+
+    to_dict = getattr(obj, "to_dict", None)
+    return to_dict() if callable(to_dict) else obj
+
+
+def _new_http_client() -> stripe.HTTPXClient:
+    return stripe.HTTPXClient(timeout=settings.stripe_http_timeout_seconds)
+
+
+async def open_shared_client() -> None:
+    """Enable a process-wide keep-alive HTTP client for Stripe API calls."""
+
+    global _shared_http_client
+    if _shared_http_client is None:
+        _shared_http_client = _new_http_client()
+
+
+async def close_shared_client() -> None:
+    global _shared_http_client
+    http_client, _shared_http_client = _shared_http_client, None
+    _shared_clients.clear()
+    _object_cache.clear()
+    if http_client is not None:
+        await http_client.close_async()
+
+
+@asynccontextmanager
+async def _stripe_client(context: StripeContext) -> AsyncIterator[stripe.StripeClient]:
+    """Yield a client on the shared connection pool, or a one-off client outside the app lifespan."""
+
+    shared_http_client = _shared_http_client
+    if shared_http_client is not None:
+        client = _shared_clients.get(context.secret_key)
+        if client is None:
+            client = stripe.StripeClient(
+                context.secret_key,
+                http_client=shared_http_client,
+                stripe_version=STRIPE_API_VERSION,
+            )
+            _shared_clients[context.secret_key] = client
+        yield client
+        return
+    http_client = _new_http_client()
+    try:
+        yield stripe.StripeClient(
+            context.secret_key,
+            http_client=http_client,
+            stripe_version=STRIPE_API_VERSION,
+        )
+    finally:
+        await http_client.close_async()
+
+
+def _request_options(idempotency_key: str | None) -> dict[str, Any]:
+    return {"idempotency_key": idempotency_key} if idempotency_key else {}
+
+
+def _cache_key(context: StripeContext, kind: str, object_id: str) -> tuple[str, str, str]:
+    return (context.secret_key, kind, object_id)
+
+
+def _cache_get(key: tuple[str, str, str]) -> dict[str, Any] | None:
+    entry = _object_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at <= time.monotonic():
+        _object_cache.pop(key, None)
+        return None
+    _object_cache.move_to_end(key)
+    return value
+
+
+def _cache_put(key: tuple[str, str, str], value: dict[str, Any]) -> None:
+    ttl = settings.stripe_object_cache_ttl_seconds
+    if ttl <= 0:
+        return
+    _object_cache[key] = (time.monotonic() + ttl, value)
+    _object_cache.move_to_end(key)
+    while len(_object_cache) > max(1, settings.stripe_object_cache_max_entries):
+        _object_cache.popitem(last=False)
+
+
+def clear_object_cache() -> None:
+    _object_cache.clear()
+
+
+async def retrieve_price(context: StripeContext, price_id: str) -> dict[str, Any]:
+    key = _cache_key(context, "price", price_id)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    async with _stripe_client(context) as client:
+        price = as_dict(await client.v1.prices.retrieve_async(price_id))
+    _cache_put(key, price)
+    return price
+
+
+async def retrieve_product(context: StripeContext, product_id: str) -> dict[str, Any]:
+    key = _cache_key(context, "product", product_id)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    async with _stripe_client(context) as client:
+        product = as_dict(await client.v1.products.retrieve_async(product_id))
+    _cache_put(key, product)
+    return product
+
+
+async def create_product(
+    context: StripeContext,
+    *,
+    idempotency_key: str | None = None,
+    **params: Any,
+) -> dict[str, Any]:
+    async with _stripe_client(context) as client:
+        product = as_dict(
+            await client.v1.products.create_async(
+                params,  # type: ignore[arg-type]
+                _request_options(idempotency_key),  # type: ignore[arg-type]
+            )
+        )
+    if isinstance(product.get("id"), str):
+        _cache_put(_cache_key(context, "product", product["id"]), product)
+    return product
+
+
+async def create_price(
+    context: StripeContext,
+    *,
+    idempotency_key: str | None = None,
+    **params: Any,
+) -> dict[str, Any]:
+    async with _stripe_client(context) as client:
+        price = as_dict(
+            await client.v1.prices.create_async(
+                params,  # type: ignore[arg-type]
+                _request_options(idempotency_key),  # type: ignore[arg-type]
+            )
+        )
+    if isinstance(price.get("id"), str):
+        _cache_put(_cache_key(context, "price", price["id"]), price)
+    return price
+
+
+async def create_customer(context: StripeContext, **params: Any) -> dict[str, Any]:
+    async with _stripe_client(context) as client:
+        return as_dict(
+            await client.v1.customers.create_async(params)  # type: ignore[arg-type]
+        )
+
+
+async def create_checkout_session(
+    context: StripeContext,
+    **params: Any,
+) -> dict[str, Any]:
+    async with _stripe_client(context) as client:
+        return as_dict(
+            await client.v1.checkout.sessions.create_async(params)  # type: ignore[arg-type]
+        )
+
+
+async def modify_subscription(
+    context: StripeContext,
+    subscription_id: str,
+    **params: Any,
+) -> dict[str, Any]:
+    async with _stripe_client(context) as client:
+        return as_dict(
+            await client.v1.subscriptions.update_async(
+                subscription_id,
+                params,  # type: ignore[arg-type]
+            )
+        )
+
+
+async def cancel_subscription(
+    context: StripeContext,
+    subscription_id: str,
+) -> dict[str, Any]:
+    async with _stripe_client(context) as client:
+        return as_dict(await client.v1.subscriptions.cancel_async(subscription_id))
+
+
+async def create_refund(
+    context: StripeContext,
+    *,
+    idempotency_key: str | None = None,
+    **params: Any,
+) -> dict[str, Any]:
+    async with _stripe_client(context) as client:
+        return as_dict(
+            await client.v1.refunds.create_async(
+                params,  # type: ignore[arg-type]
+                _request_options(idempotency_key),  # type: ignore[arg-type]
+            )
+        )
+
+
+__all__ = [
+    "as_dict",
+    "cancel_subscription",
+    "clear_object_cache",
+    "close_shared_client",
+    "create_checkout_session",
+    "create_customer",
+    "create_price",
+    "create_product",
+    "create_refund",
+    "modify_subscription",
+    "open_shared_client",
+    "retrieve_price",
+    "retrieve_product",
+]
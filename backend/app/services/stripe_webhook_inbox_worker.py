@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Mapping
+
+from ..config import settings
+from ..observability import log_buffer
+from ..repositories import stripe_webhook_inbox as inbox_repo
+from . import stripe_webhook_membership_service
+
+logger = logging.getLogger(__name__)
+
+EventProcessor = Callable[[Mapping[str, Any]], Awaitable[object]]
+
+_CHECKOUT_SESSION_COMPLETION_EVENTS = {
+    "checkout.session.completed",
+    "checkout.session.async_payment_succeeded",
+}
+
+_worker_task: asyncio.Task[None] | None = None
+_verification_mode = False
+_worker_run_started_at: float | None = None
+
+
+def _mapping(value: object) -> Mapping[str, Any]:
+    return value if isinstance(value, Mapping) else {}
+
+
+def _reference_id(value: object) -> str | None:
+    if isinstance(value, Mapping):
+        value = value.get("id")
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
+
+
+def event_ordering_key(event: Mapping[str, Any]) -> str:
+    """Serialize course and bundle checkouts per order, everything else per customer.
+
+    Membership checkouts, subscription and invoice events all update the one
+    membership row of a customer, so they share the customer key.
+    """
+
+    data_object = _mapping(_mapping(event.get("data")).get("object"))
+    if str(event.get("type") or "") in _CHECKOUT_SESSION_COMPLETION_EVENTS and not (
+        stripe_webhook_membership_service.is_membership_checkout_session(data_object)
+    ):
+        metadata = _mapping(data_object.get("metadata"))
+        order_id = _reference_id(metadata.get("order_id")) or _reference_id(
+            data_object.get("client_reference_id")
+        )
+        if order_id:
+            return f"order:{order_id}"
+    customer_id = _reference_id(data_object.get("customer"))
+    if customer_id:
+        return f"customer:{customer_id}"
+    subscription_id = _reference_id(data_object.get("subscription"))
+    if subscription_id:
+        return f"subscription:{subscription_id}"
+    return f"event:{event.get('id')}"
+
+
+def _event_created_at(event: Mapping[str, Any]) -> datetime | None:
+    created = event.get("created")
+    if isinstance(created, bool) or not isinstance(created, (int, float)):
+        return None
+    return datetime.fromtimestamp(created, tz=timezone.utc)
+
+
+async def enqueue_verified_event(event: Mapping[str, Any]) -> bool:
+    event_id = str(event["id"])
+    inserted = await inbox_repo.enqueue_event(
+        event_id=event_id,
+        event_type=str(event.get("type") or ""),
+        ordering_key=event_ordering_key(event),
+        payload=event,
+        event_created_at=_event_created_at(event),
+    )
+    if not inserted:
+        logger.info("Stripe event %s is already in the webhook inbox", event_id)
+    return inserted
+
+
+def retry_delay_seconds(attempts: int) -> float | None:
+    """Exponential backoff for a failed attempt; None once attempts are exhausted."""
+
+    if attempts >= max(1, int(settings.stripe_webhook_inbox_max_attempts)):
+        return None
+    base = max(1, int(settings.stripe_webhook_inbox_retry_base_seconds))
+    ceiling = max(base, int(settings.stripe_webhook_inbox_retry_max_seconds))
+    return float(min(ceiling, base * 2 ** max(0, attempts - 1)))
+
+
+def _default_processor() -> EventProcessor:
+    # Event dispatch lives with the webhook route so inline and queued
+    # processing share one code path.
+    from ..routes.stripe_webhooks import process_verified_event
+
+    return process_verified_event
+
+
+def _report_failure(row: Mapping[str, Any], exc: Exception, *, permanent: bool) -> None:
+    # Report through the webhook route's Sentry helpers so queued failures
+    # carry the same tags and alerts as inline ones.
+    from ..routes.stripe_webhooks import _capture_exception, _capture_message
+
+    event_type = str(row.get("event_type") or "") or None
+    event_id = str(row["event_id"])
+    _capture_exception(event_type, event_id, exc)
+    if permanent:
+        _capture_message(
+            status="failed",
+            event_type=event_type,
+            event_id=event_id,
+            message="Stripe inbox event failed permanently",
+            level="error",
+        )
+
+
+async def _process_claimed_event(
+    row: Mapping[str, Any],
+    processor: EventProcessor,
+    semaphore: asyncio.Semaphore,
+) -> bool:
+    event_id = str(row["event_id"])
+    attempts = int(row.get("attempts") or 0)
+    async with semaphore:
+        try:
+            await processor(_mapping(row.get("payload")))
+        except Exception as exc:
+            delay = retry_delay_seconds(attempts)
+            if delay is None:
+                logger.error(
+                    "Stripe inbox event %s failed permanently after %s attempts: %s",
+                    event_id,
+                    attempts,
+                    exc,
+                )
+            else:
+                logger.warning(
+                    "Stripe inbox event %s failed (attempt %s); retrying in %ss: %s",
+                    event_id,
+                    attempts,
+                    int(delay),
+                    exc,
+                )
+            _report_failure(row, exc, permanent=delay is None)
+            await inbox_repo.mark_event_failed(
+                event_id,
+                error=f"{type(exc).__name__}: {exc}",
+                retry_in_seconds=delay,
+            )
+            return False
+        await inbox_repo.mark_event_succeeded(event_id)
+        return True
+
+
+async def run_once(
+    *,
+    limit: int | None = None,
+    processor: EventProcessor | None = None,
+) -> int:
+    normalized_limit = max(1, int(limit or settings.stripe_webhook_inbox_batch_size))
+    rows = await inbox_repo.claim_due_events(
+        limit=normalized_limit,
+        lease_seconds=settings.stripe_webhook_inbox_lease_seconds,
+    )
+    if not rows:
+        return 0
+
+    active_processor = processor or _default_processor()
+    semaphore = asyncio.Semaphore(max(1, int(settings.stripe_webhook_inbox_concurrency)))
+    results = await asyncio.gather(
+        *(_process_claimed_event(row, active_processor, semaphore) for row in rows)
+    )
+    processed = sum(1 for succeeded in results if succeeded)
+    logger.info(
+        "STRIPE_WEBHOOK_INBOX_RUN_SUMMARY",
+        extra={"claimed": len(rows), "processed": processed},
+    )
+    return processed
+
+
+async def _poll_loop() -> None:
+    while True:
+        claimed_full_batch = False
+        try:
+            processed = await run_once()
+            claimed_full_batch = processed >= settings.stripe_webhook_inbox_batch_size
+        except asyncio.CancelledError:
+            break
+        except Exception as exc:  # pragma: no cover - defensive worker logging
+            logger.exception("Stripe webhook inbox worker error: %s", exc)
+        if not claimed_full_batch:
+            await asyncio.sleep(settings.stripe_webhook_inbox_interval_seconds)
+
+
+async def _verification_idle_loop() -> None:
+    while True:
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            break
+
+
+async def start_worker(*, verification_mode: bool = False) -> None:
+    global _worker_task, _verification_mode, _worker_run_started_at
+    if _worker_task is not None:
+        return
+    if not settings.stripe_webhook_inbox_enabled:
+        logger.info("Stripe webhook inbox worker disabled")
+        return
+    _verification_mode = verification_mode
+    _worker_run_started_at = time.time()
+    if verification_mode:
+        _worker_task = asyncio.create_task(_verification_idle_loop())
+        logger.info("Stripe webhook inbox worker started in no-write verification mode")
+        return
+    _worker_task = asyncio.create_task(_poll_loop())
+    logger.info("Stripe webhook inbox worker started")
+
+
+async def stop_worker() -> None:
+    global _worker_task, _verification_mode, _worker_run_started_at
+    if _worker_task is None:
+        return
+    _worker_task.cancel()
+    try:
+        await _worker_task
+    except asyncio.CancelledError:
+        pass
+    _worker_task = None
+    _verification_mode = False
+    _worker_run_started_at = None
+    logger.info("Stripe webhook inbox worker stopped")
+
+
+def get_metrics() -> dict[str, Any]:
+    if _worker_run_started_at is None:
+        last_error = None
+    else:
+        last_error = next(
+            iter(
+                log_buffer.list_events(
+                    limit=1,
+                    min_level="ERROR",
+                    logger_names={__name__},
+                    since_epoch_seconds=_worker_run_started_at,
+                )
+            ),
+            None,
+        )
+    return {
+        "enabled": settings.stripe_webhook_inbox_enabled,
+        "worker_running": _worker_task is not None and not _worker_task.done(),
+        "poll_interval_seconds": settings.stripe_webhook_inbox_interval_seconds,
+        "concurrency": settings.stripe_webhook_inbox_concurrency,
+        "last_error": last_error,
+        "verification_mode": _verification_mode,
+        "write_suppressed": _verification_mode,
+    }
+
+
+__all__ = [
+    "enqueue_verified_event",
+    "event_ordering_key",
+    "get_metrics",
+    "run_once",
+    "start_worker",
+    "stop_worker",
+]
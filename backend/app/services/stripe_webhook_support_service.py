@@ -11,7 +11,7 @@ from .. import stripe_mode
 from ..repositories import orders as orders_repo
 from ..repositories import payments as payments_repo
 from ..repositories import teachers as teachers_repo
-from ..services import checkout_service, stripe_webhook_course_service
+from ..services import checkout_service, stripe_gateway, stripe_webhook_course_service
 
 logger = logging.getLogger(__name__)
 
@@ -114,7 +114,9 @@ async def handle_connect_event(
 
     stripe.api_key = context.secret_key
     try:
-        account = await run_in_threadpool(lambda: stripe.Account.retrieve(account_id))
+        account = await run_in_threadpool(
+            lambda: stripe_gateway.as_dict(stripe.Account.retrieve(account_id))
+        )
     except stripe.error.InvalidRequestError as exc:  # type: ignore[attr-defined]
         logger.warning("Failed to fetch account %s: %s", account_id, exc)
         return
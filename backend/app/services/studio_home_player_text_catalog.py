@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from fastapi import Request
 from fastapi.responses import JSONResponse
 
+from .. import schemas
+from .text_catalog_service import stable_bundle_hash
+
 _SOURCE_CONTRACT = "actual_truth/contracts/backend_text_catalog_contract.md"
 _STUDIO_LIBRARY_API_SURFACE = "/studio/home-player/library"
 _HOME_AUDIO_API_SURFACE = "/home/audio"
@@ -744,6 +748,38 @@ def build_home_audio_runtime_text_bundle() -> dict[str, dict[str, Any]]:
     return {entry["text_id"]: entry for entry in entries}
 
 
+class CompiledHomePlayerTextBundle:
+    """A Home Player text bundle validated and hashed once at import."""
+
+    def __init__(self, entries: dict[str, dict[str, Any]]) -> None:
+        self.entries: Mapping[str, dict[str, Any]] = MappingProxyType(entries)
+        self.hash = stable_bundle_hash(entries)
+        self.text_values: Mapping[str, schemas.HomePlayerCatalogTextValue] = (
+            MappingProxyType(
+                {
+                    text_id: schemas.HomePlayerCatalogTextValue(**entry)
+                    for text_id, entry in entries.items()
+                }
+            )
+        )
+
+    def response_text_bundle(
+        self,
+        known_hashes: frozenset[str],
+    ) -> dict[str, schemas.HomePlayerCatalogTextValue]:
+        if self.hash in known_hashes:
+            return {}
+        return dict(self.text_values)
+
+
+STUDIO_HOME_PLAYER_TEXT_BUNDLE = CompiledHomePlayerTextBundle(
+    build_studio_home_player_text_bundle()
+)
+HOME_AUDIO_RUNTIME_TEXT_BUNDLE = CompiledHomePlayerTextBundle(
+    build_home_audio_runtime_text_bundle()
+)
+
+
 def is_home_player_request(request: Request) -> bool:
     path = request.url.path
     return (
@@ -807,12 +843,8 @@ _ERROR_CODE_BY_TEXT_ID = {
 
 
 def _lookup_text_entry(text_id: str) -> dict[str, Any]:
-    for bundle_builder in (
-        build_studio_home_player_text_bundle,
-        build_home_audio_runtime_text_bundle,
-    ):
-        bundle = bundle_builder()
-        entry = bundle.get(text_id)
+    for bundle in (STUDIO_HOME_PLAYER_TEXT_BUNDLE, HOME_AUDIO_RUNTIME_TEXT_BUNDLE):
+        entry = bundle.entries.get(text_id)
         if entry is not None:
             return entry
     raise KeyError(f"Unknown Home Player text id: {text_id}")
@@ -5,11 +5,11 @@ from datetime import datetime, timezone
 from typing import Any, Mapping
 
 import stripe
-from starlette.concurrency import run_in_threadpool
 
 from .. import stripe_mode
 from ..config import settings
 from ..db import pool
+from ..repositories import auth_identity as auth_identity_repo
 from ..repositories import memberships as memberships_repo
 from ..repositories import membership_support as membership_support_repo
 from ..repositories import orders as orders_repo
@@ -18,6 +18,7 @@ from ..repositories import stripe_customers as stripe_customers_repo
 from ..schemas.billing import SubscriptionCheckoutResponse, SubscriptionInterval
 from ..services.onboarding_state import sync_onboarding_state
 from . import notification_service
+from . import stripe_gateway
 from ..utils import membership_status
 
 logger = logging.getLogger(__name__)
@@ -74,9 +75,8 @@ async def create_subscription_checkout(
     except stripe_mode.StripeConfigurationError as exc:
         raise SubscriptionConfigError(str(exc)) from exc
 
-    stripe.api_key = stripe_context.secret_key
     user_id = str(user["id"])
-    customer_id = await _get_or_create_customer(user)
+    customer_id = await _get_or_create_customer(user, stripe_context)
     amount_cents, currency = _extract_amount_and_currency(price)
 
     metadata: dict[str, Any] = {
@@ -101,8 +101,9 @@ async def create_subscription_checkout(
 
     return_url = _build_frontend_url(RETURN_PATH)
 
-    def _create_session() -> dict[str, Any]:
-        return stripe.checkout.Session.create(
+    try:
+        session = await stripe_gateway.create_checkout_session(
+            stripe_context,
             mode="subscription",
             customer=customer_id,
             line_items=[{"price": price_config.price_id, "quantity": 1}],
@@ -119,9 +120,6 @@ async def create_subscription_checkout(
                 },
             },
         )
-
-    try:
-        session = await run_in_threadpool(_create_session)
     except stripe.error.InvalidRequestError as exc:  # type: ignore[attr-defined]
         if getattr(exc, "code", "") == "resource_missing":
             raise SubscriptionConfigError(
@@ -178,16 +176,13 @@ async def cancel_subscription_intent(
         user_id,
         requested_subscription_id=subscription_id,
     )
-    stripe.api_key = stripe_context.secret_key
 
-    def _submit_cancel_intent() -> dict[str, Any]:
-        return stripe.Subscription.modify(  # type: ignore[attr-defined]
+    try:
+        updated = await stripe_gateway.modify_subscription(
+            stripe_context,
             resolved_subscription_id,
             cancel_at_period_end=True,
         )
-
-    try:
-        updated = await run_in_threadpool(_submit_cancel_intent)
     except stripe.error.InvalidRequestError as exc:  # type: ignore[attr-defined]
         raise SubscriptionError(
             "Stripe kunde inte registrera avsiktsavbokningen",
@@ -272,26 +267,9 @@ async def _apply_membership_refund_resolution(
         order,
         requested_payment_intent=payment_intent_id,
     )
-    stripe.api_key = stripe_context.secret_key
-
-    def _cancel_now() -> dict[str, Any]:
-        return stripe.Subscription.cancel(  # type: ignore[attr-defined]
-            resolved_subscription_id
-        )
-
-    def _create_refund() -> dict[str, Any]:
-        return stripe.Refund.create(
-            payment_intent=resolved_payment_intent,
-            metadata={
-                "resolution_kind": resolution_kind,
-                "order_id": str(order["id"]),
-                "checkout_type": "membership",
-                "user_id": user_id,
-            },
-        )
 
     try:
-        await run_in_threadpool(_cancel_now)
+        await stripe_gateway.cancel_subscription(stripe_context, resolved_subscription_id)
     except stripe.error.InvalidRequestError as exc:  # type: ignore[attr-defined]
         raise SubscriptionError(
             "Stripe kunde inte stoppa framtida dragningar för medlemskapet",
@@ -304,7 +282,16 @@ async def _apply_membership_refund_resolution(
         ) from exc
 
     try:
-        await run_in_threadpool(_create_refund)
+        await stripe_gateway.create_refund(
+            stripe_context,
+            payment_intent=resolved_payment_intent,
+            metadata={
+                "resolution_kind": resolution_kind,
+                "order_id": str(order["id"]),
+                "checkout_type": "membership",
+                "user_id": user_id,
+            },
+        )
     except stripe.error.InvalidRequestError as exc:  # type: ignore[attr-defined]
         raise SubscriptionError(
             "Stripe kunde inte skapa medlemskapsåterbetalningen",
@@ -356,10 +343,12 @@ async def handle_webhook(payload: bytes, signature: str | None) -> None:
         raise SubscriptionError("Stripe-signatur saknas")
 
     try:
-        event = stripe.Webhook.construct_event(
-            payload=payload.decode("utf-8"),
-            sig_header=signature,
-            secret=secret,
+        event = stripe_gateway.as_dict(
+            stripe.Webhook.construct_event(
+                payload=payload.decode("utf-8"),
+                sig_header=signature,
+                secret=secret,
+            )
         )
     except ValueError as exc:
         raise SubscriptionError("Ogiltig Stripe-payload") from exc
@@ -594,6 +583,8 @@ async def _settle_membership_checkout_session(
                     conn=conn,
                 )
 
+    if membership_activated:
+        auth_identity_repo.invalidate_auth_identity(user_id)
     if order_marked_paid or payment_recorded or membership_activated:
         await sync_onboarding_state(user_id)
 
@@ -834,20 +825,21 @@ def _build_frontend_url(path: str) -> str:
     return f"{base}/{normalized_path}"
 
 
-async def _get_or_create_customer(user: Mapping[str, Any]) -> str:
+async def _get_or_create_customer(
+    user: Mapping[str, Any],
+    stripe_context: stripe_mode.StripeContext,
+) -> str:
     user_id = str(user["id"])
     customer_id = await stripe_customers_repo.get_customer_id_for_user(user_id)
     if customer_id:
         return customer_id
 
-    def _create_customer() -> dict[str, Any]:
-        return stripe.Customer.create(
-            email=user.get("email"),
-            name=user.get("display_name"),
-            metadata={"user_id": user_id},
-        )
-
-    customer = await run_in_threadpool(_create_customer)
+    customer = await stripe_gateway.create_customer(
+        stripe_context,
+        email=user.get("email"),
+        name=user.get("display_name"),
+        metadata={"user_id": user_id},
+    )
     customer_id = customer.get("id")
     if not isinstance(customer_id, str):
         raise SubscriptionError("Kunde inte skapa Stripe-kund", status_code=502)
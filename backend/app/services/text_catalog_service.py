@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import hashlib
 import json
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Final, Mapping
 
 CATALOG_VERSION: Final[str] = "catalog_v1"
@@ -9,6 +11,10 @@ COURSE_CTA_BUNDLE_ID: Final[str] = "course_cta.v1"
 COURSE_LESSON_CHROME_BUNDLE_ID: Final[str] = "course_lesson.chrome.v1"
 GLOBAL_SYSTEM_NAVIGATION_BUNDLE_ID: Final[str] = "global_system.navigation.v1"
 DEFAULT_LOCALE: Final[str] = "sv-SE"
+# Request header carrying the comma-separated hashes of bundles the client
+# already holds; matching bundles are left out of the response body.
+TEXT_BUNDLE_HASHES_HEADER: Final[str] = "X-Text-Bundle-Hashes"
+_MAX_KNOWN_BUNDLE_HASHES: Final[int] = 32
 
 
 class TextCatalogError(RuntimeError):
@@ -90,18 +96,37 @@ _LESSON_CTA_TEXT_ID_BY_TYPE: Final[dict[str, str]] = {
 }
 
 
-def get_bundle(bundle_id: str, locale: str) -> dict[str, object]:
-    if locale != DEFAULT_LOCALE:
-        raise TextCatalogError(f"Unsupported text catalog locale: {locale}")
+def stable_bundle_hash(bundle: dict[str, object]) -> str:
+    encoded = json.dumps(
+        bundle,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        sort_keys=True,
+    ).encode("utf-8")
+    return f"sha256:{hashlib.sha256(encoded).hexdigest()}"
+
+
+@dataclass(frozen=True)
+class CompiledTextBundle:
+    bundle_id: str
+    locale: str
+    texts: Mapping[str, str]
+    hash: str
+
+    def as_payload(self) -> dict[str, object]:
+        return {
+            "bundle_id": self.bundle_id,
+            "locale": self.locale,
+            "version": CATALOG_VERSION,
+            "texts": dict(self.texts),
+            "hash": self.hash,
+        }
 
-    try:
-        source_texts = _TEXTS_BY_BUNDLE[bundle_id]
-        required_text_ids = _REQUIRED_TEXT_IDS_BY_BUNDLE[bundle_id]
-    except KeyError as exc:
-        raise TextCatalogError(f"Unknown text catalog bundle: {bundle_id}") from exc
 
+def _compile_bundle(bundle_id: str, locale: str) -> CompiledTextBundle:
+    source_texts = _TEXTS_BY_BUNDLE[bundle_id]
     texts: dict[str, str] = {}
-    for text_id in required_text_ids:
+    for text_id in _REQUIRED_TEXT_IDS_BY_BUNDLE[bundle_id]:
         value = source_texts.get(text_id)
         if not value:
             raise TextCatalogError(
@@ -115,22 +140,63 @@ def get_bundle(bundle_id: str, locale: str) -> dict[str, object]:
         "version": CATALOG_VERSION,
         "texts": texts,
     }
-    bundle["hash"] = _stable_hash(bundle)
-    return bundle
+    return CompiledTextBundle(
+        bundle_id=bundle_id,
+        locale=locale,
+        texts=MappingProxyType(texts),
+        hash=stable_bundle_hash(bundle),
+    )
+
+
+# The catalog is static, so every bundle is validated and hashed once here
+# instead of on each request.
+_COMPILED_BUNDLES: Final[Mapping[tuple[str, str], CompiledTextBundle]] = MappingProxyType(
+    {
+        (bundle_id, DEFAULT_LOCALE): _compile_bundle(bundle_id, DEFAULT_LOCALE)
+        for bundle_id in _REQUIRED_TEXT_IDS_BY_BUNDLE
+    }
+)
+
+
+def get_compiled_bundle(bundle_id: str, locale: str) -> CompiledTextBundle:
+    if locale != DEFAULT_LOCALE:
+        raise TextCatalogError(f"Unsupported text catalog locale: {locale}")
+    try:
+        return _COMPILED_BUNDLES[(bundle_id, locale)]
+    except KeyError as exc:
+        raise TextCatalogError(f"Unknown text catalog bundle: {bundle_id}") from exc
+
+
+def get_bundle(bundle_id: str, locale: str) -> dict[str, object]:
+    return get_compiled_bundle(bundle_id, locale).as_payload()
+
+
+def parse_known_bundle_hashes(header_value: object) -> frozenset[str]:
+    # Route handlers called directly receive the Header() default, not a str.
+    if not isinstance(header_value, str) or not header_value:
+        return frozenset()
+    hashes = [value.strip() for value in header_value.split(",")]
+    return frozenset(value for value in hashes[:_MAX_KNOWN_BUNDLE_HASHES] if value)
 
 
 def attach_text_bundles(
     response: Any,
     required_bundle_ids: list[str],
     locale: str,
+    *,
+    known_hashes: frozenset[str] = frozenset(),
 ) -> dict[str, Any]:
+    """Attach the required bundles, leaving out those the client already holds."""
+
     payload = _response_payload(response)
     if "text_bundle" in payload:
         raise TextCatalogError("Singular text_bundle is not a valid response field")
 
     bundles = _required_bundles(required_bundle_ids, locale)
-    payload["text_bundles"] = bundles
     _validate_cta_text_bundle_contract(payload, bundles)
+    payload["text_bundles"] = [
+        bundle.as_payload() for bundle in bundles if bundle.hash not in known_hashes
+    ]
     return payload
 
 
@@ -142,12 +208,12 @@ def _response_payload(response: Any) -> dict[str, Any]:
     raise TextCatalogError("Text bundle response cannot be serialized")
 
 
-def _required_bundles(bundle_ids: list[str], locale: str) -> list[dict[str, object]]:
+def _required_bundles(bundle_ids: list[str], locale: str) -> list[CompiledTextBundle]:
     seen: set[tuple[str, str]] = set()
-    bundles: list[dict[str, object]] = []
+    bundles: list[CompiledTextBundle] = []
     for bundle_id in bundle_ids:
-        bundle = get_bundle(bundle_id, locale)
-        key = _bundle_key(bundle)
+        bundle = get_compiled_bundle(bundle_id, locale)
+        key = (bundle.bundle_id, bundle.locale)
         if key in seen:
             raise TextCatalogError(
                 f"Duplicate text bundle requested: {bundle_id}:{locale}"
@@ -157,17 +223,9 @@ def _required_bundles(bundle_ids: list[str], locale: str) -> list[dict[str, obje
     return bundles
 
 
-def _bundle_key(bundle: Mapping[str, object]) -> tuple[str, str]:
-    bundle_id = bundle.get("bundle_id")
-    locale = bundle.get("locale")
-    if not isinstance(bundle_id, str) or not isinstance(locale, str):
-        raise TextCatalogError("Text bundle identity is incomplete")
-    return bundle_id, locale
-
-
 def _validate_cta_text_bundle_contract(
     payload: dict[str, Any],
-    bundles: list[Mapping[str, object]],
+    bundles: list[CompiledTextBundle],
 ) -> None:
     cta = payload.get("cta")
     if cta is None:
@@ -206,21 +264,7 @@ def _cta_text_id_for_payload(payload: Mapping[str, Any], cta: Mapping[str, Any])
 
 
 def _bundle_contains_text_id(
-    bundles: list[Mapping[str, object]],
+    bundles: list[CompiledTextBundle],
     text_id: str,
 ) -> bool:
-    for bundle in bundles:
-        texts = bundle.get("texts")
-        if isinstance(texts, Mapping) and text_id in texts:
-            return True
-    return False
-
-
-def _stable_hash(bundle: dict[str, object]) -> str:
-    encoded = json.dumps(
-        bundle,
-        ensure_ascii=False,
-        separators=(",", ":"),
-        sort_keys=True,
-    ).encode("utf-8")
-    return f"sha256:{hashlib.sha256(encoded).hexdigest()}"
+    return any(text_id in bundle.texts for bundle in bundles)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Sequence, TypeVar
+from uuid import uuid4
+
+import psycopg
+
+from ..config import settings
+from ..repositories import worker_heartbeats as heartbeats_repo
+from . import worker_wakeups
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# First key of the two-key advisory lock space, so singleton job locks cannot
+# collide with advisory locks taken elsewhere on the database.
+_ADVISORY_LOCK_NAMESPACE = 0x41564C  # "AVL"
+# Rows older than this many heartbeat intervals are treated as dead.
+_STALE_HEARTBEAT_INTERVALS = 4
+_PRUNE_HEARTBEAT_INTERVALS = 240
+
+_worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+_process_index = 0
+_jobs: tuple[str, ...] = ()
+_started_at: datetime | None = None
+_last_heartbeat_at: datetime | None = None
+_heartbeat_task: asyncio.Task[None] | None = None
+_singleton_stats: dict[str, dict[str, Any]] = {}
+
+
+def _singleton_entry(job: str) -> dict[str, Any]:
+    return _singleton_stats.setdefault(
+        job,
+        {"runs": 0, "skipped": 0, "last_run_at": None},
+    )
+
+
+async def run_singleton(job: str, run: Callable[[], Awaitable[T]]) -> T | None:
+    """Run ``run`` only if no other process is running ``job``; else return None.
+
+    Leadership is a session-level advisory lock on a dedicated autocommit
+    connection, so no transaction stays open while the job runs its own
+    pooled queries. The lock is released when the run ends, or by the server
+    if the connection drops.
+    """
+
+    stats = _singleton_entry(job)
+    params = (_ADVISORY_LOCK_NAMESPACE, job)
+    conn = await psycopg.AsyncConnection.connect(
+        worker_wakeups.session_conninfo(),
+        autocommit=True,
+    )
+    async with conn:
+        cur = await conn.execute("select pg_try_advisory_lock(%s, hashtext(%s))", params)
+        row = await cur.fetchone()
+        if not (row and row[0]):
+            stats["skipped"] += 1
+            logger.debug("Singleton job %s is running elsewhere; skipping", job)
+            return None
+        stats["runs"] += 1
+        stats["last_run_at"] = time.time()
+        try:
+            return await run()
+        finally:
+            try:
+                await conn.execute("select pg_advisory_unlock(%s, hashtext(%s))", params)
+            except psycopg.Error as exc:
+                # A broken connection has already dropped the lock.
+                logger.warning("Failed to release singleton job %s: %s", job, exc)
+
+
+async def _beat() -> None:
+    global _last_heartbeat_at
+    interval = max(1, int(settings.worker_heartbeat_interval_seconds))
+    await heartbeats_repo.upsert_heartbeat(
+        worker_id=_worker_id,
+        hostname=socket.gethostname(),
+        pid=os.getpid(),
+        process_index=_process_index,
+        jobs=_jobs,
+        started_at=_started_at or datetime.now(timezone.utc),
+        prune_after_seconds=interval * _PRUNE_HEARTBEAT_INTERVALS,
+    )
+    _last_heartbeat_at = datetime.now(timezone.utc)
+
+
+async def _heartbeat_loop() -> None:
+    while True:
+        try:
+            await _beat()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pragma: no cover - defensive worker logging
+            logger.warning("Worker heartbeat failed: %s", exc)
+        await asyncio.sleep(max(1, int(settings.worker_heartbeat_interval_seconds)))
+
+
+async def start_heartbeat(*, process_index: int, jobs: Sequence[str]) -> None:
+    global _heartbeat_task, _process_index, _jobs, _started_at
+    if _heartbeat_task is not None:
+        return
+    _process_index = max(0, int(process_index))
+    _jobs = tuple(jobs)
+    _started_at = datetime.now(timezone.utc)
+    _heartbeat_task = asyncio.create_task(_heartbeat_loop())
+    logger.info(
+        "Worker process heartbeat started",
+        extra={"worker_id": _worker_id, "process_index": _process_index},
+    )
+
+
+async def stop_heartbeat() -> None:
+    global _heartbeat_task, _started_at, _last_heartbeat_at
+    if _heartbeat_task is None:
+        return
+    task, _heartbeat_task = _heartbeat_task, None
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    try:
+        await heartbeats_repo.delete_heartbeat(_worker_id)
+    except Exception as exc:  # pragma: no cover - best effort on shutdown
+        logger.warning("Failed to clear worker heartbeat: %s", exc)
+    _started_at = None
+    _last_heartbeat_at = None
+
+
+async def list_worker_processes() -> list[dict[str, Any]]:
+    interval = max(1, int(settings.worker_heartbeat_interval_seconds))
+    return await heartbeats_repo.list_heartbeats(
+        stale_after_seconds=interval * _STALE_HEARTBEAT_INTERVALS
+    )
+
+
+def singleton_metrics(job: str) -> dict[str, Any]:
+    return dict(_singleton_entry(job))
+
+
+__all__ = [
+    "list_worker_processes",
+    "run_singleton",
+    "singleton_metrics",
+    "start_heartbeat",
+    "stop_heartbeat",
+]
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import psycopg
+from psycopg import sql
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+# Channels are emitted by database triggers (see V2_0043_worker_wakeups.sql).
+MEDIA_ASSETS_CHANNEL = "app_media_assets_uploaded"
+NOTIFICATION_DELIVERIES_CHANNEL = "app_notification_deliveries_pending"
+COURSE_ENROLLMENTS_CHANNEL = "app_course_enrollments_changed"
+MEMBERSHIPS_CHANNEL = "app_memberships_changed"
+
+CHANNELS = (
+    MEDIA_ASSETS_CHANNEL,
+    NOTIFICATION_DELIVERIES_CHANNEL,
+    COURSE_ENROLLMENTS_CHANNEL,
+    MEMBERSHIPS_CHANNEL,
+)
+
+_RECONNECT_MIN_SECONDS = 1.0
+_RECONNECT_MAX_SECONDS = 60.0
+
+_listener_task: asyncio.Task[None] | None = None
+_subscribers = 0
+_events: dict[str, asyncio.Event] = {}
+_listening = False
+
+
+def session_conninfo() -> str:
+    """Connection string for session-level features: LISTEN and advisory locks."""
+
+    url = settings.worker_wakeup_database_url or settings.database_url
+    return url.unicode_string() if url is not None else ""
+
+
+def _wake_all() -> None:
+    for event in _events.values():
+        event.set()
+
+
+async def _listen_loop() -> None:
+    global _listening
+    delay = _RECONNECT_MIN_SECONDS
+    while True:
+        try:
+            conn = await psycopg.AsyncConnection.connect(session_conninfo(), autocommit=True)
+            async with conn:
+                for channel in CHANNELS:
+                    await conn.execute(sql.SQL("listen {}").format(sql.Identifier(channel)))
+                _listening = True
+                delay = _RECONNECT_MIN_SECONDS
+                # Anything emitted while disconnected was lost; let every
+                # worker run one catch-up poll.
+                _wake_all()
+                async for notify in conn.notifies():
+                    event = _events.get(notify.channel)
+                    if event is not None:
+                        event.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("Worker wake-up listener disconnected: %s", exc)
+        finally:
+            _listening = False
+        await asyncio.sleep(delay)
+        delay = min(_RECONNECT_MAX_SECONDS, delay * 2)
+
+
+async def subscribe() -> None:
+    """Start the shared LISTEN connection for the first subscribed worker."""
+
+    global _listener_task, _subscribers
+    _subscribers += 1
+    if _listener_task is not None or not settings.worker_wakeups_enabled:
+        return
+    _events.clear()
+    _events.update({channel: asyncio.Event() for channel in CHANNELS})
+    _listener_task = asyncio.create_task(_listen_loop())
+
+
+async def unsubscribe() -> None:
+    global _listener_task, _subscribers
+    _subscribers = max(0, _subscribers - 1)
+    if _subscribers or _listener_task is None:
+        return
+    task, _listener_task = _listener_task, None
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    _events.clear()
+
+
+async def wait(channel: str, timeout: float) -> bool:
+    """Sleep up to ``timeout`` seconds, returning early when ``channel`` fires.
+
+    Without a running listener this is a plain sleep, so the fixed poll
+    interval stays the fallback. Returns True when woken by a notification.
+    """
+
+    event = _events.get(channel)
+    if event is None:
+        await asyncio.sleep(timeout)
+        return False
+    if event.is_set():
+        event.clear()
+        return True
+    try:
+        await asyncio.wait_for(event.wait(), timeout=max(0.0, timeout))
+    except asyncio.TimeoutError:
+        return False
+    event.clear()
+    return True
+
+
+def get_metrics() -> dict[str, object]:
+    return {
+        "enabled": settings.worker_wakeups_enabled,
+        "listening": _listening,
+        "subscribers": _subscribers,
+        "channels": list(CHANNELS),
+    }
+
+
+__all__ = [
+    "CHANNELS",
+    "COURSE_ENROLLMENTS_CHANNEL",
+    "MEDIA_ASSETS_CHANNEL",
+    "MEMBERSHIPS_CHANNEL",
+    "NOTIFICATION_DELIVERIES_CHANNEL",
+    "get_metrics",
+    "subscribe",
+    "unsubscribe",
+    "wait",
+]
@@ -6,10 +6,10 @@ from enum import Enum
 from typing import Any
 
 import stripe
-from starlette.concurrency import run_in_threadpool
 
 from .config import settings
 from .schemas.billing import SubscriptionInterval
+from .services import stripe_gateway
 
 
 class StripeMode(str, Enum):
@@ -275,12 +275,8 @@ def resolve_webhook_secret(kind: str, context: StripeContext) -> tuple[str, str]
 async def ensure_price_accessible(
     price_config: MembershipPriceConfig, context: StripeContext
 ) -> dict[str, Any]:
-    def _retrieve() -> dict[str, Any]:
-        stripe.api_key = context.secret_key
-        return stripe.Price.retrieve(price_config.price_id)
-
     try:
-        price = await run_in_threadpool(_retrieve)
+        price = await stripe_gateway.retrieve_price(context, price_config.price_id)
     except stripe.error.InvalidRequestError as exc:  # type: ignore[attr-defined]
         if getattr(exc, "code", "") == "resource_missing":
             raise StripeConfigurationError(
@@ -1,29 +1,49 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import logging
 import time
 from typing import Any
 
 import httpx
 from jose import JWTError, jwk, jwt
 
+logger = logging.getLogger(__name__)
+
 _DEFAULT_JWKS_CACHE_SECONDS = 300
+# Refresh this long before expiry so request paths normally see a warm cache.
+_JWKS_REFRESH_AHEAD_SECONDS = 60
+_JWKS_REFRESH_RETRY_SECONDS = 15
+# Expired keys keep verifying tokens while a background refresh runs, up to
+# this age; past it a request waits for the refresh.
+_JWKS_MAX_STALE_SECONDS = 3600
+# Unknown kids force at most one refetch per interval so forged headers
+# cannot turn every request into a JWKS round trip.
+_JWKS_MIN_FORCED_REFRESH_SECONDS = 10
+_JWKS_FETCH_TIMEOUT_SECONDS = 5
 _SUPPORTED_ASYMMETRIC_ALGORITHMS = frozenset({"ES256", "RS256"})
 _JWKS_CACHE: dict[str, Any] = {
     "url": None,
+    "fetched_at": 0.0,
     "expires_at": 0.0,
     "keys": {},
+    "parsed_keys": {},
 }
+_refresh_tasks: dict[str, asyncio.Task[dict[str, dict[str, Any]]]] = {}
+_background_refresh_task: asyncio.Task[None] | None = None
 
 
 class SupabaseJwtError(Exception):
     pass
 
 
-def _fetch_jwks(url: str) -> dict[str, Any]:
+async def _fetch_jwks(url: str) -> dict[str, Any]:
     try:
-        resp = httpx.get(url, timeout=5)
-        resp.raise_for_status()
-        data = resp.json()
+        async with httpx.AsyncClient(timeout=_JWKS_FETCH_TIMEOUT_SECONDS) as client:
+            resp = await client.get(url)
+            resp.raise_for_status()
+            data = resp.json()
     except (httpx.HTTPError, ValueError) as exc:
         raise SupabaseJwtError(f"Failed to fetch JWKS: {exc}") from exc
     if not isinstance(data, dict) or "keys" not in data:
@@ -42,23 +62,121 @@ def _normalize_jwks(data: dict[str, Any]) -> dict[str, dict[str, Any]]:
     return keys
 
 
-def _get_cached_keys(url: str, *, force_refresh: bool = False) -> dict[str, dict[str, Any]]:
-    now = time.monotonic()
-    if not force_refresh:
-        if _JWKS_CACHE["url"] == url and now < _JWKS_CACHE["expires_at"]:
-            cached = _JWKS_CACHE.get("keys")
-            if isinstance(cached, dict):
-                return cached
+def reset_jwks_cache() -> None:
+    _JWKS_CACHE.update(
+        {
+            "url": None,
+            "fetched_at": 0.0,
+            "expires_at": 0.0,
+            "keys": {},
+            "parsed_keys": {},
+        }
+    )
+    _refresh_tasks.clear()
+
 
-    data = _fetch_jwks(url)
-    keys = _normalize_jwks(data)
-    _JWKS_CACHE["url"] = url
-    _JWKS_CACHE["keys"] = keys
-    _JWKS_CACHE["expires_at"] = now + _DEFAULT_JWKS_CACHE_SECONDS
+async def _fetch_and_store_jwks(url: str) -> dict[str, dict[str, Any]]:
+    keys = _normalize_jwks(await _fetch_jwks(url))
+    now = time.monotonic()
+    _JWKS_CACHE.update(
+        {
+            "url": url,
+            "fetched_at": now,
+            "expires_at": now + _DEFAULT_JWKS_CACHE_SECONDS,
+            "keys": keys,
+            "parsed_keys": {},
+        }
+    )
     return keys
 
 
-def verify_supabase_access_token(
+def _refresh_task(url: str) -> asyncio.Task[dict[str, dict[str, Any]]]:
+    """Return the in-flight JWKS fetch for ``url``, starting one if needed."""
+
+    task = _refresh_tasks.get(url)
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.create_task(_fetch_and_store_jwks(url))
+        _refresh_tasks[url] = task
+        task.add_done_callback(lambda done: _discard_refresh_task(url, done))
+    return task
+
+
+def _discard_refresh_task(url: str, task: asyncio.Task[Any]) -> None:
+    if _refresh_tasks.get(url) is task:
+        _refresh_tasks.pop(url, None)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Supabase JWKS refresh failed url=%s: %s", url, task.exception())
+
+
+async def _refresh_jwks(url: str) -> dict[str, dict[str, Any]]:
+    # Shield so a cancelled request does not cancel the fetch other callers
+    # are waiting on.
+    return await asyncio.shield(_refresh_task(url))
+
+
+async def _get_cached_keys(url: str, *, force_refresh: bool = False) -> dict[str, dict[str, Any]]:
+    now = time.monotonic()
+    cached = _JWKS_CACHE.get("keys")
+    if _JWKS_CACHE["url"] == url and isinstance(cached, dict) and cached:
+        if force_refresh:
+            if now - _JWKS_CACHE["fetched_at"] < _JWKS_MIN_FORCED_REFRESH_SECONDS:
+                return cached
+        elif now < _JWKS_CACHE["expires_at"]:
+            return cached
+        elif now < _JWKS_CACHE["expires_at"] + _JWKS_MAX_STALE_SECONDS:
+            _refresh_task(url)
+            return cached
+
+    return await _refresh_jwks(url)
+
+
+def _verification_key(kid: str, alg: str, key_data: dict[str, Any]) -> Any:
+    parsed_keys: dict[tuple[str, str], Any] = _JWKS_CACHE["parsed_keys"]
+    key = parsed_keys.get((kid, alg))
+    if key is None:
+        key = jwk.construct(key_data, alg)
+        parsed_keys[(kid, alg)] = key
+    return key
+
+
+async def _background_refresh_loop(url: str) -> None:
+    while True:
+        try:
+            await _refresh_jwks(url)
+        except SupabaseJwtError:
+            delay = _JWKS_REFRESH_RETRY_SECONDS
+        else:
+            delay = max(
+                _JWKS_REFRESH_RETRY_SECONDS,
+                _JWKS_CACHE["expires_at"] - time.monotonic() - _JWKS_REFRESH_AHEAD_SECONDS,
+            )
+        await asyncio.sleep(delay)
+
+
+async def start_jwks_refresh(url: str) -> None:
+    """Warm the JWKS cache and keep it refreshed ahead of expiry.
+
+    The first fetch runs in the background task, so startup never waits on
+    the JWKS endpoint; requests arriving before it completes join that fetch.
+    """
+
+    global _background_refresh_task
+    if _background_refresh_task is not None or not url:
+        return
+    _background_refresh_task = asyncio.create_task(_background_refresh_loop(url))
+
+
+async def stop_jwks_refresh() -> None:
+    global _background_refresh_task
+    task, _background_refresh_task = _background_refresh_task, None
+    if task is None:
+        return
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+
+async def verify_supabase_access_token(
     token: str,
     *,
     jwks_url: str,
@@ -79,10 +197,10 @@ def verify_supabase_access_token(
     if not kid:
         raise SupabaseJwtError("JWT header missing kid")
 
-    keys = _get_cached_keys(jwks_url)
+    keys = await _get_cached_keys(jwks_url)
     key_data = keys.get(kid)
     if not key_data:
-        keys = _get_cached_keys(jwks_url, force_refresh=True)
+        keys = await _get_cached_keys(jwks_url, force_refresh=True)
         key_data = keys.get(kid)
     if not key_data:
         raise SupabaseJwtError("JWT kid not found in JWKS")
@@ -94,7 +212,7 @@ def verify_supabase_access_token(
     ):
         raise SupabaseJwtError("JWT key is not a P-256 EC key")
 
-    key = jwk.construct(key_data, alg)
+    key = _verification_key(kid, alg, key_data)
     options = {
         "verify_aud": True,
         "verify_iss": True,
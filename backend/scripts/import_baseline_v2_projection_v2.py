@@ -42,6 +42,7 @@ EXPECTED_COUNTS = {
     "media_assets": 680,
     "lesson_media": 2466,
 }
+LOAD_STRATEGIES = ("copy", "rows")
 
 
 class ProjectionV2ImportError(RuntimeError):
@@ -129,6 +130,15 @@ def parse_args() -> argparse.Namespace:
         choices=("preserve_ids",),
         help="Only preserve_ids is supported.",
     )
+    parser.add_argument(
+        "--load-strategy",
+        default="copy",
+        choices=LOAD_STRATEGIES,
+        help=(
+            "copy streams rows into temporary staging tables with binary COPY and "
+            "inserts them set-based; rows issues one INSERT per row."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -488,11 +498,8 @@ def insert_media_assets(cur: psycopg.Cursor, rows: list[MediaAssetRow]) -> None:
 
 
 def insert_lesson_media(cur: psycopg.Cursor, rows: list[LessonMediaRow]) -> None:
+    require_lesson_media_purpose(rows)
     for row in rows:
-        if row.purpose != "lesson_media":
-            raise ProjectionV2ImportError(
-                f"lesson_media placement {row.id} references media purpose {row.purpose!r}"
-            )
         cur.execute(
             """
             insert into app.lesson_media (id, lesson_id, media_asset_id, position)
@@ -502,6 +509,254 @@ def insert_lesson_media(cur: psycopg.Cursor, rows: list[LessonMediaRow]) -> None
         )
 
 
+def require_lesson_media_purpose(rows: list[LessonMediaRow]) -> None:
+    for row in rows:
+        if row.purpose != "lesson_media":
+            raise ProjectionV2ImportError(
+                f"lesson_media placement {row.id} references media purpose {row.purpose!r}"
+            )
+
+
+def insert_rows(cur: psycopg.Cursor, rows: ProjectionRows) -> None:
+    insert_courses(cur, rows.courses)
+    insert_lessons(cur, rows.lessons)
+    insert_lesson_contents(cur, rows.lessons)
+    insert_media_assets(cur, rows.media_assets)
+    insert_lesson_media(cur, rows.lesson_media)
+
+
+# Staging tables keep uuid, enum and timestamp columns as text so the final
+# set-based inserts apply exactly the casts the per-row inserts use.
+STAGING_TABLES: dict[str, tuple[tuple[str, str], ...]] = {
+    "projection_v2_courses_stage": (
+        ("ordinal", "int4"),
+        ("id", "text"),
+        ("teacher_id", "text"),
+        ("title", "text"),
+        ("slug", "text"),
+        ("course_group_id", "text"),
+        ("group_position", "int4"),
+        ("visibility", "text"),
+        ("content_ready", "bool"),
+        ("price_amount_cents", "int4"),
+        ("stripe_product_id", "text"),
+        ("active_stripe_price_id", "text"),
+        ("sellable", "bool"),
+        ("drip_enabled", "bool"),
+        ("drip_interval_days", "int4"),
+        ("cover_media_id", "text"),
+        ("created_at", "text"),
+        ("updated_at", "text"),
+    ),
+    "projection_v2_lessons_stage": (
+        ("ordinal", "int4"),
+        ("id", "text"),
+        ("course_id", "text"),
+        ("title", "text"),
+        ("position", "int4"),
+        ("created_at", "text"),
+        ("updated_at", "text"),
+        ("content_markdown", "text"),
+    ),
+    "projection_v2_media_assets_stage": (
+        ("ordinal", "int4"),
+        ("id", "text"),
+        ("media_type", "text"),
+        ("purpose", "text"),
+        ("original_object_path", "text"),
+        ("ingest_format", "text"),
+        ("file_size", "int8"),
+        ("content_hash_algorithm", "text"),
+        ("content_hash", "text"),
+    ),
+    "projection_v2_lesson_media_stage": (
+        ("ordinal", "int4"),
+        ("id", "text"),
+        ("lesson_id", "text"),
+        ("media_asset_id", "text"),
+        ("position", "int4"),
+    ),
+}
+
+BULK_INSERT_STATEMENTS = (
+    """
+    insert into app.courses (
+      id,
+      teacher_id,
+      title,
+      slug,
+      course_group_id,
+      group_position,
+      visibility,
+      content_ready,
+      price_amount_cents,
+      stripe_product_id,
+      active_stripe_price_id,
+      sellable,
+      drip_enabled,
+      drip_interval_days,
+      cover_media_id,
+      created_at,
+      updated_at
+    )
+    select id::uuid,
+           teacher_id::uuid,
+           title,
+           slug,
+           course_group_id::uuid,
+           group_position,
+           visibility::app.course_visibility,
+           content_ready,
+           price_amount_cents,
+           stripe_product_id,
+           active_stripe_price_id,
+           sellable,
+           drip_enabled,
+           drip_interval_days,
+           cover_media_id::uuid,
+           created_at::timestamptz,
+           updated_at::timestamptz
+      from projection_v2_courses_stage
+     order by ordinal
+    """,
+    """
+    insert into app.lessons (
+      id, course_id, lesson_title, position, created_at, updated_at
+    )
+    select id::uuid, course_id::uuid, title, position, created_at::timestamptz, updated_at::timestamptz
+      from projection_v2_lessons_stage
+     order by ordinal
+    """,
+    """
+    insert into app.lesson_contents (lesson_id, content_markdown)
+    select id::uuid, content_markdown
+      from projection_v2_lessons_stage
+     order by ordinal
+    """,
+    """
+    insert into app.media_assets (
+      id,
+      media_type,
+      purpose,
+      original_object_path,
+      ingest_format,
+      file_size,
+      content_hash_algorithm,
+      content_hash
+    )
+    select id::uuid,
+           media_type::app.media_type,
+           purpose::app.media_purpose,
+           original_object_path,
+           ingest_format,
+           file_size,
+           content_hash_algorithm,
+           content_hash
+      from projection_v2_media_assets_stage
+     order by ordinal
+    """,
+    """
+    insert into app.lesson_media (id, lesson_id, media_asset_id, position)
+    select id::uuid, lesson_id::uuid, media_asset_id::uuid, position
+      from projection_v2_lesson_media_stage
+     order by ordinal
+    """,
+)
+
+
+def create_staging_tables(cur: psycopg.Cursor) -> None:
+    for table, columns in STAGING_TABLES.items():
+        column_sql = ", ".join(f"{name} {type_name}" for name, type_name in columns)
+        cur.execute(f"create temporary table {table} ({column_sql}) on commit drop")
+
+
+def copy_staging_rows(
+    cur: psycopg.Cursor,
+    table: str,
+    rows: list[tuple[Any, ...]],
+) -> None:
+    columns = STAGING_TABLES[table]
+    column_names = ", ".join(name for name, _ in columns)
+    with cur.copy(f"copy {table} ({column_names}) from stdin (format binary)") as copy:
+        copy.set_types([type_name for _, type_name in columns])
+        for ordinal, row in enumerate(rows):
+            copy.write_row((ordinal, *row))
+
+
+def copy_rows(cur: psycopg.Cursor, rows: ProjectionRows) -> None:
+    require_lesson_media_purpose(rows.lesson_media)
+    create_staging_tables(cur)
+    copy_staging_rows(
+        cur,
+        "projection_v2_courses_stage",
+        [
+            (
+                row.id,
+                row.teacher_id,
+                row.title,
+                row.slug,
+                row.course_group_id,
+                row.group_position,
+                row.visibility,
+                row.content_ready,
+                row.price_amount_cents,
+                row.stripe_product_id,
+                row.active_stripe_price_id,
+                row.sellable,
+                row.drip_enabled,
+                row.drip_interval_days,
+                row.cover_media_id,
+                row.created_at,
+                row.updated_at,
+            )
+            for row in rows.courses
+        ],
+    )
+    copy_staging_rows(
+        cur,
+        "projection_v2_lessons_stage",
+        [
+            (
+                row.id,
+                row.course_id,
+                row.title,
+                row.position,
+                row.created_at,
+                row.updated_at,
+                row.content_markdown,
+            )
+            for row in rows.lessons
+        ],
+    )
+    copy_staging_rows(
+        cur,
+        "projection_v2_media_assets_stage",
+        [
+            (
+                row.id,
+                row.media_type,
+                row.purpose,
+                row.original_object_path,
+                row.ingest_format,
+                row.file_size,
+                row.content_hash_algorithm,
+                row.content_hash,
+            )
+            for row in rows.media_assets
+        ],
+    )
+    copy_staging_rows(
+        cur,
+        "projection_v2_lesson_media_stage",
+        [
+            (row.id, row.lesson_id, row.media_asset_id, row.position)
+            for row in rows.lesson_media
+        ],
+    )
+    for statement in BULK_INSERT_STATEMENTS:
+        cur.execute(statement)
+
+
 def post_import_checks(conn: psycopg.Connection, rows: ProjectionRows) -> dict[str, Any]:
     counts = import_table_counts(conn)
     if counts != EXPECTED_COUNTS:
@@ -620,7 +875,14 @@ def post_import_checks(conn: psycopg.Connection, rows: ProjectionRows) -> dict[s
     return {"counts": counts, **checks}
 
 
-def import_projection_v2(export_root: Path, database_url: str) -> dict[str, Any]:
+def import_projection_v2(
+    export_root: Path,
+    database_url: str,
+    *,
+    load_strategy: str = "copy",
+) -> dict[str, Any]:
+    if load_strategy not in LOAD_STRATEGIES:
+        raise ProjectionV2ImportError(f"unknown load strategy {load_strategy!r}")
     require_target_database(database_url)
     export_root = resolve_export_root(str(export_root))
 
@@ -645,11 +907,10 @@ def import_projection_v2(export_root: Path, database_url: str) -> dict[str, Any]
         try:
             with conn.transaction():
                 with conn.cursor() as cur:
-                    insert_courses(cur, rows.courses)
-                    insert_lessons(cur, rows.lessons)
-                    insert_lesson_contents(cur, rows.lessons)
-                    insert_media_assets(cur, rows.media_assets)
-                    insert_lesson_media(cur, rows.lesson_media)
+                    if load_strategy == "copy":
+                        copy_rows(cur, rows)
+                    else:
+                        insert_rows(cur, rows)
                 post_checks = post_import_checks(conn, rows)
         except Exception:
             conn.rollback()
@@ -662,6 +923,7 @@ def import_projection_v2(export_root: Path, database_url: str) -> dict[str, Any]
     return {
         "status": "PASS",
         "mode": "preserve_ids",
+        "load_strategy": load_strategy,
         "target_database": TARGET_DATABASE_NAME,
         "projection_schema": PROJECTION_SCHEMA_V2,
         "before_counts": before_counts,
@@ -676,7 +938,11 @@ def import_projection_v2(export_root: Path, database_url: str) -> dict[str, Any]
 def main() -> int:
     args = parse_args()
     try:
-        result = import_projection_v2(Path(args.export_root), args.database_url)
+        result = import_projection_v2(
+            Path(args.export_root),
+            args.database_url,
+            load_strategy=args.load_strategy,
+        )
     except ProjectionV2ImportError as exc:
         print(
             json.dumps(
@@ -0,0 +1,258 @@
+alter table app.course_enrollments
+  add column next_unlock_at timestamptz;
+
+comment on column app.course_enrollments.next_unlock_at is
+  'Persisted drip schedule: when the next locked lesson becomes due for this enrollment. Null when nothing remains to unlock. Maintained by triggers on grant, advancement, and schedule changes.';
+
+create index course_enrollments_next_unlock_at_idx
+  on app.course_enrollments (next_unlock_at, id)
+  where next_unlock_at is not null;
+
+create or replace function app.project_course_enrollment_next_unlock_at(
+  p_course_id uuid,
+  p_drip_started_at timestamptz,
+  p_current_unlock_position integer
+)
+returns timestamptz
+language plpgsql
+stable
+set search_path = pg_catalog, app
+as $$
+begin
+  return app.compute_course_next_unlock_at(
+    p_course_id,
+    p_drip_started_at,
+    p_current_unlock_position
+  );
+exception
+  when others then
+    -- Schedules are edited row by row; an intermediate invalid state must not
+    -- block the write. The final row change of the edit recomputes the value.
+    raise warning 'next unlock projection skipped for course %: %',
+      p_course_id,
+      sqlerrm;
+    return null;
+end;
+$$;
+
+create or replace function app.sync_course_enrollment_next_unlock_at()
+returns trigger
+language plpgsql
+set search_path = pg_catalog, app
+as $$
+begin
+  new.next_unlock_at := app.project_course_enrollment_next_unlock_at(
+    new.course_id,
+    new.drip_started_at,
+    new.current_unlock_position
+  );
+  return new;
+end;
+$$;
+
+create trigger course_enrollments_next_unlock_schedule
+before insert or update of current_unlock_position
+on app.course_enrollments
+for each row
+execute function app.sync_course_enrollment_next_unlock_at();
+
+create or replace function app.refresh_course_enrollments_next_unlock_at(
+  p_course_id uuid
+)
+returns integer
+language plpgsql
+security definer
+set search_path = pg_catalog, app
+as $$
+declare
+  v_updated integer := 0;
+begin
+  if p_course_id is null then
+    return 0;
+  end if;
+
+  update app.course_enrollments as ce
+     set next_unlock_at = projected.next_unlock_at
+    from (
+      select e.id,
+             app.project_course_enrollment_next_unlock_at(
+               e.course_id,
+               e.drip_started_at,
+               e.current_unlock_position
+             ) as next_unlock_at
+        from app.course_enrollments as e
+       where e.course_id = p_course_id
+    ) as projected
+   where ce.id = projected.id
+     and ce.next_unlock_at is distinct from projected.next_unlock_at;
+
+  get diagnostics v_updated = row_count;
+  return v_updated;
+end;
+$$;
+
+create or replace function app.refresh_course_enrollments_after_course_change()
+returns trigger
+language plpgsql
+security definer
+set search_path = pg_catalog, app
+as $$
+begin
+  perform app.refresh_course_enrollments_next_unlock_at(new.id);
+  return null;
+end;
+$$;
+
+create or replace function app.refresh_course_enrollments_after_schedule_change()
+returns trigger
+language plpgsql
+security definer
+set search_path = pg_catalog, app
+as $$
+declare
+  v_course_id uuid;
+begin
+  -- Statement-level: each affected course is recomputed once per statement,
+  -- however many of its rows the statement touched.
+  if tg_op = 'INSERT' then
+    for v_course_id in
+      select distinct new_rows.course_id from new_rows
+    loop
+      perform app.refresh_course_enrollments_next_unlock_at(v_course_id);
+    end loop;
+  elsif tg_op = 'DELETE' then
+    for v_course_id in
+      select distinct old_rows.course_id from old_rows
+    loop
+      perform app.refresh_course_enrollments_next_unlock_at(v_course_id);
+    end loop;
+  elsif tg_table_name = 'lessons' then
+    -- Only lesson moves change a schedule; title and content edits do not.
+    for v_course_id in
+      select distinct affected.course_id
+        from old_rows
+        join new_rows
+          on new_rows.id = old_rows.id
+       cross join lateral (
+         values (old_rows.course_id), (new_rows.course_id)
+       ) as affected(course_id)
+       where old_rows.course_id is distinct from new_rows.course_id
+          or old_rows.position is distinct from new_rows.position
+    loop
+      perform app.refresh_course_enrollments_next_unlock_at(v_course_id);
+    end loop;
+  else
+    for v_course_id in
+      select old_rows.course_id from old_rows
+      union
+      select new_rows.course_id from new_rows
+    loop
+      perform app.refresh_course_enrollments_next_unlock_at(v_course_id);
+    end loop;
+  end if;
+
+  return null;
+end;
+$$;
+
+create trigger courses_next_unlock_schedule_refresh
+after update of drip_enabled, drip_interval_days on app.courses
+for each row
+when (
+  old.drip_enabled is distinct from new.drip_enabled
+  or old.drip_interval_days is distinct from new.drip_interval_days
+)
+execute function app.refresh_course_enrollments_after_course_change();
+
+create trigger lessons_next_unlock_refresh_insert
+after insert on app.lessons
+referencing new table as new_rows
+for each statement
+execute function app.refresh_course_enrollments_after_schedule_change();
+
+create trigger lessons_next_unlock_refresh_update
+after update on app.lessons
+referencing old table as old_rows new table as new_rows
+for each statement
+execute function app.refresh_course_enrollments_after_schedule_change();
+
+create trigger lessons_next_unlock_refresh_delete
+after delete on app.lessons
+referencing old table as old_rows
+for each statement
+execute function app.refresh_course_enrollments_after_schedule_change();
+
+create trigger course_custom_drip_configs_next_unlock_refresh_insert
+after insert on app.course_custom_drip_configs
+referencing new table as new_rows
+for each statement
+execute function app.refresh_course_enrollments_after_schedule_change();
+
+create trigger course_custom_drip_configs_next_unlock_refresh_update
+after update on app.course_custom_drip_configs
+referencing old table as old_rows new table as new_rows
+for each statement
+execute function app.refresh_course_enrollments_after_schedule_change();
+
+create trigger course_custom_drip_configs_next_unlock_refresh_delete
+after delete on app.course_custom_drip_configs
+referencing old table as old_rows
+for each statement
+execute function app.refresh_course_enrollments_after_schedule_change();
+
+create trigger course_custom_drip_lesson_offsets_next_unlock_refresh_insert
+after insert on app.course_custom_drip_lesson_offsets
+referencing new table as new_rows
+for each statement
+execute function app.refresh_course_enrollments_after_schedule_change();
+
+create trigger course_custom_drip_lesson_offsets_next_unlock_refresh_update
+after update on app.course_custom_drip_lesson_offsets
+referencing old table as old_rows new table as new_rows
+for each statement
+execute function app.refresh_course_enrollments_after_schedule_change();
+
+create trigger course_custom_drip_lesson_offsets_next_unlock_refresh_delete
+after delete on app.course_custom_drip_lesson_offsets
+referencing old table as old_rows
+for each statement
+execute function app.refresh_course_enrollments_after_schedule_change();
+
+update app.course_enrollments as ce
+   set next_unlock_at = app.project_course_enrollment_next_unlock_at(
+     ce.course_id,
+     ce.drip_started_at,
+     ce.current_unlock_position
+   );
+
+comment on function app.project_course_enrollment_next_unlock_at(
+  uuid,
+  timestamptz,
+  integer
+) is
+  'Fail-soft wrapper over app.compute_course_next_unlock_at used to maintain app.course_enrollments.next_unlock_at. Returns null while a course schedule is invalid.';
+
+comment on function app.sync_course_enrollment_next_unlock_at() is
+  'Keeps app.course_enrollments.next_unlock_at aligned with the enrollment anchor and current_unlock_position on grant and worker advancement.';
+
+comment on function app.refresh_course_enrollments_next_unlock_at(uuid) is
+  'Recomputes next_unlock_at for every enrollment of a course after its drip schedule changes. Returns the number of rows changed.';
+
+comment on function app.refresh_course_enrollments_after_course_change() is
+  'Row trigger entrypoint that refreshes enrollment drip schedules after a course changes its drip mode or interval.';
+
+comment on function app.refresh_course_enrollments_after_schedule_change() is
+  'Statement trigger entrypoint that refreshes enrollment drip schedules once per affected course after lesson or custom drip offset changes. Reads the old_rows/new_rows transition tables.';
+
+comment on trigger course_enrollments_next_unlock_schedule on app.course_enrollments is
+  'Projects next_unlock_at for new grants and drip advancement.';
+
+revoke all on function app.project_course_enrollment_next_unlock_at(
+  uuid,
+  timestamptz,
+  integer
+) from public;
+revoke all on function app.sync_course_enrollment_next_unlock_at() from public;
+revoke all on function app.refresh_course_enrollments_next_unlock_at(uuid) from public;
+revoke all on function app.refresh_course_enrollments_after_course_change() from public;
+revoke all on function app.refresh_course_enrollments_after_schedule_change() from public;
@@ -0,0 +1,122 @@
+create or replace function app.course_search_document(
+  p_title text,
+  p_slug text,
+  p_short_description text,
+  p_description text
+)
+returns tsvector
+language sql
+immutable
+parallel safe
+set search_path = pg_catalog
+as $$
+  select
+    setweight(to_tsvector('swedish'::regconfig, coalesce(p_title, '')), 'A')
+    || setweight(
+      to_tsvector(
+        'swedish'::regconfig,
+        replace(coalesce(p_slug, ''), '-', ' ')
+      ),
+      'B'
+    )
+    || setweight(
+      to_tsvector(
+        'swedish'::regconfig,
+        coalesce(p_short_description, '') || ' ' || coalesce(p_description, '')
+      ),
+      'C'
+    );
+$$;
+
+alter table app.course_public_content
+  add column search_document tsvector not null default ''::tsvector;
+
+comment on column app.course_public_content.search_document is
+  'Swedish full-text search document over course title (A), slug (B), and public short and full descriptions (C). Maintained by triggers; backs indexed catalog search.';
+
+create index course_public_content_search_document_idx
+  on app.course_public_content
+  using gin (search_document);
+
+create or replace function app.sync_course_public_content_search_document()
+returns trigger
+language plpgsql
+set search_path = pg_catalog, app
+as $$
+declare
+  v_title text;
+  v_slug text;
+begin
+  select c.title, c.slug
+    into v_title, v_slug
+    from app.courses as c
+   where c.id = new.course_id;
+
+  new.search_document := app.course_search_document(
+    v_title,
+    v_slug,
+    new.short_description,
+    new.description
+  );
+  return new;
+end;
+$$;
+
+create trigger course_public_content_search_document
+before insert or update of course_id, short_description, description
+on app.course_public_content
+for each row
+execute function app.sync_course_public_content_search_document();
+
+create or replace function app.refresh_course_search_document_after_course_change()
+returns trigger
+language plpgsql
+security definer
+set search_path = pg_catalog, app
+as $$
+begin
+  update app.course_public_content as cpc
+     set search_document = app.course_search_document(
+       new.title,
+       new.slug,
+       cpc.short_description,
+       cpc.description
+     )
+   where cpc.course_id = new.id;
+
+  return null;
+end;
+$$;
+
+create trigger courses_search_document_refresh
+after update of title, slug on app.courses
+for each row
+execute function app.refresh_course_search_document_after_course_change();
+
+update app.course_public_content as cpc
+   set search_document = app.course_search_document(
+     c.title,
+     c.slug,
+     cpc.short_description,
+     cpc.description
+   )
+  from app.courses as c
+ where c.id = cpc.course_id;
+
+comment on function app.course_search_document(text, text, text, text) is
+  'Builds the weighted Swedish tsvector used for course catalog search.';
+
+comment on function app.sync_course_public_content_search_document() is
+  'Recomputes app.course_public_content.search_document when public descriptions change or the sibling row is created.';
+
+comment on function app.refresh_course_search_document_after_course_change() is
+  'Recomputes the sibling search document after a course title or slug changes.';
+
+comment on trigger course_public_content_search_document on app.course_public_content is
+  'Keeps the course search document aligned with public description writes.';
+
+comment on trigger courses_search_document_refresh on app.courses is
+  'Keeps the course search document aligned with title and slug edits.';
+
+revoke all on function app.sync_course_public_content_search_document() from public;
+revoke all on function app.refresh_course_search_document_after_course_change() from public;
@@ -0,0 +1,48 @@
+create table app.stripe_webhook_inbox (
+  event_id text not null,
+  event_type text not null,
+  ordering_key text not null,
+  payload jsonb not null,
+  status text not null default 'pending',
+  attempts integer not null default 0,
+  event_created_at timestamptz,
+  received_at timestamptz not null default now(),
+  next_attempt_at timestamptz not null default now(),
+  leased_until timestamptz,
+  processed_at timestamptz,
+  last_error text,
+
+  constraint stripe_webhook_inbox_pkey primary key (event_id),
+
+  constraint stripe_webhook_inbox_event_id_not_blank_check
+    check (btrim(event_id) <> ''),
+
+  constraint stripe_webhook_inbox_ordering_key_not_blank_check
+    check (btrim(ordering_key) <> ''),
+
+  constraint stripe_webhook_inbox_status_check
+    check (status in ('pending', 'succeeded', 'dead')),
+
+  constraint stripe_webhook_inbox_attempts_check
+    check (attempts >= 0),
+
+  constraint stripe_webhook_inbox_processed_at_check
+    check ((status = 'pending') = (processed_at is null))
+);
+
+create index stripe_webhook_inbox_pending_order_idx
+  on app.stripe_webhook_inbox (ordering_key, event_created_at, received_at, event_id)
+  where status = 'pending';
+
+create index stripe_webhook_inbox_pending_due_idx
+  on app.stripe_webhook_inbox (next_attempt_at)
+  where status = 'pending';
+
+comment on table app.stripe_webhook_inbox is
+  'Verified Stripe webhook events awaiting asynchronous processing. Delivery state only; app.payment_events remains the idempotency record and app.orders, app.payments, and app.memberships remain commerce authority.';
+
+comment on column app.stripe_webhook_inbox.ordering_key is
+  'Serialization key derived from the event object (order, then customer). Only the oldest pending event per key is processed at a time.';
+
+comment on column app.stripe_webhook_inbox.leased_until is
+  'Processing lease. A worker that crashes mid-event releases the row once the lease lapses.';
@@ -0,0 +1,86 @@
+create or replace function app.emit_worker_wakeup()
+returns trigger
+language plpgsql
+set search_path = pg_catalog, app
+as $$
+begin
+  -- Empty payloads let Postgres fold every wake-up of one transaction into a
+  -- single notification per channel.
+  perform pg_notify(tg_argv[0], '');
+  return null;
+end;
+$$;
+
+comment on function app.emit_worker_wakeup() is
+  'Trigger helper: NOTIFY the channel named by the first trigger argument. Wake-ups are hints only; background workers keep polling as the fallback and re-read queue state from the tables.';
+
+create trigger media_assets_uploaded_wakeup_insert
+after insert
+on app.media_assets
+for each row
+when (new.state = 'uploaded'::app.media_state)
+execute function app.emit_worker_wakeup('app_media_assets_uploaded');
+
+create trigger media_assets_uploaded_wakeup_update
+after update of state
+on app.media_assets
+for each row
+when (
+  new.state = 'uploaded'::app.media_state
+  and old.state is distinct from new.state
+)
+execute function app.emit_worker_wakeup('app_media_assets_uploaded');
+
+create trigger notification_deliveries_pending_wakeup
+after insert
+on app.notification_deliveries
+for each row
+when (new.status = 'pending')
+execute function app.emit_worker_wakeup('app_notification_deliveries_pending');
+
+-- next_unlock_at is also rewritten by a BEFORE trigger, so these fire on any
+-- update and only notify when an enrollment is already due. Rows the drip
+-- worker advances land in the future and do not wake it again.
+create trigger course_enrollments_due_wakeup_insert
+after insert
+on app.course_enrollments
+for each row
+when (new.next_unlock_at is not null and new.next_unlock_at <= now())
+execute function app.emit_worker_wakeup('app_course_enrollments_changed');
+
+create trigger course_enrollments_due_wakeup_update
+after update
+on app.course_enrollments
+for each row
+when (
+  new.next_unlock_at is not null
+  and new.next_unlock_at <= now()
+  and old.next_unlock_at is distinct from new.next_unlock_at
+)
+execute function app.emit_worker_wakeup('app_course_enrollments_changed');
+
+-- Mirrors the expiry warning window (7 to 8 days ahead) so only memberships
+-- the warning worker would pick up wake it.
+create trigger memberships_expiry_window_wakeup_insert
+after insert
+on app.memberships
+for each row
+when (
+  new.expires_at >= now() + interval '7 days'
+  and new.expires_at < now() + interval '8 days'
+)
+execute function app.emit_worker_wakeup('app_memberships_changed');
+
+create trigger memberships_expiry_window_wakeup_update
+after update of status, expires_at
+on app.memberships
+for each row
+when (
+  new.expires_at >= now() + interval '7 days'
+  and new.expires_at < now() + interval '8 days'
+  and (
+    old.expires_at is distinct from new.expires_at
+    or old.status is distinct from new.status
+  )
+)
+execute function app.emit_worker_wakeup('app_memberships_changed');
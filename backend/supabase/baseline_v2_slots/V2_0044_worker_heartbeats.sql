@@ -0,0 +1,29 @@
+create table app.worker_heartbeats (
+  worker_id text not null,
+  hostname text not null,
+  pid integer not null,
+  process_index integer not null default 0,
+  jobs text[] not null default '{}'::text[],
+  started_at timestamptz not null,
+  heartbeat_at timestamptz not null default now(),
+
+  constraint worker_heartbeats_pkey primary key (worker_id),
+
+  constraint worker_heartbeats_worker_id_not_blank_check
+    check (btrim(worker_id) <> ''),
+
+  constraint worker_heartbeats_pid_check
+    check (pid > 0),
+
+  constraint worker_heartbeats_process_index_check
+    check (process_index >= 0)
+);
+
+create index worker_heartbeats_heartbeat_at_idx
+  on app.worker_heartbeats (heartbeat_at);
+
+comment on table app.worker_heartbeats is
+  'Liveness rows for background worker processes, one per process. Observability only: queue claims use row locks and singleton jobs use advisory locks, never this table.';
+
+comment on column app.worker_heartbeats.jobs is
+  'Worker loops started in the process. Singleton jobs listed here only run while the process holds their advisory lock.';
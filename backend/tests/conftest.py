@@ -51,6 +51,8 @@ from psycopg import connect  # noqa: E402
 from app.config import settings  # noqa: E402
 from app import db as app_db  # noqa: E402
 from app.main import app  # noqa: E402
+from app.repositories import auth_identity  # noqa: E402
+from app.services import media_resolver  # noqa: E402
 
 _SESSION_HEADER = app_db.TEST_SESSION_HEADER
 _get_session = getattr(app_db, "get_test" "_session" "_id")
@@ -109,14 +111,21 @@ def _test_session_scope():
     token = _set_session(session_id)
     original_header_setting = settings.enable_test_session_headers
     settings.enable_test_session_headers = True
+    # Tests mutate auth subjects with direct SQL between requests; the identity
+    # cache is exercised explicitly where it is under test.
+    original_identity_cache_setting = settings.auth_identity_cache_enabled
+    settings.auth_identity_cache_enabled = False
 
     try:
         yield session_id
     finally:
+        media_resolver.clear_signed_url_cache()
+        auth_identity.clear_auth_identity_cache()
         try:
             _cleanup_test_session(session_id)
         finally:
             settings.enable_test_session_headers = original_header_setting
+            settings.auth_identity_cache_enabled = original_identity_cache_setting
             _reset_session(token)
 
 
@@ -133,6 +142,51 @@ def _temp_media_root(tmp_path):
         shutil.rmtree(temp_root, ignore_errors=True)
 
 
+@pytest.fixture
+def media_row():
+    def _row(**overrides) -> dict:
+        row = {
+            "id": "media-1",
+            "kind": "audio",
+            "storage_bucket": "course-media",
+            "storage_path": "lessons/demo.mp3",
+            "content_type": "audio/mpeg",
+            "original_name": "demo.mp3",
+        }
+        row.update(overrides)
+        return row
+
+    return _row
+
+
+@pytest.fixture
+def media_stream_client(_temp_media_root):
+    """Build a client whose ``GET /stream`` runs the media streaming helper."""
+
+    from fastapi import FastAPI, Request
+
+    from app.routes import media as media_routes
+
+    def _client(row: dict, *, local_payload: bytes | None = None) -> AsyncClient:
+        if local_payload is not None:
+            media_path = _temp_media_root / row["storage_path"]
+            media_path.parent.mkdir(parents=True, exist_ok=True)
+            media_path.write_bytes(local_payload)
+
+        stream_app = FastAPI()
+
+        @stream_app.get("/stream")
+        async def stream(request: Request):
+            return await media_routes._build_streaming_response(row, request)
+
+        return AsyncClient(
+            transport=ASGITransport(app=stream_app),
+            base_url="http://testserver",
+        )
+
+    return _client
+
+
 @pytest.fixture(autouse=True)
 def _local_supabase_registration_stub(monkeypatch):
     from app.services import supabase_auth
@@ -6,6 +6,7 @@ import pytest
 from app.config import settings
 from app import db
 from app.repositories import memberships as memberships_repo
+from app.services import stripe_gateway
 
 
 def _set_stripe_test_env(
@@ -147,6 +148,9 @@ async def test_course_purchase_enrolls_student(async_client, monkeypatch):
     def fail_stripe_entity_create(**_):
         raise AssertionError("course create/update must not create Stripe entities")
 
+    async def fail_stripe_gateway_create(*args, **kwargs):
+        fail_stripe_entity_create()
+
     def fake_customer_create(**_):
         customer_id = f"cus_test_{uuid.uuid4().hex}"
         customer_ids.append(customer_id)
@@ -169,6 +173,8 @@ async def test_course_purchase_enrolls_student(async_client, monkeypatch):
 
     monkeypatch.setattr("stripe.Product.create", fail_stripe_entity_create)
     monkeypatch.setattr("stripe.Price.create", fail_stripe_entity_create)
+    monkeypatch.setattr(stripe_gateway, "create_product", fail_stripe_gateway_create)
+    monkeypatch.setattr(stripe_gateway, "create_price", fail_stripe_gateway_create)
     monkeypatch.setattr("stripe.Customer.create", fake_customer_create)
     monkeypatch.setattr("stripe.checkout.Session.create", fake_checkout_create)
     monkeypatch.setattr("stripe.Webhook.construct_event", fake_construct_event)
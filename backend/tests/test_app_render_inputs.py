@@ -205,6 +205,33 @@ def test_navigation_text_bundle_is_deterministic():
     assert str(first["hash"]).startswith("sha256:")
 
 
+def test_known_text_bundle_hashes_omit_unchanged_bundles():
+    bundle = text_catalog_service.get_bundle(
+        text_catalog_service.GLOBAL_SYSTEM_NAVIGATION_BUNDLE_ID,
+        text_catalog_service.DEFAULT_LOCALE,
+    )
+    required = [text_catalog_service.GLOBAL_SYSTEM_NAVIGATION_BUNDLE_ID]
+
+    fresh = text_catalog_service.attach_text_bundles(
+        _expected_payload(),
+        required,
+        text_catalog_service.DEFAULT_LOCALE,
+        known_hashes=text_catalog_service.parse_known_bundle_hashes("sha256:stale"),
+    )
+    cached = text_catalog_service.attach_text_bundles(
+        _expected_payload(),
+        required,
+        text_catalog_service.DEFAULT_LOCALE,
+        known_hashes=text_catalog_service.parse_known_bundle_hashes(
+            f"sha256:stale, {bundle['hash']}"
+        ),
+    )
+
+    assert fresh["text_bundles"] == [bundle]
+    assert cached["text_bundles"] == []
+    assert schemas.AppRenderInputsResponse(**cached).text_bundles == []
+
+
 def test_app_render_inputs_payload_fails_when_any_url_is_empty(monkeypatch):
     monkeypatch.setattr(
         app_render_inputs_service.storage_service,
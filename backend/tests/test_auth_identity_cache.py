@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from app import db, repositories
+from app.config import settings
+from app.repositories import auth_identity
+from app.routes import entry_state
+
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+def auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def _cleanup_user(user_id: str) -> None:
+    async with db.pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            await cur.execute("DELETE FROM app.memberships WHERE user_id = %s", (user_id,))
+            await cur.execute("DELETE FROM auth.users WHERE id = %s", (user_id,))
+            await conn.commit()
+
+
+async def _register_onboarded_user(client) -> tuple[str, str]:
+    register_resp = await client.post(
+        "/auth/register",
+        json={
+            "email": f"identity_{uuid.uuid4().hex[:8]}@example.com",
+            "password": "Passw0rd!",
+        },
+    )
+    assert register_resp.status_code == 201, register_resp.text
+    token = register_resp.json()["access_token"]
+
+    me_resp = await client.get("/profiles/me", headers=auth_header(token))
+    assert me_resp.status_code == 200, me_resp.text
+    user_id = me_resp.json()["user_id"]
+    create_profile = await client.post(
+        "/auth/onboarding/create-profile",
+        headers=auth_header(token),
+        json={"display_name": "Identity Learner", "bio": None},
+    )
+    assert create_profile.status_code == 200, create_profile.text
+    complete = await client.post(
+        "/auth/onboarding/complete",
+        headers=auth_header(token),
+    )
+    assert complete.status_code == 200, complete.text
+    return token, user_id
+
+
+async def test_identity_is_read_once_and_invalidated_on_membership_write(
+    async_client,
+    monkeypatch,
+):
+    token, user_id = await _register_onboarded_user(async_client)
+    try:
+        identity = await auth_identity.get_auth_identity(user_id)
+        assert identity is not None
+        assert str(identity["user"]["id"]) == user_id
+        assert identity["auth_subject"]["onboarding_state"] == "completed"
+        assert identity["auth_subject"]["role"] == "learner"
+        assert identity["profile"]["display_name"] == "Identity Learner"
+        assert identity["membership"] is None
+
+        monkeypatch.setattr(settings, "auth_identity_cache_enabled", True)
+        real_get_auth_identity = auth_identity.get_auth_identity
+        reads: list[str] = []
+
+        async def counting_get_auth_identity(requested_user_id):
+            reads.append(str(requested_user_id))
+            return await real_get_auth_identity(requested_user_id)
+
+        async def fail_get_membership(*args, **kwargs):
+            raise AssertionError("cached identity must carry the membership")
+
+        real_get_membership = entry_state.memberships_repo.get_membership
+        monkeypatch.setattr(auth_identity, "get_auth_identity", counting_get_auth_identity)
+        monkeypatch.setattr(entry_state.memberships_repo, "get_membership", fail_get_membership)
+
+        for _ in range(2):
+            response = await async_client.get("/entry-state", headers=auth_header(token))
+            assert response.status_code == 200, response.text
+            assert response.json()["membership_active"] is False
+        assert reads == [user_id]
+
+        monkeypatch.setattr(entry_state.memberships_repo, "get_membership", real_get_membership)
+        await repositories.upsert_membership_record(
+            user_id,
+            status="active",
+            source="coupon",
+        )
+
+        response = await async_client.get("/entry-state", headers=auth_header(token))
+        assert response.status_code == 200, response.text
+        assert response.json()["membership_active"] is True
+        assert reads == [user_id, user_id]
+    finally:
+        auth_identity.clear_auth_identity_cache()
+        await _cleanup_user(user_id)
+
+
+async def test_membership_write_on_caller_connection_leaves_invalidation_to_caller(
+    async_client,
+    monkeypatch,
+):
+    _, user_id = await _register_onboarded_user(async_client)
+    invalidated: list[str] = []
+    monkeypatch.setattr(
+        repositories.memberships,
+        "invalidate_auth_identity",
+        lambda requested_user_id: invalidated.append(str(requested_user_id)),
+    )
+    try:
+        async with db.pool.connection() as conn:  # type: ignore[attr-defined]
+            async with conn.transaction():
+                await repositories.upsert_membership_record(
+                    user_id,
+                    status="active",
+                    source="coupon",
+                    conn=conn,
+                )
+                assert invalidated == []
+        assert invalidated == []
+
+        await repositories.upsert_membership_record(
+            user_id,
+            status="inactive",
+            source="coupon",
+        )
+        assert invalidated == [user_id]
+    finally:
+        await _cleanup_user(user_id)
+
+
+def test_identity_cache_expires_and_evicts_least_recently_used():
+    cache = auth_identity.AuthIdentityCache(max_entries=2)
+    cache.set("a", {"user": "a"}, expires_at=10.0)
+    cache.set("b", {"user": "b"}, expires_at=10.0)
+
+    assert cache.get("a", now=1.0) == {"user": "a"}
+    cache.set("c", {"user": "c"}, expires_at=10.0)
+
+    assert cache.get("b", now=1.0) is None
+    assert cache.get("a", now=1.0) == {"user": "a"}
+    assert cache.get("c", now=10.0) is None
+    assert len(cache) == 1
@@ -7,12 +7,20 @@ pytestmark = pytest.mark.anyio("asyncio")
 USER_ID = "00000000-0000-0000-0000-000000000123"
 
 
-def _patch_canonical_auth_user(monkeypatch) -> None:
-    async def _fake_get_user_by_id(user_id: str):
+def _patch_canonical_auth_user(monkeypatch, *, profile: dict | None = None) -> None:
+    async def _fake_get_auth_identity(user_id: str):
         assert user_id == USER_ID
-        return {"id": USER_ID, "email": "user@example.com"}
+        return {
+            "user": {"id": USER_ID, "email": "user@example.com"},
+            "auth_subject": None,
+            "profile": profile,
+            "membership": None,
+        }
 
-    monkeypatch.setattr("app.repositories.auth.get_user_by_id", _fake_get_user_by_id)
+    monkeypatch.setattr(
+        "app.repositories.auth_identity.get_auth_identity",
+        _fake_get_auth_identity,
+    )
 
 
 async def test_build_current_user_prefers_auth_subject_over_payload_claims(
@@ -20,18 +28,9 @@ async def test_build_current_user_prefers_auth_subject_over_payload_claims(
 ) -> None:
     from app import auth as auth_module
 
-    _patch_canonical_auth_user(monkeypatch)
-
-    async def _fake_get_auth_subject(_: str, *, email: str | None = None):
-        assert email == "user@example.com"
-        return {
-            "user_id": USER_ID,
-            "onboarding_state": "completed",
-            "role": "learner",
-        }
-
-    async def _fake_get_profile(_: str):
-        return {
+    _patch_canonical_auth_user(
+        monkeypatch,
+        profile={
             "user_id": USER_ID,
             "email": "user@example.com",
             "display_name": "Canonical Profile Name",
@@ -40,16 +39,21 @@ async def test_build_current_user_prefers_auth_subject_over_payload_claims(
             "avatar_media_id": "media-123",
             "created_at": None,
             "updated_at": None,
+        },
+    )
+
+    async def _fake_get_auth_subject(_: str, *, email: str | None = None):
+        assert email == "user@example.com"
+        return {
+            "user_id": USER_ID,
+            "onboarding_state": "completed",
+            "role": "learner",
         }
 
     monkeypatch.setattr(
         "app.repositories.auth_subjects.ensure_authenticated_auth_subject",
         _fake_get_auth_subject,
     )
-    monkeypatch.setattr(
-        "app.repositories.profiles.get_profile",
-        _fake_get_profile,
-    )
 
     current_user = await auth_module._build_current_user(
         USER_ID,
@@ -93,14 +97,10 @@ async def test_build_current_user_does_not_fallback_to_supabase_metadata(
             "role": "learner",
         }
 
-    async def _fake_get_profile(_: str):
-        return None
-
     monkeypatch.setattr(
         "app.repositories.auth_subjects.ensure_authenticated_auth_subject",
         _fake_get_auth_subject,
     )
-    monkeypatch.setattr("app.repositories.profiles.get_profile", _fake_get_profile)
 
     current_user = await auth_module._build_current_user(
         USER_ID,
@@ -146,11 +146,6 @@ async def test_build_current_user_rejects_invalid_canonical_subject(monkeypatch)
         _fake_get_auth_subject,
     )
 
-    async def _fake_get_profile(_: str):
-        return None
-
-    monkeypatch.setattr("app.repositories.profiles.get_profile", _fake_get_profile)
-
     with pytest.raises(ValueError, match="Canonical onboarding_state invalid"):
         await auth_module._build_current_user(
             USER_ID,
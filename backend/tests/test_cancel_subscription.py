@@ -2,6 +2,7 @@ import pytest
 
 from app import repositories
 from app.config import settings
+from app.services import stripe_gateway
 
 from .utils import register_user
 
@@ -54,7 +55,7 @@ async def test_cancel_subscription_submits_intent_without_mutating_membership(as
 
     captured_payload: dict[str, object] = {}
 
-    def fake_modify(sub_id, **kwargs):
+    async def fake_modify(context, sub_id, **kwargs):
         captured_payload.update({"sub_id": sub_id, "kwargs": kwargs})
         return {
             "id": sub_id,
@@ -63,7 +64,7 @@ async def test_cancel_subscription_submits_intent_without_mutating_membership(as
             "current_period_end": 1735689600,
         }
 
-    monkeypatch.setattr("stripe.Subscription.modify", fake_modify)
+    monkeypatch.setattr(stripe_gateway, "modify_subscription", fake_modify)
 
     resp = await async_client.post(
         "/api/billing/cancel-subscription-intent",
@@ -104,12 +105,12 @@ async def test_cancel_subscription_rejects_mismatched_subscription_id(async_clie
 
     stripe_called = False
 
-    def fake_modify(sub_id, **kwargs):
+    async def fake_modify(context, sub_id, **kwargs):
         nonlocal stripe_called
         stripe_called = True
         return {"id": sub_id}
 
-    monkeypatch.setattr("stripe.Subscription.modify", fake_modify)
+    monkeypatch.setattr(stripe_gateway, "modify_subscription", fake_modify)
 
     resp = await async_client.post(
         "/api/billing/cancel-subscription-intent",
@@ -11,7 +11,12 @@ from pydantic import ValidationError
 from app.config import settings
 from app.main import app
 from app.schemas.billing import SubscriptionInterval, SubscriptionSessionRequest
-from app.services import checkout_service, stripe_webhook_support_service, subscription_service
+from app.services import (
+    checkout_service,
+    stripe_gateway,
+    stripe_webhook_support_service,
+    subscription_service,
+)
 from app.utils import membership_status
 
 pytestmark = pytest.mark.anyio("asyncio")
@@ -158,7 +163,7 @@ async def test_membership_checkout_is_order_backed_and_non_authoritative(
     _set_stripe_test_env(monkeypatch)
     captured: dict[str, object] = {}
 
-    async def fake_get_customer(user):
+    async def fake_get_customer(user, stripe_context):
         captured["customer_user_id"] = user["id"]
         return "cus_test"
 
@@ -190,7 +195,7 @@ async def test_membership_checkout_is_order_backed_and_non_authoritative(
             "livemode": False,
         }
 
-    def fake_session_create(**kwargs):
+    async def fake_session_create(stripe_context, **kwargs):
         captured["session_kwargs"] = kwargs
         return {"id": "cs_test", "client_secret": "cs_test_secret"}
 
@@ -220,7 +225,8 @@ async def test_membership_checkout_is_order_backed_and_non_authoritative(
         fail_membership_write,
     )
     monkeypatch.setattr(
-        "stripe.checkout.Session.create",
+        stripe_gateway,
+        "create_checkout_session",
         fake_session_create,
     )
     monkeypatch.setattr(
@@ -751,7 +757,7 @@ async def test_cancel_intent_is_non_authoritative(monkeypatch) -> None:
     async def fake_insert_billing_log(**kwargs):
         captured.setdefault("billing_logs", []).append(kwargs)
 
-    def fake_modify(subscription_id, **kwargs):
+    async def fake_modify(stripe_context, subscription_id, **kwargs):
         captured["subscription_id"] = subscription_id
         captured["modify_kwargs"] = kwargs
         return {
@@ -781,7 +787,8 @@ async def test_cancel_intent_is_non_authoritative(monkeypatch) -> None:
         fail_membership_write,
     )
     monkeypatch.setattr(
-        "stripe.Subscription.modify",
+        stripe_gateway,
+        "modify_subscription",
         fake_modify,
     )
     monkeypatch.setattr(
@@ -847,11 +854,11 @@ async def test_membership_withdrawal_is_backend_owned_and_revokes_immediately(
     async def fake_sync_onboarding_state(user_id):
         captured["synced_user_id"] = user_id
 
-    def fake_cancel(subscription_id):
+    async def fake_cancel(stripe_context, subscription_id):
         captured["cancel_subscription_id"] = subscription_id
         return {"id": subscription_id}
 
-    def fake_refund_create(**kwargs):
+    async def fake_refund_create(stripe_context, **kwargs):
         captured["refund_kwargs"] = kwargs
         return {"id": "re_membership_123"}
 
@@ -886,11 +893,13 @@ async def test_membership_withdrawal_is_backend_owned_and_revokes_immediately(
         fake_sync_onboarding_state,
     )
     monkeypatch.setattr(
-        "stripe.Subscription.cancel",
+        stripe_gateway,
+        "cancel_subscription",
         fake_cancel,
     )
     monkeypatch.setattr(
-        "stripe.Refund.create",
+        stripe_gateway,
+        "create_refund",
         fake_refund_create,
     )
     monkeypatch.setattr(
@@ -36,7 +36,9 @@ async def test_cors_exposes_etag_header_to_browser_clients():
     assert response.headers.get("etag") == '"cors-test-etag"'
     assert response.headers.get("access-control-allow-origin") == "https://aveli.app"
     assert response.headers.get("access-control-allow-credentials") == "true"
-    assert response.headers.get("access-control-expose-headers") == "ETag"
+    assert response.headers.get("access-control-expose-headers") == (
+        "ETag, X-Text-Bundle-Hashes"
+    )
 
 
 async def test_cors_header_present_on_error():
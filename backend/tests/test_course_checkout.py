@@ -11,6 +11,7 @@ from app.repositories import payments as payments_repo
 from app.routes import stripe_webhooks
 from app.services import checkout_service
 from app.services import courses_service
+from app.services import stripe_gateway
 from app.services import stripe_webhook_support_service
 
 from .utils import register_user
@@ -156,6 +157,9 @@ def _install_course_stripe_fakes(
     def fail_stripe_entity_create(**kwargs):
         raise AssertionError("course create/update must not create Stripe entities")
 
+    async def fail_stripe_gateway_create(*args, **kwargs):
+        fail_stripe_entity_create()
+
     def fake_customer_create(**kwargs):
         return {"id": f"cus_checkout_test_{uuid.uuid4().hex}"}
 
@@ -169,6 +173,8 @@ def _install_course_stripe_fakes(
 
     monkeypatch.setattr("stripe.Product.create", fail_stripe_entity_create)
     monkeypatch.setattr("stripe.Price.create", fail_stripe_entity_create)
+    monkeypatch.setattr(stripe_gateway, "create_product", fail_stripe_gateway_create)
+    monkeypatch.setattr(stripe_gateway, "create_price", fail_stripe_gateway_create)
     monkeypatch.setattr("stripe.Customer.create", fake_customer_create)
     monkeypatch.setattr("stripe.checkout.Session.create", fake_session_create)
     monkeypatch.setattr(settings, "checkout_success_url", "https://checkout.test/success")
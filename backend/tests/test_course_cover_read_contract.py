@@ -672,6 +672,55 @@ async def test_attach_course_cover_read_contract_drops_cover_when_no_cover_media
     assert row["cover"] is None
 
 
+async def test_attach_course_cover_read_contract_resolves_list_in_one_query(
+    monkeypatch,
+):
+    _install_storage(monkeypatch)
+    second_course_id = "66666666-6666-6666-6666-666666666666"
+    second_media_id = "77777777-7777-7777-7777-777777777777"
+    bulk_calls: list[list[tuple[str, str]]] = []
+
+    async def fake_list_runtime_media(*, course_media_pairs):
+        bulk_calls.append(list(course_media_pairs))
+        return {
+            (COURSE_ID, MEDIA_ID): _runtime_row(),
+            (second_course_id, second_media_id): _runtime_row(state="uploaded"),
+        }
+
+    async def fail_get_runtime_media(**kwargs):
+        raise AssertionError("list cover resolution must not query per course")
+
+    monkeypatch.setattr(
+        courses_service.runtime_media_repo,
+        "list_course_cover_runtime_media",
+        fake_list_runtime_media,
+        raising=True,
+    )
+    monkeypatch.setattr(
+        courses_service.runtime_media_repo,
+        "get_course_cover_runtime_media",
+        fail_get_runtime_media,
+        raising=True,
+    )
+
+    rows = [
+        _course(),
+        {**_course(cover_media_id=second_media_id), "id": second_course_id},
+        {**_course(cover_media_id=None), "id": "88888888-8888-8888-8888-888888888888"},
+    ]
+    rows[0]["cover_url"] = LEGACY_URL
+
+    await courses_service.attach_course_cover_read_contract(rows)
+
+    assert bulk_calls == [
+        [(COURSE_ID, MEDIA_ID), (second_course_id, second_media_id)]
+    ]
+    assert "cover_url" not in rows[0]
+    assert rows[0]["cover"] == _resolved_cover_payload()
+    assert rows[1]["cover"] is None
+    assert rows[2]["cover"] is None
+
+
 async def test_fetch_course_includes_cover_when_cover_media_id_resolves(monkeypatch):
     _install_storage(monkeypatch)
 
@@ -1093,8 +1142,15 @@ async def test_studio_courses_list_response_uses_canonical_cover_shape(
 ):
     app.dependency_overrides[permissions.require_teacher] = lambda: {"id": TEACHER_ID}
 
-    async def fake_list_courses(*, teacher_id: str):
+    async def fake_list_courses(
+        *,
+        teacher_id: str,
+        search: str | None,
+        limit: int | None,
+        cursor: str | None,
+    ):
         assert teacher_id == TEACHER_ID
+        assert (search, limit, cursor) == (None, None, None)
         return [
             {
                 **_course(),
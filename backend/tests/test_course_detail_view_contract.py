@@ -251,10 +251,13 @@ async def test_list_public_courses_reads_public_discovery_surface(monkeypatch):
         search: str | None = None,
         limit: int | None = None,
         group_position: int | None = None,
+        after_slug: str | None = None,
+        after_rank: float | None = None,
     ):
         assert search == "course"
         assert limit == 5
         assert group_position is None
+        assert (after_slug, after_rank) == (None, None)
         return [
             {
                 **_course_payload(cover=None),
@@ -296,8 +299,13 @@ async def test_list_public_courses_reads_public_discovery_surface(monkeypatch):
 
 
 async def test_course_route_rejects_legacy_step_field(monkeypatch):
-    async def fake_list_public_courses(*, search: str | None = None, limit: int | None = None):
-        del search, limit
+    async def fake_list_public_courses(
+        *,
+        search: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ):
+        del search, limit, cursor
         return [{**_course_payload(cover=None), "step": "intro"}]
 
     async def fake_attach_course_cover_read_contract(courses):
@@ -323,9 +331,15 @@ async def test_course_route_rejects_legacy_step_field(monkeypatch):
 
 
 async def test_course_list_http_shape_uses_description(async_client, monkeypatch):
-    async def fake_list_public_courses(*, search: str | None = None, limit: int | None = None):
+    async def fake_list_public_courses(
+        *,
+        search: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ):
         assert search is None
         assert limit is None
+        assert cursor is None
         return [
             {
                 **_course_payload(cover=None),
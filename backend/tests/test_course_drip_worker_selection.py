@@ -396,6 +396,84 @@ async def test_run_once_does_not_create_false_advancement_for_no_drip_course():
         assert _read_current_unlock_position(conn, str(enrollment["id"])) == 3
 
 
+def _read_next_unlock_at(conn: psycopg.Connection, enrollment_id: str) -> datetime | None:
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT next_unlock_at
+            FROM app.course_enrollments
+            WHERE id = %s
+            """,
+            (enrollment_id,),
+        )
+        row = cur.fetchone()
+    assert row is not None
+    return row[0]
+
+
+async def test_run_once_advances_only_due_enrollments_across_keyset_batches(
+    monkeypatch,
+):
+    monkeypatch.setattr(course_drip_worker.settings, "course_drip_worker_batch_size", 2)
+    with _baseline_v2_connection() as (conn, database_conninfo):
+        _apply_baseline_v2_slots(conn)
+
+        course_id = str(uuid4())
+        granted_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        _insert_course(
+            conn,
+            course_id=course_id,
+            slug="worker-due-schedule",
+            required_enrollment_source="purchase",
+            drip_enabled=True,
+            drip_interval_days=2,
+        )
+        _insert_lessons(conn, course_id, count=3)
+
+        due_enrollments = [
+            _create_enrollment(
+                conn,
+                enrollment_id=str(uuid4()),
+                user_id=str(uuid4()),
+                course_id=course_id,
+                source="purchase",
+                granted_at=granted_at + timedelta(hours=index),
+            )
+            for index in range(3)
+        ]
+        later_enrollment = _create_enrollment(
+            conn,
+            enrollment_id=str(uuid4()),
+            user_id=str(uuid4()),
+            course_id=course_id,
+            source="purchase",
+            granted_at=granted_at + timedelta(days=5),
+        )
+        assert _read_next_unlock_at(conn, str(later_enrollment["id"])) == (
+            granted_at + timedelta(days=7)
+        )
+
+        advanced_enrollments = await _run_course_drip_worker_once(
+            database_conninfo,
+            now=granted_at + timedelta(days=5),
+        )
+
+        assert advanced_enrollments == 3
+        for enrollment in due_enrollments:
+            assert _read_current_unlock_position(conn, str(enrollment["id"])) == 3
+            assert _read_next_unlock_at(conn, str(enrollment["id"])) is None
+        assert _read_current_unlock_position(conn, str(later_enrollment["id"])) == 1
+
+        with conn.cursor() as cur:
+            cur.execute(
+                "UPDATE app.courses SET drip_interval_days = 1 WHERE id = %s",
+                (course_id,),
+            )
+        assert _read_next_unlock_at(conn, str(later_enrollment["id"])) == (
+            granted_at + timedelta(days=6)
+        )
+
+
 def test_run_once_uses_mode_aware_candidate_query_and_canonical_worker_call():
     source = Path(course_drip_worker.__file__).read_text(encoding="utf-8")
     normalized = " ".join(source.lower().split())
@@ -411,3 +489,89 @@ def test_run_once_uses_mode_aware_candidate_query_and_canonical_worker_call():
         "extract(epoch",
     ):
         assert marker not in normalized
+
+
+def _refresh_calls_in_transaction(conn: psycopg.Connection) -> int:
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT coalesce(
+              pg_stat_get_xact_function_calls(
+                'app.refresh_course_enrollments_next_unlock_at(uuid)'::regprocedure
+              ),
+              0
+            )
+            """
+        )
+        row = cur.fetchone()
+    assert row is not None
+    return int(row[0])
+
+
+async def test_schedule_triggers_refresh_each_course_once_per_statement():
+    with _baseline_v2_connection() as (conn, _database_conninfo):
+        _apply_baseline_v2_slots(conn)
+
+        course_id = str(uuid4())
+        granted_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        _insert_course(
+            conn,
+            course_id=course_id,
+            slug="worker-schedule-refresh",
+            required_enrollment_source="purchase",
+            drip_enabled=True,
+            drip_interval_days=2,
+        )
+        _insert_lessons(conn, course_id, count=4)
+        enrollment = _create_enrollment(
+            conn,
+            enrollment_id=str(uuid4()),
+            user_id=str(uuid4()),
+            course_id=course_id,
+            source="purchase",
+            granted_at=granted_at,
+        )
+        assert _read_next_unlock_at(conn, str(enrollment["id"])) == (
+            granted_at + timedelta(days=2)
+        )
+
+        with conn.transaction():
+            conn.execute("SET LOCAL track_functions = 'all'")
+            conn.execute(
+                "UPDATE app.lessons SET position = position + 10 WHERE course_id = %s",
+                (course_id,),
+            )
+            assert _refresh_calls_in_transaction(conn) == 1
+
+            conn.execute(
+                "UPDATE app.lessons SET lesson_title = lesson_title || '!' WHERE course_id = %s",
+                (course_id,),
+            )
+            conn.execute(
+                """
+                UPDATE app.courses
+                   SET title = title || '!',
+                       drip_enabled = drip_enabled,
+                       drip_interval_days = drip_interval_days
+                 WHERE id = %s
+                """,
+                (course_id,),
+            )
+            assert _refresh_calls_in_transaction(conn) == 1
+
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT app.compute_course_next_unlock_at(
+                  course_id,
+                  drip_started_at,
+                  current_unlock_position
+                )
+                FROM app.course_enrollments
+                WHERE id = %s
+                """,
+                (str(enrollment["id"]),),
+            )
+            row = cur.fetchone()
+        assert row is not None
+        assert _read_next_unlock_at(conn, str(enrollment["id"])) == row[0]
@@ -1,6 +1,6 @@
 import pytest
 
-from app.services import checkout_service, courses_service
+from app.services import checkout_service, courses_service, stripe_gateway
 
 
 pytestmark = pytest.mark.anyio("asyncio")
@@ -259,6 +259,9 @@ async def test_checkout_uses_existing_active_price_without_creating_stripe_entit
     def fail_stripe_entity_create(*args, **kwargs):
         raise AssertionError("checkout must not create Stripe Product or Price")
 
+    async def fail_stripe_gateway_create(*args, **kwargs):
+        fail_stripe_entity_create()
+
     def fake_session_create(**kwargs):
         captured_checkout.update(kwargs)
         return {
@@ -339,6 +342,8 @@ async def test_checkout_uses_existing_active_price_without_creating_stripe_entit
     )
     monkeypatch.setattr("stripe.Product.create", fail_stripe_entity_create)
     monkeypatch.setattr("stripe.Price.create", fail_stripe_entity_create)
+    monkeypatch.setattr(stripe_gateway, "create_product", fail_stripe_gateway_create)
+    monkeypatch.setattr(stripe_gateway, "create_price", fail_stripe_gateway_create)
     monkeypatch.setattr("stripe.checkout.Session.create", fake_session_create)
 
     response = await checkout_service.create_course_checkout(
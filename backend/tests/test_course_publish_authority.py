@@ -9,7 +9,7 @@ from app.media_control_plane.services.media_resolver_service import (
 )
 from app.routes import studio
 from app.repositories import courses as courses_repo
-from app.services import courses_service
+from app.services import courses_service, stripe_gateway
 
 
 pytestmark = pytest.mark.anyio("asyncio")
@@ -195,7 +195,7 @@ async def _install_publish_fakes(
 def _install_stripe_create_fakes(monkeypatch):
     calls = {"product_create": 0, "price_create": 0}
 
-    def fake_product_create(**kwargs):
+    async def fake_product_create(context, **kwargs):
         calls["product_create"] += 1
         assert kwargs["metadata"] == {
             "course_id": COURSE_ID,
@@ -205,7 +205,7 @@ def _install_stripe_create_fakes(monkeypatch):
         assert kwargs["idempotency_key"] == f"course:{COURSE_ID}:product"
         return {"id": "prod_publish_1", "metadata": kwargs["metadata"], "active": True}
 
-    def fake_price_create(**kwargs):
+    async def fake_price_create(context, **kwargs):
         calls["price_create"] += 1
         assert kwargs["product"] == "prod_publish_1"
         assert kwargs["unit_amount"] == 1900
@@ -215,19 +215,19 @@ def _install_stripe_create_fakes(monkeypatch):
         )
         return {"id": "price_publish_1"}
 
-    monkeypatch.setattr("stripe.Product.create", fake_product_create)
-    monkeypatch.setattr("stripe.Price.create", fake_price_create)
+    monkeypatch.setattr(stripe_gateway, "create_product", fake_product_create)
+    monkeypatch.setattr(stripe_gateway, "create_price", fake_price_create)
     return calls
 
 
 def _install_stripe_fail_fakes(monkeypatch):
-    def fail(*args, **kwargs):
+    async def fail(*args, **kwargs):
         raise AssertionError("validation must stop before Stripe")
 
-    monkeypatch.setattr("stripe.Product.create", fail)
-    monkeypatch.setattr("stripe.Price.create", fail)
-    monkeypatch.setattr("stripe.Product.retrieve", fail)
-    monkeypatch.setattr("stripe.Price.retrieve", fail)
+    monkeypatch.setattr(stripe_gateway, "create_product", fail)
+    monkeypatch.setattr(stripe_gateway, "create_price", fail)
+    monkeypatch.setattr(stripe_gateway, "retrieve_product", fail)
+    monkeypatch.setattr(stripe_gateway, "retrieve_price", fail)
 
 
 def test_publish_endpoint_is_registered():
@@ -470,7 +470,7 @@ async def test_publish_retry_reuses_existing_stripe_mapping(monkeypatch):
     await _install_publish_fakes(monkeypatch)
     calls = _install_stripe_create_fakes(monkeypatch)
 
-    def fake_product_retrieve(product_id: str):
+    async def fake_product_retrieve(context, product_id: str):
         assert product_id == "prod_publish_1"
         return {
             "id": "prod_publish_1",
@@ -482,7 +482,7 @@ async def test_publish_retry_reuses_existing_stripe_mapping(monkeypatch):
             },
         }
 
-    def fake_price_retrieve(price_id: str):
+    async def fake_price_retrieve(context, price_id: str):
         assert price_id == "price_publish_1"
         return {
             "id": "price_publish_1",
@@ -492,8 +492,8 @@ async def test_publish_retry_reuses_existing_stripe_mapping(monkeypatch):
             "active": True,
         }
 
-    monkeypatch.setattr("stripe.Product.retrieve", fake_product_retrieve)
-    monkeypatch.setattr("stripe.Price.retrieve", fake_price_retrieve)
+    monkeypatch.setattr(stripe_gateway, "retrieve_product", fake_product_retrieve)
+    monkeypatch.setattr(stripe_gateway, "retrieve_price", fake_price_retrieve)
 
     first = await courses_service.publish_course(COURSE_ID, teacher_id=TEACHER_ID)
     second = await courses_service.publish_course(COURSE_ID, teacher_id=TEACHER_ID)
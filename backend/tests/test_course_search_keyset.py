@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app import db
+from app.repositories import courses as courses_repo
+from app.services import courses_service
+
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+async def _ensure_pool_open() -> None:
+    if db.pool.closed:  # type: ignore[attr-defined]
+        await db.pool.open(wait=True)  # type: ignore[attr-defined]
+
+
+async def _ensure_teacher(teacher_id: str) -> None:
+    await _ensure_pool_open()
+    async with db.pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            await cur.execute(
+                """
+                insert into app.auth_subjects (user_id, email, onboarding_state, role)
+                values (%s::uuid, %s, 'completed', 'teacher')
+                on conflict (user_id) do nothing
+                """,
+                (teacher_id, f"{teacher_id}@example.test"),
+            )
+            await conn.commit()
+
+
+async def _cleanup_teacher_scope(teacher_id: str) -> None:
+    await _ensure_pool_open()
+    async with db.pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            await cur.execute(
+                "delete from app.courses where teacher_id = %s::uuid",
+                (teacher_id,),
+            )
+            await cur.execute(
+                "delete from app.course_families where teacher_id = %s::uuid",
+                (teacher_id,),
+            )
+            await cur.execute(
+                "delete from app.auth_subjects where user_id = %s::uuid",
+                (teacher_id,),
+            )
+            await conn.commit()
+
+
+async def _create_course(
+    teacher_id: str,
+    family_id: str,
+    *,
+    title: str,
+    slug: str,
+    position: int,
+) -> str:
+    course = await courses_repo.create_course(
+        {
+            "teacher_id": teacher_id,
+            "title": title,
+            "slug": slug,
+            "course_group_id": family_id,
+            "group_position": position,
+            "required_enrollment_source": None,
+            "price_amount_cents": None,
+            "drip_enabled": False,
+            "drip_interval_days": None,
+        }
+    )
+    return str(course["id"])
+
+
+async def _search_all_pages(
+    teacher_id: str,
+    *,
+    search: str | None,
+    limit: int,
+) -> list[list[str]]:
+    pages: list[list[str]] = []
+    cursor: str | None = None
+    while True:
+        after_slug, after_rank = courses_service.decode_course_list_cursor(
+            cursor,
+            search=search,
+        )
+        rows = list(
+            await courses_repo.list_studio_courses(
+                teacher_id=teacher_id,
+                search=search,
+                limit=limit,
+                after_slug=after_slug,
+                after_rank=after_rank,
+            )
+        )
+        pages.append([str(row["slug"]) for row in rows])
+        cursor = courses_service.next_course_list_cursor(rows, limit=limit)
+        if cursor is None:
+            return pages
+
+
+async def test_course_search_ranks_title_matches_and_pages_by_keyset() -> None:
+    teacher_id = str(uuid4())
+    prefix = f"search-{uuid4().hex[:8]}"
+    await _ensure_teacher(teacher_id)
+    try:
+        family = await courses_repo.create_course_family(
+            teacher_id=teacher_id,
+            name=f"Family {prefix}",
+        )
+        family_id = str(family["id"])
+        await _create_course(
+            teacher_id,
+            family_id,
+            title="Andning i vardagen",
+            slug=f"{prefix}-a",
+            position=0,
+        )
+        described_id = await _create_course(
+            teacher_id,
+            family_id,
+            title="Kroppen i vila",
+            slug=f"{prefix}-b",
+            position=1,
+        )
+        await _create_course(
+            teacher_id,
+            family_id,
+            title="Andningsövningar för nybörjare",
+            slug=f"{prefix}-c",
+            position=2,
+        )
+        await _create_course(
+            teacher_id,
+            family_id,
+            title="Meditation",
+            slug=f"{prefix}-d",
+            position=3,
+        )
+        await courses_repo.upsert_course_public_content(
+            described_id,
+            description="En lugn kurs om andning och närvaro.",
+        )
+
+        search_pages = await _search_all_pages(
+            teacher_id,
+            search="andning",
+            limit=2,
+        )
+        slug_pages = await _search_all_pages(teacher_id, search=None, limit=3)
+
+        assert search_pages == [
+            [f"{prefix}-a", f"{prefix}-c"],
+            [f"{prefix}-b"],
+        ]
+        assert slug_pages == [
+            [f"{prefix}-a", f"{prefix}-b", f"{prefix}-c"],
+            [f"{prefix}-d"],
+        ]
+    finally:
+        await _cleanup_teacher_scope(teacher_id)
+
+
+def test_course_list_cursor_rejects_mismatched_mode() -> None:
+    search_cursor = courses_service.encode_course_list_cursor(
+        {"slug": "andning", "search_rank": 0.5}
+    )
+    slug_cursor = courses_service.encode_course_list_cursor({"slug": "andning"})
+
+    assert courses_service.decode_course_list_cursor(
+        search_cursor, search="andning"
+    ) == ("andning", 0.5)
+    assert courses_service.decode_course_list_cursor(slug_cursor, search=None) == (
+        "andning",
+        None,
+    )
+    for cursor, search in (
+        (search_cursor, None),
+        (slug_cursor, "andning"),
+        ("not-a-cursor", None),
+    ):
+        with pytest.raises(HTTPException) as exc_info:
+            courses_service.decode_course_list_cursor(cursor, search=search)
+        assert exc_info.value.status_code == 400
@@ -5,7 +5,7 @@ import pytest
 from app import repositories
 from app.config import settings
 from app.repositories import orders as orders_repo
-from app.services import subscription_service
+from app.services import stripe_gateway, subscription_service
 
 from .utils import register_user
 
@@ -26,16 +26,16 @@ async def test_create_subscription_session(async_client, monkeypatch):
     headers, user_id, _ = await register_user(async_client)
     fake_customer_id = f"cus_{str(user_id).replace('-', '')}"
 
-    def fake_customer_create(**kwargs):
+    async def fake_customer_create(context, **kwargs):
         return {"id": fake_customer_id}
 
     captured_session: dict[str, object] = {}
 
-    def fake_session_create(**kwargs):
+    async def fake_session_create(context, **kwargs):
         captured_session.update(kwargs)
         return {"id": "cs_test", "client_secret": "cs_test_secret"}
 
-    def fake_price_retrieve(price_id):
+    async def fake_price_retrieve(context, price_id):
         return {
             "id": price_id,
             "unit_amount": 9900,
@@ -44,9 +44,9 @@ async def test_create_subscription_session(async_client, monkeypatch):
             "livemode": False,
         }
 
-    monkeypatch.setattr("stripe.Customer.create", fake_customer_create)
-    monkeypatch.setattr("stripe.checkout.Session.create", fake_session_create)
-    monkeypatch.setattr("stripe.Price.retrieve", fake_price_retrieve)
+    monkeypatch.setattr(stripe_gateway, "create_customer", fake_customer_create)
+    monkeypatch.setattr(stripe_gateway, "create_checkout_session", fake_session_create)
+    monkeypatch.setattr(stripe_gateway, "retrieve_price", fake_price_retrieve)
 
     resp = await async_client.post(
         "/api/billing/create-subscription",
@@ -109,3 +109,33 @@ async def test_test_session_setting_remains_per_checkout(monkeypatch):
     assert checkout_calls == ["checkout", "checkout"]
     assert applied_to == [fake_conn, fake_conn]
     assert pool._configure is None
+
+
+@pytest.mark.anyio("asyncio")
+async def test_test_session_setting_only_round_trips_when_session_changes():
+    class SessionConnection:
+        def __init__(self):
+            self.calls: list[tuple[str, object]] = []
+
+        async def execute(self, query: str, params=None):
+            self.calls.append(("execute", params))
+
+        async def commit(self):
+            self.calls.append(("commit", None))
+
+    conn = SessionConnection()
+    session_id = "6f1b6c1e-9b3f-4c53-9d59-2f51f0f3a0b1"
+
+    await db._apply_test_session_setting(conn)
+    with db.use_test_session(session_id):
+        await db._apply_test_session_setting(conn)
+        await db._apply_test_session_setting(conn)
+    await db._apply_test_session_setting(conn)
+    await db._apply_test_session_setting(SessionConnection())
+
+    assert conn.calls == [
+        ("execute", (session_id,)),
+        ("commit", None),
+        ("execute", ("",)),
+        ("commit", None),
+    ]
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pytest
+
+from app import db
+
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+async def _ensure_pool_open() -> None:
+    if db.pool.closed:  # type: ignore[attr-defined]
+        await db.pool.open(wait=True)  # type: ignore[attr-defined]
+
+
+async def test_execute_hot_prepares_only_when_enabled(monkeypatch):
+    await _ensure_pool_open()
+    query = "select %s::int + 1 as value"
+    async with db.pool.connection() as conn:  # type: ignore[attr-defined]
+        previous_threshold = conn.prepare_threshold
+        try:
+            conn.prepare_threshold = 5
+            async with conn.cursor() as cur:
+                monkeypatch.setattr(db.settings, "database_prepared_statements", False)
+                await db.execute_hot(cur, query, (1,))
+                await cur.execute(
+                    "select count(*) from pg_prepared_statements "
+                    "where statement like 'select $1::int + 1%%'"
+                )
+                assert (await cur.fetchone())[0] == 0
+
+                monkeypatch.setattr(db.settings, "database_prepared_statements", True)
+                await db.execute_hot(cur, query, (1,))
+                assert (await cur.fetchone())[0] == 2
+                await cur.execute(
+                    "select count(*) from pg_prepared_statements "
+                    "where statement like 'select $1::int + 1%%'"
+                )
+                assert (await cur.fetchone())[0] == 1
+                await cur.execute("deallocate all")
+            await conn.commit()
+        finally:
+            conn.prepare_threshold = previous_threshold
+
+
+async def test_pipelined_fetchall_returns_rows_per_statement():
+    await _ensure_pool_open()
+    async with db.pool.connection() as conn:  # type: ignore[attr-defined]
+        results = await db.pipelined_fetchall(
+            conn,
+            [
+                ("select %s::int as value", (1,)),
+                ("select value from unnest(%s::int[]) as value order by value", ([3, 2],)),
+                ("select 1 as value where false", None),
+            ],
+        )
+        await conn.commit()
+
+    assert results == [[{"value": 1}], [{"value": 2}, {"value": 3}], []]
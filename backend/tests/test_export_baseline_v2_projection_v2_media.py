@@ -0,0 +1,106 @@
+import errno
+import hashlib
+import os
+
+import pytest
+
+from scripts import export_baseline_v2_projection_v2 as exporter
+
+
+_PAYLOAD = bytes(range(256)) * 64
+
+
+def _job(tmp_path, *, payload: bytes = _PAYLOAD, content_hash: str | None = None):
+    source = tmp_path / "source" / "lesson.mp3"
+    source.parent.mkdir(parents=True, exist_ok=True)
+    source.write_bytes(payload)
+    media_asset = exporter.MediaAsset(
+        id="media-1",
+        media_type="audio",
+        purpose="lesson_media",
+        original_object_path="source/lesson.mp3",
+        ingest_format="mp3",
+        file_size=len(_PAYLOAD),
+        content_hash_algorithm="sha256",
+        content_hash=content_hash or hashlib.sha256(_PAYLOAD).hexdigest(),
+        created_at=None,
+        updated_at=None,
+    )
+    return exporter.MediaCopyJob(
+        media_asset=media_asset,
+        source_path=source,
+        target_path=tmp_path / "export" / "media" / "media-1.mp3",
+    )
+
+
+def test_identity_cache_skips_hashing_known_sources_across_runs(tmp_path, monkeypatch):
+    job = _job(tmp_path)
+    cache_path = tmp_path / "export.identity-cache.json"
+
+    first_cache = exporter.IdentityCache(cache_path)
+    first = exporter.copy_global_media(job, allow_existing=False, cache=first_cache)
+    first_cache.save()
+    assert first.written is True
+    assert first.identity_cache_hits == 0
+
+    job.target_path.unlink()
+    second_cache = exporter.IdentityCache(cache_path)
+    monkeypatch.setattr(
+        exporter,
+        "stream_copy_with_identity",
+        lambda source, target: pytest.fail("known source must not be hashed again"),
+    )
+    second = exporter.copy_global_media(job, allow_existing=False, cache=second_cache)
+    assert second.written is True
+    assert second.identity_cache_hits == 1
+    assert job.target_path.read_bytes() == _PAYLOAD
+
+    existing = exporter.copy_global_media(job, allow_existing=True, cache=second_cache)
+    assert existing.written is False
+    assert existing.identity_cache_hits == 1
+
+
+def test_identity_cache_misses_when_size_or_mtime_changes(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(_PAYLOAD)
+    cache = exporter.IdentityCache(None)
+    cache.record(path, path.stat(), "hash")
+    assert cache.lookup(path, path.stat()) == "hash"
+
+    stat_result = path.stat()
+    os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+    assert cache.lookup(path, path.stat()) is None
+
+    path.write_bytes(_PAYLOAD[:-1])
+    cache.record(path, path.stat(), "hash")
+    path.write_bytes(_PAYLOAD)
+    assert cache.lookup(path, path.stat()) is None
+
+
+def test_source_identity_mismatch_removes_the_target(tmp_path):
+    job = _job(tmp_path, content_hash="0" * 64)
+
+    with pytest.raises(exporter.ProjectionV2Error, match="identity mismatch"):
+        exporter.copy_global_media(job, allow_existing=False, cache=None)
+
+    assert not job.target_path.exists()
+
+
+def test_fast_copy_falls_back_to_userspace_copy(tmp_path, monkeypatch):
+    import fcntl
+
+    def _no_reflink(fd, request, arg=0):
+        raise OSError(errno.EOPNOTSUPP, "reflink unsupported")
+
+    def _cross_device(source_fd, target_fd, count, *args):
+        raise OSError(errno.EXDEV, "cross-device copy")
+
+    monkeypatch.setattr(fcntl, "ioctl", _no_reflink)
+    monkeypatch.setattr(os, "copy_file_range", _cross_device, raising=False)
+    source = tmp_path / "source.bin"
+    target = tmp_path / "target" / "copy.bin"
+    source.write_bytes(_PAYLOAD)
+
+    exporter.fast_copy_file(source, target, len(_PAYLOAD))
+
+    assert target.read_bytes() == _PAYLOAD
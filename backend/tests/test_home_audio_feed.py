@@ -523,6 +523,16 @@ async def test_home_audio_returns_items_with_canonical_nested_media(async_client
     assert payload["text_bundle"]["home.audio.load_failed_error"]["authority_class"] == (
         "backend_error_text"
     )
+    text_bundle_hash = teacher_resp.headers["X-Text-Bundle-Hashes"]
+    assert text_bundle_hash.startswith("sha256:")
+    cached_resp = await async_client.get(
+        "/home/audio",
+        headers={**teacher_headers, "X-Text-Bundle-Hashes": text_bundle_hash},
+        params={"limit": 50},
+    )
+    assert cached_resp.status_code == 200, cached_resp.text
+    assert cached_resp.json()["text_bundle"] == {}
+    assert cached_resp.json()["items"] == payload["items"]
     item = _find_item_by_media_id(payload.get("items") or [], media_asset_id)
     assert item, payload
     assert item["source_type"] == "course_link"
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import os
+from uuid import uuid4
+
+import psycopg
+import pytest
+
+from scripts import import_baseline_v2_projection_v2 as importer
+
+
+_SNAPSHOT_QUERIES = {
+    "courses": """
+        select to_jsonb(c) from app.courses c where c.id = any(%s::uuid[]) order by c.id
+    """,
+    "lessons": """
+        select to_jsonb(l) from app.lessons l where l.course_id = any(%s::uuid[]) order by l.id
+    """,
+    "lesson_contents": """
+        select to_jsonb(c)
+          from app.lesson_contents c
+          join app.lessons l on l.id = c.lesson_id
+         where l.course_id = any(%s::uuid[])
+         order by c.lesson_id
+    """,
+    "media_assets": """
+        select to_jsonb(m)
+          from app.media_assets m
+         where m.id in (
+           select lm.media_asset_id
+             from app.lesson_media lm
+             join app.lessons l on l.id = lm.lesson_id
+            where l.course_id = any(%s::uuid[])
+         )
+         order by m.id
+    """,
+    "lesson_media": """
+        select to_jsonb(lm)
+          from app.lesson_media lm
+          join app.lessons l on l.id = lm.lesson_id
+         where l.course_id = any(%s::uuid[])
+         order by lm.id
+    """,
+}
+
+
+def _database_url() -> str:
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        pytest.skip("DATABASE_URL is required for Projection V2 load strategy tests")
+    return database_url
+
+
+def _seed_teacher(cur: psycopg.Cursor) -> tuple[str, str]:
+    teacher_id = str(uuid4())
+    family_id = str(uuid4())
+    cur.execute(
+        """
+        insert into app.auth_subjects (user_id, email, onboarding_state, role)
+        values (%s::uuid, %s, 'completed', 'teacher')
+        """,
+        (teacher_id, f"{teacher_id}@example.test"),
+    )
+    cur.execute(
+        """
+        insert into app.course_families (id, name, teacher_id)
+        values (%s::uuid, 'Projection Family', %s::uuid)
+        """,
+        (family_id, teacher_id),
+    )
+    return teacher_id, family_id
+
+
+def _projection_rows(teacher_id: str, family_id: str) -> importer.ProjectionRows:
+    courses = [
+        importer.CourseRow(
+            id=str(uuid4()),
+            teacher_id=teacher_id,
+            title=title,
+            slug=f"projection-{uuid4().hex[:8]}",
+            course_group_id=family_id,
+            group_position=position,
+            visibility="draft",
+            content_ready=False,
+            price_amount_cents=price,
+            stripe_product_id=None,
+            active_stripe_price_id=None,
+            sellable=False,
+            drip_enabled=drip_interval is not None,
+            drip_interval_days=drip_interval,
+            cover_media_id=None,
+            created_at="2024-03-01T10:00:00+01:00",
+            updated_at="2024-03-02T08:30:15.123456Z",
+        )
+        for position, (title, price, drip_interval) in enumerate(
+            [("Andning åt alla", 49000, 7), ("Tyst\tretreat", None, None)]
+        )
+    ]
+    lessons = [
+        importer.LessonRow(
+            id=str(uuid4()),
+            course_id=course.id,
+            title=f"Lektion {position}",
+            position=position,
+            created_at="2024-03-03T00:00:00Z",
+            updated_at="2024-03-03T00:00:00Z",
+            content_markdown="# Rubrik\n\nTab\there, backslash \\N, öäå \U0001f9d8\n",
+        )
+        for course in courses
+        for position in (1, 2)
+    ]
+    media_assets = [
+        importer.MediaAssetRow(
+            id=str(uuid4()),
+            media_type=media_type,
+            purpose="lesson_media",
+            original_object_path=f"media/source/{uuid4().hex}.{ingest_format}",
+            ingest_format=ingest_format,
+            file_size=file_size,
+            content_hash_algorithm="sha256",
+            content_hash=uuid4().hex * 2,
+        )
+        for media_type, ingest_format, file_size in (
+            ("audio", "mp3", 5_368_709_121),
+            ("image", "png", 0),
+        )
+    ]
+    lesson_media = [
+        importer.LessonMediaRow(
+            id=str(uuid4()),
+            lesson_id=lesson.id,
+            media_asset_id=media_assets[index % len(media_assets)].id,
+            position=1,
+            purpose="lesson_media",
+        )
+        for index, lesson in enumerate(lessons)
+    ]
+    return importer.ProjectionRows(
+        courses=courses,
+        lessons=lessons,
+        media_assets=media_assets,
+        lesson_media=lesson_media,
+    )
+
+
+def _snapshot(cur: psycopg.Cursor, course_ids: list[str]) -> dict[str, list]:
+    snapshot = {}
+    for table, query in _SNAPSHOT_QUERIES.items():
+        cur.execute(query, (course_ids,))
+        snapshot[table] = [row[0] for row in cur.fetchall()]
+    return snapshot
+
+
+def test_copy_and_rows_load_strategies_produce_identical_tables():
+    with psycopg.connect(_database_url()) as conn:
+        with conn.transaction(force_rollback=True), conn.cursor() as cur:
+            teacher_id, family_id = _seed_teacher(cur)
+            rows = _projection_rows(teacher_id, family_id)
+            course_ids = [row.id for row in rows.courses]
+
+            snapshots = {}
+            for strategy, load in (
+                ("rows", importer.insert_rows),
+                ("copy", importer.copy_rows),
+            ):
+                # Both loads share the outer transaction so now()-defaulted
+                # columns match; each is undone before the next one runs.
+                with conn.transaction(force_rollback=True):
+                    load(cur, rows)
+                    snapshots[strategy] = _snapshot(cur, course_ids)
+
+    assert [len(snapshots["rows"][table]) for table in _SNAPSHOT_QUERIES] == [2, 4, 4, 2, 4]
+    assert snapshots["copy"] == snapshots["rows"]
@@ -0,0 +1,97 @@
+import logging
+
+import pytest
+
+from app.observability import log_buffer
+
+
+@pytest.fixture
+def buffer_logger():
+    log_buffer.clear_events()
+    handler = log_buffer.OperationalLogBufferHandler(level=logging.INFO)
+    loggers = [logging.getLogger(f"tests.log_buffer.{name}") for name in ("a", "b")]
+    for logger in loggers:
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    yield loggers
+    for logger in loggers:
+        logger.removeHandler(handler)
+    log_buffer.clear_events()
+
+
+def test_list_events_sanitizes_on_read(buffer_logger):
+    logger, _ = buffer_logger
+    logger.info(
+        "Fetched https://cdn.example.com/a.mp3?token=abc for ada@example.com",
+        extra={"user_id": "u-1", "attempt": 2},
+    )
+
+    [event] = log_buffer.list_events(limit=5)
+
+    assert event["logger"] == "tests.log_buffer.a"
+    assert event["level"] == "INFO"
+    assert "token=abc" not in event["message"]
+    assert "[REDACTED_EMAIL]" in event["message"]
+    assert event["fields"]["user_id"] == "[REDACTED]"
+    assert event["fields"]["attempt"] == 2
+    assert event["timestamp"].endswith("Z")
+
+
+def test_extras_are_snapshotted_when_logged(buffer_logger):
+    class Job:
+        def __init__(self) -> None:
+            self.state = "queued"
+
+        def __str__(self) -> str:
+            return f"job:{self.state}"
+
+    logger, _ = buffer_logger
+    payload = {"owner_id": "u-1", "items": [1, 2]}
+    job = Job()
+    logger.info("Job queued", extra={"payload": payload, "job": job})
+    payload["items"].append(3)
+    job.state = "done"
+
+    [event] = log_buffer.list_events(limit=5)
+
+    assert event["fields"]["payload"] == {"items": [1, 2], "owner_id": "[REDACTED]"}
+    assert event["fields"]["job"] == "job:queued"
+
+
+def test_list_events_filters_by_level_and_logger_newest_first(buffer_logger):
+    logger_a, logger_b = buffer_logger
+    logger_a.info("a info 1")
+    logger_b.error("b error 1")
+    logger_a.warning("a warning 1")
+    logger_b.info("b info 1")
+    logger_a.error("a error 1")
+
+    assert [event["message"] for event in log_buffer.list_events(min_level="WARNING")] == [
+        "a error 1",
+        "a warning 1",
+        "b error 1",
+    ]
+    assert [
+        event["message"]
+        for event in log_buffer.list_events(
+            logger_names=["tests.log_buffer.a", "tests.log_buffer.b"],
+            min_level="ERROR",
+        )
+    ] == ["a error 1", "b error 1"]
+    assert [
+        event["message"]
+        for event in log_buffer.list_events(logger_names=["tests.log_buffer.b"])
+    ] == ["b info 1", "b error 1"]
+
+
+def test_eviction_keeps_indexes_in_step(buffer_logger):
+    logger_a, logger_b = buffer_logger
+    logger_b.error("b error evicted")
+    for index in range(log_buffer._BUFFER_MAX_EVENTS):
+        logger_a.info("a info %s", index)
+
+    assert log_buffer.list_events(logger_names=["tests.log_buffer.b"]) == []
+    assert log_buffer.list_events(min_level="ERROR") == []
+    newest = log_buffer.list_events(limit=1, logger_names=["tests.log_buffer.a"])
+    assert newest[0]["message"] == f"a info {log_buffer._BUFFER_MAX_EVENTS - 1}"
@@ -0,0 +1,121 @@
+from functools import partial
+
+import pytest
+
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+_CONTENT_HASH = "ab" * 32
+_PAYLOAD = bytes(range(256)) * 8
+
+
+@pytest.fixture
+def local_row(media_row):
+    return partial(
+        media_row,
+        storage_bucket=None,
+        storage_path="lessons/local-audio.mp3",
+        original_name="local-audio.mp3",
+        content_hash=_CONTENT_HASH,
+        content_hash_algorithm="sha256",
+    )
+
+
+@pytest.fixture
+def local_client(media_stream_client):
+    return partial(media_stream_client, local_payload=_PAYLOAD)
+
+
+async def test_local_media_uses_content_hash_etag_and_full_body(
+    local_row, local_client
+):
+    async with local_client(local_row()) as client:
+        response = await client.get("/stream")
+
+    assert response.status_code == 200
+    assert response.content == _PAYLOAD
+    assert response.headers["etag"] == f'"sha256-{_CONTENT_HASH}"'
+    assert response.headers["last-modified"]
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-length"] == str(len(_PAYLOAD))
+
+
+async def test_local_media_without_content_hash_falls_back_to_stat_etag(
+    local_row, local_client
+):
+    async with local_client(local_row(content_hash=None)) as client:
+        first = await client.get("/stream")
+        second = await client.get("/stream")
+
+    assert first.headers["etag"].startswith('"')
+    assert not first.headers["etag"].startswith('"sha256-')
+    assert first.headers["etag"] == second.headers["etag"]
+
+
+async def test_local_media_returns_304_for_matching_validators(local_row, local_client):
+    async with local_client(local_row()) as client:
+        first = await client.get("/stream")
+        by_etag = await client.get(
+            "/stream",
+            headers={"If-None-Match": f'"other", W/"sha256-{_CONTENT_HASH}"'},
+        )
+        by_date = await client.get(
+            "/stream",
+            headers={"If-Modified-Since": first.headers["last-modified"]},
+        )
+        stale_etag = await client.get(
+            "/stream",
+            headers={
+                "If-None-Match": '"other"',
+                "If-Modified-Since": first.headers["last-modified"],
+            },
+        )
+
+    assert by_etag.status_code == 304
+    assert by_etag.content == b""
+    assert by_etag.headers["etag"] == first.headers["etag"]
+    assert by_date.status_code == 304
+    assert stale_etag.status_code == 200
+    assert stale_etag.content == _PAYLOAD
+
+
+async def test_local_media_serves_single_and_multi_range_requests(
+    local_row, local_client
+):
+    async with local_client(local_row()) as client:
+        single = await client.get("/stream", headers={"Range": "bytes=10-19"})
+        multi = await client.get(
+            "/stream", headers={"Range": "bytes=0-3, 100-103"}
+        )
+
+    assert single.status_code == 206
+    assert single.content == _PAYLOAD[10:20]
+    assert single.headers["content-range"] == f"bytes 10-19/{len(_PAYLOAD)}"
+
+    assert multi.status_code == 206
+    assert multi.headers["content-type"].startswith("multipart/byteranges")
+    assert _PAYLOAD[0:4] in multi.content
+    assert _PAYLOAD[100:104] in multi.content
+    assert f"bytes 100-103/{len(_PAYLOAD)}".encode() in multi.content
+
+
+async def test_local_media_if_range_mismatch_returns_full_body(local_row, local_client):
+    async with local_client(local_row()) as client:
+        matching = await client.get(
+            "/stream",
+            headers={"Range": "bytes=0-9", "If-Range": f'"sha256-{_CONTENT_HASH}"'},
+        )
+        changed = await client.get(
+            "/stream",
+            headers={"Range": "bytes=0-9", "If-Range": '"sha256-stale"'},
+        )
+        unsatisfiable = await client.get(
+            "/stream", headers={"Range": f"bytes={len(_PAYLOAD) + 10}-"}
+        )
+
+    assert matching.status_code == 206
+    assert matching.content == _PAYLOAD[:10]
+    assert changed.status_code == 200
+    assert changed.content == _PAYLOAD
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == f"bytes */{len(_PAYLOAD)}"
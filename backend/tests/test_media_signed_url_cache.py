@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import pytest
+
+from app.config import settings
+from app.services import media_resolver, storage_service
+
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+class _CountingStorage:
+    bucket = "course-media"
+
+    def __init__(self, *, expires_in: int = 3600) -> None:
+        self.calls: list[tuple[str, int, bool]] = []
+        self.expires_in = expires_in
+
+    async def get_presigned_url(
+        self,
+        path: str,
+        ttl: int,
+        filename: str | None = None,
+        *,
+        download: bool = True,
+    ) -> storage_service.PresignedUrl:
+        self.calls.append((path, ttl, download))
+        return storage_service.PresignedUrl(
+            url=f"https://signed.local/{path}?n={len(self.calls)}",
+            expires_in=self.expires_in,
+            headers={},
+        )
+
+
+def _install(monkeypatch, storage: _CountingStorage) -> None:
+    monkeypatch.setattr(
+        media_resolver.storage_service,
+        "get_storage_service",
+        lambda bucket: storage,
+    )
+
+
+async def test_presigned_url_is_reused_until_safety_margin(monkeypatch) -> None:
+    storage = _CountingStorage()
+    _install(monkeypatch, storage)
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(media_resolver.time, "monotonic", lambda: clock["now"])
+
+    first = await media_resolver.get_presigned_url("course-media", "a.mp3", ttl=3600)
+    clock["now"] += 60
+    second = await media_resolver.get_presigned_url("course-media", "a.mp3", ttl=3600)
+
+    assert second.url == first.url
+    assert second.expires_in == 3540
+    assert len(storage.calls) == 1
+
+    clock["now"] += 3600 - 60 - settings.media_signed_url_cache_safety_seconds
+    third = await media_resolver.get_presigned_url("course-media", "a.mp3", ttl=3600)
+
+    assert third.url != first.url
+    assert len(storage.calls) == 2
+
+
+async def test_presigned_url_cache_keys_on_download_flag(monkeypatch) -> None:
+    storage = _CountingStorage()
+    _install(monkeypatch, storage)
+
+    await media_resolver.get_presigned_url("course-media", "a.mp3", ttl=3600)
+    await media_resolver.get_presigned_url(
+        "course-media", "a.mp3", ttl=3600, download=True, filename="a.mp3"
+    )
+
+    assert [call[2] for call in storage.calls] == [False, True]
+
+
+async def test_presigned_url_cache_can_be_disabled(monkeypatch) -> None:
+    storage = _CountingStorage()
+    _install(monkeypatch, storage)
+    monkeypatch.setattr(settings, "media_signed_url_cache_enabled", False)
+
+    await media_resolver.get_presigned_url("course-media", "a.mp3", ttl=3600)
+    await media_resolver.get_presigned_url("course-media", "a.mp3", ttl=3600)
+
+    assert len(storage.calls) == 2
+
+
+def test_lru_signed_url_cache_evicts_least_recently_used() -> None:
+    cache = media_resolver.LruSignedUrlCache(max_entries=2)
+    entry = media_resolver.CachedSignedUrl(url="u", headers={}, expires_at=1.0)
+    cache.set(("b", "one", False, None), entry)
+    cache.set(("b", "two", False, None), entry)
+    assert cache.get(("b", "one", False, None)) is entry
+
+    cache.set(("b", "three", False, None), entry)
+
+    assert len(cache) == 2
+    assert cache.get(("b", "two", False, None)) is None
+    assert cache.get(("b", "one", False, None)) is entry
+
+
+async def test_bulk_presign_only_signs_cache_misses(monkeypatch) -> None:
+    storage = _CountingStorage()
+    bulk_calls: list[list[str]] = []
+
+    async def get_presigned_urls(paths, ttl, *, download=False):
+        bulk_calls.append(list(paths))
+        return {
+            path: storage_service.PresignedUrl(
+                url=f"https://signed.local/{path}?bulk",
+                expires_in=ttl,
+                headers={},
+            )
+            for path in paths
+        }
+
+    storage.get_presigned_urls = get_presigned_urls  # type: ignore[attr-defined]
+    _install(monkeypatch, storage)
+
+    await media_resolver.get_presigned_url("course-media", "a.mp3", ttl=3600)
+    resolved = await media_resolver.get_presigned_urls(
+        "course-media",
+        ["a.mp3", "b.mp3", "c.mp3"],
+        ttl=3600,
+    )
+
+    assert bulk_calls == [["b.mp3", "c.mp3"]]
+    assert set(resolved) == {"a.mp3", "b.mp3", "c.mp3"}
+    again = await media_resolver.get_presigned_url("course-media", "c.mp3", ttl=3600)
+    assert again.url == "https://signed.local/c.mp3?bulk"
+    assert len(storage.calls) == 1
+
+
+async def test_presigned_url_is_not_reused_once_below_half_the_requested_ttl(
+    monkeypatch,
+) -> None:
+    storage = _CountingStorage()
+    _install(monkeypatch, storage)
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(media_resolver.time, "monotonic", lambda: clock["now"])
+
+    first = await media_resolver.get_presigned_url("course-media", "a.mp3", ttl=3600)
+    clock["now"] += 1700
+    second = await media_resolver.get_presigned_url("course-media", "a.mp3", ttl=3600)
+    assert second.url == first.url
+
+    clock["now"] += 200
+    third = await media_resolver.get_presigned_url("course-media", "a.mp3", ttl=3600)
+    assert third.url != first.url
+    assert third.expires_in == 3600
+    assert len(storage.calls) == 2
+
+    # A short-lived caller may still reuse what a long-lived caller signed.
+    clock["now"] += 3000
+    short = await media_resolver.get_presigned_url("course-media", "a.mp3", ttl=600)
+    assert short.url == third.url
+    assert len(storage.calls) == 2
@@ -0,0 +1,73 @@
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+
+from app.services import storage_service
+
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+_SIGNED_URL = "https://storage.test/object/sign/course-media/lessons/demo.mp3?token=t"
+
+
+class _FakeStorage:
+    def __init__(self, bucket: str) -> None:
+        self.bucket = bucket
+        self.enabled = True
+        self.sign_calls = 0
+
+    async def get_presigned_url(self, path, *, ttl, filename=None, download=False):
+        self.sign_calls += 1
+        return storage_service.PresignedUrl(url=_SIGNED_URL, expires_in=ttl, headers={})
+
+
+@pytest.fixture
+def fake_storage(monkeypatch):
+    storage = _FakeStorage("course-media")
+    monkeypatch.setattr(storage_service, "get_storage_service", lambda bucket: storage)
+    return storage
+
+
+@pytest.fixture
+def upstream_clients(monkeypatch):
+    requests: list[httpx.Request] = []
+    profiles: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            206,
+            headers={"content-range": "bytes 0-3/4096", "content-length": "4"},
+            content=b"abcd",
+        )
+
+    shared = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+
+    @asynccontextmanager
+    async def _storage_http_client(profile: str = "default"):
+        profiles.append(profile)
+        yield shared
+
+    monkeypatch.setattr(storage_service, "storage_http_client", _storage_http_client)
+    return shared, requests, profiles
+
+
+async def test_storage_proxy_streams_through_shared_upstream_client(
+    fake_storage, upstream_clients, media_row, media_stream_client
+):
+    shared, requests, profiles = upstream_clients
+
+    async with media_stream_client(media_row()) as client:
+        response = await client.get("/stream", headers={"Range": "bytes=0-3"})
+        await client.get("/stream")
+
+    assert response.status_code == 206
+    assert response.content == b"abcd"
+    assert response.headers["content-range"] == "bytes 0-3/4096"
+    assert requests[0].headers["range"] == "bytes=0-3"
+    assert str(requests[0].url) == _SIGNED_URL
+    assert profiles == ["proxy", "proxy"]
+    assert fake_storage.sign_calls == 1
+    assert not shared.is_closed
+    await shared.aclose()
@@ -7,23 +7,18 @@ from app.services import media_transcode_worker as worker
 pytestmark = pytest.mark.anyio("asyncio")
 
 
-async def test_worker_reschedules_locked_batch_on_cancel(monkeypatch):
-    batch = [{"id": "a"}, {"id": "b"}]
-
-    async def fake_fetch_and_lock_pending_media_assets(*, limit, max_attempts):
+def _install_queue(monkeypatch, batches_by_media_type):
+    async def fake_fetch_and_lock_pending_media_assets(
+        *, limit, max_attempts, media_types=None
+    ):
+        batch: list[dict] = []
+        for media_type in media_types or ():
+            batch.extend(batches_by_media_type.pop(media_type, []))
         return batch
 
     async def fake_list_pending_media_assets_missing_source(*, limit, max_attempts):
         return []
 
-    rescheduled: list[str] = []
-
-    async def fake_defer_media_asset_processing(*, media_id):
-        rescheduled.append(str(media_id))
-
-    async def fake_process_asset(asset):
-        raise asyncio.CancelledError
-
     monkeypatch.setattr(
         worker.media_assets_repo,
         "fetch_and_lock_pending_media_assets",
@@ -36,6 +31,29 @@ async def test_worker_reschedules_locked_batch_on_cancel(monkeypatch):
         fake_list_pending_media_assets_missing_source,
         raising=True,
     )
+    monkeypatch.setattr(
+        worker.settings, "media_transcode_poll_interval_seconds", 0.01
+    )
+
+
+async def test_worker_reschedules_locked_batch_on_cancel(monkeypatch):
+    _install_queue(
+        monkeypatch,
+        {"audio": [{"id": "a", "media_type": "audio"}, {"id": "b", "media_type": "audio"}]},
+    )
+    rescheduled: list[str] = []
+    started: list[str] = []
+    both_started = asyncio.Event()
+
+    async def fake_defer_media_asset_processing(*, media_id):
+        rescheduled.append(str(media_id))
+
+    async def fake_process_asset(asset):
+        started.append(asset["id"])
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.Event().wait()
+
     monkeypatch.setattr(
         worker.media_assets_repo,
         "defer_media_asset_processing",
@@ -44,6 +62,56 @@ async def test_worker_reschedules_locked_batch_on_cancel(monkeypatch):
     )
     monkeypatch.setattr(worker, "_process_asset", fake_process_asset, raising=True)
 
-    await worker._poll_loop()
+    poll_task = asyncio.create_task(worker._poll_loop())
+    await asyncio.wait_for(both_started.wait(), timeout=1)
+    poll_task.cancel()
+    await poll_task
 
     assert set(rescheduled) == {"a", "b"}
+    assert worker._in_flight_assets == {}
+
+
+async def test_worker_processes_images_while_audio_is_running(monkeypatch):
+    _install_queue(
+        monkeypatch,
+        {
+            "audio": [{"id": "audio-1", "media_type": "audio"}],
+            "image": [{"id": "image-1", "media_type": "image"}],
+        },
+    )
+    audio_release = asyncio.Event()
+    image_done = asyncio.Event()
+    finished: list[str] = []
+
+    async def fake_defer_media_asset_processing(*, media_id):
+        return None
+
+    async def fake_process_asset(asset):
+        if asset["media_type"] == "audio":
+            await audio_release.wait()
+        finished.append(asset["id"])
+        if asset["media_type"] == "image":
+            image_done.set()
+
+    monkeypatch.setattr(
+        worker.media_assets_repo,
+        "defer_media_asset_processing",
+        fake_defer_media_asset_processing,
+        raising=True,
+    )
+    monkeypatch.setattr(worker, "_process_asset", fake_process_asset, raising=True)
+
+    poll_task = asyncio.create_task(worker._poll_loop())
+    try:
+        await asyncio.wait_for(image_done.wait(), timeout=1)
+        assert finished == ["image-1"]
+        assert worker._in_flight_lane_counts()["audio"] == 1
+        audio_release.set()
+        for _ in range(100):
+            if "audio-1" in finished:
+                break
+            await asyncio.sleep(0.01)
+        assert finished == ["image-1", "audio-1"]
+    finally:
+        poll_task.cancel()
+        await poll_task
@@ -1,4 +1,6 @@
 import asyncio
+import contextlib
+import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -1280,3 +1282,92 @@ async def test_profile_media_image_transcode_marks_ready_through_worker(
         "playback_format": "jpg",
         "codec": "jpeg",
     }
+
+
+@pytest.mark.anyio("asyncio")
+async def test_streaming_audio_transcode_pipes_source_through_ffmpeg_into_upload(
+    monkeypatch,
+):
+    monkeypatch.setattr(worker.settings, "media_transcode_streaming_enabled", True)
+    monkeypatch.setattr(worker.settings, "mcp_mode", "production")
+    calls: dict[str, object] = {}
+
+    class DummySigned:
+        url = "https://example.invalid/source.wav"
+
+    class DummyStorage:
+        bucket = "course-media"
+
+        async def get_presigned_url(self, *args, **kwargs):
+            return DummySigned()
+
+        async def upload_object(self, path, *, content, content_type, **kwargs):
+            calls["upload_path"] = path
+            calls["upload_content_type"] = content_type
+            calls["upload_bytes"] = b"".join([chunk async for chunk in content])
+
+        async def inspect_object(self, path, *, ttl):
+            return worker.storage_service.StorageObjectMetadata(
+                path=path,
+                content_type="audio/mpeg",
+                size_bytes=len(calls["upload_bytes"]),
+            )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"wav-bytes" * 1000)
+
+    @contextlib.asynccontextmanager
+    async def fake_http_client(profile="default"):
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            yield client
+
+    # Stand-in encoder: echoes stdin and reports progress like ffmpeg does.
+    fake_encoder = (
+        "import sys; data = sys.stdin.buffer.read(); "
+        "sys.stdout.buffer.write(data.upper()); "
+        "sys.stderr.write('size=1kB time=00:01:02.50 bitrate=192kbits/s')"
+    )
+
+    async def fake_consume_attempt():
+        calls["attempt_consumed"] = True
+
+    async def fake_mark_media_asset_ready_from_worker(**kwargs):
+        calls["mark_ready"] = kwargs
+        return True
+
+    monkeypatch.setattr(
+        worker.storage_service, "get_storage_service", lambda bucket: DummyStorage()
+    )
+    monkeypatch.setattr(worker.storage_service, "storage_http_client", fake_http_client)
+    monkeypatch.setattr(
+        worker,
+        "_ffmpeg_audio_command",
+        lambda input_arg, output_arg: [sys.executable, "-c", fake_encoder],
+    )
+    monkeypatch.setattr(
+        worker.media_assets_repo,
+        "mark_media_asset_ready_from_worker",
+        fake_mark_media_asset_ready_from_worker,
+    )
+
+    asset = {
+        "id": "media-wav",
+        "media_type": "audio",
+        "purpose": "lesson_audio",
+        "ingest_format": "wav",
+        "original_filename": "demo.wav",
+        "original_object_path": "media/source/audio/courses/course-1/lessons/lesson-1/demo.wav",
+        "storage_bucket": "course-media",
+    }
+
+    await worker._transcode_audio_asset(asset, fake_consume_attempt)
+
+    assert calls["attempt_consumed"] is True
+    assert calls["upload_bytes"] == b"WAV-BYTES" * 1000
+    assert calls["upload_content_type"] == "audio/mpeg"
+    assert (
+        calls["upload_path"]
+        == "media/derived/audio/courses/course-1/lessons/lesson-1/demo.mp3"
+    )
+    assert calls["mark_ready"]["duration_seconds"] == 62
+    assert calls["mark_ready"]["playback_object_path"] == calls["upload_path"]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services import notifications_dispatcher_worker, push_provider
+
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+def _firebase_provider(monkeypatch, handler) -> push_provider.FirebasePushProvider:
+    transport = httpx.MockTransport(handler)
+    real_client = httpx.AsyncClient
+    clients: list[httpx.AsyncClient] = []
+
+    def _client(**kwargs):
+        kwargs.pop("limits", None)
+        client = real_client(transport=transport, **kwargs)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(push_provider.httpx, "AsyncClient", _client)
+    monkeypatch.setattr(push_provider.jwt, "encode", lambda *args, **kwargs: "signed")
+    provider = push_provider.FirebasePushProvider(
+        project_id="aveli-test",
+        client_email="push@example.invalid",
+        private_key="unused",
+        token_url="https://oauth.example.invalid/token",
+        api_base_url="https://fcm.example.invalid",
+        timeout_seconds=5.0,
+    )
+    provider.created_clients = clients  # type: ignore[attr-defined]
+    return provider
+
+
+async def test_firebase_provider_shares_client_and_token_across_concurrent_sends(
+    monkeypatch,
+):
+    token_requests = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal token_requests
+        if request.url.host == "oauth.example.invalid":
+            token_requests += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(
+                200, json={"access_token": "bearer-1", "expires_in": 3600}
+            )
+        assert request.headers["authorization"] == "Bearer bearer-1"
+        return httpx.Response(200, json={"name": f"msg-{request.url.path}"})
+
+    provider = _firebase_provider(monkeypatch, handler)
+    message = push_provider.PushMessage(title="t", body="b", data={})
+
+    results = await asyncio.gather(
+        *(provider.send(token=f"token-{index}", message=message) for index in range(8))
+    )
+    await provider.aclose()
+
+    assert len(results) == 8
+    assert token_requests == 1
+    assert len(provider.created_clients) == 1  # type: ignore[attr-defined]
+
+
+async def test_push_fan_out_respects_concurrency_limit(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    class _SlowProvider:
+        async def send(self, *, token: str, message) -> str | None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if token == "bad":
+                raise RuntimeError("rejected")
+            return f"id-{token}"
+
+    monkeypatch.setattr(
+        notifications_dispatcher_worker.settings, "notification_push_concurrency", 3
+    )
+    push_provider.set_push_provider_for_tests(_SlowProvider())
+    deliveries = [
+        {
+            "delivery_id": f"delivery-{index}",
+            "notification_id": f"notification-{index}",
+            "notification_type": "lesson_drip",
+            "payload_json": {"title": "Opened lesson"},
+            "devices": [
+                {
+                    "push_delivery_id": f"pdd-{index}-{device}",
+                    "device_id": f"device-{index}-{device}",
+                    "push_token": (
+                        "bad" if (index, device) == (2, 1) else f"t{index}{device}"
+                    ),
+                }
+                for device in range(2)
+            ],
+        }
+        for index in range(5)
+    ]
+    try:
+        results = await notifications_dispatcher_worker._send_push_deliveries(
+            deliveries
+        )
+    finally:
+        push_provider.set_push_provider_for_tests(None)
+
+    assert peak == 3
+    assert results["delivery-0"] == [
+        ("sent", "id-t00", None),
+        ("sent", "id-t01", None),
+    ]
+    assert results["delivery-2"][1] == ("failed", None, "rejected")
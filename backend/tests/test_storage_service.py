@@ -554,3 +554,111 @@ async def test_delete_object_quotes_storage_path_segments(monkeypatch, path):
         "https://example.supabase.co/storage/v1/object/lesson_media/"
         f"{quote(path, safe='/')}"
     )
+
+
+@pytest.mark.anyio("asyncio")
+async def test_shared_http_clients_reuse_keep_alive_connections(monkeypatch):
+    captured: dict[str, list[object]] = {"init": [], "closed": []}
+
+    class DummyResponse:
+        status_code = 200
+
+        def json(self):
+            return {"signedURL": "/object/sign/lesson_media/course/foo.mp4?t=token"}
+
+    class DummyAsyncClient:
+        is_closed = False
+
+        def __init__(self, *args, **kwargs):
+            captured["init"].append(kwargs)
+
+        async def aclose(self):
+            captured["closed"].append(self)
+
+        async def post(self, url, json, headers):
+            return DummyResponse()
+
+    monkeypatch.setattr(storage_module.httpx, "AsyncClient", DummyAsyncClient)
+
+    service = StorageService(
+        bucket="lesson_media",
+        supabase_url="https://example.supabase.co",
+        service_role_key="service-role-key",
+    )
+
+    await storage_module.open_shared_http_clients()
+    try:
+        await service.get_presigned_url("course/foo.mp4", ttl=120)
+        await service.get_presigned_url("course/bar.mp4", ttl=120)
+    finally:
+        await storage_module.close_shared_http_clients()
+
+    assert len(captured["init"]) == 1
+    limits = captured["init"][0]["limits"]
+    assert isinstance(limits, httpx.Limits)
+    assert limits.max_keepalive_connections > 0
+    assert captured["init"][0]["timeout"].read == 10.0
+    assert len(captured["closed"]) == 1
+    assert storage_module._shared_http_clients is None
+
+
+@pytest.mark.anyio("asyncio")
+async def test_get_presigned_urls_signs_many_paths_in_one_request(monkeypatch):
+    captured: list[dict[str, object]] = []
+
+    class DummyResponse:
+        status_code = 200
+
+        def json(self):
+            return [
+                {
+                    "error": None,
+                    "path": "course/a.mp3",
+                    "signedURL": "/object/sign/lesson_media/course/a.mp3?token=a",
+                },
+                {
+                    "error": "Either the object does not exist or you do not have access to it",
+                    "path": "course/missing.mp3",
+                    "signedURL": None,
+                },
+            ]
+
+    class DummyAsyncClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+        async def post(self, url, json, headers):
+            captured.append({"url": url, "json": json})
+            return DummyResponse()
+
+    monkeypatch.setattr(storage_module.httpx, "AsyncClient", DummyAsyncClient)
+
+    service = StorageService(
+        bucket="lesson_media",
+        supabase_url="https://example.supabase.co",
+        service_role_key="service-role-key",
+    )
+
+    result = await service.get_presigned_urls(
+        ["/course/a.mp3", "course/missing.mp3", "course/a.mp3"],
+        ttl=600,
+    )
+
+    assert captured == [
+        {
+            "url": "https://example.supabase.co/storage/v1/object/sign/lesson_media",
+            "json": {"expiresIn": 600, "paths": ["course/a.mp3", "course/missing.mp3"]},
+        }
+    ]
+    assert set(result) == {"course/a.mp3"}
+    assert result["course/a.mp3"].url == (
+        "https://example.supabase.co/storage/v1/object/sign/lesson_media/course/a.mp3?token=a"
+    )
+    assert result["course/a.mp3"].expires_in == 600
+    assert result["course/a.mp3"].headers == {}
@@ -0,0 +1,190 @@
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import stripe
+
+from app.config import settings
+from app.services import courses_service, stripe_gateway
+
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+def _context(secret_key: str = "sk_test_value") -> SimpleNamespace:
+    return SimpleNamespace(secret_key=secret_key)
+
+
+@pytest.fixture
+def fake_prices(monkeypatch):
+    calls: list[tuple[str, str]] = []
+
+    def _client_for(secret_key: str):
+        async def retrieve_async(price_id):
+            calls.append((secret_key, price_id))
+            return {"id": price_id, "unit_amount": 9900, "currency": "sek"}
+
+        async def create_async(params, options):
+            calls.append((secret_key, f"create:{options.get('idempotency_key')}"))
+            return {"id": "price_created", **params}
+
+        return SimpleNamespace(
+            v1=SimpleNamespace(
+                prices=SimpleNamespace(
+                    retrieve_async=retrieve_async,
+                    create_async=create_async,
+                )
+            )
+        )
+
+    @asynccontextmanager
+    async def _stripe_client(context):
+        yield _client_for(context.secret_key)
+
+    monkeypatch.setattr(stripe_gateway, "_stripe_client", _stripe_client)
+    stripe_gateway.clear_object_cache()
+    yield calls
+    stripe_gateway.clear_object_cache()
+
+
+async def test_retrieve_price_caches_by_secret_key_and_id(fake_prices):
+    first = await stripe_gateway.retrieve_price(_context(), "price_1")
+    second = await stripe_gateway.retrieve_price(_context(), "price_1")
+    other_key = await stripe_gateway.retrieve_price(_context("sk_live_value"), "price_1")
+
+    assert first is second
+    assert other_key["id"] == "price_1"
+    assert fake_prices == [("sk_test_value", "price_1"), ("sk_live_value", "price_1")]
+
+
+async def test_created_price_seeds_cache_and_forwards_idempotency_key(fake_prices):
+    created = await stripe_gateway.create_price(
+        _context(),
+        product="prod_1",
+        unit_amount=1900,
+        currency="sek",
+        idempotency_key="course:1:price",
+    )
+    fetched = await stripe_gateway.retrieve_price(_context(), "price_created")
+
+    assert created["product"] == "prod_1"
+    assert "idempotency_key" not in created
+    assert fetched is created
+    assert fake_prices == [("sk_test_value", "create:course:1:price")]
+
+
+async def test_object_cache_is_disabled_with_zero_ttl(monkeypatch, fake_prices):
+    monkeypatch.setattr(settings, "stripe_object_cache_ttl_seconds", 0)
+
+    await stripe_gateway.retrieve_price(_context(), "price_1")
+    await stripe_gateway.retrieve_price(_context(), "price_1")
+
+    assert len(fake_prices) == 2
+
+
+async def test_shared_client_is_reused_per_secret_key():
+    await stripe_gateway.open_shared_client()
+    try:
+        async with stripe_gateway._stripe_client(_context()) as first:
+            pass
+        async with stripe_gateway._stripe_client(_context()) as second:
+            pass
+        async with stripe_gateway._stripe_client(_context("sk_live_value")) as other:
+            pass
+    finally:
+        await stripe_gateway.close_shared_client()
+
+    assert first is second
+    assert other is not first
+
+
+async def test_sdk_objects_are_returned_as_plain_dicts(monkeypatch):
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if "/v1/products" in request.url.path:
+            return httpx.Response(
+                200,
+                json={"id": "prod_1", "object": "product", "metadata": {"course_id": "c-1"}},
+            )
+        return httpx.Response(
+            200,
+            json={
+                "id": "price_1",
+                "object": "price",
+                "product": "prod_1",
+                "unit_amount": 9900,
+                "recurring": {"interval": "month"},
+            },
+        )
+
+    def _mock_http_client() -> stripe.HTTPXClient:
+        http_client = stripe.HTTPXClient()
+        http_client._client_async = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        return http_client
+
+    monkeypatch.setattr(stripe_gateway, "_new_http_client", _mock_http_client)
+    stripe_gateway.clear_object_cache()
+    try:
+        product = await stripe_gateway.create_product(_context(), name="Course")
+        price = await stripe_gateway.create_price(_context(), product="prod_1")
+        fetched_product = await courses_service._stripe_retrieve_course_product(
+            _context(), "prod_1"
+        )
+        fetched_price = await courses_service._stripe_retrieve_price(_context(), "price_1")
+    finally:
+        stripe_gateway.clear_object_cache()
+
+    assert type(product) is dict
+    assert product.get("metadata") == {"course_id": "c-1"}
+    assert type(price["recurring"]) is dict
+    assert fetched_product is product
+    assert fetched_price is price
+
+
+def test_as_dict_converts_sdk_objects_and_passes_other_values_through():
+    event = stripe.Event.construct_from(
+        {"id": "evt_1", "type": "checkout.session.completed", "data": {"object": {"id": "cs_1"}}},
+        "sk_test_value",
+    )
+    plain = {"id": "evt_2"}
+
+    converted = stripe_gateway.as_dict(event)
+
+    assert type(converted) is dict
+    assert converted["data"]["object"].get("id") == "cs_1"
+    assert stripe_gateway.as_dict(plain) is plain
+    assert stripe_gateway.as_dict(None) is None
+
+
+async def test_sdk_errors_match_the_stripe_error_handlers(monkeypatch):
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/price_missing"):
+            return httpx.Response(
+                404,
+                json={"error": {"type": "invalid_request_error", "message": "No such price"}},
+            )
+        return httpx.Response(
+            401,
+            json={"error": {"type": "invalid_request_error", "message": "Invalid API Key"}},
+        )
+
+    def _mock_http_client() -> stripe.HTTPXClient:
+        http_client = stripe.HTTPXClient()
+        http_client._client_async = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        return http_client
+
+    monkeypatch.setattr(stripe_gateway, "_new_http_client", _mock_http_client)
+    stripe_gateway.clear_object_cache()
+
+    with pytest.raises(stripe.error.InvalidRequestError):  # type: ignore[attr-defined]
+        await stripe_gateway.retrieve_price(_context(), "price_missing")
+    with pytest.raises(stripe.error.StripeError) as excinfo:  # type: ignore[attr-defined]
+        await stripe_gateway.retrieve_price(_context(), "price_other")
+
+    assert not isinstance(excinfo.value, stripe.error.InvalidRequestError)  # type: ignore[attr-defined]
+    assert {request.headers["stripe-version"] for request in requests} == {
+        stripe_gateway.STRIPE_API_VERSION
+    }
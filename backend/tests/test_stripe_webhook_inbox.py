@@ -0,0 +1,297 @@
+import hashlib
+import hmac
+import json
+import time
+import uuid
+
+import pytest
+
+from app import db
+from app.config import settings
+from app.routes import stripe_webhooks
+from app.services import stripe_webhook_inbox_worker as inbox_worker
+
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+def _event(event_id: str, *, created: int, order_id: str | None = None, customer: str | None = None) -> dict:
+    data_object: dict = {"id": f"cs_{event_id}", "object": "checkout.session"}
+    if order_id:
+        data_object["metadata"] = {"order_id": order_id}
+    if customer:
+        data_object["customer"] = customer
+    return {
+        "id": event_id,
+        "type": "checkout.session.completed",
+        "created": created,
+        "data": {"object": data_object},
+    }
+
+
+async def _inbox_rows(event_ids: list[str]) -> dict[str, dict]:
+    async with db.pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            await cur.execute(
+                """
+                select event_id, status, attempts, ordering_key,
+                       next_attempt_at > clock_timestamp() as delayed,
+                       last_error
+                  from app.stripe_webhook_inbox
+                 where event_id = any(%s)
+                """,
+                (event_ids,),
+            )
+            rows = await cur.fetchall()
+    return {
+        row[0]: {
+            "status": row[1],
+            "attempts": row[2],
+            "ordering_key": row[3],
+            "delayed": row[4],
+            "last_error": row[5],
+        }
+        for row in rows
+    }
+
+
+@pytest.fixture
+async def inbox_event_ids(async_client):
+    event_ids: list[str] = []
+    yield event_ids
+    async with db.pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            await cur.execute(
+                "delete from app.stripe_webhook_inbox where event_id = any(%s)",
+                (event_ids,),
+            )
+        await conn.commit()
+
+
+@pytest.fixture
+def only_test_events(monkeypatch, inbox_event_ids):
+    """Keep run_once from touching inbox rows other tests may have left behind."""
+
+    claim_due_events = inbox_worker.inbox_repo.claim_due_events
+
+    async def _claim(*, limit, lease_seconds):
+        rows = await claim_due_events(limit=1000, lease_seconds=lease_seconds)
+        ours = [row for row in rows if row["event_id"] in inbox_event_ids]
+        others = [row["event_id"] for row in rows if row["event_id"] not in inbox_event_ids]
+        for event_id in others:
+            await inbox_worker.inbox_repo.mark_event_failed(
+                event_id, error="released by test", retry_in_seconds=0
+            )
+        return ours[:limit]
+
+    monkeypatch.setattr(inbox_worker.inbox_repo, "claim_due_events", _claim)
+
+
+def test_event_ordering_key_prefers_order_then_customer():
+    order_id = str(uuid.uuid4())
+    assert inbox_worker.event_ordering_key(_event("evt_1", created=1, order_id=order_id, customer="cus_1")) == (
+        f"order:{order_id}"
+    )
+    assert inbox_worker.event_ordering_key(_event("evt_2", created=1, customer="cus_1")) == "customer:cus_1"
+    assert inbox_worker.event_ordering_key(_event("evt_3", created=1)) == "event:evt_3"
+
+
+def test_event_ordering_key_groups_membership_events_by_customer():
+    invoice = {
+        "id": "evt_invoice",
+        "type": "invoice.payment_succeeded",
+        "data": {"object": {"id": "in_1", "customer": "cus_1", "subscription": "sub_1"}},
+    }
+    subscription = {
+        "id": "evt_subscription",
+        "type": "customer.subscription.updated",
+        "data": {
+            "object": {
+                "id": "sub_1",
+                "customer": "cus_1",
+                "metadata": {"order_id": str(uuid.uuid4())},
+            }
+        },
+    }
+    membership_checkout = _event(
+        "evt_checkout", created=1, order_id=str(uuid.uuid4()), customer="cus_1"
+    )
+    membership_checkout["data"]["object"]["mode"] = "subscription"
+
+    assert inbox_worker.event_ordering_key(invoice) == "customer:cus_1"
+    assert inbox_worker.event_ordering_key(subscription) == "customer:cus_1"
+    assert inbox_worker.event_ordering_key(membership_checkout) == "customer:cus_1"
+
+
+async def test_webhook_route_queues_event_and_acknowledges(async_client, monkeypatch, inbox_event_ids):
+    event_id = f"evt_inbox_{uuid.uuid4().hex}"
+    inbox_event_ids.append(event_id)
+    event = _event(event_id, created=1_700_000_000, customer="cus_inbox")
+    processed: list[str] = []
+
+    async def fake_process(event):
+        processed.append(event["id"])
+        return True
+
+    monkeypatch.setenv("STRIPE_SECRET_KEY", "sk_test_value")
+    monkeypatch.setenv("STRIPE_TEST_SECRET_KEY", "sk_test_value")
+    monkeypatch.delenv("STRIPE_LIVE_SECRET_KEY", raising=False)
+    monkeypatch.setattr(settings, "stripe_secret_key", "sk_test_value")
+    monkeypatch.setattr(settings, "stripe_test_secret_key", "sk_test_value")
+    monkeypatch.setattr(settings, "stripe_test_webhook_secret", "whsec_test")
+    monkeypatch.setattr(settings, "stripe_webhook_inbox_enabled", True)
+    monkeypatch.setattr(stripe_webhooks, "process_verified_event", fake_process)
+    monkeypatch.setattr("stripe.Webhook.construct_event", lambda payload, sig_header, secret: event)
+
+    first = await async_client.post(
+        "/api/stripe/webhook",
+        content=json.dumps({}),
+        headers={"stripe-signature": "sig"},
+    )
+    redelivered = await async_client.post(
+        "/api/stripe/webhook",
+        content=json.dumps({}),
+        headers={"stripe-signature": "sig"},
+    )
+
+    assert first.status_code == 200, first.text
+    assert redelivered.status_code == 200
+    assert processed == []
+    rows = await _inbox_rows([event_id])
+    assert rows[event_id]["status"] == "pending"
+    assert rows[event_id]["ordering_key"] == "customer:cus_inbox"
+
+
+@pytest.mark.parametrize("inbox_enabled", [True, False])
+async def test_webhook_route_accepts_a_really_signed_event(
+    async_client,
+    monkeypatch,
+    inbox_event_ids,
+    inbox_enabled,
+):
+    event_id = f"evt_signed_{uuid.uuid4().hex}"
+    inbox_event_ids.append(event_id)
+    payload = json.dumps(
+        {"object": "event", **_event(event_id, created=1_700_000_000, customer="cus_signed")}
+    )
+    timestamp = int(time.time())
+    digest = hmac.new(
+        b"whsec_test",
+        f"{timestamp}.{payload}".encode(),
+        hashlib.sha256,
+    ).hexdigest()
+    processed: list[dict] = []
+
+    async def fake_process(event):
+        processed.append(event)
+        return False
+
+    monkeypatch.setenv("STRIPE_SECRET_KEY", "sk_test_value")
+    monkeypatch.setenv("STRIPE_TEST_SECRET_KEY", "sk_test_value")
+    monkeypatch.delenv("STRIPE_LIVE_SECRET_KEY", raising=False)
+    monkeypatch.setattr(settings, "stripe_secret_key", "sk_test_value")
+    monkeypatch.setattr(settings, "stripe_test_secret_key", "sk_test_value")
+    monkeypatch.setattr(settings, "stripe_test_webhook_secret", "whsec_test")
+    monkeypatch.setattr(settings, "stripe_webhook_inbox_enabled", inbox_enabled)
+    monkeypatch.setattr(stripe_webhooks, "process_verified_event", fake_process)
+
+    response = await async_client.post(
+        "/api/stripe/webhook",
+        content=payload,
+        headers={"stripe-signature": f"t={timestamp},v1={digest}"},
+    )
+
+    assert response.status_code == 200, response.text
+    if inbox_enabled:
+        assert processed == []
+        rows = await _inbox_rows([event_id])
+        assert rows[event_id]["ordering_key"] == "customer:cus_signed"
+    else:
+        [event] = processed
+        assert type(event) is dict
+        assert type(event["data"]["object"]) is dict
+        assert event["data"]["object"]["customer"] == "cus_signed"
+
+
+async def test_run_once_processes_one_event_per_ordering_key_in_order(
+    inbox_event_ids, only_test_events
+):
+    order_id = str(uuid.uuid4())
+    suffix = uuid.uuid4().hex
+    first = _event(f"evt_a_{suffix}", created=100, order_id=order_id)
+    second = _event(f"evt_b_{suffix}", created=200, order_id=order_id)
+    other = _event(f"evt_c_{suffix}", created=150, customer=f"cus_{suffix}")
+    for event in (second, other, first):
+        inbox_event_ids.append(event["id"])
+        assert await inbox_worker.enqueue_verified_event(event) is True
+    assert await inbox_worker.enqueue_verified_event(first) is False
+
+    processed: list[str] = []
+
+    async def processor(event):
+        processed.append(event["id"])
+
+    assert await inbox_worker.run_once(processor=processor) == 2
+    assert sorted(processed) == sorted([first["id"], other["id"]])
+
+    assert await inbox_worker.run_once(processor=processor) == 1
+    assert processed[-1] == second["id"]
+    rows = await _inbox_rows(inbox_event_ids)
+    assert {row["status"] for row in rows.values()} == {"succeeded"}
+
+
+async def test_run_once_backs_off_failures_and_marks_exhausted_events_dead(
+    monkeypatch, inbox_event_ids, only_test_events
+):
+    event = _event(f"evt_fail_{uuid.uuid4().hex}", created=1, customer="cus_fail")
+    inbox_event_ids.append(event["id"])
+    await inbox_worker.enqueue_verified_event(event)
+
+    async def failing(event):
+        raise RuntimeError("order not committed yet")
+
+    exceptions: list[tuple[str | None, str | None, str]] = []
+    messages: list[dict] = []
+    monkeypatch.setattr(
+        stripe_webhooks,
+        "_capture_exception",
+        lambda event_type, event_id, exc: exceptions.append((event_type, event_id, str(exc))),
+    )
+    monkeypatch.setattr(stripe_webhooks, "_capture_message", lambda **kwargs: messages.append(kwargs))
+
+    monkeypatch.setattr(settings, "stripe_webhook_inbox_max_attempts", 2)
+    assert await inbox_worker.run_once(processor=failing) == 0
+    assert exceptions == [("checkout.session.completed", event["id"], "order not committed yet")]
+    assert messages == []
+    rows = await _inbox_rows([event["id"]])
+    assert rows[event["id"]]["status"] == "pending"
+    assert rows[event["id"]]["attempts"] == 1
+    assert rows[event["id"]]["delayed"] is True
+    assert "order not committed yet" in rows[event["id"]]["last_error"]
+
+    assert await inbox_worker.run_once(processor=failing) == 0
+
+    async with db.pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            await cur.execute(
+                "update app.stripe_webhook_inbox set next_attempt_at = now() where event_id = %s",
+                (event["id"],),
+            )
+        await conn.commit()
+    assert await inbox_worker.run_once(processor=failing) == 0
+    rows = await _inbox_rows([event["id"]])
+    assert rows[event["id"]]["status"] == "dead"
+    assert rows[event["id"]]["attempts"] == 2
+    assert len(exceptions) == 2
+    assert [(message["status"], message["level"]) for message in messages] == [("failed", "error")]
+    assert messages[0]["event_id"] == event["id"]
+
+
+def test_retry_delay_grows_exponentially_and_caps(monkeypatch):
+    monkeypatch.setattr(settings, "stripe_webhook_inbox_max_attempts", 10)
+    monkeypatch.setattr(settings, "stripe_webhook_inbox_retry_base_seconds", 10)
+    monkeypatch.setattr(settings, "stripe_webhook_inbox_retry_max_seconds", 60)
+    assert inbox_worker.retry_delay_seconds(1) == 10
+    assert inbox_worker.retry_delay_seconds(2) == 20
+    assert inbox_worker.retry_delay_seconds(5) == 60
+    assert inbox_worker.retry_delay_seconds(10) is None
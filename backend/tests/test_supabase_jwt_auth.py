@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import base64
+import time
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -13,6 +15,9 @@ from app import db as app_db
 from app.utils import supabase_jwt
 
 
+pytestmark = pytest.mark.anyio("asyncio")
+
+
 def _b64url_uint(value: int) -> str:
     raw = value.to_bytes(32, "big")
     return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
@@ -65,18 +70,17 @@ def _configure_supabase_jwks(monkeypatch, *, kid: str = "test-kid"):
     issuer = "https://example.supabase.co/auth/v1"
     jwks_url = "https://example.supabase.co/auth/v1/.well-known/jwks.json"
     private_pem, key = _ec_signing_key(kid=kid)
-    supabase_jwt._JWKS_CACHE.update({"url": None, "expires_at": 0.0, "keys": {}})
+    supabase_jwt.reset_jwks_cache()
     monkeypatch.setattr(auth.settings, "jwt_secret", "local-secret", raising=False)
     monkeypatch.setattr(auth.settings, "jwt_algorithm", "HS256", raising=False)
     monkeypatch.setattr(auth, "SUPABASE_JWKS_URL", jwks_url, raising=False)
     monkeypatch.setattr(auth, "SUPABASE_JWT_ISSUER", issuer, raising=False)
     monkeypatch.setattr(auth, "SUPABASE_JWT_AUDIENCE", "authenticated", raising=False)
-    monkeypatch.setattr(
-        supabase_jwt,
-        "_fetch_jwks",
-        lambda url: {"keys": [key]},
-        raising=False,
-    )
+
+    async def fake_fetch_jwks(url):
+        return {"keys": [key]}
+
+    monkeypatch.setattr(supabase_jwt, "_fetch_jwks", fake_fetch_jwks, raising=False)
     return private_pem, issuer, kid
 
 
@@ -138,10 +142,10 @@ async def _fetch_auth_subject(user_id: str) -> dict[str, str] | None:
     }
 
 
-def test_decode_access_token_accepts_supabase_es256_jwks_token(monkeypatch):
+async def test_decode_access_token_accepts_supabase_es256_jwks_token(monkeypatch):
     private_pem, issuer, kid = _configure_supabase_jwks(monkeypatch)
 
-    payload, source = auth._decode_access_token(
+    payload, source = await auth._decode_access_token(
         _es256_token(
             private_pem=private_pem,
             kid=kid,
@@ -154,11 +158,11 @@ def test_decode_access_token_accepts_supabase_es256_jwks_token(monkeypatch):
     assert payload["sub"] == "11111111-1111-4111-8111-111111111111"
 
 
-def test_decode_access_token_rejects_supabase_token_with_unknown_kid(monkeypatch):
+async def test_decode_access_token_rejects_supabase_token_with_unknown_kid(monkeypatch):
     private_pem, issuer, _ = _configure_supabase_jwks(monkeypatch, kid="known-kid")
 
     with pytest.raises(JWTError):
-        auth._decode_access_token(
+        await auth._decode_access_token(
             _es256_token(
                 private_pem=private_pem,
                 kid="unknown-kid",
@@ -168,11 +172,11 @@ def test_decode_access_token_rejects_supabase_token_with_unknown_kid(monkeypatch
         )
 
 
-def test_decode_access_token_enforces_supabase_audience(monkeypatch):
+async def test_decode_access_token_enforces_supabase_audience(monkeypatch):
     private_pem, issuer, kid = _configure_supabase_jwks(monkeypatch)
 
     with pytest.raises(JWTError):
-        auth._decode_access_token(
+        await auth._decode_access_token(
             _es256_token(
                 private_pem=private_pem,
                 kid=kid,
@@ -183,12 +187,12 @@ def test_decode_access_token_enforces_supabase_audience(monkeypatch):
         )
 
 
-def test_decode_access_token_rejects_supabase_hs256_tokens(monkeypatch):
+async def test_decode_access_token_rejects_supabase_hs256_tokens(monkeypatch):
     monkeypatch.setattr(auth.settings, "jwt_secret", "local-secret", raising=False)
     monkeypatch.setattr(auth.settings, "jwt_algorithm", "HS256", raising=False)
 
     with pytest.raises(JWTError):
-        auth._decode_access_token(
+        await auth._decode_access_token(
             jwt.encode(
                 {
                     "sub": "22222222-2222-4222-8222-222222222222",
@@ -204,11 +208,11 @@ def test_decode_access_token_rejects_supabase_hs256_tokens(monkeypatch):
         )
 
 
-def test_decode_access_token_rejects_wrong_supabase_issuer(monkeypatch):
+async def test_decode_access_token_rejects_wrong_supabase_issuer(monkeypatch):
     private_pem, issuer, kid = _configure_supabase_jwks(monkeypatch)
 
     with pytest.raises(JWTError):
-        auth._decode_access_token(
+        await auth._decode_access_token(
             _es256_token(
                 private_pem=private_pem,
                 kid=kid,
@@ -218,7 +222,7 @@ def test_decode_access_token_rejects_wrong_supabase_issuer(monkeypatch):
         )
 
 
-def test_decode_access_token_prefers_local_jwt_secret_for_local_tokens(monkeypatch):
+async def test_decode_access_token_prefers_local_jwt_secret_for_local_tokens(monkeypatch):
     monkeypatch.setattr(auth.settings, "jwt_secret", "local-secret", raising=False)
     monkeypatch.setattr(auth.settings, "jwt_algorithm", "HS256", raising=False)
 
@@ -232,12 +236,78 @@ def test_decode_access_token_prefers_local_jwt_secret_for_local_tokens(monkeypat
         algorithm="HS256",
     )
 
-    payload, source = auth._decode_access_token(token)
+    payload, source = await auth._decode_access_token(token)
 
     assert source == "local"
     assert payload["sub"] == "33333333-3333-4333-8333-333333333333"
 
 
+async def test_supabase_jwks_fetch_is_shared_and_parsed_keys_are_reused(monkeypatch):
+    _, issuer, kid = _configure_supabase_jwks(monkeypatch)
+    private_pem, key = _ec_signing_key(kid=kid)
+    fetched = asyncio.Event()
+    fetches: list[str] = []
+    constructed: list[str] = []
+    real_construct = supabase_jwt.jwk.construct
+
+    async def slow_fetch_jwks(url):
+        fetches.append(url)
+        await fetched.wait()
+        return {"keys": [key]}
+
+    def counting_construct(key_data, algorithm=None):
+        if isinstance(key_data, dict):
+            constructed.append(key_data["kid"])
+        return real_construct(key_data, algorithm)
+
+    monkeypatch.setattr(supabase_jwt, "_fetch_jwks", slow_fetch_jwks)
+    monkeypatch.setattr(supabase_jwt.jwk, "construct", counting_construct)
+    token = _es256_token(
+        private_pem=private_pem,
+        kid=kid,
+        issuer=issuer,
+        sub="55555555-5555-4555-8555-555555555555",
+    )
+
+    pending = [asyncio.ensure_future(auth._decode_access_token(token)) for _ in range(5)]
+    await asyncio.sleep(0)
+    fetched.set()
+    results = await asyncio.gather(*pending)
+    await auth._decode_access_token(token)
+
+    assert fetches == [auth.SUPABASE_JWKS_URL]
+    assert constructed == [kid]
+    assert {payload["sub"] for payload, _ in results} == {
+        "55555555-5555-4555-8555-555555555555"
+    }
+
+
+async def test_supabase_jwks_serves_stale_keys_while_refreshing(monkeypatch):
+    private_pem, issuer, kid = _configure_supabase_jwks(monkeypatch)
+    token = _es256_token(
+        private_pem=private_pem,
+        kid=kid,
+        issuer=issuer,
+        sub="66666666-6666-4666-8666-666666666666",
+    )
+    await auth._decode_access_token(token)
+    supabase_jwt._JWKS_CACHE["expires_at"] = time.monotonic() - 1
+
+    refresh_started = asyncio.Event()
+
+    async def failing_fetch_jwks(url):
+        refresh_started.set()
+        raise supabase_jwt.SupabaseJwtError("JWKS endpoint unavailable")
+
+    monkeypatch.setattr(supabase_jwt, "_fetch_jwks", failing_fetch_jwks)
+
+    payload, source = await auth._decode_access_token(token)
+    await asyncio.wait_for(refresh_started.wait(), timeout=1)
+
+    assert source == "supabase"
+    assert payload["sub"] == "66666666-6666-4666-8666-666666666666"
+
+
 async def test_entry_state_with_supabase_jwt_ensures_missing_auth_subject(
     async_client,
     monkeypatch,
@@ -1,6 +1,11 @@
+import hashlib
+import io
+
 import pytest
+from fastapi import HTTPException, UploadFile
 
 from app.main import app
+from app.routes import upload as upload_routes
 
 
 pytestmark = pytest.mark.anyio("asyncio")
@@ -53,3 +58,61 @@ async def test_removed_upload_routes_fail_closed_as_not_found(async_client):
     for path in forbidden_paths:
         response = await async_client.post(path)
         assert response.status_code == 404, (path, response.text)
+
+
+class _CountingUpload(UploadFile):
+    def __init__(self, payload: bytes) -> None:
+        super().__init__(io.BytesIO(payload), filename="clip.mp4")
+        self.reads = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        self.reads += 1
+        return await super().read(size)
+
+
+async def test_upload_writer_streams_hash_and_size_in_chunks(monkeypatch, tmp_path):
+    monkeypatch.setattr(upload_routes, "_UPLOAD_CHUNK_SIZE", 4)
+    payload = b"streamed upload payload"
+    upload = _CountingUpload(payload)
+    upload_dir = tmp_path / "uploads"
+    upload_dir.mkdir()
+    destination = upload_dir / "clip.mp4"
+
+    size, checksum = await upload_routes._stream_upload_to_path(
+        upload,
+        destination,
+        max_bytes=len(payload),
+    )
+
+    assert size == len(payload)
+    assert checksum == hashlib.sha256(payload).hexdigest()
+    assert destination.read_bytes() == payload
+    assert upload.reads == len(payload) // 4 + 2
+    assert list(upload_dir.iterdir()) == [destination]
+
+
+async def test_upload_writer_aborts_oversize_upload_early(monkeypatch, tmp_path):
+    monkeypatch.setattr(upload_routes, "_UPLOAD_CHUNK_SIZE", 4)
+    upload = _CountingUpload(b"x" * 64)
+    upload_dir = tmp_path / "uploads"
+    upload_dir.mkdir()
+
+    with pytest.raises(upload_routes._UploadTooLargeError) as exc_info:
+        await upload_routes._stream_upload_to_path(
+            upload,
+            upload_dir / "clip.mp4",
+            max_bytes=10,
+        )
+
+    assert exc_info.value.received_bytes == 12
+    assert upload.reads == 3
+    assert list(upload_dir.iterdir()) == []
+
+    with pytest.raises(HTTPException) as empty_info:
+        await upload_routes._stream_upload_to_path(
+            _CountingUpload(b""),
+            upload_dir / "empty.mp4",
+            max_bytes=None,
+        )
+    assert empty_info.value.status_code == 400
+    assert list(upload_dir.iterdir()) == []
@@ -6,6 +6,7 @@ import pytest
 from app import db, repositories
 from app.config import settings
 from app.repositories import courses as courses_repo
+from app.services import stripe_gateway
 
 from .utils import register_user
 
@@ -275,6 +276,9 @@ async def test_unified_webhook_processes_subscription_and_checkout(async_client,
     def fail_stripe_entity_create(**kwargs):
         raise AssertionError("course create/update must not create Stripe entities")
 
+    async def fail_stripe_gateway_create(*args, **kwargs):
+        fail_stripe_entity_create()
+
     def fake_customer_create(**kwargs):
         return {"id": "cus_canonical"}
 
@@ -288,6 +292,8 @@ async def test_unified_webhook_processes_subscription_and_checkout(async_client,
 
     monkeypatch.setattr("stripe.Product.create", fail_stripe_entity_create)
     monkeypatch.setattr("stripe.Price.create", fail_stripe_entity_create)
+    monkeypatch.setattr(stripe_gateway, "create_product", fail_stripe_gateway_create)
+    monkeypatch.setattr(stripe_gateway, "create_price", fail_stripe_gateway_create)
     monkeypatch.setattr("stripe.Customer.create", fake_customer_create)
     monkeypatch.setattr("stripe.checkout.Session.create", fake_checkout_create)
 
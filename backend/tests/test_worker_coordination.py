@@ -0,0 +1,99 @@
+import uuid
+from datetime import datetime, timezone
+
+import psycopg
+import pytest
+
+from app.config import settings
+from app.repositories import worker_heartbeats as heartbeats_repo
+from app.services import worker_coordination
+
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+async def _singleton_holder_state(conn, job: str) -> str | None:
+    cur = await conn.execute(
+        """
+        select a.state
+          from pg_locks l
+          join pg_stat_activity a on a.pid = l.pid
+         where l.locktype = 'advisory'
+           and l.granted
+           and l.classid = %s
+           and l.objid = hashtext(%s)::oid
+        """,
+        (worker_coordination._ADVISORY_LOCK_NAMESPACE, job),
+    )
+    row = await cur.fetchone()
+    return row[0] if row else None
+
+
+async def test_run_singleton_skips_while_another_process_holds_the_job(async_client):
+    job = f"test_singleton_{uuid.uuid4().hex}"
+    params = (worker_coordination._ADVISORY_LOCK_NAMESPACE, job)
+
+    async def follower_run():  # pragma: no cover - must not run
+        raise AssertionError("singleton job ran while another process held it")
+
+    other_process = await psycopg.AsyncConnection.connect(
+        settings.database_url.unicode_string(),
+        autocommit=True,
+    )
+    try:
+        await other_process.execute("select pg_advisory_lock(%s, hashtext(%s))", params)
+        assert await worker_coordination.run_singleton(job, follower_run) is None
+        await other_process.execute("select pg_advisory_unlock(%s, hashtext(%s))", params)
+
+        async def next_run():
+            # The leader holds the lock without an open transaction.
+            assert await _singleton_holder_state(other_process, job) == "idle"
+            return "next"
+
+        assert await worker_coordination.run_singleton(job, next_run) == "next"
+        assert await _singleton_holder_state(other_process, job) is None
+    finally:
+        await other_process.close()
+
+    metrics = worker_coordination.singleton_metrics(job)
+    assert metrics["runs"] == 1
+    assert metrics["skipped"] == 1
+
+
+async def test_heartbeats_round_trip(async_client):
+    worker_id = f"test-host:{uuid.uuid4().hex}"
+    try:
+        await heartbeats_repo.upsert_heartbeat(
+            worker_id=worker_id,
+            hostname="test-host",
+            pid=4321,
+            process_index=2,
+            jobs=["media_transcode", "course_drip"],
+            started_at=datetime.now(timezone.utc),
+            prune_after_seconds=3600,
+        )
+        rows = await heartbeats_repo.list_heartbeats(stale_after_seconds=60)
+        first = next(row for row in rows if row["worker_id"] == worker_id)
+
+        # A second beat from the same process refreshes the existing row.
+        await heartbeats_repo.upsert_heartbeat(
+            worker_id=worker_id,
+            hostname="test-host",
+            pid=4321,
+            process_index=2,
+            jobs=["media_transcode"],
+            started_at=datetime.now(timezone.utc),
+            prune_after_seconds=3600,
+        )
+        rows = await heartbeats_repo.list_heartbeats(stale_after_seconds=60)
+        matching = [row for row in rows if row["worker_id"] == worker_id]
+        assert len(matching) == 1
+        assert matching[0]["process_index"] == 2
+        assert matching[0]["jobs"] == ["media_transcode"]
+        assert matching[0]["alive"] is True
+        assert matching[0]["heartbeat_at"] > first["heartbeat_at"]
+    finally:
+        await heartbeats_repo.delete_heartbeat(worker_id)
+
+    rows = await heartbeats_repo.list_heartbeats(stale_after_seconds=60)
+    assert all(row["worker_id"] != worker_id for row in rows)
@@ -0,0 +1,104 @@
+import asyncio
+import uuid
+
+import pytest
+
+from app import db
+from app.services import worker_wakeups
+
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+async def _insert_media_asset(media_asset_id: str, state: str) -> None:
+    async with db.pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            await cur.execute(
+                """
+                insert into app.media_assets (
+                  id,
+                  media_type,
+                  purpose,
+                  original_object_path,
+                  ingest_format,
+                  state
+                )
+                values (
+                  %s::uuid,
+                  'audio'::app.media_type,
+                  'lesson_media'::app.media_purpose,
+                  %s,
+                  'wav',
+                  %s::app.media_state
+                )
+                """,
+                (media_asset_id, f"media/source/audio/{uuid.uuid4().hex}.wav", state),
+            )
+        await conn.commit()
+
+
+async def _delete_media_assets(media_asset_ids: list[str]) -> None:
+    async with db.pool.connection() as conn:  # type: ignore[attr-defined]
+        async with conn.cursor() as cur:  # type: ignore[attr-defined]
+            await cur.execute(
+                "delete from app.media_assets where id = any(%s::uuid[])",
+                (media_asset_ids,),
+            )
+        await conn.commit()
+
+
+@pytest.fixture
+async def listening_wakeups():
+    await worker_wakeups.subscribe()
+    try:
+        for _ in range(100):
+            if worker_wakeups.get_metrics()["listening"]:
+                break
+            await asyncio.sleep(0.05)
+        assert worker_wakeups.get_metrics()["listening"] is True
+        # Connecting wakes every channel once for a catch-up poll.
+        for channel in worker_wakeups.CHANNELS:
+            assert await worker_wakeups.wait(channel, 1) is True
+        yield
+    finally:
+        await worker_wakeups.unsubscribe()
+
+
+async def test_wait_sleeps_for_the_poll_interval_without_listener():
+    assert worker_wakeups.get_metrics()["subscribers"] == 0
+    assert await worker_wakeups.wait(worker_wakeups.MEDIA_ASSETS_CHANNEL, 0.01) is False
+
+
+async def test_uploaded_media_asset_wakes_transcode_channel(async_client, listening_wakeups):
+    pending_id = str(uuid.uuid4())
+    uploaded_id = str(uuid.uuid4())
+    try:
+        await _insert_media_asset(pending_id, "pending_upload")
+        assert (
+            await worker_wakeups.wait(worker_wakeups.MEDIA_ASSETS_CHANNEL, 0.3)
+            is False
+        )
+
+        await _insert_media_asset(uploaded_id, "uploaded")
+        assert await worker_wakeups.wait(worker_wakeups.MEDIA_ASSETS_CHANNEL, 5) is True
+        assert (
+            await worker_wakeups.wait(
+                worker_wakeups.NOTIFICATION_DELIVERIES_CHANNEL,
+                0.1,
+            )
+            is False
+        )
+    finally:
+        await _delete_media_assets([pending_id, uploaded_id])
+
+
+async def test_listener_stops_with_last_subscriber():
+    await worker_wakeups.subscribe()
+    await worker_wakeups.subscribe()
+    await worker_wakeups.unsubscribe()
+    assert worker_wakeups.get_metrics()["subscribers"] == 1
+    assert worker_wakeups._listener_task is not None
+
+    await worker_wakeups.unsubscribe()
+    assert worker_wakeups.get_metrics()["subscribers"] == 0
+    assert worker_wakeups._listener_task is None
@@ -42,6 +42,13 @@ from dependency_authority import (
     DependencyAuthorityError,
     require_valid_d01_pass_for_build,
 )
+from lexical_postings import (
+    LEXICAL_POSTINGS_FILE,
+    LexicalPostingsError,
+    read_lexical_postings_header,
+    validate_lexical_postings_binding,
+    write_lexical_postings,
+)
 
 SentenceTransformer = None
 chromadb = None
@@ -706,6 +713,7 @@ def load_controller_build_context() -> dict:
         "lexical_index_dir": staging_root / "lexical_index",
         "lexical_index_manifest": staging_root / "lexical_index" / "manifest.json",
         "lexical_index_documents": staging_root / "lexical_index" / "documents.jsonl",
+        "lexical_index_postings": staging_root / "lexical_index" / LEXICAL_POSTINGS_FILE,
         "vector_db_dir": staging_root / "chroma_db",
         "build_execution_result": staging_root / "build_execution_result.json",
         "staging_verification_result": staging_root / "staging_verification_result.json",
@@ -1243,10 +1251,12 @@ def write_lexical_index(
     lexical_index_dir: Path,
     lexical_index_manifest: Path,
     lexical_index_documents: Path,
+    lexical_index_postings: Path,
 ) -> None:
     assert_staging_write_path(lexical_index_dir)
     assert_staging_write_path(lexical_index_manifest)
     assert_staging_write_path(lexical_index_documents)
+    assert_staging_write_path(lexical_index_postings)
     lexical_records = []
     document_frequency: dict[str, int] = {}
     total_length = 0
@@ -1288,6 +1298,10 @@ def write_lexical_index(
         "doc_ids": [record["doc_id"] for record in lexical_records],
     }
     save_json_object(lexical_index_manifest, lexical_manifest)
+    try:
+        write_lexical_postings(lexical_index_postings, lexical_records, lexical_manifest)
+    except LexicalPostingsError as exc:
+        raise RuntimeError(str(exc)) from exc
 
 
 def ensure_unique_doc_ids(records: list[dict]) -> None:
@@ -1797,6 +1811,13 @@ def verify_lexical_index(build_context: dict, records: list[dict], manifest: dic
     for field_name in ("contract_version", "corpus_manifest_hash", "chunk_manifest_hash"):
         if lexical_manifest.get(field_name) != manifest[field_name]:
             raise RuntimeError(f"FEL: lexical manifest {field_name} matchar inte indexmanifest")
+    try:
+        validate_lexical_postings_binding(
+            read_lexical_postings_header(build_context["lexical_index_postings"]),
+            lexical_manifest,
+        )
+    except LexicalPostingsError as exc:
+        raise RuntimeError(str(exc)) from exc
 
 
 def verify_staging_artifacts(
@@ -2221,6 +2242,7 @@ def run_build(build_context: dict) -> None:
         lexical_index_dir=staging_lexical_index_dir,
         lexical_index_manifest=staging_lexical_index_manifest,
         lexical_index_documents=staging_lexical_index_documents,
+        lexical_index_postings=build_context["lexical_index_postings"],
     )
 
     # ---------------------------------------------------------
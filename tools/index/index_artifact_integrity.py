@@ -3,6 +3,13 @@ import json
 import math
 import struct
 from pathlib import Path
+from typing import Iterable, Iterator
+
+from lexical_postings import (
+    LEXICAL_POSTINGS_FILE,
+    LexicalPostingsError,
+    validate_lexical_postings,
+)
 
 
 REQUIRED_INDEX_ARTIFACTS = {
@@ -184,25 +191,30 @@ def load_json_object(path: Path, root: Path, label: str) -> dict:
     return value
 
 
-def load_jsonl_records(path: Path, root: Path, label: str) -> list[dict]:
+def iter_jsonl_records(path: Path, root: Path, label: str) -> Iterator[dict]:
     require_file(root, path, label)
-    records = []
-    for line_number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        if not line.strip():
-            raise IndexArtifactIntegrityError(
-                f"FEL: tom rad i JSONL-artefakt {display_path(root, path)} pa rad {line_number}"
-            )
-        try:
-            value = json.loads(line)
-        except json.JSONDecodeError as exc:
-            raise IndexArtifactIntegrityError(
-                f"FEL: ogiltig JSONL-rad i {display_path(root, path)} pa rad {line_number}"
-            ) from exc
-        if not isinstance(value, dict):
-            raise IndexArtifactIntegrityError(
-                f"FEL: JSONL-rad i {display_path(root, path)} pa rad {line_number} ar inte objekt"
-            )
-        records.append(value)
+    with path.open("r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            line = line.rstrip("\r\n")
+            if not line.strip():
+                raise IndexArtifactIntegrityError(
+                    f"FEL: tom rad i JSONL-artefakt {display_path(root, path)} pa rad {line_number}"
+                )
+            try:
+                value = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise IndexArtifactIntegrityError(
+                    f"FEL: ogiltig JSONL-rad i {display_path(root, path)} pa rad {line_number}"
+                ) from exc
+            if not isinstance(value, dict):
+                raise IndexArtifactIntegrityError(
+                    f"FEL: JSONL-rad i {display_path(root, path)} pa rad {line_number} ar inte objekt"
+                )
+            yield value
+
+
+def load_jsonl_records(path: Path, root: Path, label: str) -> list[dict]:
+    records = list(iter_jsonl_records(path, root, label))
     if not records:
         raise IndexArtifactIntegrityError(f"FEL: {label} far inte vara tom")
     return records
@@ -391,8 +403,9 @@ def validate_lexical_index(
     *,
     manifest_bindings: dict,
     lexical_manifest: dict,
-    lexical_records: list[dict],
+    lexical_records: Iterable[dict],
     ordered_doc_ids: list[str],
+    postings_path: Path | None = None,
 ) -> dict:
     contract_version = manifest_bindings["contract_version"]
     corpus_manifest_hash = manifest_bindings["corpus_manifest_hash"]
@@ -426,8 +439,6 @@ def validate_lexical_index(
     ]
     if normalized_lexical_doc_ids != ordered_doc_ids:
         raise IndexArtifactIntegrityError("FEL: lexical_index.doc_ids matchar inte kanonisk chunkordning")
-    if len(lexical_records) != len(ordered_doc_ids):
-        raise IndexArtifactIntegrityError("FEL: lexical_index/documents.jsonl antal matchar inte chunkmanifest")
 
     document_frequency = lexical_manifest.get("document_frequency")
     if not isinstance(document_frequency, dict):
@@ -437,7 +448,12 @@ def validate_lexical_index(
     recomputed_lengths = []
     records_doc_ids = []
     seen_doc_ids = set()
-    for expected_doc_id, record in zip(ordered_doc_ids, lexical_records):
+    # Records are streamed and not retained; only the per-document lengths and
+    # the vocabulary survive the loop.
+    for record_index, record in enumerate(lexical_records):
+        if record_index >= len(ordered_doc_ids):
+            raise IndexArtifactIntegrityError("FEL: lexical_index/documents.jsonl antal matchar inte chunkmanifest")
+        expected_doc_id = ordered_doc_ids[record_index]
         doc_id = validate_sha256_hex(record.get("doc_id"), "lexical_index.documents.doc_id")
         if doc_id != expected_doc_id:
             raise IndexArtifactIntegrityError("FEL: lexical_index/documents.jsonl foljer inte kanonisk chunkordning")
@@ -465,6 +481,8 @@ def validate_lexical_index(
         recomputed_lengths.append(length)
         records_doc_ids.append(doc_id)
 
+    if len(records_doc_ids) != len(ordered_doc_ids):
+        raise IndexArtifactIntegrityError("FEL: lexical_index/documents.jsonl antal matchar inte chunkmanifest")
     if records_doc_ids != ordered_doc_ids:
         raise IndexArtifactIntegrityError("FEL: lexical_index/documents.jsonl doc_id-set matchar inte chunkmanifest")
     if document_frequency != recomputed_document_frequency:
@@ -479,10 +497,23 @@ def validate_lexical_index(
         raise IndexArtifactIntegrityError(
             "FEL: lexical_index.avg_doc_length matchar inte deterministisk tokenisering"
         )
+    postings_source = "term_freqs"
+    if postings_path is not None and postings_path.is_file():
+        try:
+            validate_lexical_postings(
+                postings_path,
+                lexical_manifest,
+                document_frequency=recomputed_document_frequency,
+                doc_lengths=recomputed_lengths,
+            )
+        except LexicalPostingsError as exc:
+            raise IndexArtifactIntegrityError(str(exc)) from exc
+        postings_source = "postings_file"
     return {
         "doc_count": len(ordered_doc_ids),
         "doc_id_set_hash": compute_doc_id_set_hash(ordered_doc_ids),
         "tokenization_authority": "lexical_index/documents.jsonl",
+        "postings_source": postings_source,
     }
 
 
@@ -674,16 +705,16 @@ def validate_index_artifact_integrity(
         root,
         "lexical_index/manifest.json",
     )
-    lexical_records = load_jsonl_records(
-        lexical_index_dir / LEXICAL_INDEX_DOCUMENTS,
-        root,
-        "lexical_index/documents.jsonl",
-    )
     lexical_report = validate_lexical_index(
         manifest_bindings=manifest_bindings,
         lexical_manifest=lexical_manifest,
-        lexical_records=lexical_records,
+        lexical_records=iter_jsonl_records(
+            lexical_index_dir / LEXICAL_INDEX_DOCUMENTS,
+            root,
+            "lexical_index/documents.jsonl",
+        ),
         ordered_doc_ids=chunk_report["ordered_doc_ids"],
+        postings_path=lexical_index_dir / LEXICAL_POSTINGS_FILE,
     )
     vector_report = validate_vector_index(
         manifest_bindings=manifest_bindings,
@@ -702,7 +733,6 @@ def validate_index_artifact_integrity(
             "doc_id_set_hash": chunk_report["doc_id_set_hash"],
         },
         "lexical_manifest": lexical_manifest,
-        "lexical_records": lexical_records,
         "lexical_index": lexical_report,
         "vector_index": vector_report,
     }
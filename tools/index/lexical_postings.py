@@ -0,0 +1,295 @@
+import json
+import math
+import struct
+from pathlib import Path
+from typing import Callable
+
+
+LEXICAL_POSTINGS_FILE = "postings.bin"
+LEXICAL_POSTINGS_FORMAT = "lexical_postings_v1"
+LEXICAL_POSTINGS_MAGIC = b"AVLXPST1"
+LEXICAL_POSTINGS_ALIGNMENT = 8
+LEXICAL_POSTINGS_BINDING_FIELDS = (
+    "contract_version",
+    "corpus_manifest_hash",
+    "chunk_manifest_hash",
+    "doc_count",
+)
+LEXICAL_POSTINGS_SECTIONS = (
+    ("term_offsets", "<u8"),
+    ("term_bytes", "u1"),
+    ("posting_offsets", "<u8"),
+    ("posting_doc_indexes", "<u4"),
+    ("posting_term_freqs", "<u4"),
+    ("doc_lengths", "<u4"),
+)
+
+
+class LexicalPostingsError(RuntimeError):
+    pass
+
+
+def load_numpy():
+    try:
+        import numpy
+    except Exception as exc:
+        raise LexicalPostingsError("FEL: numpy kravs for lexical postings") from exc
+    return numpy
+
+
+def aligned(offset: int) -> int:
+    remainder = offset % LEXICAL_POSTINGS_ALIGNMENT
+    return offset if remainder == 0 else offset + LEXICAL_POSTINGS_ALIGNMENT - remainder
+
+
+def build_postings_arrays(lexical_records: list[dict]) -> dict:
+    np = load_numpy()
+    postings_by_term: dict[str, list[tuple[int, int]]] = {}
+    doc_lengths = np.zeros(len(lexical_records), dtype="<u4")
+    for doc_index, record in enumerate(lexical_records):
+        term_freqs = record.get("term_freqs")
+        if not record.get("doc_id") or not isinstance(term_freqs, dict):
+            raise LexicalPostingsError("FEL: lexical-indexet saknar lagrade termfrekvenser")
+        doc_lengths[doc_index] = int(record.get("length", 0))
+        for token, raw_term_freq in term_freqs.items():
+            term_freq = int(raw_term_freq)
+            if term_freq <= 0:
+                raise LexicalPostingsError("FEL: lexical-indexet innehaller ogiltig termfrekvens")
+            postings_by_term.setdefault(str(token), []).append((doc_index, term_freq))
+
+    terms = sorted(postings_by_term)
+    encoded_terms = [term.encode("utf-8") for term in terms]
+    term_offsets = np.zeros(len(terms) + 1, dtype="<u8")
+    term_offsets[1:] = np.cumsum([len(encoded) for encoded in encoded_terms], dtype="<u8")
+    posting_offsets = np.zeros(len(terms) + 1, dtype="<u8")
+    posting_offsets[1:] = np.cumsum([len(postings_by_term[term]) for term in terms], dtype="<u8")
+    flat_postings = [posting for term in terms for posting in postings_by_term[term]]
+    return {
+        "term_offsets": term_offsets,
+        "term_bytes": np.frombuffer(b"".join(encoded_terms), dtype="u1"),
+        "posting_offsets": posting_offsets,
+        "posting_doc_indexes": np.array([doc_index for doc_index, _ in flat_postings], dtype="<u4"),
+        "posting_term_freqs": np.array([term_freq for _, term_freq in flat_postings], dtype="<u4"),
+        "doc_lengths": doc_lengths,
+    }
+
+
+def write_lexical_postings(path: Path, lexical_records: list[dict], lexical_manifest: dict) -> None:
+    arrays = build_postings_arrays(lexical_records)
+    sections = {}
+    header = {
+        "format": LEXICAL_POSTINGS_FORMAT,
+        **{field_name: lexical_manifest[field_name] for field_name in LEXICAL_POSTINGS_BINDING_FIELDS},
+        "term_count": int(len(arrays["term_offsets"]) - 1),
+        "posting_count": int(len(arrays["posting_doc_indexes"])),
+        "sections": sections,
+    }
+
+    # Section offsets depend on the header length, which in turn contains the
+    # offsets; repeat until the serialized header stops growing.
+    header_bytes = b""
+    while True:
+        offset = aligned(len(LEXICAL_POSTINGS_MAGIC) + 4 + len(header_bytes))
+        for name, dtype in LEXICAL_POSTINGS_SECTIONS:
+            sections[name] = {"offset": offset, "dtype": dtype, "count": int(len(arrays[name]))}
+            offset = aligned(offset + arrays[name].nbytes)
+        serialized = json.dumps(header, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        if len(serialized) == len(header_bytes):
+            header_bytes = serialized
+            break
+        header_bytes = serialized
+
+    with path.open("wb") as handle:
+        handle.write(LEXICAL_POSTINGS_MAGIC)
+        handle.write(struct.pack("<I", len(header_bytes)))
+        handle.write(header_bytes)
+        for name, _ in LEXICAL_POSTINGS_SECTIONS:
+            handle.write(b"\0" * (sections[name]["offset"] - handle.tell()))
+            handle.write(arrays[name].tobytes())
+
+
+def read_lexical_postings_header(path: Path) -> dict:
+    try:
+        with path.open("rb") as handle:
+            magic = handle.read(len(LEXICAL_POSTINGS_MAGIC))
+            (header_length,) = struct.unpack("<I", handle.read(4))
+            header = json.loads(handle.read(header_length).decode("utf-8"))
+    except (OSError, struct.error, UnicodeDecodeError, ValueError) as exc:
+        raise LexicalPostingsError(f"FEL: lexical postings kan inte lasas vid {path}") from exc
+    if magic != LEXICAL_POSTINGS_MAGIC or not isinstance(header, dict):
+        raise LexicalPostingsError(f"FEL: lexical postings har okant format vid {path}")
+    if header.get("format") != LEXICAL_POSTINGS_FORMAT:
+        raise LexicalPostingsError("FEL: lexical postings-format stods inte")
+    return header
+
+
+def validate_lexical_postings_binding(header: dict, lexical_manifest: dict) -> None:
+    for field_name in LEXICAL_POSTINGS_BINDING_FIELDS:
+        if header.get(field_name) != lexical_manifest.get(field_name):
+            raise LexicalPostingsError(
+                f"FEL: lexical postings {field_name} matchar inte lexical manifest"
+            )
+
+
+def map_lexical_postings(path: Path, lexical_manifest: dict) -> dict:
+    np = load_numpy()
+    header = read_lexical_postings_header(path)
+    validate_lexical_postings_binding(header, lexical_manifest)
+    mapped = np.memmap(path, dtype="u1", mode="r")
+    arrays = {}
+    for name, dtype in LEXICAL_POSTINGS_SECTIONS:
+        section = header["sections"].get(name)
+        if not isinstance(section, dict) or section.get("dtype") != dtype:
+            raise LexicalPostingsError(f"FEL: lexical postings saknar sektion {name}")
+        try:
+            arrays[name] = np.frombuffer(
+                mapped,
+                dtype=dtype,
+                count=int(section["count"]),
+                offset=int(section["offset"]),
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            raise LexicalPostingsError(f"FEL: lexical postings sektion {name} ligger utanfor filen") from exc
+    if len(arrays["doc_lengths"]) != int(lexical_manifest["doc_count"]):
+        raise LexicalPostingsError("FEL: lexical postings doc_count matchar inte lexical manifest")
+    return arrays
+
+
+def validate_lexical_postings(
+    path: Path,
+    lexical_manifest: dict,
+    *,
+    document_frequency: dict[str, int],
+    doc_lengths: list[int],
+) -> None:
+    """Check postings.bin against the tokenization verified from documents.jsonl.
+
+    The term table must equal the document-frequency vocabulary, each term must
+    have exactly ``document_frequency[term]`` postings, and the term
+    frequencies of every document must add up to its verified length.
+    """
+
+    np = load_numpy()
+    arrays = map_lexical_postings(path, lexical_manifest)
+    doc_count = len(doc_lengths)
+    if not np.array_equal(arrays["doc_lengths"], np.asarray(doc_lengths, dtype="<u4")):
+        raise LexicalPostingsError("FEL: lexical postings doc_lengths matchar inte documents.jsonl")
+
+    term_offsets = arrays["term_offsets"]
+    posting_offsets = arrays["posting_offsets"]
+    terms = sorted(document_frequency)
+    if len(term_offsets) != len(terms) + 1 or len(posting_offsets) != len(terms) + 1:
+        raise LexicalPostingsError("FEL: lexical postings termtabell matchar inte document_frequency")
+    if int(term_offsets[-1]) != len(arrays["term_bytes"]):
+        raise LexicalPostingsError("FEL: lexical postings termtabell ar trunkerad")
+    term_bytes = arrays["term_bytes"].tobytes()
+    for index, term in enumerate(terms):
+        if term_bytes[int(term_offsets[index]):int(term_offsets[index + 1])] != term.encode("utf-8"):
+            raise LexicalPostingsError("FEL: lexical postings termtabell matchar inte document_frequency")
+
+    expected_counts = np.asarray([document_frequency[term] for term in terms], dtype="<u8")
+    if int(posting_offsets[0]) != 0 or not np.array_equal(np.diff(posting_offsets), expected_counts):
+        raise LexicalPostingsError("FEL: lexical postings antal matchar inte document_frequency")
+    doc_indexes = arrays["posting_doc_indexes"]
+    term_freqs = arrays["posting_term_freqs"]
+    if len(doc_indexes) != int(posting_offsets[-1]) or len(term_freqs) != len(doc_indexes):
+        raise LexicalPostingsError("FEL: lexical postings posting-antal ar inkonsistent")
+    if len(doc_indexes) and (int(doc_indexes.max()) >= doc_count or int(term_freqs.min()) <= 0):
+        raise LexicalPostingsError("FEL: lexical postings innehaller ogiltig posting")
+    summed_lengths = np.bincount(doc_indexes, weights=term_freqs, minlength=doc_count)
+    if not np.array_equal(summed_lengths.astype(np.int64), np.asarray(doc_lengths, dtype=np.int64)):
+        raise LexicalPostingsError("FEL: lexical postings termfrekvenser matchar inte documents.jsonl")
+
+
+class LexicalPostings:
+    """BM25 postings over the lexical index, opened on first query.
+
+    Reads ``postings.bin`` through a read-only memory map when present and
+    otherwise builds the same arrays from the stored term frequencies, which
+    are only loaded in that case.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: Path,
+        lexical_manifest: dict,
+        load_lexical_records: Callable[[], list[dict]],
+    ) -> None:
+        self.path = path
+        self.doc_ids = [str(doc_id) for doc_id in lexical_manifest["doc_ids"]]
+        self.doc_count = int(lexical_manifest["doc_count"])
+        self.avg_doc_length = float(lexical_manifest["avg_doc_length"])
+        self._lexical_manifest = lexical_manifest
+        self._load_lexical_records = load_lexical_records
+        self._arrays: dict | None = None
+        self._doc_id_order = None
+
+    @property
+    def source(self) -> str:
+        return "postings_file" if self.path.is_file() else "term_freqs"
+
+    def arrays(self) -> dict:
+        if self._arrays is None:
+            if self.path.is_file():
+                self._arrays = map_lexical_postings(self.path, self._lexical_manifest)
+            else:
+                self._arrays = build_postings_arrays(self._load_lexical_records())
+        return self._arrays
+
+    def term_bytes(self, term_index: int) -> bytes:
+        arrays = self.arrays()
+        start = int(arrays["term_offsets"][term_index])
+        end = int(arrays["term_offsets"][term_index + 1])
+        return arrays["term_bytes"][start:end].tobytes()
+
+    def term_postings(self, token: str):
+        arrays = self.arrays()
+        target = token.encode("utf-8")
+        low = 0
+        high = len(arrays["term_offsets"]) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if self.term_bytes(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low >= len(arrays["term_offsets"]) - 1 or self.term_bytes(low) != target:
+            return None
+        start = int(arrays["posting_offsets"][low])
+        end = int(arrays["posting_offsets"][low + 1])
+        return arrays["posting_doc_indexes"][start:end], arrays["posting_term_freqs"][start:end]
+
+    def bm25_scores(self, query_tokens: list[str], *, bm25_k1: float, bm25_b: float):
+        np = load_numpy()
+        scores = np.zeros(self.doc_count, dtype=np.float64)
+        if self.doc_count <= 0:
+            return scores
+        doc_lengths = self.arrays()["doc_lengths"]
+        for token in query_tokens:
+            postings = self.term_postings(token)
+            if postings is None:
+                continue
+            doc_indexes, raw_term_freqs = postings
+            doc_freq = len(doc_indexes)
+            idf = math.log(1.0 + ((self.doc_count - doc_freq + 0.5) / (doc_freq + 0.5)))
+            term_freqs = raw_term_freqs.astype(np.float64)
+            normalized_lengths = np.maximum(1, doc_lengths[doc_indexes]).astype(np.float64)
+            numerator = term_freqs * (bm25_k1 + 1.0)
+            denominator = term_freqs + bm25_k1 * (
+                1.0 - bm25_b + bm25_b * (normalized_lengths / self.avg_doc_length)
+            )
+            scores[doc_indexes] += idf * (numerator / denominator)
+        return scores
+
+    def top_doc_ids(self, scores, top_n: int) -> list[str]:
+        np = load_numpy()
+        candidates = np.flatnonzero((scores > 0.0) & np.isfinite(scores))
+        if len(candidates) == 0 or top_n <= 0:
+            return []
+        if self._doc_id_order is None:
+            order = np.empty(self.doc_count, dtype=np.int64)
+            order[np.argsort(np.array(self.doc_ids))] = np.arange(self.doc_count)
+            self._doc_id_order = order
+        ranked = candidates[np.lexsort((self._doc_id_order[candidates], -scores[candidates]))]
+        return [self.doc_ids[int(doc_index)] for doc_index in ranked[:top_n]]
@@ -306,7 +306,10 @@ def write_retrieval_runtime_health(runtime_state: dict[str, Any]) -> dict[str, A
             "embedding_model_loaded": bool(runtime_state.get("warm_models", {}).get("embedding")),
             "rerank_model_loaded": bool(runtime_state.get("warm_models", {}).get("rerank")),
             "manifest": _manifest_summary(manifest if isinstance(manifest, dict) else {}),
-            "lexical_doc_count": runtime_state.get("lexical_runtime_index", {}).get("doc_count"),
+            "lexical_doc_count": runtime_state.get("lexical_manifest", {}).get("doc_count"),
+            "lexical_postings_source": getattr(
+                runtime_state.get("lexical_runtime_index"), "source", None
+            ),
             "chunk_count": len(runtime_state.get("chunk_records", [])),
         }
     )
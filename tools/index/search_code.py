@@ -26,6 +26,7 @@ from model_authority import (
 )
 from index_artifact_integrity import (
     IndexArtifactIntegrityError,
+    load_jsonl_records,
     validate_index_artifact_integrity,
 )
 from retrieval_policies import (
@@ -38,6 +39,11 @@ from dependency_authority import (
     DependencyAuthorityError,
     require_valid_d01_pass_from_environment,
 )
+from lexical_postings import (
+    LEXICAL_POSTINGS_FILE,
+    LexicalPostings,
+    LexicalPostingsError,
+)
 from retrieval_observability import (
     RETRIEVAL_QUERY_TRACE_PATH,
     RetrievalObservabilityError,
@@ -57,6 +63,7 @@ CHUNK_MANIFEST = ROOT / ".repo_index" / "chunk_manifest.jsonl"
 LEXICAL_INDEX_DIR = ROOT / ".repo_index" / "lexical_index"
 LEXICAL_INDEX_MANIFEST = LEXICAL_INDEX_DIR / "manifest.json"
 LEXICAL_INDEX_DOCUMENTS = LEXICAL_INDEX_DIR / "documents.jsonl"
+LEXICAL_INDEX_POSTINGS = LEXICAL_INDEX_DIR / LEXICAL_POSTINGS_FILE
 COLLECTION_NAME = "aveli_repo"
 INDEX_MANIFEST_REQUIRED_FIELDS = {
     "contract_version",
@@ -401,32 +408,26 @@ def load_warm_model_surface(model_authority: dict) -> dict:
     }
 
 
-def build_lexical_runtime_index(lexical_records: list[dict], lexical_manifest: dict) -> dict:
-    postings: dict[str, list[tuple[str, int, int]]] = {}
-    doc_lengths: dict[str, int] = {}
-    for record in lexical_records:
-        doc_id = str(record.get("doc_id", ""))
-        length = int(record.get("length", 0))
-        term_freqs = record.get("term_freqs")
-        if not doc_id or not isinstance(term_freqs, dict):
-            raise SystemExit("FEL: lexical-indexet saknar lagrade termfrekvenser")
-        doc_lengths[doc_id] = length
-        for token, raw_term_freq in term_freqs.items():
-            term_freq = int(raw_term_freq)
-            if term_freq <= 0:
-                raise SystemExit("FEL: lexical-indexet innehaller ogiltig termfrekvens")
-            postings.setdefault(str(token), []).append((doc_id, term_freq, length))
-
-    for token in postings:
-        postings[token].sort(key=lambda item: item[0])
+def load_lexical_records() -> list[dict]:
+    try:
+        return load_jsonl_records(
+            LEXICAL_INDEX_DOCUMENTS,
+            ROOT,
+            "lexical_index/documents.jsonl",
+        )
+    except IndexArtifactIntegrityError as exc:
+        raise SystemExit(str(exc)) from exc
 
-    return {
-        "postings": postings,
-        "doc_lengths": doc_lengths,
-        "doc_count": int(lexical_manifest["doc_count"]),
-        "avg_doc_length": float(lexical_manifest["avg_doc_length"]),
-        "document_frequency": lexical_manifest["document_frequency"],
-    }
+
+def build_lexical_runtime_index(lexical_manifest: dict) -> LexicalPostings:
+    # Postings are mapped from postings.bin on the first lexical query; indexes
+    # built before the binary format fall back to the stored term frequencies,
+    # and only then is documents.jsonl loaded again.
+    return LexicalPostings(
+        path=LEXICAL_INDEX_POSTINGS,
+        lexical_manifest=lexical_manifest,
+        load_lexical_records=load_lexical_records,
+    )
 
 
 def load_runtime_state() -> dict:
@@ -442,10 +443,7 @@ def load_runtime_state() -> dict:
     model_authority = validate_runtime_model_authority(index_manifest)
     collection = open_vector_collection()
     artifact_integrity = validate_runtime_artifact_integrity(collection)
-    lexical_runtime_index = build_lexical_runtime_index(
-        artifact_integrity["lexical_records"],
-        artifact_integrity["lexical_manifest"],
-    )
+    lexical_runtime_index = build_lexical_runtime_index(artifact_integrity["lexical_manifest"])
     warm_models = load_warm_model_surface(model_authority)
 
     _RUNTIME_STATE = {
@@ -462,7 +460,6 @@ def load_runtime_state() -> dict:
             "vector_index": artifact_integrity["vector_index"],
         },
         "lexical_manifest": artifact_integrity["lexical_manifest"],
-        "lexical_records": artifact_integrity["lexical_records"],
         "lexical_runtime_index": lexical_runtime_index,
         "chunk_records": artifact_integrity["chunk_records"],
         "chunk_records_by_doc_id": {
@@ -496,32 +493,15 @@ def lexical_search(normalized_query: str, runtime_state: dict, top_n: int) -> li
         raise SystemExit("FEL: query saknar token efter kanonisk normalisering")
 
     lexical_index = runtime_state["lexical_runtime_index"]
-    postings = lexical_index["postings"]
-    total_docs = int(lexical_index["doc_count"])
-    avg_doc_length = float(lexical_index["avg_doc_length"])
-    document_frequency = lexical_index["document_frequency"]
-    bm25_k1 = float(lexical_policy["bm25_k1"])
-    bm25_b = float(lexical_policy["bm25_b"])
-
-    scored_by_doc_id: dict[str, float] = {}
-    for token in query_tokens:
-        doc_freq = int(document_frequency.get(token, 0))
-        if doc_freq <= 0 or total_docs <= 0:
-            continue
-        idf = math.log(1.0 + ((total_docs - doc_freq + 0.5) / (doc_freq + 0.5)))
-        for doc_id, term_freq, length in postings.get(token, []):
-            normalized_length = max(1, int(length))
-            numerator = term_freq * (bm25_k1 + 1.0)
-            denominator = term_freq + bm25_k1 * (1.0 - bm25_b + bm25_b * (normalized_length / avg_doc_length))
-            scored_by_doc_id[doc_id] = scored_by_doc_id.get(doc_id, 0.0) + idf * (numerator / denominator)
-
-    scored = [
-        (doc_id, score)
-        for doc_id, score in scored_by_doc_id.items()
-        if score > 0.0 and math.isfinite(score)
-    ]
-    scored.sort(key=lambda item: (-item[1], item[0]))
-    return [doc_id for doc_id, _ in scored[:top_n]]
+    try:
+        scores = lexical_index.bm25_scores(
+            query_tokens,
+            bm25_k1=float(lexical_policy["bm25_k1"]),
+            bm25_b=float(lexical_policy["bm25_b"]),
+        )
+        return lexical_index.top_doc_ids(scores, top_n)
+    except LexicalPostingsError as exc:
+        raise SystemExit(str(exc)) from exc
 
 
 def normalize_file_for_order(file_path: str) -> str:
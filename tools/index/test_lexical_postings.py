@@ -0,0 +1,157 @@
+import importlib.util
+import math
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+MODULE_PATH = ROOT / "tools" / "index" / "lexical_postings.py"
+
+SPEC = importlib.util.spec_from_file_location("lexical_postings", MODULE_PATH)
+assert SPEC is not None
+assert SPEC.loader is not None
+lexical_postings = importlib.util.module_from_spec(SPEC)
+SPEC.loader.exec_module(lexical_postings)
+
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    NUMPY_AVAILABLE = False
+else:
+    NUMPY_AVAILABLE = True
+
+
+def build_corpus(doc_count: int) -> tuple[list[dict], dict]:
+    generator = random.Random(7)
+    vocabulary = ["kurs", "lektion", "media", "ljud", "å", "drip", "stripe", "lärare"]
+    records = []
+    document_frequency: dict[str, int] = {}
+    total_length = 0
+    for index in range(doc_count):
+        tokens = [generator.choice(vocabulary) for _ in range(generator.randint(0, 12))]
+        term_freqs: dict[str, int] = {}
+        for token in tokens:
+            term_freqs[token] = term_freqs.get(token, 0) + 1
+        for token in term_freqs:
+            document_frequency[token] = document_frequency.get(token, 0) + 1
+        total_length += len(tokens)
+        records.append({
+            "doc_id": f"{(index * 7919) % doc_count:064x}",
+            "text": " ".join(tokens),
+            "term_freqs": term_freqs,
+            "length": len(tokens),
+        })
+    manifest = {
+        "contract_version": "test-contract",
+        "corpus_manifest_hash": "a" * 64,
+        "chunk_manifest_hash": "b" * 64,
+        "doc_count": doc_count,
+        "avg_doc_length": total_length / doc_count,
+        "document_frequency": document_frequency,
+        "doc_ids": [record["doc_id"] for record in records],
+    }
+    return records, manifest
+
+
+def reference_search(records: list[dict], manifest: dict, query_tokens: list[str], top_n: int) -> list[str]:
+    total_docs = manifest["doc_count"]
+    scored_by_doc_id: dict[str, float] = {}
+    for token in query_tokens:
+        doc_freq = int(manifest["document_frequency"].get(token, 0))
+        if doc_freq <= 0:
+            continue
+        idf = math.log(1.0 + ((total_docs - doc_freq + 0.5) / (doc_freq + 0.5)))
+        for record in records:
+            term_freq = record["term_freqs"].get(token)
+            if not term_freq:
+                continue
+            normalized_length = max(1, int(record["length"]))
+            numerator = term_freq * (1.5 + 1.0)
+            denominator = term_freq + 1.5 * (1.0 - 0.75 + 0.75 * (normalized_length / manifest["avg_doc_length"]))
+            scored_by_doc_id[record["doc_id"]] = scored_by_doc_id.get(record["doc_id"], 0.0) + idf * (numerator / denominator)
+    scored = sorted(scored_by_doc_id.items(), key=lambda item: (-item[1], item[0]))
+    return [doc_id for doc_id, score in scored if score > 0.0][:top_n]
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy kravs for lexical postings")
+class LexicalPostingsTests(unittest.TestCase):
+    def test_mapped_postings_match_reference_bm25_ranking(self) -> None:
+        records, manifest = build_corpus(64)
+        queries = [["kurs"], ["ljud", "å", "ljud"], ["lärare", "saknas"], ["saknas"]]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            postings_path = Path(temp_dir) / lexical_postings.LEXICAL_POSTINGS_FILE
+            lexical_postings.write_lexical_postings(postings_path, records, manifest)
+            mapped = lexical_postings.LexicalPostings(
+                path=postings_path,
+                lexical_manifest=manifest,
+                load_lexical_records=list,
+            )
+            fallback = lexical_postings.LexicalPostings(
+                path=Path(temp_dir) / "missing.bin",
+                lexical_manifest=manifest,
+                load_lexical_records=lambda: records,
+            )
+
+            for query_tokens in queries:
+                expected = reference_search(records, manifest, query_tokens, 10)
+                for postings in (mapped, fallback):
+                    scores = postings.bm25_scores(query_tokens, bm25_k1=1.5, bm25_b=0.75)
+                    self.assertEqual(postings.top_doc_ids(scores, 10), expected)
+            self.assertEqual(mapped.source, "postings_file")
+            self.assertEqual(fallback.source, "term_freqs")
+
+    def test_postings_bound_to_other_manifest_are_rejected(self) -> None:
+        records, manifest = build_corpus(8)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            postings_path = Path(temp_dir) / lexical_postings.LEXICAL_POSTINGS_FILE
+            lexical_postings.write_lexical_postings(postings_path, records, manifest)
+            stale = lexical_postings.LexicalPostings(
+                path=postings_path,
+                lexical_manifest={**manifest, "chunk_manifest_hash": "c" * 64},
+                load_lexical_records=lambda: records,
+            )
+
+            with self.assertRaises(lexical_postings.LexicalPostingsError):
+                stale.term_postings("kurs")
+
+    def test_postings_validate_against_verified_tokenization(self) -> None:
+        records, manifest = build_corpus(32)
+        doc_lengths = [record["length"] for record in records]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            postings_path = Path(temp_dir) / lexical_postings.LEXICAL_POSTINGS_FILE
+            lexical_postings.write_lexical_postings(postings_path, records, manifest)
+            lexical_postings.validate_lexical_postings(
+                postings_path,
+                manifest,
+                document_frequency=manifest["document_frequency"],
+                doc_lengths=doc_lengths,
+            )
+
+            tampered = [dict(record, term_freqs=dict(record["term_freqs"])) for record in records]
+            first = next(record for record in tampered if record["term_freqs"])
+            first["term_freqs"][next(iter(first["term_freqs"]))] += 1
+            lexical_postings.write_lexical_postings(postings_path, tampered, manifest)
+            with self.assertRaises(lexical_postings.LexicalPostingsError):
+                lexical_postings.validate_lexical_postings(
+                    postings_path,
+                    manifest,
+                    document_frequency=manifest["document_frequency"],
+                    doc_lengths=doc_lengths,
+                )
+
+            with self.assertRaises(lexical_postings.LexicalPostingsError):
+                lexical_postings.validate_lexical_postings(
+                    postings_path,
+                    manifest,
+                    document_frequency={**manifest["document_frequency"], "saknas": 1},
+                    doc_lengths=doc_lengths,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()